@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Generate playbooks for many companies in one local run.
+
+All jobs run in one process: they share the Claude client, one LLM
+concurrency budget, the pooled HTTP client and the research cache. Jobs are
+fed through the same lease-based queue worker the Modal consumer uses, backed
+by an in-memory table. Each playbook and trace is written to the output
+directory, and a manifest records per-company status so an interrupted batch
+resumes where it stopped.
+
+Usage:
+  python batch_generate.py urls.txt --out batch_output
+  python batch_generate.py tests/test_companies.json --jobs 8 --llm-concurrency 24
+  python batch_generate.py https://owner.com https://toast.com --publish
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Add this directory to path for imports when run from elsewhere
+sys.path.insert(0, str(Path(__file__).parent))
+
+from tools.job_queue import TABLE, JobQueue, QueueWorker
+from tools.job_trace import aggregate_traces
+from tools.local_supabase import LocalSupabase
+
+
+MANIFEST_FILE = "manifest.json"
+
+
+def normalize_url(url: str) -> str:
+    url = url.strip()
+    if url and not url.startswith(("http://", "https://")):
+        url = f"https://{url}"
+    return url.rstrip("/")
+
+
+def load_urls(sources: List[str]) -> List[str]:
+    """
+    Collect company URLs from arguments.
+
+    Each source is a URL, a .txt file (one URL per line, # comments), a .csv
+    file (`company_url`/`url` column, else the first column) or a .json file
+    (list of URLs, or {"companies": [{"url": ...}]} like test_companies.json).
+    Duplicates are dropped, order is kept.
+    """
+    urls = []
+    for source in sources:
+        path = Path(source)
+        if not path.is_file():
+            urls.append(source)
+        elif path.suffix == ".json":
+            data = json.loads(path.read_text())
+            entries = data.get("companies", []) if isinstance(data, dict) else data
+            urls.extend(e["url"] if isinstance(e, dict) else e for e in entries)
+        elif path.suffix == ".csv":
+            with open(path, newline="") as f:
+                rows = list(csv.reader(f))
+            if rows:
+                header = [h.strip().lower() for h in rows[0]]
+                col = next((header.index(c) for c in ("company_url", "url") if c in header), None)
+                body = rows[1:] if col is not None else rows
+                urls.extend(row[col or 0] for row in body if row)
+        else:
+            for line in path.read_text().splitlines():
+                line = line.split("#", 1)[0].strip()
+                if line:
+                    urls.append(line)
+
+    seen = set()
+    unique = []
+    for url in map(normalize_url, urls):
+        if url and url not in seen:
+            seen.add(url)
+            unique.append(url)
+    return unique
+
+
+class Manifest:
+    """Per-company batch status, persisted after every change."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.entries: Dict[str, Dict] = {}
+        if path.exists():
+            self.entries = json.loads(path.read_text()).get("companies", {})
+
+    def pending(self, urls: List[str], retry_failed: bool = True) -> List[str]:
+        """URLs that still need a run (never completed; failed ones optionally)."""
+        todo = []
+        for url in urls:
+            status = self.entries.get(url, {}).get("status")
+            if status == "completed" or (status == "failed" and not retry_failed):
+                continue
+            todo.append(url)
+        return todo
+
+    def update(self, url: str, **fields):
+        self.entries.setdefault(url, {}).update(fields, updated_at=datetime.now().isoformat())
+        self.save()
+
+    def save(self):
+        # Write-then-rename so an interrupted run never leaves a torn manifest
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"companies": self.entries}, indent=2))
+        os.replace(tmp, self.path)
+
+
+async def run_batch(
+    urls: List[str],
+    out_dir: Path,
+    jobs: int = 4,
+    llm_concurrency: Optional[int] = 16,
+    publish: bool = False,
+    retry_failed: bool = True
+) -> Dict:
+    """
+    Run the wave pipeline for every URL not yet completed in the manifest.
+
+    Returns:
+        {"completed": int, "failed": int, "skipped": int, "aggregate": {...}}
+    """
+    from main import build_worker_context, run_blueprint_job
+    from tools.claude_retry import set_llm_concurrency
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    manifest = Manifest(out_dir / MANIFEST_FILE)
+    todo = manifest.pending(urls, retry_failed=retry_failed)
+    skipped = len(urls) - len(todo)
+    print(f"[Batch] {len(urls)} companies, {skipped} already done, {len(todo)} to run "
+          f"({jobs} jobs at once, LLM concurrency {llm_concurrency or 'unlimited'})")
+
+    # One LLM budget shared by all jobs in this process
+    set_llm_concurrency(llm_concurrency)
+
+    db = LocalSupabase()
+    url_by_job = {}
+    for url in todo:
+        row = db.table(TABLE).insert({"company_url": url}).execute().data[0]
+        url_by_job[row["id"]] = url
+
+    ctx = build_worker_context(supabase=db)
+    ctx.update(
+        playbook_dir=str(out_dir / "playbooks"),
+        trace_dir=str(out_dir / "traces"),
+        publish=publish,
+    )
+
+    async def run_job(job: Dict) -> Dict:
+        url = url_by_job[job["id"]]
+        manifest.update(url, status="running", job_id=job["id"])
+        result = await run_blueprint_job(job, ctx)
+        manifest.update(
+            url,
+            status="completed" if result.get("success") else "failed",
+            playbook_path=result.get("playbook_path"),
+            playbook_url=result.get("playbook_url"),
+            trace_path=result.get("trace_path"),
+            error=result.get("error"),
+            cost_usd=(result.get("trace_summary") or {}).get("cost_usd"),
+        )
+        return result
+
+    queue = JobQueue(db, worker_id="batch", max_attempts=1)
+    worker = QueueWorker(queue, run_job, concurrency=jobs, poll_interval=1)
+    try:
+        results = await worker.run(drain=True)
+    finally:
+        set_llm_concurrency(None)
+        await ctx["http"].aclose()
+        # Jobs interrupted mid-run go back to "pending" for the next resume
+        for url, entry in manifest.entries.items():
+            if entry.get("status") == "running":
+                manifest.update(url, status="pending")
+
+    traces = []
+    for entry in manifest.entries.values():
+        trace_path = entry.get("trace_path")
+        if entry.get("status") == "completed" and trace_path and Path(trace_path).exists():
+            traces.append(json.loads(Path(trace_path).read_text()))
+
+    summary = {
+        "completed": sum(1 for r in results.values() if r.get("success")),
+        "failed": sum(1 for r in results.values() if not r.get("success")),
+        "skipped": skipped,
+        "aggregate": aggregate_traces(traces),
+        "research_cache": ctx["research_cache"].stats(),
+    }
+    (out_dir / "summary.json").write_text(json.dumps(summary, indent=2))
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate Blueprint playbooks for many companies")
+    parser.add_argument("sources", nargs="+", help="Company URLs and/or .txt/.csv/.json files of URLs")
+    parser.add_argument("--out", default="batch_output", help="Output directory (playbooks, traces, manifest)")
+    parser.add_argument("--jobs", type=int, default=4, help="Companies processed at once")
+    parser.add_argument("--llm-concurrency", type=int, default=16,
+                        help="Max in-flight Claude requests across all jobs (0 = unlimited)")
+    parser.add_argument("--publish", action="store_true", help="Also publish each playbook to GitHub Pages")
+    parser.add_argument("--skip-failed", action="store_true", help="Don't retry companies that failed before")
+    args = parser.parse_args()
+
+    urls = load_urls(args.sources)
+    if not urls:
+        parser.error("no company URLs found")
+
+    summary = asyncio.run(run_batch(
+        urls,
+        Path(args.out),
+        jobs=args.jobs,
+        llm_concurrency=args.llm_concurrency or None,
+        publish=args.publish,
+        retry_failed=not args.skip_failed
+    ))
+
+    aggregate = summary["aggregate"]
+    print(f"\n{'='*60}")
+    print("BATCH SUMMARY")
+    print(f"{'='*60}")
+    print(f"Completed:     {summary['completed']}")
+    print(f"Failed:        {summary['failed']}")
+    print(f"Skipped:       {summary['skipped']} (already completed)")
+    print(f"Cost (traced): ${aggregate['cost_usd']['total']:.2f}")
+    print(f"Job time p50:  {aggregate['duration_s']['p50']:.0f}s, p95: {aggregate['duration_s']['p95']:.0f}s")
+    print(f"\nResults saved to: {Path(args.out) / 'summary.json'}")
+
+    if summary["failed"] > 0:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,9 @@ from typing import Dict
 # Define Modal app (v2 - threshold fix)
 app = modal.App("blueprint-gtm-worker")
 
+# Jobs run concurrently per warm container (webhook inputs and queue worker slots)
+JOB_CONCURRENCY = int(os.environ.get("BLUEPRINT_JOB_CONCURRENCY", "4"))
+
 # Define secrets (created via: modal secret create blueprint-secrets ...)
 secrets = modal.Secret.from_name("blueprint-secrets")
 vercel_secrets = modal.Secret.from_name("blueprint-vercel")
@@ -34,6 +37,81 @@ image = (
 )
 
 
+# Clients shared by every job in this container (built on first use)
+_worker_context = None
+
+
+def build_worker_context(supabase=None) -> Dict:
+    """
+    Create the clients shared by all jobs running in one warm container.
+
+    Returns a dict with the Claude client, Supabase client, a pooled httpx
+    client, the web fetch/search tools built on it and the ResearchCache.
+    Pass `supabase` to use a different table backend (e.g. LocalSupabase).
+    """
+    import httpx
+    from anthropic import AsyncAnthropic
+    from tools import WebFetch, WebSearch, DualProviderSearch
+    from tools.openrouter_client import DualClaudeClient
+    from tools.research_cache import ResearchCache
+
+    anthropic_client = AsyncAnthropic(api_key=os.environ["ANTHROPIC_API_KEY"])
+
+    # Check for OpenRouter key for parallel API calls
+    openrouter_key = os.environ.get("OPENROUTER_API_KEY")
+    if openrouter_key:
+        print("[Blueprint Worker] OpenRouter key found - using dual-provider mode")
+        claude = DualClaudeClient(anthropic_client, openrouter_key)
+    else:
+        print("[Blueprint Worker] Using Anthropic-only mode")
+        claude = anthropic_client
+
+    if supabase is None:
+        from supabase import create_client
+        supabase = create_client(
+            os.environ["SUPABASE_URL"],
+            os.environ["SUPABASE_SERVICE_KEY"]
+        )
+
+    # One connection pool + research cache for all concurrent jobs
+    http = httpx.AsyncClient(limits=httpx.Limits(max_connections=100, max_keepalive_connections=20))
+    research_cache = ResearchCache()
+
+    # Initialize tools
+    serper_key = os.environ.get("SERPER_API_KEY", "")
+    rapidapi_key = os.environ.get("RAPIDAPI_KEY", "")
+    openweb_ninja_key = os.environ.get("OPENWEB_NINJA_KEY", "")  # Native ak_ format key
+    web_fetch = WebFetch(client=http, cache=research_cache)
+
+    # Use dual-provider search with OpenWeb Ninja native API (preferred) or RapidAPI
+    if openweb_ninja_key:
+        print("[Tools] Using dual-provider search (Serper + OpenWeb Ninja native API)")
+        web_search = DualProviderSearch(serper_key, openweb_ninja_key, use_native=True, client=http, cache=research_cache)
+    elif rapidapi_key:
+        print("[Tools] Using dual-provider search (Serper + OpenWeb Ninja via RapidAPI)")
+        web_search = DualProviderSearch(serper_key, rapidapi_key, use_native=False, client=http, cache=research_cache)
+    else:
+        print("[Tools] Using Serper-only search")
+        web_search = WebSearch(serper_key, client=http, cache=research_cache)
+
+    return {
+        "claude": claude,
+        "supabase": supabase,
+        "http": http,
+        "web_fetch": web_fetch,
+        "web_search": web_search,
+        "research_cache": research_cache,
+    }
+
+
+def get_worker_context() -> Dict:
+    """Return this container's shared worker context, building it once."""
+    global _worker_context
+    if _worker_context is None:
+        _worker_context = build_worker_context()
+    return _worker_context
+
+
 @app.function(
     image=image,
     secrets=[secrets, vercel_secrets, openrouter_secrets],
@@ -42,6 +120,7 @@ image = (
     memory=2048,
     scaledown_window=300,  # Keep container warm for 5 min after job completes
 )
+@modal.concurrent(max_inputs=JOB_CONCURRENCY)  # Concurrent webhook jobs share one warm container
 @modal.fastapi_endpoint(method="POST")
 async def process_blueprint_job(request: Dict) -> Dict:
     """
@@ -58,33 +137,16 @@ async def process_blueprint_job(request: Dict) -> Dict:
             "created_at": "..."
         }
     }
+
+    The job is claimed with a lease first, so the webhook and the queue
+    worker never run the same job twice. If the claim itself fails the job
+    is not run here; it stays in the queue for the cron's consumer.
     """
     try:
-        from anthropic import AsyncAnthropic
-        from supabase import create_client
+        ctx = get_worker_context()
     except ImportError as e:
         print(f"[Blueprint Worker] Import error: {e}")
         return {"success": False, "error": f"Import error: {e}"}
-
-    # Initialize clients
-    try:
-        from tools.openrouter_client import DualClaudeClient
-
-        anthropic_client = AsyncAnthropic(api_key=os.environ["ANTHROPIC_API_KEY"])
-
-        # Check for OpenRouter key for parallel API calls
-        openrouter_key = os.environ.get("OPENROUTER_API_KEY")
-        if openrouter_key:
-            print("[Blueprint Worker] OpenRouter key found - using dual-provider mode")
-            claude = DualClaudeClient(anthropic_client, openrouter_key)
-        else:
-            print("[Blueprint Worker] Using Anthropic-only mode")
-            claude = anthropic_client
-
-        supabase = create_client(
-            os.environ["SUPABASE_URL"],
-            os.environ["SUPABASE_SERVICE_KEY"]
-        )
     except Exception as e:
         print(f"[Blueprint Worker] Client init error: {e}")
         return {"success": False, "error": f"Client init error: {e}"}
@@ -97,9 +159,59 @@ async def process_blueprint_job(request: Dict) -> Dict:
     if not job_id or not company_url:
         return {"success": False, "error": "Missing job_id or company_url"}
 
+    from tools.job_queue import JobQueue, QueueWorker
+
+    queue = JobQueue(ctx["supabase"])
+    worker = QueueWorker(queue, lambda job: run_blueprint_job(job, ctx))
+    try:
+        job = queue.claim_job(job_id)
+        claimed_elsewhere = job is None and queue.exists(job_id)
+    except Exception as e:
+        # Fail closed: running without a lease could run the job twice
+        print(f"[Blueprint Worker] Lease claim failed ({type(e).__name__}: {e}) - not running job {job_id}")
+        return {"success": False, "error": f"Could not claim job: {type(e).__name__}: {e}"}
+
+    if job:
+        return await worker.process({**record, **job})
+    if claimed_elsewhere:
+        print(f"[Blueprint Worker] Job {job_id} already claimed by another worker - skipping")
+        return {"success": False, "error": "Job already claimed by another worker"}
+
+    # No job row (direct/local call) - run without a lease
+    return await run_blueprint_job(record, ctx)
+
+
+async def run_blueprint_job(record: Dict, ctx: Dict) -> Dict:
+    """
+    Run the full wave pipeline for one job record using shared clients.
+
+    Writes the completed/failed status to the job row and never raises for
+    pipeline errors (they are recorded on the job instead).
+
+    Optional ctx keys (used by the local batch runner):
+        playbook_dir: Also write the playbook HTML to `<dir>/<slug>.html`
+        publish: False skips GitHub publishing (playbook_url = local file)
+        trace_dir: Write the job trace JSON here (default BLUEPRINT_TRACE_DIR)
+    """
+    claude = ctx["claude"]
+    supabase = ctx["supabase"]
+    web_fetch = ctx["web_fetch"]
+    web_search = ctx["web_search"]
+
+    job_id = record.get("id")
+    company_url = record.get("company_url")
+
     print(f"[Blueprint Worker] Starting job {job_id} for {company_url}")
     job_start = time.time()
 
+    # Per-job cached vs uncached input token accounting (prompt caching)
+    from tools.prompt_cache import track_cache_usage
+    cache_usage = track_cache_usage()
+
+    # Per-job spans for waves and every LLM/search/fetch call
+    from tools.job_trace import start_trace
+    trace = start_trace(job_id, company_url)
+
     try:
         # Update status to processing
         supabase.table("blueprint_jobs").update({
@@ -120,31 +232,13 @@ async def process_blueprint_job(request: Dict) -> Dict:
             Wave4HTML,
             Wave45Publish
         )
-        from tools import WebFetch, WebSearch, DualProviderSearch
-
-        # Initialize tools
-        serper_key = os.environ.get("SERPER_API_KEY", "")
-        rapidapi_key = os.environ.get("RAPIDAPI_KEY", "")
-        openweb_ninja_key = os.environ.get("OPENWEB_NINJA_KEY", "")  # Native ak_ format key
-        web_fetch = WebFetch()
-
-        # Use dual-provider search with OpenWeb Ninja native API (preferred) or RapidAPI
-        if openweb_ninja_key:
-            print("[Tools] Using dual-provider search (Serper + OpenWeb Ninja native API)")
-            web_search = DualProviderSearch(serper_key, openweb_ninja_key, use_native=True)
-        elif rapidapi_key:
-            print("[Tools] Using dual-provider search (Serper + OpenWeb Ninja via RapidAPI)")
-            web_search = DualProviderSearch(serper_key, rapidapi_key, use_native=False)
-        else:
-            print("[Tools] Using Serper-only search")
-            web_search = WebSearch(serper_key)
 
         # ========== WAVE 1: Company Intelligence ==========
-        wave_start = time.time()
+        wave_span = trace.begin("wave1", "wave")
         print("[Wave 1] Gathering company intelligence...")
         wave1 = Wave1CompanyResearch(claude, web_fetch, web_search)
         company_context = await wave1.execute(company_url)
-        print(f"[Wave 1] Complete in {time.time() - wave_start:.1f}s: {company_context.get('company_name', 'Unknown')}")
+        print(f"[Wave 1] Complete in {trace.end(wave_span)['duration_s']:.1f}s: {company_context.get('company_name', 'Unknown')}")
 
         # Validate Wave 1 output - fail fast if company extraction failed
         if not company_context:
@@ -153,41 +247,41 @@ async def process_blueprint_job(request: Dict) -> Dict:
             raise ValueError(f"[Wave 1] Failed to extract company name from {company_url}")
 
         # ========== WAVE 0.5: Product Fit Analysis ==========
-        wave_start = time.time()
+        wave_span = trace.begin("wave05", "wave")
         print("[Wave 0.5] Analyzing product fit...")
         wave05 = Wave05ProductFit(claude)
         product_fit = await wave05.execute(company_context)
-        print(f"[Wave 0.5] Complete in {time.time() - wave_start:.1f}s: {len(product_fit.get('valid_domains', []))} valid domains")
+        print(f"[Wave 0.5] Complete in {trace.end(wave_span)['duration_s']:.1f}s: {len(product_fit.get('valid_domains', []))} valid domains")
 
         # ========== WAVE 1.5: Niche Conversion ==========
-        wave_start = time.time()
+        wave_span = trace.begin("wave15", "wave")
         print("[Wave 1.5] Converting niches...")
         wave15 = Wave15NicheConversion(claude, web_search)
         niches = await wave15.execute(company_context, product_fit)
-        print(f"[Wave 1.5] Complete in {time.time() - wave_start:.1f}s: {len(niches.get('qualified_niches', []))} qualified niches")
+        print(f"[Wave 1.5] Complete in {trace.end(wave_span)['duration_s']:.1f}s: {len(niches.get('qualified_niches', []))} qualified niches")
 
         # ========== WAVE 2.5: Situation Fallback (if needed) ==========
         situation_segments = []
         if niches.get("fallback_needed", False):
-            wave_start = time.time()
+            wave_span = trace.begin("wave25", "wave")
             print("[Wave 2.5] Niche fallback triggered - generating situation segments...")
             wave25 = Wave25SituationFallback(claude, web_search)
             situation_result = await wave25.execute(company_context, product_fit)
             situation_segments = situation_result.get("situation_segments", [])
-            print(f"[Wave 2.5] Complete in {time.time() - wave_start:.1f}s: {len(situation_segments)} situation segments")
+            print(f"[Wave 2.5] Complete in {trace.end(wave_span)['duration_s']:.1f}s: {len(situation_segments)} situation segments")
 
         # ========== WAVE 2: Data Landscape ==========
-        wave_start = time.time()
+        wave_span = trace.begin("wave2", "wave")
         print("[Wave 2] Mapping data landscape...")
         wave2 = Wave2DataLandscape(claude, web_search)
         data_landscape = await wave2.execute(
             niches.get("qualified_niches", [{}])[0] if niches.get("qualified_niches") else {},
             company_context
         )
-        print(f"[Wave 2] Complete in {time.time() - wave_start:.1f}s: {sum(len(v) for v in data_landscape.values() if isinstance(v, list))} sources found")
+        print(f"[Wave 2] Complete in {trace.end(wave_span)['duration_s']:.1f}s: {sum(len(v) for v in data_landscape.values() if isinstance(v, list))} sources found")
 
         # ========== SYNTHESIS: Sequential Thinking ==========
-        wave_start = time.time()
+        wave_span = trace.begin("synthesis", "wave")
         print("[Synthesis] Generating pain segments...")
         synthesis = Synthesis(claude)
         segments_result = await synthesis.generate_segments(
@@ -196,7 +290,7 @@ async def process_blueprint_job(request: Dict) -> Dict:
             product_fit
         )
         segments = segments_result.get("segments", [])
-        print(f"[Synthesis] Complete in {time.time() - wave_start:.1f}s: {len(segments)} segments generated")
+        print(f"[Synthesis] Complete in {trace.end(wave_span)['duration_s']:.1f}s: {len(segments)} segments generated")
 
         # Warn if synthesis produced no segments - this will likely degrade output quality
         if not segments:
@@ -218,11 +312,11 @@ async def process_blueprint_job(request: Dict) -> Dict:
             print(f"[Synthesis] Added {len(situation_segments)} situation segments")
 
         # ========== HARD GATES: Validation ==========
-        wave_start = time.time()
+        wave_span = trace.begin("hard_gates", "wave")
         print("[Hard Gates] Validating segments...")
         hard_gates = HardGates(claude)
         validated_segments = await hard_gates.validate(segments, product_fit, company_context)
-        print(f"[Hard Gates] Complete in {time.time() - wave_start:.1f}s: {len(validated_segments)}/{len(segments)} segments passed")
+        print(f"[Hard Gates] Complete in {trace.end(wave_span)['duration_s']:.1f}s: {len(validated_segments)}/{len(segments)} segments passed")
 
         # Track if fallback was used for logging
         used_fallback = False
@@ -246,36 +340,49 @@ async def process_blueprint_job(request: Dict) -> Dict:
             print("[Hard Gates] ALERT: Job continuing with fallback segments - output quality may be degraded")
 
         # ========== WAVE 3: Message Generation ==========
-        wave_start = time.time()
+        wave_span = trace.begin("wave3", "wave")
         print("[Wave 3] Generating messages...")
         wave3 = Wave3Messages(claude)
         messages = await wave3.generate(validated_segments[:4], company_context)  # Process 4 segments instead of 2
-        print(f"[Wave 3] Complete in {time.time() - wave_start:.1f}s: {len(messages)} messages generated")
+        print(f"[Wave 3] Complete in {trace.end(wave_span)['duration_s']:.1f}s: {len(messages)} messages generated "
+              f"(first message at {wave3.last_timing.get('time_to_first_message_s')}s)")
 
         # ========== WAVE 4: HTML Assembly ==========
-        wave_start = time.time()
+        wave_span = trace.begin("wave4", "wave")
         print("[Wave 4] Assembling HTML playbook...")
         wave4 = Wave4HTML()
         html_content = wave4.generate(company_context, messages)
-        print(f"[Wave 4] Complete in {time.time() - wave_start:.1f}s: {len(html_content)} bytes")
+        print(f"[Wave 4] Complete in {trace.end(wave_span)['duration_s']:.1f}s: {len(html_content)} bytes")
 
-        # ========== WAVE 4.5: Publish to GitHub ==========
-        wave_start = time.time()
-        print("[Wave 4.5] Publishing to GitHub Pages...")
-        wave45 = Wave45Publish(
-            github_token=os.environ.get("GITHUB_TOKEN", ""),
-            repo=os.environ.get("GITHUB_REPO", "blueprint-gtm-playbooks"),
-            owner=os.environ.get("GITHUB_OWNER", "SantaJordan")
-        )
         company_slug = company_url.split("//")[-1].split("/")[0].replace(".", "-").replace("www-", "")
-        playbook_url = await wave45.publish(html_content, company_slug)
-        print(f"[Wave 4.5] Complete in {time.time() - wave_start:.1f}s: {playbook_url}")
+        playbook_path = None
+        if ctx.get("playbook_dir"):
+            os.makedirs(ctx["playbook_dir"], exist_ok=True)
+            playbook_path = os.path.join(ctx["playbook_dir"], f"{company_slug}.html")
+            with open(playbook_path, "w") as f:
+                f.write(html_content)
+            print(f"[Wave 4] Saved playbook to {playbook_path}")
+
+        # ========== WAVE 4.5: Publish to GitHub ==========
+        if ctx.get("publish", True):
+            wave_span = trace.begin("wave45", "wave")
+            print("[Wave 4.5] Publishing to GitHub Pages...")
+            wave45 = Wave45Publish(
+                github_token=os.environ.get("GITHUB_TOKEN", ""),
+                repo=os.environ.get("GITHUB_REPO", "blueprint-gtm-playbooks"),
+                owner=os.environ.get("GITHUB_OWNER", "SantaJordan")
+            )
+            playbook_url = await wave45.publish(html_content, company_slug)
+            print(f"[Wave 4.5] Complete in {trace.end(wave_span)['duration_s']:.1f}s: {playbook_url}")
+        else:
+            playbook_url = playbook_path
+            print("[Wave 4.5] Skipped - publishing disabled")
 
         # ========== WAVE 5: Capture Payment (if applicable) ==========
         payment_intent_id = record.get("stripe_payment_intent_id")
         if payment_intent_id:
             import httpx
-            wave_start = time.time()
+            wave_span = trace.begin("wave5", "wave")
             print("[Wave 5] Capturing payment...")
             vercel_api_url = os.environ.get("VERCEL_API_URL", "")
             modal_webhook_secret = os.environ.get("MODAL_WEBHOOK_SECRET", "")
@@ -295,13 +402,15 @@ async def process_blueprint_job(request: Dict) -> Dict:
                             }
                         )
                         if response.status_code == 200:
-                            print(f"[Wave 5] Payment captured successfully in {time.time() - wave_start:.1f}s")
+                            print(f"[Wave 5] Payment captured successfully in {trace.end(wave_span)['duration_s']:.1f}s")
                         else:
                             print(f"[Wave 5] Payment capture failed: {response.text}")
                 except Exception as payment_err:
                     print(f"[Wave 5] Payment capture error: {payment_err}")
             else:
                 print("[Wave 5] Payment capture skipped - missing VERCEL_API_URL or MODAL_WEBHOOK_SECRET")
+            if wave_span["duration_s"] is None:
+                trace.end(wave_span, status="error")
         else:
             print("[Wave 5] Skipped - no payment intent (test job or legacy)")
 
@@ -313,8 +422,23 @@ async def process_blueprint_job(request: Dict) -> Dict:
         }).eq("id", job_id).execute()
 
         total_time = time.time() - job_start
+        usage_summary = cache_usage.summary()
+        trace.finish()
+        trace_summary = trace.summary()
+        trace_path = save_job_trace(supabase, trace, ctx.get("trace_dir"))
         print(f"[Blueprint Worker] Job {job_id} completed in {total_time:.1f}s ({total_time/60:.1f} min)")
-        return {"success": True, "playbook_url": playbook_url}
+        print(f"[Blueprint Worker] Input tokens: {usage_summary['cache_read_tokens']} cached, "
+              f"{usage_summary['cache_write_tokens']} cache-write, {usage_summary['input_tokens_uncached']} uncached "
+              f"({usage_summary['cache_hit_rate']:.0%} hit rate over {usage_summary['calls']} calls)")
+        print(f"[Blueprint Worker] Estimated cost: ${trace_summary['cost_usd']:.2f}, wave times: {trace_summary['waves']}")
+        return {
+            "success": True,
+            "playbook_url": playbook_url,
+            "playbook_path": playbook_path,
+            "trace_path": trace_path,
+            "token_usage": usage_summary,
+            "trace_summary": trace_summary
+        }
 
     except Exception as e:
         error_msg = str(e)
@@ -322,6 +446,7 @@ async def process_blueprint_job(request: Dict) -> Dict:
 
         # Log full error for debugging (visible in Modal logs)
         print(f"[Blueprint Worker] FULL ERROR for job {job_id}:")
+        print(f"[Blueprint Worker] Token usage before failure: {cache_usage.summary()}")
         print(f"[Blueprint Worker] Error type: {error_type}")
         print(f"[Blueprint Worker] Error message: {error_msg}")
 
@@ -341,33 +466,114 @@ async def process_blueprint_job(request: Dict) -> Dict:
         except Exception as update_err:
             print(f"[Blueprint Worker] Failed to update job status: {update_err}")
 
-        return {"success": False, "error": error_msg}
+        trace.finish()
+        trace_path = save_job_trace(supabase, trace, ctx.get("trace_dir"))
+
+        return {"success": False, "error": error_msg, "trace_path": trace_path, "trace_summary": trace.summary()}
+
+
+def save_job_trace(supabase, trace, trace_dir: str = None):
+    """
+    Persist a job trace next to the job record (`trace` JSONB column) and,
+    when `trace_dir` or BLUEPRINT_TRACE_DIR is set, as `<dir>/<job_id>.json`.
+
+    Never raises - a missing column or unwritable directory only logs.
+
+    Returns:
+        Path of the written trace file, or None
+    """
+    from tools.job_trace import write_trace
+
+    trace_dict = trace.to_dict()
+    trace_dir = trace_dir or os.environ.get("BLUEPRINT_TRACE_DIR")
+    path = None
+    if trace_dir:
+        try:
+            path = write_trace(trace_dict, trace_dir)
+            print(f"[Trace] Wrote {path}")
+        except OSError as e:
+            print(f"[Trace] Failed to write trace file: {e}")
+
+    if trace.job_id:
+        try:
+            supabase.table("blueprint_jobs").update({"trace": trace_dict}).eq("id", trace.job_id).execute()
+        except Exception as e:
+            print(f"[Trace] Failed to store trace on job row: {type(e).__name__}: {str(e)[:200]}")
+    return path
+
+
+@app.function(
+    image=image,
+    secrets=[secrets, vercel_secrets, openrouter_secrets],
+    timeout=4 * 3600,  # Long-lived consumer; stops claiming well before this
+    cpu=4,
+    memory=4096,
+)
+async def drain_job_queue(concurrency: int = JOB_CONCURRENCY, claim_for_seconds: float = 2.5 * 3600) -> Dict:
+    """
+    Queue consumer: claim pending (or lease-expired) jobs N at a time and run
+    them concurrently in this container with shared clients and caches.
+
+    Stops claiming after `claim_for_seconds` so in-flight jobs can finish
+    before the function timeout; remaining jobs go to the next run.
+
+    Only one consumer drains at a time: it holds the drain_job_queue worker
+    lease, exits at once if another consumer has it, and stops claiming if
+    the lease is lost.
+    """
+    import asyncio
+    from tools.job_queue import JobQueue, QueueWorker, WorkerLease
+
+    ctx = get_worker_context()
+    queue = JobQueue(ctx["supabase"])
+    lease = WorkerLease(ctx["supabase"], worker_id=queue.worker_id)
+    if not lease.acquire():
+        print("[Queue] Another queue worker holds the lease - exiting")
+        return {"processed": 0, "succeeded": 0, "skipped": "lease held by another worker"}
+
+    worker = QueueWorker(queue, lambda job: run_blueprint_job(job, ctx), concurrency=concurrency)
+    print(f"[Queue] Worker {queue.worker_id} draining queue with concurrency {concurrency}")
+
+    async def hold_lease():
+        await lease.keep_alive()
+        print("[Queue] Lost the worker lease - no longer claiming jobs")
+        worker.stop_claiming()
+
+    keeper = asyncio.create_task(hold_lease())
+    try:
+        results = await worker.run(drain=True, claim_for=claim_for_seconds)
+    finally:
+        keeper.cancel()
+        lease.release()
+    succeeded = sum(1 for r in results.values() if r.get("success"))
+    print(f"[Queue] Drained {len(results)} jobs ({succeeded} succeeded), research cache: {ctx['research_cache'].stats()}")
+    return {"processed": len(results), "succeeded": succeeded}
 
 
 @app.function(image=image, secrets=[secrets, vercel_secrets], schedule=modal.Cron("*/5 * * * *"))
 async def poll_pending_jobs():
     """
     Backup cron job that polls for pending jobs every 5 minutes.
-    This handles cases where the webhook fails.
+    This handles cases where the webhook fails, and recovers jobs whose
+    worker died (expired lease), by spawning a queue consumer - unless one
+    is already running (it holds the worker lease).
     """
     from supabase import create_client
+    from tools.job_queue import JobQueue, WorkerLease
 
     supabase = create_client(
         os.environ["SUPABASE_URL"],
         os.environ["SUPABASE_SERVICE_KEY"]
     )
 
-    # Find pending jobs
-    result = supabase.table("blueprint_jobs").select("*").eq("status", "pending").limit(1).execute()
+    if WorkerLease(supabase).is_held():
+        print("[Cron] Queue worker already running - not spawning another")
+        return
 
-    if result.data:
-        job = result.data[0]
-        print(f"[Cron] Found pending job: {job['id']}")
-
-        # Process the job locally (webhook functions can't use .remote())
-        await process_blueprint_job.local({
-            "record": job
-        })
+    claimable = JobQueue(supabase).count_claimable()
+    if claimable:
+        print(f"[Cron] Found {claimable} claimable job(s) - spawning queue worker")
+        await drain_job_queue.spawn.aio()
     else:
         print("[Cron] No pending jobs found")
 
@@ -0,0 +1,82 @@
+"""
+Tests for batch input parsing and manifest resume logic.
+
+Run: python -m pytest blueprint-worker/tests/test_batch_generate.py -q
+"""
+import asyncio
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from batch_generate import Manifest, load_urls
+from tools.claude_retry import call_claude_with_retry, set_llm_concurrency
+
+
+def test_load_urls_from_mixed_sources(tmp_path):
+    txt = tmp_path / "urls.txt"
+    txt.write_text("# batch one\nowner.com\nhttps://toast.com/  # dup below\n\n")
+    csv_file = tmp_path / "urls.csv"
+    csv_file.write_text("name,company_url\nToast,https://toast.com\nCanvas,canvasmedical.com\n")
+    json_file = tmp_path / "companies.json"
+    json_file.write_text(json.dumps({"companies": [{"name": "Fountain", "url": "https://fountain.com"}]}))
+
+    urls = load_urls([str(txt), str(csv_file), str(json_file), "https://extra.io"])
+    assert urls == [
+        "https://owner.com",
+        "https://toast.com",
+        "https://canvasmedical.com",
+        "https://fountain.com",
+        "https://extra.io",
+    ]
+
+
+def test_load_urls_test_companies_dataset():
+    dataset = Path(__file__).parent / "test_companies.json"
+    urls = load_urls([str(dataset)])
+    assert urls and all(u.startswith("https://") for u in urls)
+
+
+def test_manifest_resumes_and_persists(tmp_path):
+    path = tmp_path / "manifest.json"
+    urls = ["https://a.com", "https://b.com", "https://c.com"]
+
+    manifest = Manifest(path)
+    manifest.update("https://a.com", status="completed", playbook_path="a.html")
+    manifest.update("https://b.com", status="failed", error="boom")
+
+    reloaded = Manifest(path)
+    assert reloaded.entries["https://a.com"]["playbook_path"] == "a.html"
+    assert reloaded.pending(urls) == ["https://b.com", "https://c.com"]
+    assert reloaded.pending(urls, retry_failed=False) == ["https://c.com"]
+    assert not path.with_suffix(".tmp").exists()
+
+
+def test_llm_budget_caps_concurrent_calls():
+    state = {"now": 0, "peak": 0}
+
+    class Messages:
+        async def create(self, **kwargs):
+            state["now"] += 1
+            state["peak"] = max(state["peak"], state["now"])
+            await asyncio.sleep(0.01)
+            state["now"] -= 1
+            return SimpleNamespace(content=[SimpleNamespace(text="ok")], usage=None)
+
+    client = SimpleNamespace(messages=Messages())
+
+    async def many_jobs():
+        await asyncio.gather(*(
+            call_claude_with_retry(client, model="m", max_tokens=1, messages=[])
+            for _ in range(12)
+        ))
+
+    set_llm_concurrency(3)
+    try:
+        asyncio.run(many_jobs())
+    finally:
+        set_llm_concurrency(None)
+    assert state["peak"] == 3
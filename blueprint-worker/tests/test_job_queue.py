@@ -0,0 +1,257 @@
+"""
+Tests for the lease-based job queue, run against the LocalSupabase stand-in.
+
+Run: python -m pytest blueprint-worker/tests/test_job_queue.py -q
+"""
+import asyncio
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tools.job_queue import JobQueue, LeaseLost, QueueWorker, TABLE, WorkerLease
+from tools.local_supabase import LocalSupabase
+from tools.research_cache import ResearchCache
+
+
+def make_db(n_jobs: int) -> LocalSupabase:
+    db = LocalSupabase()
+    for i in range(n_jobs):
+        db.table(TABLE).insert({
+            "company_url": f"https://company{i}.com",
+            "created_at": f"2025-01-01T00:00:{i:02d}+00:00",
+        }).execute()
+    return db
+
+
+def statuses(db: LocalSupabase) -> list:
+    return sorted(row["status"] for row in db.rows(TABLE))
+
+
+def test_claims_are_exclusive_between_workers():
+    db = make_db(5)
+    a = JobQueue(db, worker_id="a")
+    b = JobQueue(db, worker_id="b")
+
+    claimed_a = a.claim(3)
+    claimed_b = b.claim(3)
+
+    ids_a = {job["id"] for job in claimed_a}
+    ids_b = {job["id"] for job in claimed_b}
+    assert len(ids_a) == 3 and len(ids_b) == 2
+    assert not ids_a & ids_b
+    assert all(job["worker_id"] == "a" and job["status"] == "processing" for job in claimed_a)
+    # Oldest jobs are claimed first
+    assert [job["company_url"] for job in claimed_a] == [f"https://company{i}.com" for i in range(3)]
+
+
+def test_stale_observation_loses_race():
+    db = make_db(1)
+    job = db.rows(TABLE)[0]
+    a = JobQueue(db, worker_id="a")
+    b = JobQueue(db, worker_id="b")
+
+    now = datetime.now(timezone.utc).isoformat()
+    assert a._try_claim(job, now) is not None
+    # b acts on the same (now stale) pending snapshot
+    assert b._try_claim(job, now) is None
+    assert db.rows(TABLE)[0]["worker_id"] == "a"
+
+
+def test_expired_lease_is_reclaimed_but_live_lease_is_not():
+    db = make_db(1)
+    a = JobQueue(db, worker_id="a", lease_seconds=600)
+    b = JobQueue(db, worker_id="b")
+
+    job = a.claim(1)[0]
+    assert b.claim(1) == []
+    assert b.claim_job(job["id"]) is None
+
+    # Simulate a dead worker: lease in the past
+    past = (datetime.now(timezone.utc) - timedelta(seconds=5)).isoformat()
+    db.table(TABLE).update({"lease_expires_at": past}).eq("id", job["id"]).execute()
+
+    reclaimed = b.claim(1)
+    assert len(reclaimed) == 1
+    assert reclaimed[0]["worker_id"] == "b"
+    assert reclaimed[0]["attempts"] == 2
+    # The original worker lost its lease
+    assert a.heartbeat(job["id"]) is False
+    assert b.heartbeat(job["id"]) is True
+
+
+def test_job_abandoned_after_max_attempts():
+    db = make_db(1)
+    queue = JobQueue(db, worker_id="a", max_attempts=2)
+    past = (datetime.now(timezone.utc) - timedelta(seconds=5)).isoformat()
+
+    for _ in range(2):
+        job = queue.claim(1)[0]
+        db.table(TABLE).update({"lease_expires_at": past}).eq("id", job["id"]).execute()
+
+    assert queue.claim(1) == []
+    row = db.rows(TABLE)[0]
+    assert row["status"] == "failed"
+    assert "Abandoned" in row["error_message"]
+
+
+def test_worker_runs_jobs_concurrently_and_drains():
+    db = make_db(6)
+    queue = JobQueue(db, worker_id="w")
+    running = {"now": 0, "peak": 0}
+
+    async def run_job(job):
+        running["now"] += 1
+        running["peak"] = max(running["peak"], running["now"])
+        await asyncio.sleep(0.05)
+        running["now"] -= 1
+        db.table(TABLE).update({"status": "completed"}).eq("id", job["id"]).execute()
+        return {"success": True}
+
+    worker = QueueWorker(queue, run_job, concurrency=3, poll_interval=0.01)
+    results = asyncio.run(worker.run(drain=True))
+
+    assert len(results) == 6
+    assert running["peak"] == 3
+    assert statuses(db) == ["completed"] * 6
+
+
+def test_crashed_job_releases_lease():
+    db = make_db(2)
+    queue = JobQueue(db, worker_id="w")
+
+    async def run_job(job):
+        if job["company_url"].endswith("company0.com"):
+            raise RuntimeError("container blew up")
+        db.table(TABLE).update({"status": "completed"}).eq("id", job["id"]).execute()
+        return {"success": True}
+
+    worker = QueueWorker(queue, run_job, concurrency=2, poll_interval=0.01)
+    asyncio.run(worker.run(drain=True, max_jobs=2))
+
+    rows = {row["company_url"]: row for row in db.rows(TABLE)}
+    crashed = rows["https://company0.com"]
+    assert crashed["status"] == "pending"
+    assert crashed["worker_id"] is None and crashed["lease_expires_at"] is None
+    assert rows["https://company1.com"]["status"] == "completed"
+
+
+def test_cancelled_worker_releases_all_leases():
+    db = make_db(3)
+    queue = JobQueue(db, worker_id="w")
+
+    async def run_job(job):
+        await asyncio.sleep(10)
+        return {"success": True}
+
+    async def run_then_cancel():
+        worker = QueueWorker(queue, run_job, concurrency=3, poll_interval=0.01)
+        task = asyncio.create_task(worker.run(drain=True))
+        await asyncio.sleep(0.05)
+        assert statuses(db) == ["processing"] * 3
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(run_then_cancel())
+    assert statuses(db) == ["pending"] * 3
+
+
+def test_heartbeat_extends_lease():
+    db = make_db(1)
+    queue = JobQueue(db, worker_id="w", lease_seconds=600)
+
+    async def run_job(job):
+        before = db.rows(TABLE)[0]["lease_expires_at"]
+        await asyncio.sleep(0.05)
+        after = db.rows(TABLE)[0]["lease_expires_at"]
+        return {"success": True, "extended": after > before}
+
+    worker = QueueWorker(queue, run_job, heartbeat_interval=0.01, poll_interval=0.01)
+    results = asyncio.run(worker.run(drain=True))
+    assert list(results.values())[0]["extended"] is True
+
+
+def test_lost_lease_cancels_the_job():
+    db = make_db(1)
+    queue = JobQueue(db, worker_id="a")
+    finished = []
+
+    async def run_job(job):
+        # Another worker steals the job (e.g. after a long GC pause)
+        db.table(TABLE).update({"worker_id": "b"}).eq("id", job["id"]).execute()
+        await asyncio.sleep(10)
+        finished.append(job["id"])
+        return {"success": True}
+
+    async def run():
+        worker = QueueWorker(queue, run_job, heartbeat_interval=0.01)
+        job = queue.claim(1)[0]
+        try:
+            await worker.process(job)
+        except LeaseLost:
+            return "lost"
+
+    assert asyncio.run(run()) == "lost"
+    assert finished == []
+    # b's claim is left alone
+    assert db.rows(TABLE)[0]["worker_id"] == "b"
+
+
+def test_worker_lease_allows_one_consumer():
+    db = LocalSupabase()
+    a = WorkerLease(db, worker_id="a", lease_seconds=600)
+    b = WorkerLease(db, worker_id="b")
+
+    assert not a.is_held()
+    assert a.acquire() is True
+    assert a.is_held() and b.acquire() is False
+    assert b.renew() is False and a.renew() is True
+
+    a.release()
+    assert not b.is_held()
+    assert b.acquire() is True and a.renew() is False
+
+
+def test_research_cache_shares_inflight_and_cached_results():
+    cache = ResearchCache(ttl_seconds=60)
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"success": True, "text": "page"}
+
+    async def run():
+        first = await asyncio.gather(*(cache.get_or_fetch(("fetch", "u"), fetch) for _ in range(5)))
+        again = await cache.get_or_fetch(("fetch", "u"), fetch)
+        return first, again
+
+    first, again = asyncio.run(run())
+    assert len(calls) == 1
+    assert all(r["text"] == "page" for r in first) and again["text"] == "page"
+    assert cache.stats()["hits"] == 5
+
+
+def test_research_cache_waiters_survive_owner_cancellation():
+    cache = ResearchCache(ttl_seconds=60)
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"success": True, "text": "page"}
+
+    async def run():
+        owner = asyncio.create_task(cache.get_or_fetch(("fetch", "u"), fetch))
+        await asyncio.sleep(0)
+        waiters = [asyncio.create_task(cache.get_or_fetch(("fetch", "u"), fetch)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        owner.cancel()  # The owning job is cancelled mid-fetch
+        return await asyncio.gather(*waiters)
+
+    results = asyncio.run(run())
+    assert all(r["text"] == "page" for r in results)
+    # One waiter took over the fetch; the others shared it
+    assert len(calls) == 2
@@ -0,0 +1,166 @@
+"""
+Tests for per-job tracing (spans, token/cost accounting, aggregation).
+
+Run: python -m pytest blueprint-worker/tests/test_job_trace.py -q
+"""
+import asyncio
+import contextvars
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tools.claude_retry import call_claude_with_retry
+from tools.job_trace import JobTrace, aggregate_traces, annotate, current_trace, estimate_cost, start_trace, trace_span, write_trace
+from tools.research_cache import ResearchCache
+from tools.web_fetch import WebFetch
+
+
+class FakeMessages:
+    def __init__(self, usage):
+        self.usage = usage
+
+    async def create(self, **kwargs):
+        await asyncio.sleep(0)
+        return SimpleNamespace(content=[SimpleNamespace(text="ok")], usage=self.usage)
+
+
+def anthropic_usage(input_tokens=100, output_tokens=50, write=0, read=0):
+    return SimpleNamespace(
+        input_tokens=input_tokens,
+        output_tokens=output_tokens,
+        cache_creation_input_tokens=write,
+        cache_read_input_tokens=read,
+    )
+
+
+def test_llm_calls_nest_under_wave_and_are_costed():
+    model = "claude-sonnet-4-5-20250929"
+    client = SimpleNamespace(messages=FakeMessages(anthropic_usage(1000, 200, read=4000)))
+
+    async def job():
+        trace = start_trace("job-1", "https://acme.com")
+        wave = trace.begin("wave05", "wave")
+        await asyncio.gather(*(
+            call_claude_with_retry(client, model=model, max_tokens=10, messages=[])
+            for _ in range(2)
+        ))
+        trace.end(wave)
+        trace.finish()
+        return trace
+
+    trace = asyncio.run(job())
+    data = trace.to_dict()
+    wave = next(s for s in data["spans"] if s["kind"] == "wave")
+    llm = [s for s in data["spans"] if s["kind"] == "llm"]
+
+    assert len(llm) == 2
+    assert all(s["parent_id"] == wave["id"] for s in llm)
+    assert llm[0]["attrs"]["provider"] == "anthropic"
+    assert llm[0]["attrs"]["cost_usd"] == estimate_cost(model, 1000, 200, 0, 4000)
+
+    summary = data["summary"]
+    assert summary["calls"]["llm"]["calls"] == 2
+    assert summary["models"][model]["cache_read_tokens"] == 8000
+    assert summary["cost_usd"] == round(2 * estimate_cost(model, 1000, 200, 0, 4000), 4)
+    assert "wave05" in summary["waves"]
+    json.dumps(data)
+
+
+def test_openrouter_usage_is_attributed():
+    usage = {"prompt_tokens": 300, "completion_tokens": 20, "prompt_tokens_details": {"cached_tokens": 100}}
+    client = SimpleNamespace(messages=FakeMessages(usage))
+
+    async def job():
+        trace = start_trace("job-2")
+        await call_claude_with_retry(client, model="claude-sonnet-4-5-20250929", max_tokens=10, messages=[])
+        return trace
+
+    span = asyncio.run(job()).spans[0]
+    assert span["attrs"]["provider"] == "openrouter"
+    assert span["attrs"]["input_tokens"] == 200
+    assert span["attrs"]["cache_read_tokens"] == 100
+
+
+def test_cached_fetch_spans_and_error_status():
+    fetch = WebFetch(cache=ResearchCache())
+    calls = []
+
+    async def fake_fetch(url):
+        calls.append(url)
+        annotate(cached=False)
+        return {"url": url, "success": url.endswith("ok"), "status": 200}
+
+    fetch._fetch = fake_fetch
+
+    async def job():
+        trace = start_trace("job-3")
+        await fetch.fetch("https://a.com/ok")
+        await fetch.fetch("https://a.com/ok")
+        await fetch.fetch("https://a.com/bad")
+        return trace
+
+    spans = asyncio.run(job()).spans
+    assert [s["attrs"]["cached"] for s in spans] == [False, True, False]
+    assert [s["status"] for s in spans] == ["ok", "ok", "error"]
+    assert len(calls) == 2
+
+
+def test_concurrent_jobs_do_not_share_spans():
+    async def job(name):
+        trace = start_trace(name)
+        with trace_span(name, "wave"):
+            await asyncio.sleep(0.01)
+        return trace
+
+    async def both():
+        return await asyncio.gather(job("a"), job("b"))
+
+    a, b = asyncio.run(both())
+    assert [s["name"] for s in a.spans] == ["a"]
+    assert [s["name"] for s in b.spans] == ["b"]
+
+
+def test_failed_wave_is_closed_as_incomplete():
+    trace = JobTrace("job-4")
+    trace.begin("wave2", "wave")
+    trace.finish()
+    assert trace.spans[0]["status"] == "incomplete"
+    assert trace.spans[0]["duration_s"] is not None
+
+
+def test_trace_span_is_noop_without_trace():
+    async def untraced():
+        with trace_span("fetch", "fetch") as span:
+            span["status"] = "error"
+        return current_trace()
+
+    # Fresh context: no trace started
+    assert contextvars.Context().run(asyncio.run, untraced()) is None
+
+
+def test_aggregate_traces_across_jobs(tmp_path):
+    model = "claude-opus-4-5-20251101"
+    client = SimpleNamespace(messages=FakeMessages(anthropic_usage(2000, 500)))
+    paths = []
+
+    async def job(job_id):
+        trace = start_trace(job_id)
+        with trace_span("synthesis", "wave"):
+            await call_claude_with_retry(client, model=model, max_tokens=10, messages=[])
+        trace.finish()
+        return trace.to_dict()
+
+    for i in range(3):
+        paths.append(write_trace(asyncio.run(job(f"job-{i}")), str(tmp_path)))
+
+    traces = [json.loads(Path(p).read_text()) for p in paths]
+    agg = aggregate_traces(traces)
+    assert agg["jobs"] == 3
+    assert agg["models"][model]["calls"] == 3
+    assert agg["models"][model]["input_tokens"] == 6000
+    assert agg["cost_usd"]["total"] == round(3 * estimate_cost(model, 2000, 500), 4)
+    assert set(agg["waves"]["synthesis"]) == {"p50", "p95", "max"}
@@ -2,12 +2,21 @@
 Claude API retry wrapper with exponential backoff.
 
 Handles transient errors like rate limits, timeouts, and connection issues.
-Supports Claude's extended thinking API for deep reasoning tasks.
+Supports Claude's extended thinking API for deep reasoning tasks
+and cache-marked prompt prefixes (Anthropic prompt caching).
+Every call is recorded as an "llm" span on the current job trace.
 """
 
 import asyncio
+import contextlib
+import time
+from typing import Optional
+
 from anthropic import RateLimitError, APITimeoutError, APIConnectionError, InternalServerError
 
+from tools.job_trace import record_llm_call
+from tools.prompt_cache import build_cached_system, record_usage
+
 
 # Models that support extended thinking
 EXTENDED_THINKING_MODELS = {
@@ -15,6 +24,21 @@ EXTENDED_THINKING_MODELS = {
     "claude-opus-4-5-20251101",
 }
 
+# Optional process-wide cap on in-flight Claude requests, shared by every job
+# in the process (None = unlimited). Backoff sleeps don't hold a slot.
+_llm_semaphore: Optional[asyncio.Semaphore] = None
+
+
+def set_llm_concurrency(limit: Optional[int]) -> None:
+    """Cap concurrent Claude requests across all jobs (None or 0 removes the cap)."""
+    global _llm_semaphore
+    _llm_semaphore = asyncio.Semaphore(limit) if limit else None
+
+
+def _llm_slot():
+    """Async context manager holding one slot of the shared LLM budget."""
+    return _llm_semaphore if _llm_semaphore is not None else contextlib.nullcontext()
+
 
 async def call_claude_with_retry(
     client,
@@ -24,7 +48,8 @@ async def call_claude_with_retry(
     system: str = None,
     thinking_budget: int = None,
     max_retries: int = 3,
-    base_delay: float = 0.5  # Reduced from 1.0 for faster recovery
+    base_delay: float = 0.5,  # Reduced from 1.0 for faster recovery
+    cache_prefix: list = None
 ):
     """
     Call Claude API with exponential backoff retry on transient errors.
@@ -43,6 +68,10 @@ async def call_claude_with_retry(
                         - 16000: Complex multi-source synthesis
         max_retries: Number of retry attempts (default 3)
         base_delay: Base delay in seconds for exponential backoff (default 1.0)
+        cache_prefix: Optional list of stable text blocks (company context,
+                      product fit, static wave instructions) sent as
+                      cache-marked system blocks ahead of `system`. Keep them
+                      byte-identical across calls so they hit the cache.
 
     Returns:
         Claude API response. When thinking_budget is set, response.content
@@ -60,6 +89,7 @@ async def call_claude_with_retry(
         model in EXTENDED_THINKING_MODELS
     )
 
+    started = time.perf_counter()
     for attempt in range(max_retries):
         try:
             kwargs = {
@@ -67,7 +97,9 @@ async def call_claude_with_retry(
                 "max_tokens": max_tokens,
                 "messages": messages
             }
-            if system:
+            if cache_prefix:
+                kwargs["system"] = build_cached_system(cache_prefix, system)
+            elif system:
                 kwargs["system"] = system
 
             # Add extended thinking parameters if requested
@@ -80,11 +112,14 @@ async def call_claude_with_retry(
 
             # If client is DualClaudeClient and thinking is enabled, force Anthropic
             # (OpenRouter doesn't support extended thinking)
-            if use_extended_thinking and hasattr(client, '_force_anthropic'):
-                response = await client._force_anthropic(**kwargs)
-            else:
-                response = await client.messages.create(**kwargs)
-
+            async with _llm_slot():
+                if use_extended_thinking and hasattr(client, '_force_anthropic'):
+                    response = await client._force_anthropic(**kwargs)
+                else:
+                    response = await client.messages.create(**kwargs)
+
+            record_usage(response)
+            record_llm_call(model, response, started, retries=attempt)
             return response
 
         except (RateLimitError, APITimeoutError, APIConnectionError, InternalServerError) as e:
@@ -93,6 +128,7 @@ async def call_claude_with_retry(
 
             if attempt == max_retries - 1:
                 print(f"[Claude Retry] All {max_retries} attempts failed. Last error: {error_type}: {str(e)[:200]}")
+                record_llm_call(model, None, started, retries=attempt, error=e)
                 raise
 
             delay = base_delay * (2 ** attempt)  # 1s, 2s, 4s
@@ -102,6 +138,105 @@ async def call_claude_with_retry(
         except Exception as e:
             # Non-retryable error (e.g., invalid request, auth error)
             print(f"[Claude Retry] Non-retryable error: {type(e).__name__}: {str(e)[:200]}")
+            record_llm_call(model, None, started, retries=attempt, error=e)
+            raise
+
+    raise last_error
+
+
+async def stream_claude_with_retry(
+    client,
+    model: str,
+    max_tokens: int,
+    messages: list,
+    on_text,
+    on_restart=None,
+    system: str = None,
+    max_retries: int = 3,
+    base_delay: float = 0.5,
+    cache_prefix: list = None
+):
+    """
+    Stream a Claude completion, passing text deltas to `on_text` as they arrive.
+
+    Same retry policy as call_claude_with_retry. When an attempt fails after
+    some text was streamed, `on_restart` is called before the retry so the
+    consumer can discard its partial buffer.
+
+    Clients without a streaming interface fall back to a single
+    call_claude_with_retry and deliver the full text in one `on_text` call.
+    So does a DualClaudeClient whose next turn is OpenRouter's
+    (client.can_stream() is False), keeping its provider split intact.
+
+    Args:
+        client: AsyncAnthropic client instance (or DualClaudeClient)
+        model: Model name
+        max_tokens: Maximum tokens in response
+        messages: List of message dicts
+        on_text: Callback receiving each text delta (str)
+        on_restart: Optional callback invoked before a retry
+        system: Optional system prompt
+        max_retries: Number of retry attempts (default 3)
+        base_delay: Base delay in seconds for exponential backoff
+        cache_prefix: Optional cache-marked prefix blocks (see call_claude_with_retry)
+
+    Returns:
+        Final Claude message (with usage), as returned by the stream
+    """
+    can_stream = getattr(client, "can_stream", None)
+    if not hasattr(client.messages, "stream") or (can_stream is not None and not can_stream()):
+        response = await call_claude_with_retry(
+            client, model=model, max_tokens=max_tokens, messages=messages,
+            system=system, max_retries=max_retries, base_delay=base_delay,
+            cache_prefix=cache_prefix
+        )
+        on_text(response.content[0].text)
+        return response
+
+    kwargs = {
+        "model": model,
+        "max_tokens": max_tokens,
+        "messages": messages
+    }
+    if cache_prefix:
+        kwargs["system"] = build_cached_system(cache_prefix, system)
+    elif system:
+        kwargs["system"] = system
+
+    last_error = None
+    started = time.perf_counter()
+    for attempt in range(max_retries):
+        streamed_any = False
+        try:
+            async with _llm_slot(), client.messages.stream(**kwargs) as stream:
+                async for text in stream.text_stream:
+                    streamed_any = True
+                    on_text(text)
+                response = await stream.get_final_message()
+
+            record_usage(response)
+            record_llm_call(model, response, started, retries=attempt, streamed=True)
+            return response
+
+        except (RateLimitError, APITimeoutError, APIConnectionError, InternalServerError) as e:
+            last_error = e
+            error_type = type(e).__name__
+
+            if attempt == max_retries - 1:
+                print(f"[Claude Retry] All {max_retries} stream attempts failed. Last error: {error_type}: {str(e)[:200]}")
+                record_llm_call(model, None, started, retries=attempt, streamed=True, error=e)
+                raise
+
+            if streamed_any and on_restart:
+                on_restart()
+
+            delay = base_delay * (2 ** attempt)
+            print(f"[Claude Retry] Stream attempt {attempt+1}/{max_retries} failed ({error_type}), retrying in {delay}s...")
+            await asyncio.sleep(delay)
+
+        except Exception as e:
+            print(f"[Claude Retry] Non-retryable stream error: {type(e).__name__}: {str(e)[:200]}")
+            record_llm_call(model, None, started, retries=attempt, streamed=True, error=e)
             raise
 
     raise last_error
@@ -0,0 +1,36 @@
+"""
+Shared-or-throwaway httpx sessions for the web tools.
+
+Tools built with a pooled client (one per warm container) borrow it for
+each request and leave it open; tools built without one open and close a
+client per request.
+"""
+from typing import Optional
+
+import httpx
+
+
+class BorrowedClient:
+    """Async context manager that yields a shared client without closing it."""
+
+    def __init__(self, client: httpx.AsyncClient):
+        self.client = client
+
+    async def __aenter__(self) -> httpx.AsyncClient:
+        return self.client
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+def client_session(client: Optional[httpx.AsyncClient], **client_kwargs):
+    """
+    Shared client (left open) or a throwaway client for this request.
+
+    Args:
+        client: Pooled client to borrow, or None
+        client_kwargs: httpx.AsyncClient arguments for the throwaway client
+    """
+    if client is not None:
+        return BorrowedClient(client)
+    return httpx.AsyncClient(**client_kwargs)
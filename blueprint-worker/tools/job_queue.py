@@ -0,0 +1,430 @@
+"""
+Job queue consumer for the blueprint_jobs table.
+
+Jobs are claimed with an atomic status transition (pending -> processing)
+that also stamps a lease (worker_id + lease_expires_at). A heartbeat keeps
+the lease alive while a job runs; leases are released if the worker crashes
+or is cancelled, and expired leases of dead workers can be reclaimed.
+
+Atomicity comes from compare-and-set updates: the UPDATE is filtered on the
+state the worker observed, so when two workers race for the same row only
+one gets it back in `result.data`.
+
+Required columns (in addition to the base schema):
+    worker_id TEXT, lease_expires_at TIMESTAMPTZ, attempts INT DEFAULT 0
+
+WorkerLease keeps at most one queue consumer running, using one row per
+consumer name in the blueprint_workers table:
+    name TEXT PRIMARY KEY, worker_id TEXT, lease_expires_at TIMESTAMPTZ
+"""
+import asyncio
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Dict, List, Optional
+
+
+TABLE = "blueprint_jobs"
+WORKER_TABLE = "blueprint_workers"
+
+
+class LeaseLost(Exception):
+    """This worker no longer holds the lease it was running under."""
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def default_worker_id() -> str:
+    """Unique id for this worker process (Modal task id or hostname)."""
+    host = os.environ.get("MODAL_TASK_ID") or socket.gethostname()
+    return f"{host}-{uuid.uuid4().hex[:6]}"
+
+
+class JobQueue:
+    """Lease-based claiming on top of a Supabase (or local stand-in) client."""
+
+    def __init__(
+        self,
+        supabase,
+        worker_id: Optional[str] = None,
+        lease_seconds: int = 600,
+        max_attempts: int = 3
+    ):
+        """
+        Args:
+            supabase: supabase-py client (or LocalSupabase for tests/local runs)
+            worker_id: Identifier written to claimed rows
+            lease_seconds: Lease length; renewed by heartbeat()
+            max_attempts: Claims per job before it is marked failed
+        """
+        self.supabase = supabase
+        self.worker_id = worker_id or default_worker_id()
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+
+    def _lease_expiry(self) -> str:
+        return (_now() + timedelta(seconds=self.lease_seconds)).isoformat()
+
+    def claim(self, limit: int) -> List[Dict]:
+        """
+        Claim up to `limit` jobs: pending ones first (oldest first), then
+        processing jobs whose lease has expired (crashed workers).
+
+        Returns:
+            The claimed job rows (status already 'processing')
+        """
+        if limit <= 0:
+            return []
+
+        now = _now().isoformat()
+        pending = (
+            self.supabase.table(TABLE).select("*")
+            .eq("status", "pending")
+            .order("created_at")
+            .limit(limit)
+            .execute()
+        ).data or []
+
+        expired = []
+        if len(pending) < limit:
+            expired = (
+                self.supabase.table(TABLE).select("*")
+                .eq("status", "processing")
+                .lt("lease_expires_at", now)
+                .order("created_at")
+                .limit(limit - len(pending))
+                .execute()
+            ).data or []
+
+        claimed = []
+        for job in pending + expired:
+            row = self._try_claim(job, now)
+            if row:
+                claimed.append(row)
+            if len(claimed) >= limit:
+                break
+        return claimed
+
+    def claim_job(self, job_id: str) -> Optional[Dict]:
+        """Claim one specific job (webhook path). Returns None if not claimable."""
+        now = _now().isoformat()
+        rows = (
+            self.supabase.table(TABLE).select("*").eq("id", job_id).limit(1).execute()
+        ).data or []
+        if not rows:
+            return None
+        job = rows[0]
+        if job.get("status") == "pending" or (
+            job.get("status") == "processing"
+            and job.get("lease_expires_at")
+            and job["lease_expires_at"] < now
+        ):
+            return self._try_claim(job, now)
+        return None
+
+    def count_claimable(self, limit: int = 100) -> int:
+        """Number of pending plus lease-expired jobs (capped at `limit`)."""
+        pending = (
+            self.supabase.table(TABLE).select("id").eq("status", "pending").limit(limit).execute()
+        ).data or []
+        expired = (
+            self.supabase.table(TABLE).select("id")
+            .eq("status", "processing")
+            .lt("lease_expires_at", _now().isoformat())
+            .limit(limit)
+            .execute()
+        ).data or []
+        return min(limit, len(pending) + len(expired))
+
+    def exists(self, job_id: str) -> bool:
+        """Whether a job row with this id exists."""
+        rows = (
+            self.supabase.table(TABLE).select("id").eq("id", job_id).limit(1).execute()
+        ).data or []
+        return bool(rows)
+
+    def _try_claim(self, job: Dict, now: str) -> Optional[Dict]:
+        """Compare-and-set transition of one observed row to processing."""
+        attempts = (job.get("attempts") or 0) + 1
+        query = self.supabase.table(TABLE)
+
+        if attempts > self.max_attempts:
+            # Poison job: stop retrying it
+            update = query.update({
+                "status": "failed",
+                "failed_at": now,
+                "error_message": f"Abandoned after {self.max_attempts} attempts (lease expired)",
+                "worker_id": None,
+                "lease_expires_at": None,
+            })
+        else:
+            update = query.update({
+                "status": "processing",
+                "started_at": now,
+                "worker_id": self.worker_id,
+                "lease_expires_at": self._lease_expiry(),
+                "attempts": attempts,
+            })
+
+        update = update.eq("id", job["id"]).eq("status", job["status"])
+        if job["status"] == "processing":
+            # Only steal a lease that is still expired
+            update = update.lt("lease_expires_at", now)
+
+        rows = update.execute().data or []
+        if not rows or attempts > self.max_attempts:
+            if rows:
+                print(f"[Queue] Job {job['id']} failed permanently after {self.max_attempts} attempts")
+            return None
+        return rows[0]
+
+    def heartbeat(self, job_id: str) -> bool:
+        """Extend this worker's lease on a job. Returns False if the lease was lost."""
+        rows = (
+            self.supabase.table(TABLE)
+            .update({"lease_expires_at": self._lease_expiry()})
+            .eq("id", job_id)
+            .eq("worker_id", self.worker_id)
+            .eq("status", "processing")
+            .execute()
+        ).data or []
+        return bool(rows)
+
+    def release(self, job_id: str) -> bool:
+        """Return a job this worker still holds to the pending state."""
+        rows = (
+            self.supabase.table(TABLE)
+            .update({"status": "pending", "worker_id": None, "lease_expires_at": None})
+            .eq("id", job_id)
+            .eq("worker_id", self.worker_id)
+            .eq("status", "processing")
+            .execute()
+        ).data or []
+        return bool(rows)
+
+
+class WorkerLease:
+    """
+    Singleton lease for a long-running consumer (e.g. drain_job_queue).
+
+    The cron checks is_held() before spawning a consumer, and the consumer
+    only drains the queue while it holds the lease, so overlapping cron
+    ticks don't start one consumer each.
+    """
+
+    def __init__(
+        self,
+        supabase,
+        name: str = "drain_job_queue",
+        worker_id: Optional[str] = None,
+        lease_seconds: int = 600
+    ):
+        self.supabase = supabase
+        self.name = name
+        self.worker_id = worker_id or default_worker_id()
+        self.lease_seconds = lease_seconds
+
+    def _row(self) -> Optional[Dict]:
+        rows = (
+            self.supabase.table(WORKER_TABLE).select("*").eq("name", self.name).limit(1).execute()
+        ).data or []
+        return rows[0] if rows else None
+
+    def is_held(self) -> bool:
+        """Whether some worker holds a live lease."""
+        row = self._row()
+        return bool(row and row.get("lease_expires_at") and row["lease_expires_at"] >= _now().isoformat())
+
+    def acquire(self) -> bool:
+        """Take the lease if it is free or expired. Returns False if another worker holds it."""
+        now = _now().isoformat()
+        values = {
+            "worker_id": self.worker_id,
+            "lease_expires_at": (_now() + timedelta(seconds=self.lease_seconds)).isoformat(),
+        }
+        if self._row() is None:
+            try:
+                self.supabase.table(WORKER_TABLE).insert({"name": self.name, **values}).execute()
+                return True
+            except Exception:
+                # Another worker inserted the row first (primary key)
+                return False
+        # Compare-and-set: only an expired (or released) lease can be taken
+        rows = (
+            self.supabase.table(WORKER_TABLE).update(values)
+            .eq("name", self.name)
+            .lt("lease_expires_at", now)
+            .execute()
+        ).data or []
+        return bool(rows)
+
+    def renew(self) -> bool:
+        """Extend the lease. Returns False if it was lost."""
+        rows = (
+            self.supabase.table(WORKER_TABLE)
+            .update({"lease_expires_at": (_now() + timedelta(seconds=self.lease_seconds)).isoformat()})
+            .eq("name", self.name)
+            .eq("worker_id", self.worker_id)
+            .execute()
+        ).data or []
+        return bool(rows)
+
+    def release(self) -> bool:
+        """Expire the lease now so the next consumer can start at once."""
+        rows = (
+            self.supabase.table(WORKER_TABLE)
+            .update({"lease_expires_at": _now().isoformat()})
+            .eq("name", self.name)
+            .eq("worker_id", self.worker_id)
+            .execute()
+        ).data or []
+        return bool(rows)
+
+    async def keep_alive(self, interval: float = 60):
+        """Renew every `interval` seconds; returns once the lease is lost."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if not self.renew():
+                    return
+            except Exception as e:
+                print(f"[Queue] Worker lease renewal failed ({type(e).__name__}: {e})")
+                return
+
+
+class QueueWorker:
+    """
+    Runs claimed jobs concurrently in one process with shared clients.
+
+    `run_job(record)` executes the pipeline and is responsible for writing
+    the final completed/failed status; the worker only manages leases. A job
+    whose lease is lost (heartbeat fails) is cancelled, since another worker
+    may already be running it.
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        run_job: Callable[[Dict], Awaitable[Dict]],
+        concurrency: int = 4,
+        heartbeat_interval: float = 60,
+        poll_interval: float = 15
+    ):
+        self.queue = queue
+        self.run_job = run_job
+        self.concurrency = concurrency
+        self.heartbeat_interval = heartbeat_interval
+        self.poll_interval = poll_interval
+        self._active: Dict[str, asyncio.Task] = {}
+        self.results: Dict[str, Dict] = {}
+        self.claiming = True
+
+    async def process(self, job: Dict) -> Dict:
+        """
+        Run one claimed job with a heartbeat; release its lease on crash.
+
+        Raises LeaseLost (after cancelling the job) if the heartbeat fails.
+        """
+        job_id = job["id"]
+        run = asyncio.create_task(self.run_job(job))
+        heartbeat = asyncio.create_task(self._heartbeat(job_id))
+        try:
+            await asyncio.wait({run, heartbeat}, return_when=asyncio.FIRST_COMPLETED)
+            if not run.done():
+                raise LeaseLost(f"Lost lease on job {job_id}")
+            result = run.result()
+        except BaseException as e:
+            # Crash, cancellation or lost lease: stop the job and hand it
+            # back for another worker (a no-op if the lease is already gone)
+            if not run.done():
+                run.cancel()
+                await asyncio.gather(run, return_exceptions=True)
+            released = self.queue.release(job_id)
+            print(f"[Queue] Job {job_id} interrupted ({type(e).__name__}), lease {'released' if released else 'already gone'}")
+            raise
+        finally:
+            heartbeat.cancel()
+        self.results[job_id] = result
+        return result
+
+    async def _heartbeat(self, job_id: str):
+        """Renew the job lease; returns once it is lost (or can't be renewed)."""
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                if not self.queue.heartbeat(job_id):
+                    print(f"[Queue] Lost lease on job {job_id}")
+                    return
+            except Exception as e:
+                print(f"[Queue] Heartbeat for job {job_id} failed ({type(e).__name__}: {e})")
+                return
+
+    def stop_claiming(self):
+        """Finish the in-flight jobs but claim no new ones."""
+        self.claiming = False
+
+    async def run(
+        self,
+        drain: bool = True,
+        max_jobs: Optional[int] = None,
+        claim_for: Optional[float] = None
+    ) -> Dict[str, Dict]:
+        """
+        Claim and run jobs until the queue is empty (drain=True) or forever.
+
+        Args:
+            drain: Stop once nothing is claimable and all jobs finished
+            max_jobs: Optional cap on jobs claimed by this run
+            claim_for: Stop claiming new jobs after this many seconds
+                       (in-flight jobs still finish)
+
+        Returns:
+            Mapping of job id -> run_job result
+        """
+        claimed_total = 0
+        loop = asyncio.get_running_loop()
+        claim_deadline = loop.time() + claim_for if claim_for is not None else None
+        try:
+            while True:
+                slots = self.concurrency - len(self._active)
+                if max_jobs is not None:
+                    slots = min(slots, max_jobs - claimed_total)
+                claiming_closed = not self.claiming or (
+                    claim_deadline is not None and loop.time() >= claim_deadline
+                )
+                if claiming_closed:
+                    slots = 0
+
+                for job in self.queue.claim(slots) if slots > 0 else []:
+                    claimed_total += 1
+                    print(f"[Queue] Claimed job {job['id']} ({job.get('company_url')}) - {len(self._active) + 1}/{self.concurrency} slots")
+                    self._active[job["id"]] = asyncio.create_task(self.process(job))
+
+                if not self._active:
+                    if drain or claiming_closed or (max_jobs is not None and claimed_total >= max_jobs):
+                        break
+                    await asyncio.sleep(self.poll_interval)
+                    continue
+
+                done, _ = await asyncio.wait(
+                    self._active.values(),
+                    timeout=self.poll_interval,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    job_id = next(jid for jid, t in self._active.items() if t is task)
+                    del self._active[job_id]
+                    if not task.cancelled() and task.exception():
+                        print(f"[Queue] Job {job_id} crashed: {type(task.exception()).__name__}: {task.exception()}")
+        finally:
+            # Worker crash/shutdown: cancel in-flight jobs (each releases its lease)
+            for task in self._active.values():
+                task.cancel()
+            if self._active:
+                await asyncio.gather(*self._active.values(), return_exceptions=True)
+                self._active.clear()
+
+        return self.results
@@ -0,0 +1,342 @@
+"""
+Structured per-job tracing: spans for waves and for every LLM/search/fetch call.
+
+A JobTrace is bound to the running job through a ContextVar (like the
+prompt-cache usage tracker), so concurrent jobs in one container never mix
+spans. Spans nest automatically: calls made while a wave span is open get
+that wave as their parent, including calls made from gathered subtasks.
+
+Traces serialize to JSON (`to_dict`) and can be aggregated across jobs:
+
+    python -m tools.job_trace traces/*.json
+"""
+import json
+import os
+import sys
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional
+
+
+# USD per million tokens: (input, output). Cache writes bill at 1.25x input,
+# cache reads at 0.1x input.
+MODEL_PRICING = {
+    "claude-opus-4-5-20251101": (5.00, 25.00),
+    "claude-sonnet-4-5-20250929": (3.00, 15.00),
+    "claude-sonnet-4-20250514": (3.00, 15.00),
+    "claude-haiku-4-5-20251001": (1.00, 5.00),
+}
+CACHE_WRITE_MULTIPLIER = 1.25
+CACHE_READ_MULTIPLIER = 0.1
+
+
+def estimate_cost(
+    model: str,
+    input_tokens: int = 0,
+    output_tokens: int = 0,
+    cache_write_tokens: int = 0,
+    cache_read_tokens: int = 0
+) -> float:
+    """Estimated USD cost of one call (0.0 for unknown models)."""
+    pricing = MODEL_PRICING.get(model)
+    if pricing is None:
+        # OpenRouter ids ("anthropic/claude-sonnet-4.5") - match on family
+        family = next((m for m in MODEL_PRICING if m.split("-")[1] in (model or "")), None)
+        pricing = MODEL_PRICING.get(family)
+    if pricing is None:
+        return 0.0
+    input_price, output_price = pricing
+    cost = (
+        input_tokens * input_price
+        + cache_write_tokens * input_price * CACHE_WRITE_MULTIPLIER
+        + cache_read_tokens * input_price * CACHE_READ_MULTIPLIER
+        + output_tokens * output_price
+    ) / 1_000_000
+    return round(cost, 6)
+
+
+def usage_tokens(usage) -> Dict:
+    """Normalize Anthropic usage objects and OpenRouter usage dicts."""
+    if usage is None:
+        return {"input_tokens": 0, "output_tokens": 0, "cache_write_tokens": 0, "cache_read_tokens": 0}
+    if isinstance(usage, dict):
+        # OpenRouter (OpenAI format): prompt_tokens includes cached tokens
+        cached = (usage.get("prompt_tokens_details") or {}).get("cached_tokens", 0) or 0
+        return {
+            "input_tokens": max(0, (usage.get("prompt_tokens", 0) or 0) - cached),
+            "output_tokens": usage.get("completion_tokens", 0) or 0,
+            "cache_write_tokens": 0,
+            "cache_read_tokens": cached,
+        }
+    return {
+        "input_tokens": getattr(usage, "input_tokens", 0) or 0,
+        "output_tokens": getattr(usage, "output_tokens", 0) or 0,
+        "cache_write_tokens": getattr(usage, "cache_creation_input_tokens", 0) or 0,
+        "cache_read_tokens": getattr(usage, "cache_read_input_tokens", 0) or 0,
+    }
+
+
+class JobTrace:
+    """Collects spans for one job and summarizes where time and money went."""
+
+    def __init__(self, job_id: Optional[str] = None, company_url: Optional[str] = None):
+        self.job_id = job_id
+        self.company_url = company_url
+        self.started_at = datetime.now(timezone.utc).isoformat()
+        self._t0 = time.perf_counter()
+        self.spans: List[Dict] = []
+        self.finished_s: Optional[float] = None
+
+    def _offset(self, at: Optional[float] = None) -> float:
+        return round((at if at is not None else time.perf_counter()) - self._t0, 3)
+
+    def begin(self, name: str, kind: str, started: Optional[float] = None, **attrs) -> Dict:
+        """Open a span and make it the parent of spans started after it."""
+        parent = _current_span.get()
+        span = {
+            "id": uuid.uuid4().hex[:12],
+            "parent_id": parent["id"] if parent else None,
+            "name": name,
+            "kind": kind,
+            "start_s": self._offset(started),
+            "duration_s": None,
+            "status": "ok",
+            "attrs": dict(attrs),
+        }
+        span["_token"] = _current_span.set(span)
+        self.spans.append(span)
+        return span
+
+    def end(self, span: Dict, status: str = "ok", **attrs) -> Dict:
+        """Close a span opened with begin()."""
+        span["duration_s"] = round(self._offset() - span["start_s"], 3)
+        span["status"] = status
+        span["attrs"].update(attrs)
+        token = span.pop("_token", None)
+        if token is not None:
+            try:
+                _current_span.reset(token)
+            except ValueError:
+                # Closed from a different context (e.g. another task)
+                pass
+        return span
+
+    @contextmanager
+    def span(self, name: str, kind: str, **attrs):
+        """Context manager form of begin()/end(); records errors on the span."""
+        span = self.begin(name, kind, **attrs)
+        try:
+            yield span
+        except BaseException as e:
+            self.end(span, status="error", error=f"{type(e).__name__}: {str(e)[:200]}")
+            raise
+        self.end(span, status=span["status"])
+
+    def record(self, name: str, kind: str, started: float, status: str = "ok", **attrs) -> Dict:
+        """Add an already-finished span that started at perf_counter() `started`."""
+        parent = _current_span.get()
+        span = {
+            "id": uuid.uuid4().hex[:12],
+            "parent_id": parent["id"] if parent else None,
+            "name": name,
+            "kind": kind,
+            "start_s": self._offset(started),
+            "duration_s": round(time.perf_counter() - started, 3),
+            "status": status,
+            "attrs": attrs,
+        }
+        self.spans.append(span)
+        return span
+
+    def finish(self) -> None:
+        """Stop the job clock; spans still open (job failed mid-wave) are closed as incomplete."""
+        for span in self.spans:
+            if span["duration_s"] is None:
+                self.end(span, status="incomplete")
+        self.finished_s = self._offset()
+
+    def summary(self) -> Dict:
+        """Per-wave durations and per-kind/per-model call, token and cost totals."""
+        waves = {}
+        for span in self.spans:
+            if span["kind"] == "wave":
+                waves[span["name"]] = waves.get(span["name"], 0) + (span["duration_s"] or 0)
+
+        calls: Dict[str, Dict] = {}
+        models: Dict[str, Dict] = {}
+        for span in self.spans:
+            if span["kind"] == "wave":
+                continue
+            kind = calls.setdefault(span["kind"], {"calls": 0, "errors": 0, "retries": 0, "cached": 0, "latency_s": 0.0})
+            kind["calls"] += 1
+            kind["errors"] += span["status"] != "ok"
+            kind["retries"] += span["attrs"].get("retries", 0)
+            kind["cached"] += bool(span["attrs"].get("cached"))
+            kind["latency_s"] = round(kind["latency_s"] + (span["duration_s"] or 0), 3)
+
+            if span["kind"] == "llm":
+                model = models.setdefault(span["attrs"].get("model", "unknown"), {
+                    "calls": 0, "input_tokens": 0, "output_tokens": 0,
+                    "cache_write_tokens": 0, "cache_read_tokens": 0, "cost_usd": 0.0
+                })
+                model["calls"] += 1
+                for key in ("input_tokens", "output_tokens", "cache_write_tokens", "cache_read_tokens"):
+                    model[key] += span["attrs"].get(key, 0)
+                model["cost_usd"] = round(model["cost_usd"] + span["attrs"].get("cost_usd", 0.0), 6)
+
+        return {
+            "total_s": self.finished_s if self.finished_s is not None else self._offset(),
+            "waves": {name: round(s, 3) for name, s in waves.items()},
+            "calls": calls,
+            "models": models,
+            "cost_usd": round(sum(m["cost_usd"] for m in models.values()), 4),
+        }
+
+    def to_dict(self) -> Dict:
+        """JSON-serializable trace (metadata, summary and all spans)."""
+        return {
+            "job_id": self.job_id,
+            "company_url": self.company_url,
+            "started_at": self.started_at,
+            "summary": self.summary(),
+            "spans": [{k: v for k, v in span.items() if not k.startswith("_")} for span in self.spans],
+        }
+
+
+# Trace and innermost open span for the current async context
+_current_trace: ContextVar[Optional[JobTrace]] = ContextVar("blueprint_job_trace", default=None)
+_current_span: ContextVar[Optional[Dict]] = ContextVar("blueprint_trace_span", default=None)
+
+
+def start_trace(job_id: Optional[str] = None, company_url: Optional[str] = None) -> JobTrace:
+    """Start tracing the current job and return its trace."""
+    trace = JobTrace(job_id, company_url)
+    _current_trace.set(trace)
+    _current_span.set(None)
+    return trace
+
+
+def current_trace() -> Optional[JobTrace]:
+    return _current_trace.get()
+
+
+@contextmanager
+def trace_span(name: str, kind: str, **attrs):
+    """Span on the current job's trace; yields a throwaway dict when not tracing."""
+    trace = _current_trace.get()
+    if trace is None:
+        yield {"attrs": dict(attrs), "status": "ok"}
+        return
+    with trace.span(name, kind, **attrs) as span:
+        yield span
+
+
+def annotate(**attrs) -> None:
+    """Set attributes on the innermost open span, if any."""
+    span = _current_span.get()
+    if span is not None:
+        span["attrs"].update(attrs)
+
+
+def record_llm_call(
+    model: str,
+    response,
+    started: float,
+    retries: int = 0,
+    streamed: bool = False,
+    error: Optional[Exception] = None
+) -> None:
+    """Record one Claude call (after retries) on the current job's trace."""
+    trace = _current_trace.get()
+    if trace is None:
+        return
+    usage = getattr(response, "usage", None)
+    tokens = usage_tokens(usage)
+    attrs = {
+        "model": model,
+        # OpenRouter responses carry a plain usage dict
+        "provider": "openrouter" if isinstance(usage, dict) else "anthropic",
+        "retries": retries,
+        "streamed": streamed,
+        **tokens,
+        "cost_usd": estimate_cost(model, **tokens),
+    }
+    if error is not None:
+        attrs["error"] = f"{type(error).__name__}: {str(error)[:200]}"
+    trace.record("claude", "llm", started, status="error" if error is not None else "ok", **attrs)
+
+
+def write_trace(trace: Dict, directory: str) -> str:
+    """Write a trace dict to `<directory>/<job_id>.json` and return the path."""
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{trace.get('job_id') or uuid.uuid4().hex}.json")
+    with open(path, "w") as f:
+        json.dump(trace, f, indent=2)
+    return path
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return round(ordered[index], 3)
+
+
+def aggregate_traces(traces: Iterable[Dict]) -> Dict:
+    """
+    Combine trace dicts from many jobs.
+
+    Returns job count, total/p50/p95 job duration and cost, per-wave
+    p50/p95/max duration, per-kind call totals and per-model token/cost totals.
+    """
+    traces = list(traces)
+    durations = [t["summary"]["total_s"] for t in traces]
+    costs = [t["summary"]["cost_usd"] for t in traces]
+
+    wave_durations: Dict[str, List[float]] = {}
+    calls: Dict[str, Dict] = {}
+    models: Dict[str, Dict] = {}
+    for t in traces:
+        summary = t["summary"]
+        for name, seconds in summary["waves"].items():
+            wave_durations.setdefault(name, []).append(seconds)
+        for kind, stats in summary["calls"].items():
+            total = calls.setdefault(kind, {})
+            for key, value in stats.items():
+                total[key] = round(total.get(key, 0) + value, 3)
+        for model, stats in summary["models"].items():
+            total = models.setdefault(model, {})
+            for key, value in stats.items():
+                total[key] = round(total.get(key, 0) + value, 6)
+
+    return {
+        "jobs": len(traces),
+        "duration_s": {"p50": _percentile(durations, 50), "p95": _percentile(durations, 95), "total": round(sum(durations), 3)},
+        "cost_usd": {
+            "total": round(sum(costs), 4),
+            "mean": round(sum(costs) / len(costs), 4) if costs else 0.0,
+            "p95": _percentile(costs, 95),
+        },
+        "waves": {
+            name: {"p50": _percentile(values, 50), "p95": _percentile(values, 95), "max": round(max(values), 3)}
+            for name, values in wave_durations.items()
+        },
+        "calls": calls,
+        "models": models,
+    }
+
+
+if __name__ == "__main__":
+    paths = sys.argv[1:]
+    if not paths:
+        print("Usage: python -m tools.job_trace TRACE.json [TRACE.json ...]")
+        sys.exit(1)
+    loaded = []
+    for path in paths:
+        with open(path) as f:
+            loaded.append(json.load(f))
+    print(json.dumps(aggregate_traces(loaded), indent=2))
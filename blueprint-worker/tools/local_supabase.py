@@ -0,0 +1,123 @@
+"""
+LocalSupabase - in-memory stand-in for the Supabase client.
+
+Implements the subset of the supabase-py query builder the worker uses
+(select/insert/update + eq/lt/order/limit + execute) so the job queue and
+pipeline can run locally and in tests without a database. Filters on an
+UPDATE are evaluated against the current row, which gives the same
+compare-and-set semantics as a filtered UPDATE in Postgres.
+"""
+import copy
+import threading
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+
+class LocalResult:
+    """Mimics the APIResponse returned by supabase-py."""
+
+    def __init__(self, data: List[Dict]):
+        self.data = data
+
+
+class LocalQuery:
+    """Chainable query over one in-memory table."""
+
+    def __init__(self, db: "LocalSupabase", table: str):
+        self._db = db
+        self._table = table
+        self._action = "select"
+        self._values: Any = None
+        self._columns = "*"
+        self._filters = []
+        self._order: Optional[tuple] = None
+        self._limit: Optional[int] = None
+
+    def select(self, columns: str = "*"):
+        self._action = "select"
+        self._columns = columns
+        return self
+
+    def insert(self, values):
+        self._action = "insert"
+        self._values = values
+        return self
+
+    def update(self, values: Dict):
+        self._action = "update"
+        self._values = values
+        return self
+
+    def eq(self, column: str, value):
+        self._filters.append(lambda row: row.get(column) == value)
+        return self
+
+    def lt(self, column: str, value):
+        self._filters.append(lambda row: row.get(column) is not None and row[column] < value)
+        return self
+
+    def order(self, column: str, desc: bool = False):
+        self._order = (column, desc)
+        return self
+
+    def limit(self, count: int):
+        self._limit = count
+        return self
+
+    def _matches(self, row: Dict) -> bool:
+        return all(f(row) for f in self._filters)
+
+    def _project(self, row: Dict) -> Dict:
+        if self._columns == "*":
+            return copy.deepcopy(row)
+        cols = [c.strip() for c in self._columns.split(",")]
+        return {c: copy.deepcopy(row.get(c)) for c in cols}
+
+    def execute(self) -> LocalResult:
+        with self._db.lock:
+            rows = self._db.tables.setdefault(self._table, [])
+
+            if self._action == "insert":
+                new_rows = self._values if isinstance(self._values, list) else [self._values]
+                inserted = []
+                for values in new_rows:
+                    row = {
+                        "id": str(uuid.uuid4()),
+                        "status": "pending",
+                        "created_at": datetime.now(timezone.utc).isoformat(),
+                        **copy.deepcopy(values),
+                    }
+                    rows.append(row)
+                    inserted.append(copy.deepcopy(row))
+                return LocalResult(inserted)
+
+            matched = [row for row in rows if self._matches(row)]
+
+            if self._action == "update":
+                for row in matched:
+                    row.update(copy.deepcopy(self._values))
+                return LocalResult([copy.deepcopy(row) for row in matched])
+
+            if self._order:
+                column, desc = self._order
+                matched.sort(key=lambda r: (r.get(column) is None, r.get(column) or ""), reverse=desc)
+            if self._limit is not None:
+                matched = matched[:self._limit]
+            return LocalResult([self._project(row) for row in matched])
+
+
+class LocalSupabase:
+    """In-memory client exposing `table(name)` like supabase-py."""
+
+    def __init__(self, tables: Optional[Dict[str, List[Dict]]] = None):
+        self.tables: Dict[str, List[Dict]] = copy.deepcopy(tables) if tables else {}
+        self.lock = threading.Lock()
+
+    def table(self, name: str) -> LocalQuery:
+        return LocalQuery(self, name)
+
+    def rows(self, name: str) -> List[Dict]:
+        """Snapshot of a table's rows (for assertions and local inspection)."""
+        with self.lock:
+            return copy.deepcopy(self.tables.get(name, []))
@@ -147,6 +147,15 @@ class DualClaudeMessages:
             **kwargs
         )
 
+    def stream(self, **kwargs):
+        """
+        Stream a message via Anthropic (OpenRouter streaming is not wired up).
+
+        Callers check client.can_stream() first, so OpenRouter's turns in
+        the round-robin are made as regular calls instead.
+        """
+        return self._client._stream_anthropic(**kwargs)
+
 
 class DualClaudeClient:
     """
@@ -268,6 +277,22 @@ class DualClaudeClient:
 
         return await self.anthropic.messages.create(**api_kwargs)
 
+    def can_stream(self) -> bool:
+        """Whether the next call goes to Anthropic, the only backend that streams."""
+        return not (self.openrouter and self._use_openrouter)
+
+    def _stream_anthropic(self, **kwargs):
+        """
+        Open an Anthropic message stream (bypasses OpenRouter).
+
+        Returns the SDK's async stream manager; use with `async with`.
+        """
+        # A streamed call takes Anthropic's turn in the round-robin
+        self._use_openrouter = bool(self.openrouter)
+        self._call_count += 1
+        print(f"[DualClient] Streaming via Anthropic (call #{self._call_count})")
+        return self.anthropic.messages.stream(**kwargs)
+
     async def close(self):
         """Close clients."""
         if self.openrouter:
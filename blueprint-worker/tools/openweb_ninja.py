@@ -7,7 +7,10 @@ Authentication: x-api-key header with ak_* format key
 """
 import httpx
 import asyncio
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+from .job_trace import annotate, trace_span
+from .http_session import client_session
 
 
 class OpenWebNinjaSearch:
@@ -16,16 +19,18 @@ class OpenWebNinjaSearch:
     # Native API endpoint (search-light for fast lightweight searches)
     BASE_URL = "https://api.openwebninja.com/realtime-web-search/search-light"
 
-    def __init__(self, api_key: str, timeout: int = 30):
+    def __init__(self, api_key: str, timeout: int = 30, client: Optional[httpx.AsyncClient] = None):
         """
         Initialize OpenWeb Ninja search client.
 
         Args:
             api_key: Native OpenWeb Ninja API key (ak_* format)
             timeout: Request timeout in seconds
+            client: Optional shared (pooled) httpx client
         """
         self.api_key = api_key
         self.timeout = timeout
+        self.client = client
 
     async def search(
         self,
@@ -36,6 +41,23 @@ class OpenWebNinjaSearch:
         """
         Perform a web search using OpenWeb Ninja native API.
 
+        See _search for arguments and the result format.
+        """
+        with trace_span("openweb_ninja", "search", provider="openweb_ninja", query=query) as span:
+            result = await self._search(query, num_results, region)
+            if not result.get("success"):
+                span["status"] = "error"
+            return result
+
+    async def _search(
+        self,
+        query: str,
+        num_results: int = 10,
+        region: str = "us-en"
+    ) -> Dict:
+        """
+        Perform a web search using OpenWeb Ninja native API.
+
         Args:
             query: Search query string
             num_results: Number of results to return (max 50)
@@ -58,7 +80,7 @@ class OpenWebNinjaSearch:
             }
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with client_session(self.client, timeout=self.timeout) as client:
                 response = await client.get(
                     self.BASE_URL,
                     headers={
@@ -67,7 +89,8 @@ class OpenWebNinjaSearch:
                     params={
                         "q": query,
                         "limit": min(num_results, 50)
-                    }
+                    },
+                    timeout=self.timeout
                 )
 
                 if response.status_code == 401:
@@ -156,21 +179,31 @@ class RapidAPIOpenWebNinjaSearch:
 
     BASE_URL = "https://real-time-web-search.p.rapidapi.com/search"
 
-    def __init__(self, api_key: str, timeout: int = 30):
+    def __init__(self, api_key: str, timeout: int = 30, client: Optional[httpx.AsyncClient] = None):
         self.api_key = api_key
         self.timeout = timeout
+        self.client = client
 
     async def search(self, query: str, num_results: int = 10, region: str = "us-en") -> Dict:
         """Perform search via RapidAPI."""
+        with trace_span("openweb_ninja_rapidapi", "search", provider="openweb_ninja_rapidapi", query=query) as span:
+            result = await self._search(query, num_results)
+            if not result.get("success"):
+                span["status"] = "error"
+            return result
+
+    async def _search(self, query: str, num_results: int = 10) -> Dict:
+        """Run a RapidAPI search (untraced)."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with client_session(self.client, timeout=self.timeout) as client:
                 response = await client.get(
                     self.BASE_URL,
                     headers={
                         "X-RapidAPI-Key": self.api_key,
                         "X-RapidAPI-Host": "real-time-web-search.p.rapidapi.com"
                     },
-                    params={"q": query, "limit": min(num_results, 50)}
+                    params={"q": query, "limit": min(num_results, 50)},
+                    timeout=self.timeout
                 )
 
                 if response.status_code != 200:
@@ -200,14 +233,24 @@ class DualProviderSearch:
     Merges results for better coverage and redundancy.
     """
 
-    def __init__(self, serper_key: str, ninja_key: str, timeout: int = 30, use_native: bool = True):
+    def __init__(
+        self,
+        serper_key: str,
+        ninja_key: str,
+        timeout: int = 30,
+        use_native: bool = True,
+        client: Optional[httpx.AsyncClient] = None,
+        cache=None
+    ):
         from .web_search import WebSearch
-        self.serper = WebSearch(serper_key, timeout)
+        self.serper = WebSearch(serper_key, timeout, client=client)
         # Use native OpenWeb Ninja API if use_native=True, otherwise use RapidAPI
         if use_native:
-            self.ninja = OpenWebNinjaSearch(ninja_key, timeout)
+            self.ninja = OpenWebNinjaSearch(ninja_key, timeout, client=client)
         else:
-            self.ninja = RapidAPIOpenWebNinjaSearch(ninja_key, timeout)
+            self.ninja = RapidAPIOpenWebNinjaSearch(ninja_key, timeout, client=client)
+        # Merged results are cached (not the per-provider ones)
+        self.cache = cache
 
     async def search(self, query: str, num_results: int = 10) -> Dict:
         """
@@ -215,6 +258,18 @@ class DualProviderSearch:
 
         Returns combined results with source attribution.
         """
+        # Provider calls are traced as child "search" spans of this group span
+        with trace_span("dual_search", "search_group", query=query, cached=self.cache is not None):
+            if self.cache is not None:
+                return await self.cache.get_or_fetch(
+                    ("dual", query, num_results),
+                    lambda: self._search(query, num_results)
+                )
+            return await self._search(query, num_results)
+
+    async def _search(self, query: str, num_results: int) -> Dict:
+        """Query both providers and merge (uncached)."""
+        annotate(cached=False)
         serper_result, ninja_result = await asyncio.gather(
             self.serper.search(query, num_results),
             self.ninja.search(query, num_results)
@@ -0,0 +1,138 @@
+"""
+Prompt prefix caching for the shared company context.
+
+Wave 0.5, Synthesis, Hard Gates and Wave 3 all resend the same company
+context. These helpers render it as a stable, cache-marked system prefix
+(Anthropic prompt caching) so repeated and parallel calls reuse it, and
+track cached vs uncached input tokens per job.
+"""
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+
+from tools.job_trace import usage_tokens
+
+
+# Ephemeral (5 min) cache entries, refreshed on every hit
+CACHE_CONTROL = {"type": "ephemeral"}
+
+# Anthropic allows at most 4 cache breakpoints per request
+MAX_CACHE_BREAKPOINTS = 4
+
+
+def _join(values) -> str:
+    """Render a list (or scalar) field as a comma-separated string."""
+    if isinstance(values, (list, tuple)):
+        return ", ".join(str(v) for v in values if v)
+    return str(values or "")
+
+
+def company_context_block(company_context: Dict) -> str:
+    """
+    Render Wave 1 output as the shared company-context block.
+
+    Field order and formatting are fixed so every wave produces a
+    byte-identical prefix for the same job (required for cache hits).
+    """
+    return f"""=== COMPANY CONTEXT ===
+Company: {company_context.get('company_name', 'Unknown')}
+Website: {company_context.get('company_url', '')}
+Offering: {company_context.get('offering', 'Unknown')}
+Value Prop: {company_context.get('value_prop', 'Unknown')}
+Differentiators: {_join(company_context.get('differentiators', []))}
+Industries Served: {_join(company_context.get('industries_served', []))}
+Product Category: {company_context.get('product_category', '') or 'General'}
+ICP: {company_context.get('icp', 'Unknown')}
+Target Persona: {company_context.get('persona_title', 'Unknown')}
+Persona Responsibilities: {company_context.get('persona', '')}
+Persona KPIs: {_join(company_context.get('persona_kpis', []))}
+Persona Blind Spots: {company_context.get('persona_blind_spots', '')}
+=== END COMPANY CONTEXT ==="""
+
+
+def product_fit_block(product_fit: Dict) -> str:
+    """Render Wave 0.5 output as the shared product-fit block."""
+    return f"""=== PRODUCT FIT ANALYSIS ===
+Core Problem Solved: {product_fit.get('core_problem', 'Unknown')}
+Product Type: {product_fit.get('product_type', 'Unknown')}
+Urgency Triggers: {_join(product_fit.get('urgency_triggers', []))}
+Target Personas: {_join(product_fit.get('target_personas', []))}
+Valid Pain Domains: {_join(product_fit.get('valid_domains', []))}
+Invalid Pain Domains: {_join(product_fit.get('invalid_domains', []))}
+Product Fit Question: {product_fit.get('product_fit_question', '')}
+=== END PRODUCT FIT ANALYSIS ==="""
+
+
+def build_cached_system(cache_prefix: List[str], system: Optional[str] = None) -> List[Dict]:
+    """
+    Build a system prompt whose leading blocks are cache breakpoints.
+
+    Each prefix entry becomes its own cache-marked text block, so a call that
+    shares only the first N blocks with an earlier call still hits the cache
+    for those N. A plain `system` string is appended uncached.
+    """
+    blocks = [b for b in cache_prefix if b]
+    if len(blocks) > MAX_CACHE_BREAKPOINTS:
+        raise ValueError(f"At most {MAX_CACHE_BREAKPOINTS} cache prefix blocks supported, got {len(blocks)}")
+
+    system_blocks = [
+        {"type": "text", "text": block, "cache_control": CACHE_CONTROL}
+        for block in blocks
+    ]
+    if system:
+        system_blocks.append({"type": "text", "text": system})
+    return system_blocks
+
+
+class CacheUsage:
+    """Per-job accumulator of cached vs uncached input tokens."""
+
+    def __init__(self):
+        self.calls = 0
+        self.input_tokens = 0          # Uncached input tokens
+        self.cache_write_tokens = 0    # Tokens written to the cache
+        self.cache_read_tokens = 0     # Tokens served from the cache
+        self.output_tokens = 0
+
+    def record(self, usage) -> None:
+        """Add one response's usage (Anthropic object or OpenRouter dict)."""
+        if usage is None:
+            return
+        self.calls += 1
+
+        # Same parsing as the job trace, so cache and trace token counts agree
+        tokens = usage_tokens(usage)
+        self.input_tokens += tokens["input_tokens"]
+        self.cache_write_tokens += tokens["cache_write_tokens"]
+        self.cache_read_tokens += tokens["cache_read_tokens"]
+        self.output_tokens += tokens["output_tokens"]
+
+    def summary(self) -> Dict:
+        """Return totals plus the share of input tokens served from cache."""
+        total_input = self.input_tokens + self.cache_write_tokens + self.cache_read_tokens
+        return {
+            "calls": self.calls,
+            "input_tokens_uncached": self.input_tokens,
+            "cache_write_tokens": self.cache_write_tokens,
+            "cache_read_tokens": self.cache_read_tokens,
+            "output_tokens": self.output_tokens,
+            "total_input_tokens": total_input,
+            "cache_hit_rate": round(self.cache_read_tokens / total_input, 3) if total_input else 0.0,
+        }
+
+
+# Tracker for the job running in the current async context (None = not tracking)
+_current_usage: ContextVar[Optional[CacheUsage]] = ContextVar("blueprint_cache_usage", default=None)
+
+
+def track_cache_usage() -> CacheUsage:
+    """Start tracking token usage for the current job and return the tracker."""
+    usage = CacheUsage()
+    _current_usage.set(usage)
+    return usage
+
+
+def record_usage(response) -> None:
+    """Record a Claude response's usage on the current job's tracker, if any."""
+    tracker = _current_usage.get()
+    if tracker is not None:
+        tracker.record(getattr(response, "usage", None))
@@ -0,0 +1,113 @@
+"""
+ResearchCache - in-memory TTL cache for web fetch/search results.
+
+Shared by all jobs running in one warm container, so concurrent jobs that
+research the same URL or query reuse one result instead of paying for it
+again. Concurrent requests for the same key share a single in-flight call.
+"""
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class _OwnerCancelled(Exception):
+    """Set on an in-flight fetch whose owner was cancelled; waiters retry."""
+
+
+class ResearchCache:
+    """Async TTL/LRU cache with in-flight request de-duplication."""
+
+    def __init__(self, ttl_seconds: float = 3600, max_entries: int = 5000):
+        """
+        Args:
+            ttl_seconds: How long a successful result stays valid
+            max_entries: Maximum cached results (least recently used evicted)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def get_or_fetch(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[Any]],
+        cacheable: Callable[[Any], bool] = lambda result: bool(result.get("success"))
+    ) -> Any:
+        """
+        Return the cached result for `key`, or run `fetch()` and cache it.
+
+        Args:
+            key: Cache key (e.g. ("fetch", url))
+            fetch: Zero-arg coroutine factory producing the result
+            cacheable: Predicate deciding whether a result is stored
+                       (failed fetches/searches are not cached by default)
+        """
+        while True:
+            entry = self._entries.get(key)
+            if entry is not None:
+                stored_at, result = entry
+                if time.monotonic() - stored_at < self.ttl_seconds:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return result
+                del self._entries[key]
+
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                break
+            try:
+                result = await asyncio.shield(inflight)
+            except _OwnerCancelled:
+                # The job running the fetch was cancelled; the next waiter
+                # through the loop becomes the owner and fetches again
+                continue
+            self.hits += 1
+            return result
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await fetch()
+        except asyncio.CancelledError:
+            # Don't cancel the waiters (they belong to other jobs)
+            future.set_exception(_OwnerCancelled())
+            future.exception()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited failure doesn't log a warning
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+        future.set_result(result)
+        if cacheable(result):
+            self._store(key, result)
+        return result
+
+    def _store(self, key: Hashable, result: Any):
+        self._entries[key] = (time.monotonic(), result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> Dict:
+        """Return hit/miss counters and current size."""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+        }
+
+    def clear(self):
+        """Drop all cached results."""
+        self._entries.clear()
+
@@ -8,13 +8,32 @@ from typing import Dict, List, Optional
 from html import unescape
 import re
 
+from .http_session import client_session
+from .job_trace import annotate, trace_span
+
 
 class WebFetch:
     """Async HTTP client for fetching web pages."""
 
-    def __init__(self, timeout: int = 15, max_retries: int = 2):  # Reduced for faster fail-fast
+    def __init__(
+        self,
+        timeout: int = 15,  # Reduced for faster fail-fast
+        max_retries: int = 2,
+        client: Optional[httpx.AsyncClient] = None,
+        cache=None
+    ):
+        """
+        Args:
+            timeout: Request timeout in seconds
+            max_retries: Attempts per URL
+            client: Optional shared (pooled) httpx client; a new client is
+                    created per request when omitted
+            cache: Optional ResearchCache shared across jobs
+        """
         self.timeout = timeout
         self.max_retries = max_retries
+        self.client = client
+        self.cache = cache
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
@@ -36,14 +55,31 @@ class WebFetch:
                 "error": str | None  # Error message if failed
             }
         """
+        with trace_span("fetch", "fetch", url=url, cached=self.cache is not None) as span:
+            if self.cache is not None:
+                result = await self.cache.get_or_fetch(("fetch", url), lambda: self._fetch(url))
+            else:
+                result = await self._fetch(url)
+            span["attrs"].update(success=result.get("success"), http_status=result.get("status"))
+            if not result.get("success"):
+                span["status"] = "error"
+            return result
+
+    async def _fetch(self, url: str) -> Dict:
+        """Fetch a URL with retries (uncached)."""
+        annotate(cached=False)
         for attempt in range(self.max_retries):
+            annotate(retries=attempt)
             try:
-                async with httpx.AsyncClient(
-                    timeout=self.timeout,
-                    follow_redirects=True,
-                    headers=self.headers
+                async with client_session(
+                    self.client, timeout=self.timeout, follow_redirects=True, headers=self.headers
                 ) as client:
-                    response = await client.get(url)
+                    response = await client.get(
+                        url,
+                        headers=self.headers,
+                        timeout=self.timeout,
+                        follow_redirects=True
+                    )
 
                     content = response.text
                     text = self._extract_text(content)
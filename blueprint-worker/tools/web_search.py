@@ -6,15 +6,27 @@ import httpx
 import asyncio
 from typing import Dict, List, Optional
 
+from .job_trace import annotate, trace_span
+from .http_session import client_session
+
 
 class WebSearch:
     """Async search client using Serper API."""
 
     BASE_URL = "https://google.serper.dev/search"
 
-    def __init__(self, api_key: str, timeout: int = 30):
+    def __init__(self, api_key: str, timeout: int = 30, client: Optional[httpx.AsyncClient] = None, cache=None):
+        """
+        Args:
+            api_key: Serper API key
+            timeout: Request timeout in seconds
+            client: Optional shared (pooled) httpx client
+            cache: Optional ResearchCache shared across jobs
+        """
         self.api_key = api_key
         self.timeout = timeout
+        self.client = client
+        self.cache = cache
 
     async def search(
         self,
@@ -47,8 +59,23 @@ class WebSearch:
                 "error": str | None
             }
         """
+        with trace_span("serper", "search", provider="serper", query=query, cached=self.cache is not None) as span:
+            if self.cache is not None:
+                result = await self.cache.get_or_fetch(
+                    ("serper", query, num_results),
+                    lambda: self._search(query, num_results)
+                )
+            else:
+                result = await self._search(query, num_results)
+            if not result.get("success"):
+                span["status"] = "error"
+            return result
+
+    async def _search(self, query: str, num_results: int) -> Dict:
+        """Run a Serper search (uncached)."""
+        annotate(cached=False)
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with client_session(self.client, timeout=self.timeout) as client:
                 response = await client.post(
                     self.BASE_URL,
                     headers={
@@ -60,7 +87,8 @@ class WebSearch:
                         "num": num_results,
                         "gl": "us",
                         "hl": "en"
-                    }
+                    },
+                    timeout=self.timeout
                 )
 
                 if response.status_code != 200:
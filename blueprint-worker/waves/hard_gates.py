@@ -15,6 +15,7 @@ import re
 import asyncio
 
 from tools.claude_retry import call_claude_with_retry
+from tools.prompt_cache import company_context_block, product_fit_block
 
 
 # Product type to pain domain mapping for fast Gate 5 pre-check
@@ -142,17 +143,10 @@ def pre_check_domain_fit(
 class HardGates:
     """Hard Gates: Validate segments against 5 mandatory quality gates."""
 
-    VALIDATION_PROMPT = """Validate this pain segment against 5 mandatory gates.
-
-SEGMENT: {segment_name}
-DESCRIPTION: {segment_description}
-DATA SOURCES: {data_sources}
-FIELDS: {fields}
-
-PRODUCT CONTEXT:
-Core Problem: {core_problem}
-Valid Pain Domains: {valid_domains}
-Invalid Pain Domains: {invalid_domains}
+    # Static gate rules - sent as the last cached prefix block so every
+    # parallel validation call shares it. Segment details go in the user turn.
+    VALIDATION_RULES = """You validate pain segments against 5 mandatory gates.
+Use the PRODUCT FIT ANALYSIS above for the product context.
 
 VALIDATE EACH GATE:
 
@@ -216,6 +210,13 @@ GATE_5: PASS/FAIL
 VERDICT: PROCEED / DESTROY / REVISE_ONCE
 CAN_REVISE: YES/NO (only YES if failed Gate 3 or 4 only)"""
 
+    VALIDATION_PROMPT = """Validate this pain segment against the 5 mandatory gates.
+
+SEGMENT: {segment_name}
+DESCRIPTION: {segment_description}
+DATA SOURCES: {data_sources}
+FIELDS: {fields}"""
+
     def __init__(self, claude_client):
         self.claude = claude_client
         self._product_type = None  # Cached product type for pre-check
@@ -276,7 +277,7 @@ CAN_REVISE: YES/NO (only YES if failed Gate 3 or 4 only)"""
 
         # Phase 1: Validate remaining segments in parallel
         validation_tasks = [
-            self._validate_segment(segment, product_fit)
+            self._validate_segment(segment, product_fit, company_context)
             for segment in pre_checked_segments
         ]
         results = await asyncio.gather(*validation_tasks, return_exceptions=True)
@@ -300,7 +301,7 @@ CAN_REVISE: YES/NO (only YES if failed Gate 3 or 4 only)"""
         # Phase 3: Process all revisions in parallel
         if needs_revision:
             revision_tasks = [
-                self._revise_segment(segment, result, product_fit)
+                self._revise_segment(segment, result, product_fit, company_context)
                 for segment, result in needs_revision
             ]
             revised_results = await asyncio.gather(*revision_tasks, return_exceptions=True)
@@ -311,7 +312,19 @@ CAN_REVISE: YES/NO (only YES if failed Gate 3 or 4 only)"""
 
         return validated
 
-    async def _validate_segment(self, segment: Dict, product_fit: Dict) -> Dict:
+    def _cache_prefix(self, product_fit: Dict, company_context: Optional[Dict]) -> List[str]:
+        """Shared prefix blocks: company context (if known) and product fit."""
+        prefix = [product_fit_block(product_fit)]
+        if company_context:
+            prefix.insert(0, company_context_block(company_context))
+        return prefix
+
+    async def _validate_segment(
+        self,
+        segment: Dict,
+        product_fit: Dict,
+        company_context: Optional[Dict] = None
+    ) -> Dict:
         """Validate a single segment against all 5 gates."""
         # V5: Add pre-validation check for obvious product mismatches
         pre_check_fail = self._pre_validate_gate5(segment, product_fit)
@@ -334,17 +347,15 @@ CAN_REVISE: YES/NO (only YES if failed Gate 3 or 4 only)"""
             segment_name=segment.get("name", "Unknown"),
             segment_description=segment.get("description", ""),
             data_sources=", ".join(segment.get("data_sources", [])),
-            fields=", ".join(segment.get("fields", [])),
-            core_problem=product_fit.get("core_problem", "Unknown"),
-            valid_domains=", ".join(product_fit.get("valid_domains", [])),
-            invalid_domains=", ".join(product_fit.get("invalid_domains", []))
+            fields=", ".join(segment.get("fields", []))
         )
 
         response = await call_claude_with_retry(
             self.claude,
             model="claude-sonnet-4-5-20250929",  # Use Sonnet 4.5 for validation (faster)
             max_tokens=2048,
-            messages=[{"role": "user", "content": prompt}]
+            messages=[{"role": "user", "content": prompt}],
+            cache_prefix=self._cache_prefix(product_fit, company_context) + [self.VALIDATION_RULES]
         )
 
         return self._parse_validation(response.content[0].text)
@@ -399,7 +410,13 @@ CAN_REVISE: YES/NO (only YES if failed Gate 3 or 4 only)"""
 
         return result
 
-    async def _revise_segment(self, segment: Dict, validation: Dict, product_fit: Dict) -> Dict:
+    async def _revise_segment(
+        self,
+        segment: Dict,
+        validation: Dict,
+        product_fit: Dict,
+        company_context: Optional[Dict] = None
+    ) -> Dict:
         """Attempt to revise a segment that failed Gate 3 or 4 only."""
         failed_gates = []
         if not validation["gates"]["gate_3"]["passed"]:
@@ -407,7 +424,7 @@ CAN_REVISE: YES/NO (only YES if failed Gate 3 or 4 only)"""
         if not validation["gates"]["gate_4"]["passed"]:
             failed_gates.append("Gate 4 (Feasibility)")
 
-        prompt = f"""This segment failed validation. Revise it to pass.
+        prompt = f"""This segment failed validation. Revise it to pass, using the PRODUCT FIT ANALYSIS above.
 
 ORIGINAL SEGMENT:
 Name: {segment.get('name', '')}
@@ -421,10 +438,6 @@ GATE FEEDBACK:
 {validation["gates"]["gate_3"]["rationale"] if not validation["gates"]["gate_3"]["passed"] else ""}
 {validation["gates"]["gate_4"]["rationale"] if not validation["gates"]["gate_4"]["passed"] else ""}
 
-PRODUCT CONTEXT:
-Core Problem: {product_fit.get('core_problem', '')}
-Valid Domains: {', '.join(product_fit.get('valid_domains', []))}
-
 REVISE THE SEGMENT to:
 - Use company-specific statistics (not industry averages) for Gate 3
 - Specify exact API fields or scraping selectors for Gate 4
@@ -441,7 +454,8 @@ REVISED_SEGMENT:
             self.claude,
             model="claude-sonnet-4-5-20250929",  # Use Sonnet 4.5 for revision (faster)
             max_tokens=1024,
-            messages=[{"role": "user", "content": prompt}]
+            messages=[{"role": "user", "content": prompt}],
+            cache_prefix=self._cache_prefix(product_fit, company_context)
         )
 
         # Parse revised segment
@@ -449,7 +463,7 @@ REVISED_SEGMENT:
 
         if revised:
             # Validate the revision
-            revision_result = await self._validate_segment(revised, product_fit)
+            revision_result = await self._validate_segment(revised, product_fit, company_context)
             if revision_result["verdict"] == "PROCEED":
                 revised["validation"] = revision_result
                 return revised
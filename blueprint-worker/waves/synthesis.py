@@ -8,6 +8,7 @@ from typing import Dict, List
 import re
 
 from tools.claude_retry import call_claude_with_retry
+from tools.prompt_cache import company_context_block, product_fit_block
 
 # Extended thinking budget tiers
 THINKING_BUDGET_STANDARD = 8000   # Standard synthesis (2-5 data sources)
@@ -17,7 +18,8 @@ THINKING_BUDGET_COMPLEX = 16000  # Complex synthesis (6+ data sources)
 class Synthesis:
     """Synthesis: Generate pain segments using extended thinking."""
 
-    # Removed SYSTEM_PROMPT - extended thinking doesn't use system prompts
+    # Removed SYSTEM_PROMPT - instructions live in the user prompt; the system
+    # prompt only carries the cached company context / product fit prefix
 
     def __init__(self, claude_client):
         self.claude = claude_client
@@ -65,19 +67,9 @@ class Synthesis:
         product_category = company_context.get('product_category', '')
 
         # Build comprehensive prompt for extended thinking
+        # Company context and product fit go in the cached system prefix
         prompt = f"""You are generating pain segment hypotheses for Blueprint GTM outreach.
-
-COMPANY CONTEXT:
-Company: {company_context.get('company_name', 'Unknown')}
-Offering: {company_context.get('offering', 'Unknown')}
-Product Category: {product_category or 'General'}
-ICP: {company_context.get('icp', 'Unknown')}
-Target Persona: {company_context.get('persona_title', 'Unknown')} - {company_context.get('persona', '')}
-
-PRODUCT FIT ANALYSIS:
-Core Problem Solved: {product_fit.get('core_problem', 'Unknown')}
-Valid Pain Domains: {', '.join(product_fit.get('valid_domains', []))}
-Invalid Pain Domains: {', '.join(product_fit.get('invalid_domains', []))}
+Use the COMPANY CONTEXT and PRODUCT FIT ANALYSIS provided above.
 
 DATA LANDSCAPE (Available Sources):
 {self._format_data_landscape(data_landscape)}
@@ -137,7 +129,8 @@ SEGMENT 3:
             model="claude-sonnet-4-5-20250929",  # Sonnet 4.5 supports extended thinking
             max_tokens=16000,  # Higher for extended thinking response
             messages=[{"role": "user", "content": prompt}],
-            thinking_budget=thinking_budget
+            thinking_budget=thinking_budget,
+            cache_prefix=[company_context_block(company_context), product_fit_block(product_fit)]
         )
 
         # Extract text and thinking from response
@@ -8,38 +8,13 @@ from typing import Dict, List
 import re
 
 from tools.claude_retry import call_claude_with_retry
+from tools.prompt_cache import company_context_block
 
 
 class Wave05ProductFit:
     """Wave 0.5: Product value anchoring."""
 
-    def __init__(self, claude_client):
-        self.claude = claude_client
-
-    async def execute(self, company_context: Dict) -> Dict:
-        """
-        Analyze product value and define valid/invalid pain domains.
-
-        Args:
-            company_context: Output from Wave 1
-
-        Returns:
-            {
-                "core_problem": str,
-                "product_type": str,
-                "urgency_triggers": [str],
-                "target_personas": [str],
-                "valid_domains": [str],
-                "invalid_domains": [str],
-                "product_fit_question": str
-            }
-        """
-        prompt = f"""Analyze this product to understand its core value proposition.
-
-COMPANY: {company_context.get('company_name', 'Unknown')}
-OFFERING: {company_context.get('offering', 'Unknown')}
-VALUE PROP: {company_context.get('value_prop', 'Unknown')}
-TARGET PERSONA: {company_context.get('persona_title', 'Unknown')}
+    INSTRUCTIONS = """Analyze the product in the COMPANY CONTEXT above to understand its core value proposition.
 
 Answer these questions:
 
@@ -84,11 +59,37 @@ VALID_DOMAINS: [domain1, domain2, domain3]
 INVALID_DOMAINS: [domain1, domain2, domain3]
 PRODUCT_FIT_QUESTION: "Would resolving [pain] require buying [this product]?" """
 
+    def __init__(self, claude_client):
+        self.claude = claude_client
+
+    async def execute(self, company_context: Dict) -> Dict:
+        """
+        Analyze product value and define valid/invalid pain domains.
+
+        Args:
+            company_context: Output from Wave 1
+
+        Returns:
+            {
+                "core_problem": str,
+                "product_type": str,
+                "urgency_triggers": [str],
+                "target_personas": [str],
+                "valid_domains": [str],
+                "invalid_domains": [str],
+                "product_fit_question": str
+            }
+        """
+        # Company context and the static instructions form the cached system
+        # prefix; the context block is shared with later waves
+        prompt = "Analyze the product in the COMPANY CONTEXT using the format above."
+
         response = await call_claude_with_retry(
             self.claude,
             model="claude-sonnet-4-5-20250929",  # Sonnet 4.5 for faster product fit
             max_tokens=2048,
-            messages=[{"role": "user", "content": prompt}]
+            messages=[{"role": "user", "content": prompt}],
+            cache_prefix=[company_context_block(company_context), self.INSTRUCTIONS]
         )
 
         return self._parse_response(response.content[0].text)
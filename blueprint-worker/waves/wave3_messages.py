@@ -7,26 +7,84 @@ then critiques them from the buyer's perspective.
 OPTIMIZATION: All Claude API calls run in parallel via asyncio.gather()
 - Before: 4 segments × (PQS + PVP + Critique) = 12 sequential calls (~28 min)
 - After: 3 parallel batches = ~7 min (4x faster)
+
+STREAMING: PQS/PVP completions are streamed and parsed incrementally. Each
+segment is critiqued in one call as soon as both of its sets are complete,
+so critiques overlap with the generations of other segments still in flight
+(one critique call per segment, as before streaming).
 """
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, List, Optional
 import re
+import time
 import asyncio
 
-from tools.claude_retry import call_claude_with_retry
+from tools.claude_retry import call_claude_with_retry, stream_claude_with_retry
+from tools.prompt_cache import company_context_block
+
+
+class StreamingMessageParser:
+    """
+    Incrementally parse `{TYPE}_VARIANT_N` blocks from a streamed completion.
+
+    A variant block is complete once the next variant header arrives (or the
+    stream closes). Completed blocks are parsed with `parse_block` and passed
+    to `on_message`. Variant numbers already emitted are skipped, so a stream
+    restarted after a retry never emits the same message twice.
+    """
+
+    def __init__(
+        self,
+        msg_type: str,
+        parse_block: Callable[[str, str], List[Dict]],
+        on_message: Callable[[Dict, int], None]
+    ):
+        self.msg_type = msg_type
+        self._parse_block = parse_block
+        self._on_message = on_message
+        self._header = re.compile(rf'{msg_type}_VARIANT_(\d+)', re.IGNORECASE)
+        self._buffer = ""
+        self._emitted = set()
+        self.messages: List[Dict] = []
+
+    def feed(self, text: str):
+        """Add streamed text and emit every variant block that is now complete."""
+        self._buffer += text
+        headers = list(self._header.finditer(self._buffer))
+        if len(headers) < 2:
+            return
+        for current, following in zip(headers, headers[1:]):
+            self._emit(current, self._buffer[current.start():following.start()])
+        # Keep only the (still open) last block
+        self._buffer = self._buffer[headers[-1].start():]
+
+    def close(self):
+        """Flush the final variant block at end of stream."""
+        match = self._header.search(self._buffer)
+        if match:
+            self._emit(match, self._buffer[match.start():])
+        self._buffer = ""
+
+    def reset(self):
+        """Drop partial text before a retried stream (emitted variants are kept)."""
+        self._buffer = ""
+
+    def _emit(self, header: re.Match, block: str):
+        variant = int(header.group(1))
+        if variant in self._emitted:
+            return
+        self._emitted.add(variant)
+        for msg in self._parse_block(block, self.msg_type):
+            self.messages.append(msg)
+            self._on_message(msg, variant)
 
 
 class Wave3Messages:
     """Wave 3: Generate and validate messages for each segment."""
 
-    PQS_PROMPT = """Generate a PQS (Pain-Qualified Segment) message for this segment.
-
-SEGMENT: {segment_name}
-DESCRIPTION: {segment_description}
-DATA SOURCES: {data_sources}
-FIELDS: {fields}
-
-TARGET PERSONA: {persona_title}
-COMPANY OFFERING: {offering}
+    # Message rules are static per job: they follow the company context in the
+    # cached system prefix, and only the segment details vary per call.
+    PQS_RULES = """You write PQS (Pain-Qualified Segment) messages for the target persona
+and offering in the COMPANY CONTEXT above.
 
 === PQS MESSAGE RULES ===
 
@@ -85,15 +143,8 @@ Subject: [2-4 words only]
 Body: [full message with specific data - NO placeholders]
 Calculation_Worksheet: [if any numeric claims, show the math]"""
 
-    PVP_PROMPT = """Generate a PVP (Permissionless Value Proposition) message for this segment.
-
-SEGMENT: {segment_name}
-DESCRIPTION: {segment_description}
-DATA SOURCES: {data_sources}
-FIELDS: {fields}
-
-TARGET PERSONA: {persona_title}
-COMPANY OFFERING: {offering}
+    PVP_RULES = """You write PVP (Permissionless Value Proposition) messages for the target persona
+and offering in the COMPANY CONTEXT above.
 
 === PVP MESSAGE RULES ===
 
@@ -154,7 +205,14 @@ Body: [full message with specific data - NO placeholders]
 Calculation_Worksheet: [show the math for any numeric claims]
 Data_Sources_Used: [which APIs/databases this comes from]"""
 
-    CRITIQUE_PROMPT = """Adopt this buyer persona and brutally critique these messages.
+    SEGMENT_PROMPT = """Generate {msg_type} messages for this segment.
+
+SEGMENT: {segment_name}
+DESCRIPTION: {segment_description}
+DATA SOURCES: {data_sources}
+FIELDS: {fields}"""
+
+    CRITIQUE_RULES = """Adopt this buyer persona and brutally critique the messages you are given.
 
 PERSONA: {persona_title}
 RESPONSIBILITIES: {persona_responsibilities}
@@ -170,9 +228,6 @@ I only respond to emails that:
 I am NOT a marketer evaluating this message. I AM THE BUYER. Would I reply to this?
 If 'maybe'—that's a NO."
 
-MESSAGES TO CRITIQUE:
-{messages}
-
 === AUTOMATIC DISQUALIFICATION ===
 
 Check FIRST for these instant-fail conditions:
@@ -218,19 +273,26 @@ TEXADA:
 VERDICT: KEEP (≥8.0) / REVISE (6.5-7.9) / DESTROY (<6.5)
 FEEDBACK: [specific improvement needed to make me reply]"""
 
-    def __init__(self, claude_client):
+    CRITIQUE_PROMPT = """MESSAGES TO CRITIQUE:
+{messages}"""
+
+    def __init__(self, claude_client, max_concurrent_critiques: int = 8):
         self.claude = claude_client
+        self.max_concurrent_critiques = max_concurrent_critiques
+        self.last_timing: Dict = {}
 
     async def generate(self, segments: List[Dict], company_context: Dict) -> List[Dict]:
         """
         Generate and critique messages for all segments IN PARALLEL.
 
-        ULTRA-AGGRESSIVE PARALLELIZATION:
-        - Step 1: Generate ALL PQS + PVP messages in ONE batch (8 concurrent calls)
-        - Step 2: Critique ALL segments in parallel (4 concurrent calls)
+        STREAMING PIPELINE:
+        - All PQS + PVP generations stream concurrently (8 calls for 4 segments)
+        - Each message is parsed as soon as its Subject/Body block completes
+        - A segment's messages are critiqued together (one call per segment)
+          once both its sets are done, while other segments still generate
 
-        Before: 3 parallel batches (~7 min each) = ~21 min
-        After: 2 parallel batches (~5 min each) = ~10 min
+        Timing is recorded in `self.last_timing` (time to first message,
+        generation and total wall-clock).
 
         Args:
             segments: Validated segments from Hard Gates
@@ -242,71 +304,79 @@ FEEDBACK: [specific improvement needed to make me reply]"""
         if not segments:
             return []
 
-        print(f"[Wave 3] ULTRA-PARALLEL: Generating messages for {len(segments)} segments...")
-
-        # Step 1: Generate ALL PQS + PVP messages simultaneously (8 concurrent API calls)
-        print(f"[Wave 3] Step 1/2: Generating {len(segments) * 2} message sets in parallel (PQS + PVP together)...")
-        pqs_tasks = [self._generate_pqs(seg, company_context) for seg in segments]
-        pvp_tasks = [self._generate_pvp(seg, company_context) for seg in segments]
-
-        # Run all 8 calls at once
-        all_results = await asyncio.gather(*pqs_tasks, *pvp_tasks, return_exceptions=True)
-
-        # Log any exceptions that were caught
-        failed_count = 0
-        for i, result in enumerate(all_results):
-            if isinstance(result, Exception):
-                failed_count += 1
-                task_type = "PQS" if i < len(segments) else "PVP"
-                print(f"[Wave 3] {task_type} generation task {i} failed: {type(result).__name__}: {str(result)[:200]}")
-
-        if failed_count > 0:
-            print(f"[Wave 3] WARNING: {failed_count}/{len(all_results)} message generation tasks failed")
-
-        # Split results back into PQS and PVP
-        all_pqs_results = all_results[:len(segments)]
-        all_pvp_results = all_results[len(segments):]
-
-        # Combine PQS + PVP for each segment (for critique)
-        segment_messages: List[Tuple[Dict, List[Dict], List[Dict]]] = []
-        for i, segment in enumerate(segments):
-            pqs_msgs = all_pqs_results[i] if not isinstance(all_pqs_results[i], Exception) else []
-            pvp_msgs = all_pvp_results[i] if not isinstance(all_pvp_results[i], Exception) else []
-            if pqs_msgs or pvp_msgs:
-                segment_messages.append((segment, pqs_msgs, pvp_msgs))
-
-        # Step 2: Critique ALL segments in parallel (switched to Sonnet for speed)
-        print(f"[Wave 3] Step 2/2: Critiquing {len(segment_messages)} message sets in parallel...")
-        critique_tasks = [
-            self._critique_messages(pqs + pvp, company_context)
-            for (seg, pqs, pvp) in segment_messages
-        ]
-        all_critiques = await asyncio.gather(*critique_tasks, return_exceptions=True)
+        wave_start = time.time()
+        self.last_timing = {
+            "time_to_first_message_s": None,
+            "time_to_first_critique_s": None,
+            "generation_s": None,
+            "total_s": None,
+            "messages_streamed": 0,
+            "critique_calls": 0
+        }
+        critique_semaphore = asyncio.Semaphore(self.max_concurrent_critiques)
+        generation_done: List[float] = []
+
+        def on_message(msg: Dict, variant: int):
+            if self.last_timing["time_to_first_message_s"] is None:
+                self.last_timing["time_to_first_message_s"] = round(time.time() - wave_start, 2)
+                print(f"[Wave 3] First message parsed after {self.last_timing['time_to_first_message_s']}s")
+            self.last_timing["messages_streamed"] += 1
+
+        async def run_segment(seg_idx: int, segment: Dict) -> List[Dict]:
+            # PQS + PVP stream together; the segment is critiqued in one call
+            # as soon as both sets are complete, while other segments generate
+            results = await asyncio.gather(
+                self._generate_pqs(segment, company_context, on_message=on_message),
+                self._generate_pvp(segment, company_context, on_message=on_message),
+                return_exceptions=True
+            )
+            generation_done.append(time.time() - wave_start)
+            messages = []
+            for msg_type, result in zip(("PQS", "PVP"), results):
+                if isinstance(result, Exception):
+                    print(f"[Wave 3] {msg_type} generation for segment {seg_idx + 1} failed: {type(result).__name__}: {str(result)[:200]}")
+                    continue
+                messages.extend(result)
+            if not messages:
+                return []
+
+            async with critique_semaphore:
+                self.last_timing["critique_calls"] += 1
+                critiques = await self._critique_messages(messages, company_context)
+            if self.last_timing["time_to_first_critique_s"] is None:
+                self.last_timing["time_to_first_critique_s"] = round(time.time() - wave_start, 2)
+
+            critiqued = []
+            for msg, critique in zip(messages, critiques):
+                msg["critique"] = critique
+                msg["segment"] = segment.get("name", f"Segment {seg_idx + 1}")
+                critiqued.append(msg)
+            return critiqued
+
+        print(f"[Wave 3] STREAMING: Generating messages for {len(segments)} segments...")
+        print(f"[Wave 3] Streaming {len(segments) * 2} message sets (PQS + PVP), critiquing each segment as it completes...")
+        segment_results = await asyncio.gather(
+            *(run_segment(i, seg) for i, seg in enumerate(segments)),
+            return_exceptions=True
+        )
+        self.last_timing["generation_s"] = round(max(generation_done), 2) if generation_done else None
 
         # Log any critique exceptions
+        all_messages = []
         critique_failed = 0
-        for i, result in enumerate(all_critiques):
+        for i, result in enumerate(segment_results):
             if isinstance(result, Exception):
                 critique_failed += 1
-                print(f"[Wave 3] Critique task {i} failed: {type(result).__name__}: {str(result)[:200]}")
+                print(f"[Wave 3] Critique for segment {i + 1} failed: {type(result).__name__}: {str(result)[:200]}")
+                continue
+            all_messages.extend(result)
 
         if critique_failed > 0:
-            print(f"[Wave 3] WARNING: {critique_failed}/{len(all_critiques)} critique tasks failed")
+            print(f"[Wave 3] WARNING: {critique_failed}/{len(segment_results)} segment critiques failed")
 
-        # Assemble final messages with critiques
-        all_messages = []
-        for idx, (segment, pqs_msgs, pvp_msgs) in enumerate(segment_messages):
-            critiques = all_critiques[idx] if not isinstance(all_critiques[idx], Exception) else []
-
-            combined_msgs = pqs_msgs + pvp_msgs
-            for i, msg in enumerate(combined_msgs):
-                if i < len(critiques):
-                    msg["critique"] = critiques[i]
-                    msg["segment"] = segment.get("name", f"Segment {idx + 1}")
-                    msg["type"] = "PQS" if i < len(pqs_msgs) else "PVP"
-                    all_messages.append(msg)
-
-        print(f"[Wave 3] Generated {len(all_messages)} total messages")
+        self.last_timing["total_s"] = round(time.time() - wave_start, 2)
+        print(f"[Wave 3] Generated {len(all_messages)} total messages with {self.last_timing['critique_calls']} critique calls "
+              f"(first message {self.last_timing['time_to_first_message_s']}s, total {self.last_timing['total_s']}s)")
 
         # Sort ALL messages by score (best first)
         all_messages.sort(
@@ -333,45 +403,63 @@ FEEDBACK: [specific improvement needed to make me reply]"""
 
         return passing_messages
 
-    async def _generate_pqs(self, segment: Dict, context: Dict) -> List[Dict]:
-        """Generate PQS messages for a segment."""
-        prompt = self.PQS_PROMPT.format(
-            segment_name=segment.get("name", ""),
-            segment_description=segment.get("description", ""),
-            data_sources=", ".join(segment.get("data_sources", [])),
-            fields=", ".join(segment.get("fields", [])),
-            persona_title=context.get("persona_title", ""),
-            offering=context.get("offering", "")
-        )
-
-        response = await call_claude_with_retry(
-            self.claude,
-            model="claude-sonnet-4-5-20250929",  # Sonnet 4.5 for faster message gen
-            max_tokens=2048,
-            messages=[{"role": "user", "content": prompt}]
-        )
-
-        return self._parse_messages(response.content[0].text, "PQS")
-
-    async def _generate_pvp(self, segment: Dict, context: Dict) -> List[Dict]:
-        """Generate PVP messages for a segment."""
-        prompt = self.PVP_PROMPT.format(
+    def _segment_prompt(self, segment: Dict, msg_type: str) -> str:
+        """Build the per-segment (uncached) part of a PQS/PVP request."""
+        return self.SEGMENT_PROMPT.format(
+            msg_type=msg_type,
             segment_name=segment.get("name", ""),
             segment_description=segment.get("description", ""),
             data_sources=", ".join(segment.get("data_sources", [])),
-            fields=", ".join(segment.get("fields", [])),
-            persona_title=context.get("persona_title", ""),
-            offering=context.get("offering", "")
+            fields=", ".join(segment.get("fields", []))
         )
 
-        response = await call_claude_with_retry(
+    async def _generate_pqs(
+        self,
+        segment: Dict,
+        context: Dict,
+        on_message: Optional[Callable[[Dict, int], None]] = None
+    ) -> List[Dict]:
+        """Generate PQS messages for a segment (streamed when on_message is given)."""
+        return await self._generate_messages(segment, context, "PQS", self.PQS_RULES, on_message)
+
+    async def _generate_pvp(
+        self,
+        segment: Dict,
+        context: Dict,
+        on_message: Optional[Callable[[Dict, int], None]] = None
+    ) -> List[Dict]:
+        """Generate PVP messages for a segment (streamed when on_message is given)."""
+        return await self._generate_messages(segment, context, "PVP", self.PVP_RULES, on_message)
+
+    async def _generate_messages(
+        self,
+        segment: Dict,
+        context: Dict,
+        msg_type: str,
+        rules: str,
+        on_message: Optional[Callable[[Dict, int], None]]
+    ) -> List[Dict]:
+        """Generate one PQS/PVP message set, emitting each message as it is parsed."""
+        request = {
+            "model": "claude-sonnet-4-5-20250929",  # Sonnet 4.5 for faster message gen
+            "max_tokens": 2048,
+            "messages": [{"role": "user", "content": self._segment_prompt(segment, msg_type)}],
+            "cache_prefix": [company_context_block(context), rules]
+        }
+
+        if on_message is None:
+            response = await call_claude_with_retry(self.claude, **request)
+            return self._parse_messages(response.content[0].text, msg_type)
+
+        parser = StreamingMessageParser(msg_type, self._parse_messages, on_message)
+        await stream_claude_with_retry(
             self.claude,
-            model="claude-sonnet-4-5-20250929",  # Sonnet 4.5 for faster message gen
-            max_tokens=2048,
-            messages=[{"role": "user", "content": prompt}]
+            on_text=parser.feed,
+            on_restart=parser.reset,
+            **request
         )
-
-        return self._parse_messages(response.content[0].text, "PVP")
+        parser.close()
+        return parser.messages
 
     async def _critique_messages(self, messages: List[Dict], context: Dict) -> List[Dict]:
         """Critique all messages from buyer perspective."""
@@ -381,18 +469,19 @@ FEEDBACK: [specific improvement needed to make me reply]"""
             messages_text += f"Subject: {msg.get('subject', '')}\n"
             messages_text += f"Body: {msg.get('body', '')}\n"
 
-        prompt = self.CRITIQUE_PROMPT.format(
+        # Persona rules depend only on the job's company context, so they are cached
+        critique_rules = self.CRITIQUE_RULES.format(
             persona_title=context.get("persona_title", "Decision Maker"),
             persona_responsibilities=context.get("persona", ""),
-            persona_kpis=", ".join(context.get("persona_kpis", [])),
-            messages=messages_text
+            persona_kpis=", ".join(context.get("persona_kpis", []))
         )
 
         response = await call_claude_with_retry(
             self.claude,
             model="claude-sonnet-4-5-20250929",  # Sonnet 4.5 for faster critique
             max_tokens=4096,
-            messages=[{"role": "user", "content": prompt}]
+            messages=[{"role": "user", "content": self.CRITIQUE_PROMPT.format(messages=messages_text)}],
+            cache_prefix=[company_context_block(context), critique_rules]
         )
 
         return self._parse_critiques(response.content[0].text, len(messages))
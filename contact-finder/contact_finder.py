@@ -28,14 +28,18 @@ from typing import Any
 
 # Internal modules
 from modules.llm.provider import get_provider, LLMProvider
+from modules.budget import BudgetGovernor, get_governor, set_governor
 from modules.enrichment.blitz import BlitzClient
 from modules.enrichment.leadmagic import LeadMagicClient
 from modules.enrichment.scrapin import ScrapinClient
 from modules.enrichment.exa import ExaClient
+from modules.enrichment.profile_store import ProfileStore, set_profile_store
 from modules.enrichment.site_scraper import SiteScraper
 from modules.enrichment.waterfall import EnrichmentWaterfall, EnrichedContact
 from modules.discovery.linkedin_company import LinkedInCompanyDiscovery
+from modules.discovery.page_store import PageStore, set_page_store
 from modules.discovery.contact_search import ContactSearchEngine, ContactCandidate
+from modules.pipeline.blocking import add_blocking_argument, detect_blocking
 from modules.validation.contact_judge import ContactJudge, ContactJudgment, create_evidence_bundle
 from modules.validation.email_validator import EmailValidator, EmailOrigin
 from modules.validation.linkedin_normalizer import normalize_linkedin_url
@@ -124,11 +128,15 @@ class ContactFinder:
         leadmagic_client: LeadMagicClient | None = None,
         scrapin_client: ScrapinClient | None = None,
         exa_client: ExaClient | None = None,
-        site_scraper: SiteScraper | None = None
+        site_scraper: SiteScraper | None = None,
+        governor: BudgetGovernor | None = None
     ):
         self.config = config
         self.llm = llm_provider
 
+        # Budget: paid clients reserve from this governor (default: process-wide one)
+        self.governor = governor or get_governor()
+
         # API clients
         self.blitz = blitz_client
         self.leadmagic = leadmagic_client
@@ -165,6 +173,26 @@ class ContactFinder:
         llm_config = config.get("llm", {})
         llm_provider = get_provider(llm_config) if llm_config else None
 
+        # Shared LinkedIn profile cache, used by every client built in this process
+        profile_store_path = config.get("enrichment", {}).get("profile_store")
+        if profile_store_path:
+            set_profile_store(ProfileStore(profile_store_path))
+
+        # Shared page memo / dead-domain cache for every website fetcher
+        page_store_path = config.get("scraping", {}).get("page_store")
+        if page_store_path:
+            set_page_store(PageStore(page_store_path))
+
+        # Spend caps for every paid client built in this process
+        budget_config = config.get("budget", {})
+        governor = None
+        if budget_config.get("run_budget_usd") is not None or budget_config.get("company_budget_usd") is not None:
+            governor = BudgetGovernor(
+                run_budget_usd=budget_config.get("run_budget_usd"),
+                company_budget_usd=budget_config.get("company_budget_usd")
+            )
+            set_governor(governor)
+
         # Initialize API clients
         blitz_client = None
         blitz_keys = api_keys.get("blitz", {})
@@ -197,7 +225,8 @@ class ContactFinder:
             leadmagic_client=leadmagic_client,
             scrapin_client=scrapin_client,
             exa_client=exa_client,
-            site_scraper=site_scraper
+            site_scraper=site_scraper,
+            governor=governor
         )
 
     def _get_linkedin_discovery(self) -> LinkedInCompanyDiscovery:
@@ -225,11 +254,16 @@ class ContactFinder:
     def _get_enrichment(self) -> EnrichmentWaterfall:
         """Get or create enrichment component"""
         if not self._enrichment:
+            enrichment_config = self.config.get("enrichment", {})
             self._enrichment = EnrichmentWaterfall(
                 scrapin_client=self.scrapin,
                 blitz_client=self.blitz,
                 leadmagic_client=self.leadmagic,
-                email_validator=self._get_email_validator()
+                email_validator=self._get_email_validator(),
+                mode=enrichment_config.get("mode", "sequential"),
+                latency_target_s=enrichment_config.get("latency_target_s", 0.0),
+                cost_ceiling=enrichment_config.get("cost_ceiling"),
+                governor=self.governor
             )
         return self._enrichment
 
@@ -257,6 +291,8 @@ class ContactFinder:
         Find contacts at a company.
 
         This is the main entry point for single-company contact finding.
+        With a budget governor, paid calls are charged to this company and
+        the company is skipped once the run budget is gone.
 
         Args:
             company_name: Company name
@@ -268,6 +304,28 @@ class ContactFinder:
         Returns:
             CompanyContactResult with all found contacts
         """
+        if self.governor is None:
+            return await self._find_contacts(company_name, domain, location, industry, target_titles)
+
+        remaining = self.governor.run_remaining_usd()
+        if remaining is not None and remaining <= 0:
+            return CompanyContactResult(
+                company_name=company_name,
+                domain=domain,
+                linkedin_company_url=None,
+                errors=["Run budget exhausted"]
+            )
+        with self.governor.company_scope(company_name):
+            return await self._find_contacts(company_name, domain, location, industry, target_titles)
+
+    async def _find_contacts(
+        self,
+        company_name: str,
+        domain: str | None,
+        location: str | None,
+        industry: str | None,
+        target_titles: list[str] | None
+    ) -> CompanyContactResult:
         start_time = datetime.now()
         titles = target_titles or self.target_titles
 
@@ -560,9 +618,15 @@ async def main():
     parser.add_argument("--config", default="config.yaml", help="Config file path")
     parser.add_argument("--batch", "-b", help="Batch input file (JSON/CSV)")
     parser.add_argument("--output", "-o", help="Output file")
+    add_blocking_argument(parser)
 
     args = parser.parse_args()
 
+    async with detect_blocking(args.detect_blocking):
+        await _run_cli(parser, args)
+
+
+async def _run_cli(parser, args):
     finder = ContactFinder.from_config(args.config)
 
     try:
@@ -6,10 +6,12 @@ modules/
 ├── llm/           - LLM provider abstraction (OpenAI, Anthropic)
 ├── enrichment/    - API clients (Blitz, LeadMagic, Scrapin, Exa)
 ├── discovery/     - LinkedIn company and contact discovery, email finding
-└── validation/    - Email validation, LinkedIn normalization, LLM judge, MillionVerifier
+├── validation/    - Email validation, LinkedIn normalization, LLM judge, MillionVerifier
+└── budget/        - Shared spend/rate governor for the paid APIs
 """
 
 from .llm import LLMProvider, get_provider
+from .budget import BudgetGovernor, BudgetExceeded, set_governor
 from .enrichment import (
     BlitzClient,
     LeadMagicClient,
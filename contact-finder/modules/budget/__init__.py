@@ -0,0 +1,24 @@
+# Budget Modules
+from .governor import (
+    BudgetGovernor,
+    BudgetExceeded,
+    ProviderLimits,
+    Reservation,
+    DEFAULT_PROVIDER_LIMITS,
+    get_governor,
+    reserve,
+    set_governor,
+    track_dispatched
+)
+
+__all__ = [
+    'BudgetGovernor',
+    'BudgetExceeded',
+    'ProviderLimits',
+    'Reservation',
+    'DEFAULT_PROVIDER_LIMITS',
+    'get_governor',
+    'reserve',
+    'set_governor',
+    'track_dispatched',
+]
@@ -0,0 +1,407 @@
+"""
+Budget Governor - Shared spend control for the paid APIs
+
+Every paid client (Blitz, LeadMagic, Scrapin, Exa, OpenWeb Ninja,
+MillionVerifier, Serper, ZenRows) reserves from the governor before it makes
+a request:
+
+    async with reserve(self.governor, "blitz", credits=1) as spend:
+        result = await self._post(...)
+        spend.settle(result.get("credits_consumed", 0))
+
+- Caps: a per-run USD cap, a per-company USD cap, and per-provider credit
+  limits. A request that would cross any of them raises BudgetExceeded
+  before it is sent. Reservations count against the caps while in flight, so
+  concurrent requests can never overshoot together.
+- Throughput: each provider has its own rate (requests/second) and
+  concurrency limit. Callers can fan out as wide as they like; the governor
+  meters the actual requests against those limits.
+- Only hard caps are enforced. The rate and concurrency limits are fixed
+  when the governor is built: 429 responses and the remaining budget are
+  not fed back into them (a 429 is the client's to retry, and a request
+  that no longer fits the budget raises BudgetExceeded rather than being
+  slowed down). Set limits that the provider plan actually allows.
+- Metrics: snapshot() returns live spend, in-flight reservations and
+  remaining budget per run, provider and company.
+
+Company scoping uses a ContextVar, so concurrent companies never mix:
+
+    with governor.company_scope("Joe's Plumbing"):
+        await pipeline_stages(...)
+
+Clients constructed without a governor use the process-wide one installed by
+set_governor(); with neither, reserve() is a no-op.
+
+A caller that may cancel a request it started (a speculative race) wraps the
+task creation in track_dispatched(): the reservations whose requests were
+actually sent are collected there, so their credits can be counted even
+though the caller never sees the response.
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, replace
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ProviderLimits:
+    """Pricing and limits for one paid API (static hard caps, not adapted during the run)"""
+    cost_per_credit: float              # USD per credit
+    credits_per_call: float = 1.0       # Default reservation when the caller doesn't say
+    max_credits: float | None = None    # Credit limit for the run (None = unlimited)
+    rate_per_second: float | None = None  # Max request starts per second
+    max_concurrent: int | None = None   # Max requests in flight
+
+
+# Approximate list prices; override per run via BudgetGovernor(providers=...)
+DEFAULT_PROVIDER_LIMITS: dict[str, ProviderLimits] = {
+    "serper": ProviderLimits(cost_per_credit=0.001, rate_per_second=50, max_concurrent=50),
+    "openweb_ninja": ProviderLimits(cost_per_credit=0.002, rate_per_second=20, max_concurrent=20),
+    "zenrows": ProviderLimits(cost_per_credit=0.01, rate_per_second=10, max_concurrent=10),
+    "leadmagic": ProviderLimits(cost_per_credit=0.01, rate_per_second=10, max_concurrent=10),
+    "millionverifier": ProviderLimits(cost_per_credit=0.00029, rate_per_second=50, max_concurrent=20),
+    "blitz": ProviderLimits(cost_per_credit=0.05, rate_per_second=5, max_concurrent=5),
+    "scrapin": ProviderLimits(cost_per_credit=0.01, rate_per_second=5, max_concurrent=5),
+    "exa": ProviderLimits(cost_per_credit=0.005, rate_per_second=5, max_concurrent=5),
+}
+
+
+class BudgetExceeded(Exception):
+    """A reservation would cross the run, company or provider limit"""
+
+    def __init__(self, scope: str, provider: str, requested: float, remaining: float):
+        self.scope = scope
+        self.provider = provider
+        self.requested = requested
+        self.remaining = remaining
+        super().__init__(
+            f"{scope} budget exceeded for {provider}: "
+            f"requested {requested:.4f}, remaining {remaining:.4f}"
+        )
+
+
+@dataclass
+class Reservation:
+    """An in-flight reservation; settle() records what the call actually cost"""
+    provider: str
+    company: str | None
+    credits: float
+    cost_usd: float
+    settled: bool = False
+
+    def settle(self, credits: float):
+        self.credits = credits
+        self.settled = True
+
+
+@dataclass
+class _ProviderState:
+    limits: ProviderLimits
+    semaphore: asyncio.Semaphore | None = None
+    next_start: float = 0.0
+    calls: int = 0
+    credits: float = 0.0
+    cost_usd: float = 0.0
+    reserved_credits: float = 0.0
+    in_flight: int = 0
+    rejected: int = 0
+
+
+@dataclass
+class _CompanySpend:
+    spent_usd: float = 0.0
+    reserved_usd: float = 0.0
+    calls: int = 0
+    by_provider: dict[str, float] = field(default_factory=dict)
+
+
+_company: ContextVar[str | None] = ContextVar("budget_company", default=None)
+_dispatched: ContextVar[list | None] = ContextVar("budget_dispatched", default=None)
+
+
+class BudgetGovernor:
+    """
+    Reserve-before-call spend control shared by all paid clients.
+
+    Budgets, credits, rate and concurrency are hard caps fixed at
+    construction; the governor does not back off on 429s.
+
+    Example:
+        governor = BudgetGovernor(run_budget_usd=25.0, company_budget_usd=0.05)
+        set_governor(governor)
+        ...
+        print(governor.snapshot()["run"]["remaining_usd"])
+    """
+
+    def __init__(
+        self,
+        run_budget_usd: float | None = None,
+        company_budget_usd: float | None = None,
+        providers: dict[str, ProviderLimits] | None = None
+    ):
+        """
+        Args:
+            run_budget_usd: Total spend cap for the run (None = unlimited)
+            company_budget_usd: Spend cap per company scope (None = unlimited)
+            providers: Overrides merged over DEFAULT_PROVIDER_LIMITS
+        """
+        self.run_budget_usd = run_budget_usd
+        self.company_budget_usd = company_budget_usd
+        limits = {name: replace(l) for name, l in DEFAULT_PROVIDER_LIMITS.items()}
+        limits.update(providers or {})
+        self._providers = {name: _ProviderState(l) for name, l in limits.items()}
+        self._companies: dict[str, _CompanySpend] = {}
+        self.spent_usd = 0.0
+        self.reserved_usd = 0.0
+        self.rejected = 0
+
+    # --- scoping ---
+
+    @contextmanager
+    def company_scope(self, company: str):
+        """Attribute reservations made inside this block (and its tasks) to `company`."""
+        token = _company.set(company)
+        try:
+            yield
+        finally:
+            _company.reset(token)
+
+    # --- budget checks ---
+
+    def _provider(self, name: str) -> _ProviderState:
+        state = self._providers.get(name)
+        if state is None:
+            raise KeyError(f"Unknown provider '{name}' (add it via providers=)")
+        return state
+
+    def run_remaining_usd(self) -> float | None:
+        """USD left for the run, counting in-flight reservations (None = unlimited)."""
+        if self.run_budget_usd is None:
+            return None
+        return self.run_budget_usd - self.spent_usd - self.reserved_usd
+
+    def remaining_usd(self, company: str | None = None) -> float | None:
+        """USD left for the run, or for `company` if tighter (None = unlimited)."""
+        remaining = self.run_remaining_usd()
+        company = company if company is not None else _company.get()
+        if company is not None and self.company_budget_usd is not None:
+            spend = self._companies.get(company, _CompanySpend())
+            left = self.company_budget_usd - spend.spent_usd - spend.reserved_usd
+            remaining = left if remaining is None else min(remaining, left)
+        return remaining
+
+    def can_afford(self, provider: str, credits: float | None = None, company: str | None = None) -> bool:
+        """Whether a reservation of `credits` on `provider` would be accepted now."""
+        try:
+            self._check(provider, credits, company if company is not None else _company.get())
+            return True
+        except BudgetExceeded:
+            return False
+
+    def _check(self, provider: str, credits: float | None, company: str | None) -> tuple[float, float]:
+        state = self._provider(provider)
+        credits = state.limits.credits_per_call if credits is None else credits
+        cost = credits * state.limits.cost_per_credit
+
+        if state.limits.max_credits is not None:
+            left = state.limits.max_credits - state.credits - state.reserved_credits
+            if credits > left:
+                raise BudgetExceeded("provider", provider, credits, left)
+        if self.run_budget_usd is not None:
+            left = self.run_budget_usd - self.spent_usd - self.reserved_usd
+            if cost > left:
+                raise BudgetExceeded("run", provider, cost, left)
+        if company is not None and self.company_budget_usd is not None:
+            spend = self._companies.get(company, _CompanySpend())
+            left = self.company_budget_usd - spend.spent_usd - spend.reserved_usd
+            if cost > left:
+                raise BudgetExceeded("company", provider, cost, left)
+        return credits, cost
+
+    # --- reservations ---
+
+    @asynccontextmanager
+    async def reserve(self, provider: str, credits: float | None = None, company: str | None = None):
+        """
+        Hold budget for one request, then wait for a rate/concurrency slot.
+
+        Raises BudgetExceeded (before waiting) if any cap would be crossed.
+        On exit the settled credits are charged; unsettled reservations are
+        charged at the estimate, including when the request raised.
+        """
+        company = company if company is not None else _company.get()
+        state = self._provider(provider)
+        try:
+            credits, cost = self._check(provider, credits, company)
+        except BudgetExceeded:
+            state.rejected += 1
+            self.rejected += 1
+            raise
+
+        reservation = Reservation(provider=provider, company=company, credits=credits, cost_usd=cost)
+        spend = self._companies.setdefault(company, _CompanySpend()) if company is not None else None
+        self._hold(state, spend, credits, cost)
+
+        acquired = started = False
+        try:
+            if state.limits.max_concurrent:
+                if state.semaphore is None:
+                    state.semaphore = asyncio.Semaphore(state.limits.max_concurrent)
+                await state.semaphore.acquire()
+                acquired = True
+            await self._wait_for_rate(state)
+
+            state.in_flight += 1
+            started = True
+            try:
+                yield reservation
+            finally:
+                state.in_flight -= 1
+        finally:
+            if acquired:
+                state.semaphore.release()
+            self._hold(state, spend, -credits, -cost)
+            # Cancelled while queued: nothing was sent, nothing is charged
+            if started:
+                self._charge(state, spend, reservation)
+
+    def _hold(self, state: _ProviderState, spend: _CompanySpend | None, credits: float, cost: float):
+        state.reserved_credits += credits
+        self.reserved_usd += cost
+        if spend is not None:
+            spend.reserved_usd += cost
+
+    def _charge(self, state: _ProviderState, spend: _CompanySpend | None, reservation: Reservation):
+        cost = reservation.credits * state.limits.cost_per_credit
+        reservation.cost_usd = cost
+        state.calls += 1
+        state.credits += reservation.credits
+        state.cost_usd += cost
+        self.spent_usd += cost
+        if spend is not None:
+            spend.spent_usd += cost
+            spend.calls += 1
+            spend.by_provider[reservation.provider] = spend.by_provider.get(reservation.provider, 0.0) + cost
+
+    async def _wait_for_rate(self, state: _ProviderState):
+        rate = state.limits.rate_per_second
+        if not rate:
+            return
+        # Each caller claims the next start slot, then sleeps until it
+        now = time.monotonic()
+        start = max(now, state.next_start)
+        state.next_start = start + 1.0 / rate
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    # --- metrics ---
+
+    def company_spend(self, company: str) -> float:
+        spend = self._companies.get(company)
+        return spend.spent_usd if spend else 0.0
+
+    def snapshot(self) -> dict[str, Any]:
+        """Live spend and remaining budget per run, provider and company."""
+        providers = {}
+        for name, state in self._providers.items():
+            if not state.calls and not state.in_flight and not state.rejected:
+                continue
+            max_credits = state.limits.max_credits
+            providers[name] = {
+                "calls": state.calls,
+                "credits": round(state.credits, 4),
+                "cost_usd": round(state.cost_usd, 6),
+                "in_flight": state.in_flight,
+                "rejected": state.rejected,
+                "remaining_credits": (
+                    round(max_credits - state.credits - state.reserved_credits, 4)
+                    if max_credits is not None else None
+                ),
+            }
+
+        remaining = self.run_remaining_usd()
+        return {
+            "run": {
+                "budget_usd": self.run_budget_usd,
+                "spent_usd": round(self.spent_usd, 6),
+                "reserved_usd": round(self.reserved_usd, 6),
+                "remaining_usd": round(remaining, 6) if remaining is not None else None,
+                "rejected": self.rejected,
+            },
+            "company_budget_usd": self.company_budget_usd,
+            "companies": {
+                name: {
+                    "spent_usd": round(s.spent_usd, 6),
+                    "calls": s.calls,
+                    "by_provider": {p: round(c, 6) for p, c in s.by_provider.items()},
+                }
+                for name, s in self._companies.items()
+            },
+            "providers": providers,
+        }
+
+
+_governor: BudgetGovernor | None = None
+
+
+def set_governor(governor: BudgetGovernor | None):
+    """Install the process-wide governor used by clients built without one."""
+    global _governor
+    _governor = governor
+
+
+def get_governor() -> BudgetGovernor | None:
+    return _governor
+
+
+@asynccontextmanager
+async def reserve(
+    governor: BudgetGovernor | None,
+    provider: str,
+    credits: float | None = None
+):
+    """
+    Client-side helper: reserve from `governor` (or the process-wide one).
+
+    Yields a Reservation, or an unattached one when no governor is set, so
+    clients can call settle() unconditionally.
+    """
+    governor = governor or _governor
+    if governor is None:
+        reservation = Reservation(provider=provider, company=None, credits=credits or 0.0, cost_usd=0.0)
+        _record_dispatch(reservation)
+        yield reservation
+        return
+    async with governor.reserve(provider, credits) as reservation:
+        _record_dispatch(reservation)
+        yield reservation
+
+
+def _record_dispatch(reservation: Reservation):
+    dispatched = _dispatched.get()
+    if dispatched is not None:
+        dispatched.append(reservation)
+
+
+@contextmanager
+def track_dispatched():
+    """
+    Collect the reservations whose requests are sent inside this block.
+
+    Tasks created inside the block report to the same list, also after the
+    block has exited. A reservation in the list was charged by the governor
+    (at its estimate unless settled), whether or not its caller got the
+    response.
+    """
+    dispatched: list[Reservation] = []
+    token = _dispatched.set(dispatched)
+    try:
+        yield dispatched
+    finally:
+        _dispatched.reset(token)
@@ -17,6 +17,8 @@ from .email_permutator import (
     is_valid_for_permutation,
     NameComponents,
 )
+from .page_store import PageStore, StoredPage, set_page_store, get_page_store
+from .payload_store import PayloadStore, set_payload_store, get_payload_store, put_payload, load_payload
 from .email_finder import (
     EmailFinder,
     EmailFinderResult,
@@ -44,4 +46,15 @@ __all__ = [
     "EmailFinderResult",
     "EmailCandidate",
     "find_email_for_contact",
+    # Page store
+    "PageStore",
+    "StoredPage",
+    "set_page_store",
+    "get_page_store",
+    # Payload store
+    "PayloadStore",
+    "set_payload_store",
+    "get_payload_store",
+    "put_payload",
+    "load_payload",
 ]
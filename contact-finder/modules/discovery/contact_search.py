@@ -10,6 +10,8 @@ from enum import Enum
 
 from ..validation.linkedin_normalizer import normalize_linkedin_url, is_valid_linkedin_in_url
 from ..validation.email_validator import EmailOrigin
+from .page_store import PageStore, get_page_store
+from .payload_store import load_payload, put_payload
 
 
 class ContactSource(Enum):
@@ -22,7 +24,7 @@ class ContactSource(Enum):
     GOOGLE_MAPS = "google_maps"   # FREE - Maps listing
 
 
-@dataclass
+@dataclass(slots=True)
 class ContactCandidate:
     """A contact candidate from search"""
     name: str | None
@@ -36,7 +38,17 @@ class ContactCandidate:
     email_origin: EmailOrigin | None
     confidence: float  # 0-100
     evidence: list[str] = field(default_factory=list)
-    raw_data: dict = field(default_factory=dict)
+    raw_ref: str | dict | None = None  # Provider response: inline, or a PayloadStore ref
+
+    @property
+    def raw_data(self) -> dict:
+        """
+        Provider response this candidate was built from ({} if none)
+
+        Also {} once the payload has been evicted from the bounded default
+        store (DEFAULT_MAX_PAYLOADS); see payload_store.
+        """
+        return load_payload(self.raw_ref) or {}
 
 
 @dataclass
@@ -71,12 +83,14 @@ class ContactSearchEngine:
         exa_client: Any = None,
         blitz_client: Any = None,
         site_scraper: Any = None,
-        target_titles: list[str] | None = None
+        target_titles: list[str] | None = None,
+        page_store: PageStore | None = None
     ):
         self.scrapin = scrapin_client
         self.exa = exa_client
         self.blitz = blitz_client
         self.site_scraper = site_scraper
+        self.page_store = page_store
         self.target_titles = target_titles or [
             "Owner", "CEO", "President", "Founder",
             "General Manager", "Manager", "Director"
@@ -130,7 +144,7 @@ class ContactSearchEngine:
                         email_origin=None,
                         confidence=70 if normalized_url else 50,
                         evidence=[f"Found in {company_name} LinkedIn employees"],
-                        raw_data=emp
+                        raw_ref=put_payload(emp)
                     ))
 
             # Also try person matching if we have the company
@@ -158,7 +172,7 @@ class ContactSearchEngine:
                                     email_origin=EmailOrigin.LINKEDIN_ENRICHED if result.email else None,
                                     confidence=75 if result.email else 60,
                                     evidence=[f"Scrapin match for {title} at {company_name}"],
-                                    raw_data=result.raw_response
+                                    raw_ref=put_payload(result.raw_response)
                                 ))
                     except Exception:
                         continue
@@ -230,7 +244,7 @@ class ContactSearchEngine:
                         email_origin=None,
                         confidence=60 if linkedin_url else 40,
                         evidence=[f"Exa search: {r.title or 'Unknown'}"],
-                        raw_data=r.raw_response
+                        raw_ref=put_payload(r.raw_response)
                     ))
 
         except Exception:
@@ -286,7 +300,7 @@ class ContactSearchEngine:
                     email_origin=email_origin,
                     confidence=contact.confidence_score if contact.confidence_score else 70,
                     evidence=[f"Blitz ICP waterfall: {contact.job_title}"],
-                    raw_data=contact.raw_response
+                    raw_ref=put_payload(contact.raw_response)
                 ))
 
         except Exception:
@@ -307,6 +321,11 @@ class ContactSearchEngine:
         if not self.site_scraper or not domain:
             return []
 
+        # Another stage already found the domain does not resolve
+        store = self.page_store or get_page_store()
+        if store and await asyncio.to_thread(store.host_failure, domain):
+            return []
+
         candidates = []
 
         try:
@@ -326,7 +345,7 @@ class ContactSearchEngine:
                     email_origin=EmailOrigin.SITE_OBSERVED,
                     confidence=80,  # Site-observed email is high trust
                     evidence=[f"Email found on {domain}"],
-                    raw_data={"email": email, "source": "site_scrape"}
+                    raw_ref=put_payload({"email": email, "source": "site_scrape"})
                 ))
 
             # Extracted contacts
@@ -343,7 +362,7 @@ class ContactSearchEngine:
                     email_origin=EmailOrigin.SITE_OBSERVED if contact.email else None,
                     confidence=75 if contact.email else 50,
                     evidence=[f"Extracted from {contact.source_url}"],
-                    raw_data={"context": contact.context}
+                    raw_ref=put_payload({"context": contact.context})
                 ))
 
         except Exception:
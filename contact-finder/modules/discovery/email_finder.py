@@ -13,6 +13,7 @@ from .email_permutator import (
     parse_name,
     NameComponents
 )
+from ..budget import BudgetGovernor
 from ..validation.million_verifier import (
     MillionVerifierClient,
     VerificationResult,
@@ -113,7 +114,8 @@ class EmailFinder:
         self,
         million_verifier_api_key: Optional[str] = None,
         max_concurrent: int = 10,
-        verification_timeout: int = 20
+        verification_timeout: int = 20,
+        governor: Optional[BudgetGovernor] = None
     ):
         """
         Initialize EmailFinder.
@@ -122,11 +124,13 @@ class EmailFinder:
             million_verifier_api_key: API key for MillionVerifier
             max_concurrent: Max concurrent verification requests
             verification_timeout: Timeout per verification in seconds
+            governor: Budget governor for verification credits
         """
         self.verifier = MillionVerifierClient(
             api_key=million_verifier_api_key,
             timeout_seconds=verification_timeout,
-            max_concurrent=max_concurrent
+            max_concurrent=max_concurrent,
+            governor=governor
         )
 
     async def close(self):
@@ -10,6 +10,8 @@ from dataclasses import dataclass, field
 from typing import Any
 from urllib.parse import quote_plus
 
+from ..budget import BudgetGovernor, reserve
+from .page_store import PageStore, StoredPage, download, get_page_store
 from ..validation.linkedin_normalizer import (
     normalize_linkedin_url,
     is_valid_linkedin_company_url,
@@ -46,12 +48,16 @@ class LinkedInCompanyDiscovery:
         serper_api_key: str | None = None,
         scrapin_client: Any = None,
         exa_client: Any = None,
-        timeout: int = 30
+        timeout: int = 30,
+        governor: BudgetGovernor | None = None,
+        page_store: PageStore | None = None
     ):
         self.serper_api_key = serper_api_key
         self.scrapin = scrapin_client
         self.exa = exa_client
         self.timeout = timeout
+        self.governor = governor
+        self.page_store = page_store
         self._session: aiohttp.ClientSession | None = None
 
     async def _get_session(self) -> aiohttp.ClientSession:
@@ -91,7 +97,7 @@ class LinkedInCompanyDiscovery:
 
             query = " ".join(query_parts)
 
-            async with session.post(
+            async with reserve(self.governor, "serper"), session.post(
                 "https://google.serper.dev/search",
                 headers={
                     "X-API-KEY": self.serper_api_key,
@@ -231,28 +237,34 @@ class LinkedInCompanyDiscovery:
                 re.I
             )
 
+            store = self.page_store or get_page_store()
+
+            async def fetch(url: str) -> StoredPage:
+                return await download(
+                    session,
+                    url,
+                    headers={"User-Agent": "Mozilla/5.0"},
+                    allow_redirects=True,
+                    timeout=aiohttp.ClientTimeout(total=10)
+                )
+
             for url in urls_to_try:
                 try:
-                    async with session.get(
-                        url,
-                        headers={"User-Agent": "Mozilla/5.0"},
-                        allow_redirects=True,
-                        timeout=aiohttp.ClientTimeout(total=10)
-                    ) as response:
-                        if response.status == 200:
-                            html = await response.text()
-
-                            matches = linkedin_pattern.findall(html)
-                            for slug in matches[:3]:  # Take first 3 unique
-                                normalized = f"linkedin.com/company/{slug}"
-                                if not any(c["url"] == normalized for c in candidates):
-                                    candidates.append({
-                                        "url": normalized,
-                                        "title": "",
-                                        "snippet": f"Found on {url}",
-                                        "source": "site_scrape",
-                                        "confidence_boost": 30  # Found on company site = very high confidence
-                                    })
+                    page = await store.fetch(url, fetch) if store else await fetch(url)
+                    if page.ok:
+                        matches = linkedin_pattern.findall(page.html)
+                        for slug in matches[:3]:  # Take first 3 unique
+                            normalized = f"linkedin.com/company/{slug}"
+                            if not any(c["url"] == normalized for c in candidates):
+                                candidates.append({
+                                    "url": normalized,
+                                    "title": "",
+                                    "snippet": f"Found on {url}",
+                                    "source": "site_scrape",
+                                    "confidence_boost": 30  # Found on company site = very high confidence
+                                })
+                    elif page.error == "dns":
+                        break  # Dead domain: the other pages cannot resolve either
                 except Exception:
                     continue
         except Exception:
@@ -12,6 +12,9 @@ import aiohttp
 from dataclasses import dataclass, field
 from urllib.parse import urlparse
 
+from ..budget import BudgetGovernor, reserve
+from .page_store import PageStore, get_page_store
+
 
 @dataclass
 class LocalBusinessResult:
@@ -104,9 +107,17 @@ class OpenWebNinjaClient:
     WEBSITE_CONTACTS_HOST = "website-contacts-scraper.p.rapidapi.com"
     SOCIAL_LINKS_HOST = "social-links-search.p.rapidapi.com"
 
-    def __init__(self, api_key: str, timeout: int = 30):
+    def __init__(
+        self,
+        api_key: str,
+        timeout: int = 30,
+        governor: BudgetGovernor | None = None,
+        page_store: PageStore | None = None
+    ):
         self.api_key = api_key
         self.timeout = timeout
+        self.governor = governor
+        self.page_store = page_store
         self._sessions: dict[str, aiohttp.ClientSession] = {}
 
     async def _get_session(self, host: str) -> aiohttp.ClientSession:
@@ -165,7 +176,7 @@ class OpenWebNinjaClient:
         }
 
         try:
-            async with session.get(url, params=params) as response:
+            async with reserve(self.governor, "openweb_ninja"), session.get(url, params=params) as response:
                 if response.status == 401:
                     return LocalBusinessResult(
                         place_id=None, name=None, owner_name=None,
@@ -267,8 +278,17 @@ class OpenWebNinjaClient:
 
         payload = {"query": domain}
 
+        # Don't pay to scrape a domain that does not resolve (known, or looked up now)
+        store = self.page_store or get_page_store()
+        dead = await store.check_host(domain) if store else None
+        if dead:
+            return OpenWebContactResult(
+                domain=domain,
+                error=f"Domain unreachable ({dead}, cached)"
+            )
+
         try:
-            async with session.post(url, json=payload) as response:
+            async with reserve(self.governor, "openweb_ninja"), session.post(url, json=payload) as response:
                 if response.status == 401:
                     return OpenWebContactResult(
                         domain=domain,
@@ -333,7 +353,7 @@ class OpenWebNinjaClient:
         }
 
         try:
-            async with session.post(url, json=payload) as response:
+            async with reserve(self.governor, "openweb_ninja"), session.post(url, json=payload) as response:
                 if response.status == 401:
                     return SocialLinksResult(
                         query=name,
@@ -0,0 +1,196 @@
+"""
+Page Extraction - Single-pass contact extraction from raw HTML
+
+WebsiteContactExtractor used to run two regexes per owner keyword plus
+separate email/phone/LinkedIn/JSON-LD scans over every page (22 passes).
+This module does it in three:
+
+1. One combined scan of the raw HTML for JSON-LD blocks, links,
+   LinkedIn slugs, emails and phones (contacts inside JSON-LD are
+   sub-scanned so nothing the separate scans found is lost).
+2. One pass that strips markup (script/style/comments dropped, tags
+   replaced by their alt/title/content/aria-label text, block tags
+   turned into phrase breaks, entities unescaped).
+3. One scan of the stripped text for every owner keyword at once; the
+   "Owner: Jane Doe" / "Jane Doe, Owner" name patterns are then matched
+   anchored at each keyword hit instead of searched across the page.
+
+Owner patterns see text, not markup, so names split by inline tags
+("<strong>Owner:</strong> Jane Doe", "<span>Jane Doe</span>, Owner")
+and names in image alt text are now found as well.
+
+extract_page() is a plain module-level function over a str so heavy
+pages can be shipped to a process pool.
+"""
+
+import html as html_lib
+import json
+import re
+from dataclasses import dataclass, field
+
+
+# Owner-related keywords (order is the output order)
+OWNER_KEYWORDS = [
+    "owner", "founder", "president", "ceo", "chief executive",
+    "proprietor", "principal", "managing partner", "general manager"
+]
+
+# JSON-LD block | LinkedIn slug | email | phone, in one alternation
+_CONTACT_PATTERNS = (
+    r'(?P<li>linkedin\.com/in/(?P<slug>[a-zA-Z0-9\-]+))'
+    r'|(?P<email>\b[A-Za-z0-9._%+-]++@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b)'
+    r'|(?P<phone>\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})'
+)
+# href only consumes `href="`: the URL is read by the lookahead, so emails,
+# phones and LinkedIn slugs inside it are still matched by the next alternatives
+_RAW_SCAN = re.compile(
+    r'(?P<ld>(?si:<script[^>]*type=["\']application/ld\+json["\'][^>]*>(?P<ld_body>.*?)</script>))'
+    r'|(?P<href>(?i:\bhref)\s*=\s*["\']?(?=(?P<url>[^"\'\s>]+)))|'
+    + _CONTACT_PATTERNS
+)
+_CONTACT_SCAN = re.compile(_CONTACT_PATTERNS)
+_NON_DIGIT = re.compile(r'[^\d]')
+
+# script/style/noscript bodies and comments are dropped; other tags are split
+# below. Whitespace around a tag goes with it, which is most of a page's whitespace.
+_MARKUP = re.compile(
+    r'\s*(?:<(script|style|noscript)\b[^>]*>.*?</\1\s*>|<!--.*?-->|</?([a-zA-Z][\w:-]*)([^>]*)>|<[^>]*>)\s*',
+    re.DOTALL | re.IGNORECASE
+)
+_TEXT_ATTRS = re.compile(r'\b(?:alt|title|content|aria-label)\s*=\s*(["\'])(.*?)\1', re.DOTALL | re.IGNORECASE)
+# Inline tags become a space ("<b>Owner</b>: Jane Doe" still reads as one phrase);
+# every other tag ends the phrase with "|", which no name pattern crosses, so
+# "<h3>Jane Doe</h3><p>Owner of Acme...</p>" does not pair a heading with the next block
+_INLINE_TAGS = {
+    "a", "abbr", "b", "bdi", "cite", "code", "em", "font", "i", "label", "mark",
+    "q", "s", "small", "span", "strong", "sub", "sup", "time", "u"
+}
+
+# Every keyword in its own group: match.lastindex - 1 is the keyword index
+# (the lookahead on first letters lets the scan skip most positions cheaply)
+_KEYWORD_SCAN = re.compile(
+    r'(?=[' + "".join(sorted({k[0] for k in OWNER_KEYWORDS})) + r'])'
+    r'\b(?:' + "|".join(f"({re.escape(k)})" for k in OWNER_KEYWORDS) + r')\b',
+    re.IGNORECASE
+)
+_NAME = r'([A-Z][a-z]+\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)'
+# "Owner: Jane Doe" - the legacy pattern was case-insensitive as a whole, so is this
+_NAME_AFTER = re.compile(r'[:\s]+' + _NAME, re.IGNORECASE)
+# "Jane Doe, Owner" - one per keyword, searched only around each keyword hit
+# (the greedy name can run through the keyword into a later one: "Chief Executive Owner, Owner")
+_NAME_BEFORE = [re.compile(_NAME + r'[,\s]+(?i:\b' + re.escape(k) + r'\b)') for k in OWNER_KEYWORDS]
+_NAME_BEFORE_WINDOW = 200
+
+
+@dataclass
+class PageExtraction:
+    """Raw extraction from one page (filtering is left to the caller)"""
+    schemas: list[dict] = field(default_factory=list)
+    emails: list[str] = field(default_factory=list)           # Unique, in page order, as written
+    phones: list[str] = field(default_factory=list)           # Unique, last 10 digits
+    linkedin_slugs: list[str] = field(default_factory=list)   # In page order, repeats kept
+    owners: list[tuple[str, str]] = field(default_factory=list)  # (name, keyword), keyword order
+    links: list[str] = field(default_factory=list)            # Unique href values, in page order
+
+
+def _markup_replacement(match: re.Match) -> str:
+    tag_name = match.group(2)
+    if tag_name is None:
+        # script/style/noscript body, comment or stray "<...>"
+        return " | " if match.group(1) else " "
+    attrs = match.group(3)
+    # Substring checks first: running _TEXT_ATTRS on every tag doubles the cost of the strip
+    if "=" in attrs and ("alt" in attrs or "title" in attrs or "content" in attrs or "label" in attrs):
+        values = [m.group(2) for m in _TEXT_ATTRS.finditer(attrs)]
+        if values:
+            # Each alt/title value is its own phrase wherever the tag sits
+            return f" | {' | '.join(values)} | "
+    return " " if tag_name.lower() in _INLINE_TAGS else " | "
+
+
+def strip_markup(html: str) -> str:
+    """Visible text of an HTML page, block elements separated by " | "."""
+    return html_lib.unescape(_MARKUP.sub(_markup_replacement, html))
+
+
+def _parse_json_ld(body: str, schemas: list[dict]):
+    try:
+        data = json.loads(body.strip())
+    except json.JSONDecodeError:
+        return
+    # Handle @graph array
+    if isinstance(data, dict) and "@graph" in data:
+        schemas.extend(data["@graph"])
+    elif isinstance(data, list):
+        schemas.extend(data)
+    else:
+        schemas.append(data)
+
+
+def find_owner_names(text: str) -> list[tuple[str, str]]:
+    """
+    (name, keyword) pairs for "Owner: Jane Doe" and "Jane Doe, Owner".
+
+    Same matches, in the same order, as running both patterns per
+    keyword with re.findall: keyword by keyword, "after" matches then
+    "before" matches, each by position.
+    """
+    found: list[tuple[int, int, int, str]] = []
+    after_end = [0] * len(OWNER_KEYWORDS)   # findall never rescans consumed text
+    before_end = [0] * len(OWNER_KEYWORDS)
+
+    for hit in _KEYWORD_SCAN.finditer(text):
+        k = hit.lastindex - 1
+        start, end = hit.span()
+
+        if start >= after_end[k]:
+            name = _NAME_AFTER.match(text, end)
+            if name:
+                after_end[k] = name.end()
+                found.append((k, 0, start, name.group(1)))
+
+        # A match starting at or after this hit belongs to a later hit
+        lo = max(before_end[k], start - _NAME_BEFORE_WINDOW)
+        name = _NAME_BEFORE[k].search(text, lo, end + _NAME_BEFORE_WINDOW)
+        if name and name.start() < start:
+            before_end[k] = name.end()
+            found.append((k, 1, name.start(), name.group(1)))
+
+    found.sort()
+    return [(name.strip(), OWNER_KEYWORDS[k]) for k, _, _, name in found]
+
+
+def extract_page(html: str) -> PageExtraction:
+    """Schema.org blocks, emails, phones, LinkedIn slugs and owner names from one page."""
+    result = PageExtraction()
+    emails: dict[str, None] = {}
+    phones: dict[str, None] = {}
+    links: dict[str, None] = {}
+
+    def take(match: re.Match):
+        kind = match.lastgroup
+        if kind == "li":
+            result.linkedin_slugs.append(match.group("slug"))
+        elif kind == "email":
+            emails.setdefault(match.group("email"))
+        elif kind == "phone":
+            digits = _NON_DIGIT.sub("", match.group("phone"))
+            if len(digits) >= 10:
+                phones.setdefault(digits[-10:])
+
+    for match in _RAW_SCAN.finditer(html):
+        if match.lastgroup == "ld":
+            body = match.group("ld_body")
+            _parse_json_ld(body, result.schemas)
+            for inner in _CONTACT_SCAN.finditer(body):
+                take(inner)
+        elif match.lastgroup == "href":
+            links.setdefault(match.group("url"))
+        else:
+            take(match)
+
+    result.emails = list(emails)
+    result.phones = list(phones)
+    result.links = list(links)
+    result.owners = find_owner_names(strip_markup(html))
+    return result
@@ -0,0 +1,319 @@
+"""
+Page Store
+Shared fetch memo and negative cache for company web pages
+
+Within one company run the same site is fetched by several stages
+(WebsiteContactExtractor, LinkedInCompanyDiscovery's site scrape, ...),
+and dead domains used to be retried by every stage on every rerun. Every
+page fetcher goes through one PageStore instead:
+
+- Pages are keyed by URL (scheme/host lowercased, fragment dropped, empty
+  path = "/") and hold HTML, status, final URL and fetch time. A fresh
+  entry is served without a request; concurrent fetches of the same URL
+  share one download.
+- Failures are cached too, each kind with its own TTL: 4xx responses and
+  timeouts per URL, DNS failures per host (every URL on a host that does
+  not resolve fails without a request). 429 and 5xx are transient and
+  never cached, and neither is a page the fetcher marks not cacheable.
+- check_host() resolves a domain before a paid per-domain call, so a dead
+  domain is known even when no page fetch has tried it yet.
+- SQLite and (de)compression run in a worker thread, off the event loop.
+
+Fetchers built without a store use the process-wide one set with
+set_page_store(); with neither, nothing is cached.
+"""
+
+import asyncio
+import socket
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Awaitable, Callable
+from urllib.parse import urlsplit, urlunsplit
+
+import aiohttp
+
+
+DAY = 24 * 3600
+
+DEFAULT_TTL = DAY
+
+# How long each kind of failure is remembered
+DEFAULT_NEGATIVE_TTLS = {
+    "dns": DAY,
+    "timeout": 6 * 3600,
+    "http_4xx": 3 * DAY,
+}
+
+
+def page_key(url: str) -> str:
+    """Store key for a URL: lowercase scheme/host, no fragment, "/" for an empty path."""
+    parts = urlsplit(url.strip())
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or "/", parts.query, ""))
+
+
+def host_key(url_or_domain: str) -> str:
+    """Bare lowercase host (no www.) for a URL or domain."""
+    if "//" not in url_or_domain:
+        url_or_domain = f"https://{url_or_domain}"
+    host = (urlsplit(url_or_domain).hostname or "").lower()
+    return host.removeprefix("www.")
+
+
+@dataclass
+class StoredPage:
+    """One fetch outcome (a page, or a remembered failure)"""
+    url: str
+    status: int = 0                   # HTTP status; 0 when no response came back
+    html: str | None = None
+    final_url: str | None = None      # After redirects
+    fetched_at: float = 0.0
+    error: str | None = None          # dns | timeout | http_4xx | transient error text
+    cached: bool = False              # Served from the store
+    cacheable: bool = True            # False: the fetcher is not sure the failure is definitive
+
+    @property
+    def ok(self) -> bool:
+        return self.status == 200 and self.html is not None
+
+
+def classify_error(error: BaseException) -> str | None:
+    """Negative-cache kind for a fetch exception, or None if it is transient."""
+    if isinstance(error, (asyncio.TimeoutError, aiohttp.ServerTimeoutError)):
+        return "timeout"
+    if isinstance(error, aiohttp.ClientConnectorError) and isinstance(error.os_error, socket.gaierror):
+        return "dns"
+    if isinstance(error, socket.gaierror):
+        return "dns"
+    return None
+
+
+async def download(
+    session: aiohttp.ClientSession,
+    url: str,
+    **kwargs
+) -> StoredPage:
+    """Plain GET through `session` (kwargs go to session.get); raises on transport errors."""
+    async with session.get(url, **kwargs) as response:
+        html = await response.text(errors="replace") if response.status == 200 else None
+        return StoredPage(url=url, status=response.status, html=html, final_url=str(response.url))
+
+
+class PageStore:
+    """
+    SQLite-backed page memo shared by all website fetchers.
+
+    Usage:
+        store = PageStore("data/pages.db")
+        set_page_store(store)   # or pass page_store= to each fetcher
+
+        page = await store.fetch(url, lambda u: download(session, u, timeout=...))
+        if page.ok:
+            parse(page.html)
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path | None = None,
+        ttl: float = DEFAULT_TTL,
+        negative_ttls: dict | None = None
+    ):
+        """
+        Args:
+            db_path: SQLite file (None = in-memory, for one process)
+            ttl: Seconds a fetched page is reused
+            negative_ttls: Overrides for DEFAULT_NEGATIVE_TTLS (seconds)
+        """
+        if db_path is not None:
+            db_path = Path(db_path)
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_path
+        self.ttl = ttl
+        self.negative_ttls = {**DEFAULT_NEGATIVE_TTLS, **(negative_ttls or {})}
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path) if db_path else ":memory:", check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._init_db()
+
+    def _init_db(self):
+        with self._lock, self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS pages (
+                    url TEXT PRIMARY KEY,
+                    status INTEGER NOT NULL,
+                    html BLOB,
+                    final_url TEXT,
+                    error TEXT,
+                    fetched_at REAL NOT NULL
+                )
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS dead_hosts (
+                    host TEXT PRIMARY KEY,
+                    error TEXT NOT NULL,
+                    failed_at REAL NOT NULL
+                )
+            """)
+
+    def close(self):
+        self._conn.close()
+
+    # --- lookups ---
+
+    def host_failure(self, url_or_domain: str) -> str | None:
+        """Why the host is known dead ("dns"), or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT error, failed_at FROM dead_hosts WHERE host = ?", (host_key(url_or_domain),)
+            ).fetchone()
+        if row is None or time.time() - row["failed_at"] > self.negative_ttls.get(row["error"], 0):
+            return None
+        return row["error"]
+
+    def get(self, url: str) -> StoredPage | None:
+        """Fresh stored outcome for `url` (a page or a cached failure), else None."""
+        key = page_key(url)
+        dead = self.host_failure(key)
+        if dead:
+            return StoredPage(url=key, error=dead, cached=True)
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM pages WHERE url = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        ttl = self.negative_ttls.get(row["error"], 0) if row["error"] else self.ttl
+        if time.time() - row["fetched_at"] > ttl:
+            return None
+        return StoredPage(
+            url=key,
+            status=row["status"],
+            html=zlib.decompress(row["html"]).decode("utf-8") if row["html"] is not None else None,
+            final_url=row["final_url"],
+            fetched_at=row["fetched_at"],
+            error=row["error"],
+            cached=True,
+        )
+
+    # --- writes ---
+
+    def put(self, page: StoredPage):
+        """Remember a fetch outcome if it is cacheable (2xx/3xx, 4xx except 429, dns, timeout)."""
+        if not page.cacheable:
+            return
+        page.fetched_at = page.fetched_at or time.time()
+        if page.error == "dns":
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO dead_hosts (host, error, failed_at) VALUES (?, ?, ?)",
+                    (host_key(page.url), "dns", page.fetched_at)
+                )
+            return
+        if 400 <= page.status < 500 and page.status != 429:
+            page.error = "http_4xx"
+        elif page.error != "timeout" and not 200 <= page.status < 400:
+            return
+        html = zlib.compress(page.html.encode("utf-8")) if page.html is not None else None
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages (url, status, html, final_url, error, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (page_key(page.url), page.status, html, page.final_url, page.error, page.fetched_at)
+            )
+
+    # --- async access (SQLite and zlib off the event loop) ---
+
+    async def check_host(self, url_or_domain: str) -> str | None:
+        """
+        Why the host is dead ("dns"), resolving it first if it is not known.
+
+        A host that resolves neither bare nor with www. is remembered as a
+        DNS failure, like a failed page fetch would be.
+        """
+        host = host_key(url_or_domain)
+        dead = await asyncio.to_thread(self.host_failure, host)
+        if dead or not host:
+            return dead
+        loop = asyncio.get_running_loop()
+        for name in (host, f"www.{host}"):
+            try:
+                await loop.getaddrinfo(name, 443)
+                return None
+            except socket.gaierror:
+                continue
+        await asyncio.to_thread(self.put, StoredPage(url=f"https://{host}/", error="dns"))
+        return "dns"
+
+    # --- fetch through the store ---
+
+    async def fetch(self, url: str, fetcher: Callable[[str], Awaitable[StoredPage]]) -> StoredPage:
+        """
+        Stored outcome for `url`, or run `fetcher(url)` once and remember it.
+
+        Transport exceptions from the fetcher are caught and returned as a
+        StoredPage with `error` set (cached when classify_error() says so).
+        """
+        cached = await asyncio.to_thread(self.get, url)
+        if cached is not None:
+            if cached.ok:
+                self.hits += 1
+            else:
+                self.negative_hits += 1
+            return cached
+
+        key = page_key(url)
+        pending = self._inflight.get(key)
+        if pending is not None:
+            page = await asyncio.shield(pending)
+            if page is None:
+                # The owner was cancelled: fetch again instead of sharing its cancellation
+                return await self.fetch(url, fetcher)
+            self.hits += 1
+            return page
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            try:
+                page = await fetcher(url)
+            except Exception as e:
+                page = StoredPage(url=url, error=classify_error(e) or f"{type(e).__name__}: {e}")
+            await asyncio.to_thread(self.put, page)
+            future.set_result(page)
+            return page
+        except BaseException:
+            # Cancelled: None tells waiters to fetch again themselves
+            if not future.done():
+                future.set_result(None)
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    def stats(self) -> dict:
+        with self._lock:
+            pages = self._conn.execute("SELECT COUNT(*) FROM pages WHERE error IS NULL").fetchone()[0]
+            negative = self._conn.execute("SELECT COUNT(*) FROM pages WHERE error IS NOT NULL").fetchone()[0]
+            dead_hosts = self._conn.execute("SELECT COUNT(*) FROM dead_hosts").fetchone()[0]
+        return {
+            "pages": pages, "negative_pages": negative, "dead_hosts": dead_hosts,
+            "hits": self.hits, "negative_hits": self.negative_hits, "misses": self.misses,
+        }
+
+
+_page_store: PageStore | None = None
+
+
+def set_page_store(store: PageStore | None):
+    """Install the process-wide store used by fetchers built without one."""
+    global _page_store
+    _page_store = store
+
+
+def get_page_store() -> PageStore | None:
+    return _page_store
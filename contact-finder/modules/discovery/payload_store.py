@@ -0,0 +1,179 @@
+"""
+Payload Store
+Raw provider responses kept out of contact records, by reference
+
+Candidates and enriched contacts used to carry each provider's full JSON
+response in a raw_data dict, so a large run held every payload (often the
+same employee list once per candidate) for as long as the records lived,
+although nothing reads them during the run. Records now keep raw_ref, a
+content hash, and the payload lives here:
+
+- Each distinct payload is stored once, as zlib-compressed JSON
+- In memory by default; with a db_path the payloads go to disk and the
+  process only holds the refs
+- record.raw_data loads a payload back when it is needed (debugging, audits)
+- Small flat payloads (a name and a title, an email and its source) are not
+  worth a hash, a compress and an SQLite write per candidate: put_payload()
+  returns them as-is and the record keeps them inline
+
+Records built while no store is installed use a process-wide in-memory one
+that keeps the most recent DEFAULT_MAX_PAYLOADS payloads, so long-running
+workers do not grow it forever. Older payloads are evicted: raw_data of a
+record whose payload was evicted comes back empty. The first eviction is
+logged and stats() counts evictions and misses; runs that need every
+payload afterwards should install an on-disk store with set_payload_store().
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import zlib
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Payloads with at most this many keys and only scalar values stay inline
+INLINE_MAX_KEYS = 8
+
+# Bound of the implicit process-wide store
+DEFAULT_MAX_PAYLOADS = 10_000
+
+
+def payload_ref(payload: dict) -> str:
+    """Content hash of a payload (key order does not matter)."""
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=10).hexdigest()
+
+
+class PayloadStore:
+    """
+    SQLite-backed, content-addressed store for raw API payloads.
+
+    Usage:
+        store = PayloadStore("data/payloads.db")
+        set_payload_store(store)
+
+        ref = store.put(response)       # Keep `ref` on the record
+        response = store.get(ref)
+    """
+
+    def __init__(self, db_path: str | Path | None = None, max_payloads: int | None = None):
+        """
+        Args:
+            db_path: SQLite file (None = in-memory, for one process)
+            max_payloads: Keep only the most recently added payloads (None = all)
+        """
+        if db_path is not None:
+            db_path = Path(db_path)
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_path
+        self.max_payloads = max_payloads
+        self.puts = 0
+        self.duplicates = 0
+        self.evicted = 0                  # Payloads dropped to stay under max_payloads
+        self.misses = 0                   # get() of a ref that is not (or no longer) stored
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path) if db_path else ":memory:", check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS payloads (
+                    ref TEXT PRIMARY KEY,
+                    data BLOB NOT NULL
+                )
+            """)
+
+    def close(self):
+        self._conn.close()
+
+    def put(self, payload: dict | None) -> str | None:
+        """Store a payload and return its ref (None for an empty payload)."""
+        if not payload:
+            return None
+        ref = payload_ref(payload)
+        data = zlib.compress(json.dumps(payload, default=str).encode("utf-8"))
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO payloads (ref, data) VALUES (?, ?)", (ref, data)
+            )
+            evicted = 0
+            if self.max_payloads is not None and cursor.rowcount:
+                evicted = self._conn.execute(
+                    "DELETE FROM payloads WHERE rowid <= ?", (cursor.lastrowid - self.max_payloads,)
+                ).rowcount
+        self.puts += 1
+        if cursor.rowcount == 0:
+            self.duplicates += 1
+        if evicted:
+            if not self.evicted:
+                logger.warning(
+                    f"Payload store is full ({self.max_payloads} payloads): evicting the oldest, whose "
+                    f"raw_data will read back empty. Install an on-disk PayloadStore to keep them all."
+                )
+            self.evicted += evicted
+        return ref
+
+    def get(self, ref: str | None) -> dict | None:
+        """Payload stored under `ref`, else None."""
+        if ref is None:
+            return None
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM payloads WHERE ref = ?", (ref,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        return json.loads(zlib.decompress(row[0]))
+
+    def stats(self) -> dict:
+        with self._lock:
+            payloads, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(LENGTH(data)), 0) FROM payloads"
+            ).fetchone()
+        return {
+            "payloads": payloads, "compressed_bytes": size, "puts": self.puts, "duplicates": self.duplicates,
+            "evicted": self.evicted, "misses": self.misses,
+        }
+
+
+_payload_store: PayloadStore | None = None
+
+
+def set_payload_store(store: PayloadStore | None):
+    """Install the process-wide store records keep their payloads in."""
+    global _payload_store
+    _payload_store = store
+
+
+def get_payload_store() -> PayloadStore:
+    """Process-wide store (a bounded in-memory one is created on first use)."""
+    global _payload_store
+    if _payload_store is None:
+        _payload_store = PayloadStore(max_payloads=DEFAULT_MAX_PAYLOADS)
+    return _payload_store
+
+
+def is_inline(payload: dict) -> bool:
+    """Whether a payload is small enough to keep on the record itself."""
+    return len(payload) <= INLINE_MAX_KEYS and all(
+        value is None or isinstance(value, (str, int, float, bool)) for value in payload.values()
+    )
+
+
+def put_payload(payload: dict | None) -> str | dict | None:
+    """
+    Ref for a payload: small ones are returned as-is, others are stored in
+    the process-wide store and their hash is returned.
+    """
+    if not payload:
+        return None
+    if is_inline(payload):
+        return payload
+    return get_payload_store().put(payload)
+
+
+def load_payload(ref: str | dict | None) -> dict | None:
+    """Payload for a ref from put_payload()."""
+    if isinstance(ref, dict):
+        return ref
+    return get_payload_store().get(ref)
@@ -12,6 +12,8 @@ from dataclasses import dataclass, field
 from typing import Any
 import aiohttp
 
+from ..budget import BudgetGovernor, reserve
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,10 +34,11 @@ class SerperDataFiller:
     Can fill: domain, address, phone, owner name
     """
 
-    def __init__(self, api_key: str | None = None):
+    def __init__(self, api_key: str | None = None, governor: BudgetGovernor | None = None):
         self.api_key = api_key or os.environ.get("SERPER_API_KEY")
         self.base_url = "https://google.serper.dev/search"
         self.cost_per_query = 0.001
+        self.governor = governor
 
     async def search(self, query: str, num_results: int = 5) -> dict:
         """Execute a Serper search"""
@@ -52,7 +55,7 @@ class SerperDataFiller:
             "num": num_results
         }
 
-        async with aiohttp.ClientSession() as session:
+        async with reserve(self.governor, "serper"), aiohttp.ClientSession() as session:
             async with session.post(
                 self.base_url,
                 json=payload,
@@ -164,7 +167,7 @@ class SerperDataFiller:
         # Case-sensitive patterns for proper names
         owner_patterns = [
             r'(?i)(?:owner|founder|president|ceo)[:\s]+([A-Z][a-z]+\s+[A-Z][a-z]+)',
-            r'([A-Z][a-z]+\s+[A-Z][a-z]+)[,\s]+(?i)(?:owner|founder|president)',
+            r'([A-Z][a-z]+\s+[A-Z][a-z]+)[,\s]+(?i:owner|founder|president)',
             r'(?i)(?:owned by|founded by)[:\s]+([A-Z][a-z]+\s+[A-Z][a-z]+)',
         ]
 
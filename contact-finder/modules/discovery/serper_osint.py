@@ -12,6 +12,8 @@ from dataclasses import dataclass, field
 from typing import Optional
 import aiohttp
 
+from ..budget import BudgetGovernor, reserve
+
 logger = logging.getLogger(__name__)
 
 
@@ -45,9 +47,10 @@ class SerperOsint:
     Recency: Immediate (finds news/changes within hours)
     """
 
-    def __init__(self, api_key: str | None = None):
+    def __init__(self, api_key: str | None = None, governor: BudgetGovernor | None = None):
         self.api_key = api_key or os.environ.get("SERPER_API_KEY")
         self.base_url = "https://google.serper.dev/search"
+        self.governor = governor
 
     async def search(self, query: str, num_results: int = 10) -> dict:
         """Execute a Serper search"""
@@ -64,7 +67,7 @@ class SerperOsint:
             "num": num_results
         }
 
-        async with aiohttp.ClientSession() as session:
+        async with reserve(self.governor, "serper"), aiohttp.ClientSession() as session:
             async with session.post(
                 self.base_url,
                 json=payload,
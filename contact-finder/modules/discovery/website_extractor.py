@@ -6,15 +6,18 @@ Designed to RIP through websites at scale.
 """
 
 import asyncio
-import json
 import os
-import re
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any
 from urllib.parse import urljoin, urlparse
 import aiohttp
 
+from ..budget import BudgetExceeded, BudgetGovernor, reserve
+from .page_extraction import OWNER_KEYWORDS, PageExtraction, extract_page
+from .page_store import PageStore, StoredPage, download, get_page_store
+
 logger = logging.getLogger(__name__)
 
 
@@ -40,6 +43,8 @@ class WebsiteExtractionResult:
     phones: list[str] = field(default_factory=list)
     company_name: str | None = None
     pages_scraped: int = 0
+    zenrows_requests: int = 0
+    stopped_early: bool = False  # Link crawl found an owner with email before running out of pages
     errors: list[str] = field(default_factory=list)
     has_schema_org: bool = False
 
@@ -66,20 +71,15 @@ class WebsiteContactExtractor:
         "meet-the-team",
     ]
 
-    # Owner-related keywords
-    OWNER_KEYWORDS = [
-        "owner", "founder", "president", "ceo", "chief executive",
-        "proprietor", "principal", "managing partner", "general manager"
+    # Link crawl: hrefs containing these are followed, in this order
+    CRAWL_LINK_KEYWORDS = [
+        "contact", "about", "team", "leadership", "staff", "owner", "founder",
+        "people", "story", "who-we-are",
     ]
+    CRAWL_SKIP_EXTENSIONS = (".pdf", ".jpg", ".jpeg", ".png", ".gif", ".svg", ".css", ".js", ".xml", ".zip")
 
-    # Email regex
-    EMAIL_REGEX = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
-
-    # Phone regex
-    PHONE_REGEX = re.compile(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
-
-    # LinkedIn URL regex
-    LINKEDIN_REGEX = re.compile(r'linkedin\.com/in/([a-zA-Z0-9\-]+)')
+    # Owner-related keywords (matched by page_extraction in one pass)
+    OWNER_KEYWORDS = OWNER_KEYWORDS
 
     # Blacklist emails
     EMAIL_BLACKLIST = {
@@ -92,13 +92,43 @@ class WebsiteContactExtractor:
         zenrows_api_key: str | None = None,
         timeout: int = 15,
         max_pages: int = 5,
-        concurrency: int = 5
+        concurrency: int = 5,
+        governor: BudgetGovernor | None = None,
+        heavy_page_bytes: int = 200_000,
+        extraction_workers: int = 2,
+        crawl_mode: str = "fixed",
+        stop_confidence: float = 0.9,
+        crawl_batch: int = 2,
+        page_store: PageStore | None = None
     ):
+        """
+        Args:
+            heavy_page_bytes: Pages at least this large are parsed in a worker
+                process instead of on the event loop
+            extraction_workers: Worker processes for heavy pages (0 parses inline)
+            crawl_mode: "fixed" fetches CONTACT_PAGES[:max_pages] at once;
+                "links" fetches the homepage, then only the contact/about links
+                it contains, and stops once an owner with an email is found
+            stop_confidence: Link crawl stops at a named contact with an email
+                at or above this confidence (schema.org founder/Person data)
+            crawl_batch: Linked pages fetched concurrently per step of the link crawl
+            page_store: Page memo/negative cache (default: the process-wide one)
+        """
+        if crawl_mode not in ("fixed", "links"):
+            raise ValueError(f"Unknown crawl_mode: {crawl_mode}")
         self.zenrows_api_key = zenrows_api_key or os.environ.get("ZENROWS_API_KEY")
         self.timeout = timeout
         self.max_pages = max_pages
         self.concurrency = concurrency
+        self.governor = governor
+        self.heavy_page_bytes = heavy_page_bytes
+        self.extraction_workers = extraction_workers
+        self.crawl_mode = crawl_mode
+        self.stop_confidence = stop_confidence
+        self.crawl_batch = crawl_batch
+        self.page_store = page_store
         self._session: aiohttp.ClientSession | None = None
+        self._pool: ProcessPoolExecutor | None = None
 
     async def _get_session(self) -> aiohttp.ClientSession:
         if self._session is None or self._session.closed:
@@ -113,12 +143,29 @@ class WebsiteContactExtractor:
     async def close(self):
         if self._session and not self._session.closed:
             await self._session.close()
-
-    async def _fetch_url(self, url: str, use_zenrows: bool = True) -> str | None:
-        """Fetch URL content, using ZenRows for reliability"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    async def _parse_page(self, html: str) -> PageExtraction:
+        """Run the single-pass extraction, off the loop for heavy pages"""
+        if self.extraction_workers <= 0 or len(html) < self.heavy_page_bytes:
+            return extract_page(html)
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.extraction_workers)
+        return await asyncio.get_running_loop().run_in_executor(self._pool, extract_page, html)
+
+    async def _download(
+        self,
+        url: str,
+        use_zenrows: bool = True,
+        result: WebsiteExtractionResult | None = None
+    ) -> StoredPage:
+        """One fetch: ZenRows first, direct request as fallback (transport errors raise)"""
         session = await self._get_session()
+        zenrows_transient = False
 
-        # Try ZenRows first (reliable for scale)
+        # Try ZenRows first (reliable for scale); over budget falls through to direct
         if use_zenrows and self.zenrows_api_key:
             try:
                 zenrows_url = "https://api.zenrows.com/v1/"
@@ -128,47 +175,46 @@ class WebsiteContactExtractor:
                     "js_render": "false",
                     "premium_proxy": "true"
                 }
-                async with session.get(zenrows_url, params=params) as response:
-                    if response.status == 200:
-                        return await response.text()
+                async with reserve(self.governor, "zenrows"):
+                    if result is not None:
+                        result.zenrows_requests += 1
+                    async with session.get(zenrows_url, params=params) as response:
+                        if response.status == 200:
+                            return StoredPage(url=url, status=200, html=await response.text())
+                        zenrows_transient = response.status == 429 or response.status >= 500
+            except BudgetExceeded:
+                pass
             except Exception as e:
+                zenrows_transient = True
                 logger.debug(f"ZenRows failed for {url}: {e}")
 
-        # Fallback to direct request
-        try:
-            async with session.get(url) as response:
-                if response.status == 200:
-                    html = await response.text()
-                    if len(html) > 500:
-                        return html
-        except Exception as e:
-            logger.debug(f"Direct request failed for {url}: {e}")
-
-        return None
-
-    def _extract_schema_org(self, html: str) -> list[dict]:
-        """Extract JSON-LD Schema.org data"""
-        schemas = []
+        # Fallback to direct request; a direct 4xx (often a bot block) is only
+        # definitive when ZenRows did not just fail transiently
+        page = await download(session, url)
+        if zenrows_transient and 400 <= page.status < 500:
+            page.cacheable = False
+        return page
 
-        # Find all JSON-LD blocks
-        pattern = r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>'
-        matches = re.findall(pattern, html, re.DOTALL | re.IGNORECASE)
-
-        for match in matches:
+    async def _fetch_url(
+        self,
+        url: str,
+        use_zenrows: bool = True,
+        result: WebsiteExtractionResult | None = None
+    ) -> str | None:
+        """Fetch URL content through the page store, using ZenRows for reliability (counted on `result`)"""
+        store = self.page_store or get_page_store()
+        if store is not None:
+            page = await store.fetch(url, lambda u: self._download(u, use_zenrows, result))
+        else:
             try:
-                data = json.loads(match.strip())
-
-                # Handle @graph array
-                if isinstance(data, dict) and "@graph" in data:
-                    schemas.extend(data["@graph"])
-                elif isinstance(data, list):
-                    schemas.extend(data)
-                else:
-                    schemas.append(data)
-            except json.JSONDecodeError:
-                continue
-
-        return schemas
+                page = await self._download(url, use_zenrows, result)
+            except Exception as e:
+                page = StoredPage(url=url, error=str(e))
+        if page.error:
+            logger.debug(f"Fetch failed for {url}: {page.error}")
+        if page.ok and len(page.html) > 500:
+            return page.html
+        return None
 
     def _extract_contacts_from_schema(self, schemas: list[dict], source_page: str) -> list[ExtractedContact]:
         """Extract contact info from Schema.org data"""
@@ -243,14 +289,10 @@ class WebsiteContactExtractor:
 
         return [c for c in contacts if c.name or c.email]
 
-    def _extract_emails(self, html: str, domain: str) -> list[str]:
-        """Extract emails from HTML, filtering to domain emails"""
-        all_emails = set(self.EMAIL_REGEX.findall(html))
-
+    def _filter_emails(self, emails: list[str], domain: str) -> list[str]:
+        """Filter page emails to domain and personal addresses"""
         valid_emails = []
-        for email in all_emails:
-            email = email.lower()
-
+        for email in dict.fromkeys(e.lower() for e in emails):
             # Filter blacklist
             local_part = email.split("@")[0]
             if any(bl in local_part for bl in self.EMAIL_BLACKLIST):
@@ -269,15 +311,6 @@ class WebsiteContactExtractor:
 
         return valid_emails[:10]
 
-    def _extract_phones(self, html: str) -> list[str]:
-        """Extract phone numbers"""
-        phones = set()
-        for match in self.PHONE_REGEX.findall(html):
-            phone = re.sub(r'[^\d]', '', match)
-            if len(phone) >= 10:
-                phones.add(phone[-10:])
-        return list(phones)[:5]
-
     # Common words that should NOT be names (includes business terms)
     INVALID_NAME_WORDS = {
         # Common words
@@ -326,38 +359,24 @@ class WebsiteContactExtractor:
 
         return True
 
-    def _extract_contacts_from_page(self, html: str, domain: str, source_page: str) -> list[ExtractedContact]:
-        """Extract contacts by parsing page content"""
+    def _extract_contacts_from_page(self, page: PageExtraction, source_page: str) -> list[ExtractedContact]:
+        """Contacts from owner/title patterns and LinkedIn links on the page"""
         contacts = []
 
-        # Look for owner/founder patterns (case-sensitive for proper names)
-        for keyword in self.OWNER_KEYWORDS:
-            # Pattern: "Owner: John Smith" or "John Smith, Owner"
-            # Use word boundary and proper capitalization
-            patterns = [
-                rf'(?i)\b{keyword}\b[:\s]+([A-Z][a-z]+\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)',
-                rf'([A-Z][a-z]+\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)[,\s]+(?i)\b{keyword}\b',
-            ]
-
-            for pattern in patterns:
-                matches = re.findall(pattern, html)
-                for match in matches:
-                    name = match.strip()
-                    if self._is_valid_name(name):
-                        contacts.append(ExtractedContact(
-                            name=name,
-                            title=keyword.title(),
-                            source_page=source_page,
-                            source_type="page_scrape",
-                            confidence=0.7
-                        ))
+        # "Owner: John Smith" or "John Smith, Owner"
+        for name, keyword in page.owners:
+            if self._is_valid_name(name):
+                contacts.append(ExtractedContact(
+                    name=name,
+                    title=keyword.title(),
+                    source_page=source_page,
+                    source_type="page_scrape",
+                    confidence=0.7
+                ))
 
-        # Look for LinkedIn URLs and extract names
-        for match in self.LINKEDIN_REGEX.findall(html):
-            linkedin_url = f"https://www.linkedin.com/in/{match}"
-            # Try to find associated name
+        for slug in page.linkedin_slugs:
             contacts.append(ExtractedContact(
-                linkedin_url=linkedin_url,
+                linkedin_url=f"https://www.linkedin.com/in/{slug}",
                 source_page=source_page,
                 source_type="page_scrape",
                 confidence=0.6
@@ -365,6 +384,65 @@ class WebsiteContactExtractor:
 
         return contacts
 
+    def _crawl_links(self, page: PageExtraction, base_url: str, domain: str) -> list[str]:
+        """Same-site contact/about links on a page, best first"""
+        ranked = {}
+        for href in page.links:
+            url = urljoin(base_url, href).split("#")[0]
+            parsed = urlparse(url)
+            if parsed.scheme not in ("http", "https") or parsed.netloc.replace("www.", "") != domain:
+                continue
+            path = parsed.path.lower().rstrip("/")
+            if not path or path.endswith(self.CRAWL_SKIP_EXTENSIONS):
+                continue
+            for rank, keyword in enumerate(self.CRAWL_LINK_KEYWORDS):
+                if keyword in path:
+                    key = parsed.path.rstrip("/")
+                    if key not in ranked or ranked[key][0] > rank:
+                        ranked[key] = (rank, len(ranked), url)
+                    break
+        return [url for _, _, url in sorted(ranked.values())]
+
+    def _has_owner_with_email(self, contacts: list[ExtractedContact]) -> bool:
+        return any(c.name and c.email and c.confidence >= self.stop_confidence for c in contacts)
+
+    def _absorb_page(
+        self,
+        result: WebsiteExtractionResult,
+        url: str,
+        page: PageExtraction,
+        domain: str,
+        all_contacts: list[ExtractedContact],
+        all_emails: set[str],
+        all_phones: set[str]
+    ):
+        """Add one parsed page's findings to the running totals"""
+        result.pages_scraped += 1
+
+        # Extract Schema.org
+        schemas = page.schemas
+        if schemas:
+            result.has_schema_org = True
+            schema_contacts = self._extract_contacts_from_schema(schemas, url)
+            all_contacts.extend(schema_contacts)
+
+            # Try to get company name from schema
+            for schema in schemas:
+                if schema.get("@type") in ("Organization", "LocalBusiness", "Store"):
+                    if schema.get("name") and not result.company_name:
+                        result.company_name = schema["name"]
+
+        # Extract emails
+        emails = self._filter_emails(page.emails, domain)
+        all_emails.update(emails)
+
+        # Extract phones
+        all_phones.update(page.phones[:5])
+
+        # Extract from page content
+        page_contacts = self._extract_contacts_from_page(page, url)
+        all_contacts.extend(page_contacts)
+
     async def extract(self, domain: str) -> WebsiteExtractionResult:
         """
         Extract contacts from a domain.
@@ -381,12 +459,6 @@ class WebsiteContactExtractor:
         base_url = f"https://{domain}" if not domain.startswith("http") else domain
         domain = urlparse(base_url).netloc.replace("www.", "")
 
-        # Build URLs to scrape
-        pages_to_try = [
-            urljoin(base_url, f"/{page}")
-            for page in self.CONTACT_PAGES[:self.max_pages]
-        ]
-
         all_contacts = []
         all_emails = set()
         all_phones = set()
@@ -396,41 +468,34 @@ class WebsiteContactExtractor:
 
         async def scrape_page(url: str):
             async with semaphore:
-                return url, await self._fetch_url(url)
-
-        page_results = await asyncio.gather(*[scrape_page(url) for url in pages_to_try])
-
-        for url, html in page_results:
-            if not html:
-                result.errors.append(f"Failed to fetch: {url}")
-                continue
-
-            result.pages_scraped += 1
-
-            # Extract Schema.org
-            schemas = self._extract_schema_org(html)
-            if schemas:
-                result.has_schema_org = True
-                schema_contacts = self._extract_contacts_from_schema(schemas, url)
-                all_contacts.extend(schema_contacts)
-
-                # Try to get company name from schema
-                for schema in schemas:
-                    if schema.get("@type") in ("Organization", "LocalBusiness", "Store"):
-                        if schema.get("name") and not result.company_name:
-                            result.company_name = schema["name"]
-
-            # Extract emails
-            emails = self._extract_emails(html, domain)
-            all_emails.update(emails)
-
-            # Extract phones
-            phones = self._extract_phones(html)
-            all_phones.update(phones)
-
-            # Extract from page content
-            page_contacts = self._extract_contacts_from_page(html, domain, url)
-            all_contacts.extend(page_contacts)
+                return url, await self._fetch_url(url, result=result)
+
+        async def scrape_all(urls: list[str]) -> list[tuple[str, PageExtraction]]:
+            parsed = []
+            for url, html in await asyncio.gather(*[scrape_page(url) for url in urls]):
+                if not html:
+                    result.errors.append(f"Failed to fetch: {url}")
+                    continue
+                page = await self._parse_page(html)
+                self._absorb_page(result, url, page, domain, all_contacts, all_emails, all_phones)
+                parsed.append((url, page))
+            return parsed
+
+        if self.crawl_mode == "fixed":
+            # Build URLs to scrape
+            await scrape_all([
+                urljoin(base_url, f"/{page}")
+                for page in self.CONTACT_PAGES[:self.max_pages]
+            ])
+        else:
+            # Homepage first; follow only the contact/about links it actually has
+            home = await scrape_all([urljoin(base_url, "/")])
+            links = self._crawl_links(home[0][1], base_url, domain)[:self.max_pages - 1] if home else []
+            for i in range(0, len(links), self.crawl_batch):
+                if self._has_owner_with_email(all_contacts):
+                    result.stopped_early = True
+                    break
+                await scrape_all(links[i:i + self.crawl_batch])
 
         # Deduplicate contacts by name
         seen_names = set()
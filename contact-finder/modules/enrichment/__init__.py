@@ -3,14 +3,26 @@ from .blitz import BlitzClient
 from .leadmagic import LeadMagicClient
 from .scrapin import ScrapinClient
 from .exa import ExaClient
-from .waterfall import EnrichmentWaterfall, EnrichedContact, EnrichmentResult
+from .profile_store import ProfileStore, set_profile_store, get_profile_store
+from .waterfall import (
+    EnrichmentWaterfall,
+    EnrichedContact,
+    EnrichmentResult,
+    WaterfallStats,
+    compare_waterfall_modes
+)
 
 __all__ = [
     'BlitzClient',
     'LeadMagicClient',
     'ScrapinClient',
     'ExaClient',
+    'ProfileStore',
+    'set_profile_store',
+    'get_profile_store',
     'EnrichmentWaterfall',
     'EnrichedContact',
     'EnrichmentResult',
+    'WaterfallStats',
+    'compare_waterfall_modes',
 ]
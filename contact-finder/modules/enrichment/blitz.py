@@ -15,6 +15,8 @@ import asyncio
 from dataclasses import dataclass
 from typing import Any
 
+from ..budget import BudgetGovernor, reserve
+
 
 @dataclass
 class BlitzEmailResult:
@@ -56,9 +58,10 @@ class BlitzClient:
 
     BASE_URL = "https://beta.blitz-api.ai/api"
 
-    def __init__(self, api_key: str, timeout: int = 30):
+    def __init__(self, api_key: str, timeout: int = 30, governor: BudgetGovernor | None = None):
         self.api_key = api_key
         self.timeout = timeout
+        self.governor = governor
         self._session: aiohttp.ClientSession | None = None
 
     async def _get_session(self) -> aiohttp.ClientSession:
@@ -73,18 +76,20 @@ class BlitzClient:
         if self._session and not self._session.closed:
             await self._session.close()
 
-    async def _post(self, endpoint: str, data: dict) -> dict:
-        """Make a POST request to Blitz API"""
+    async def _post(self, endpoint: str, data: dict, credits: float = 1.0) -> dict:
+        """Make a POST request to Blitz API, reserving `credits` from the budget"""
         session = await self._get_session()
         url = f"{self.BASE_URL}{endpoint}"
 
-        async with session.post(url, json=data) as response:
-            result = await response.json()
-            if response.status == 401:
-                raise ValueError("Invalid Blitz API key")
-            if response.status == 402:
-                raise ValueError("Insufficient Blitz credits")
-            return result
+        async with reserve(self.governor, "blitz", credits) as spend:
+            async with session.post(url, json=data) as response:
+                result = await response.json()
+                if response.status == 401:
+                    raise ValueError("Invalid Blitz API key")
+                if response.status == 402:
+                    raise ValueError("Insufficient Blitz credits")
+                spend.settle(result.get("credits_consumed", credits))
+                return result
 
     async def find_email(self, linkedin_url: str) -> BlitzEmailResult:
         """
@@ -114,7 +119,7 @@ class BlitzClient:
         Cost: 3 credits on success
         """
         try:
-            result = await self._post("/enrichment/phone", {"linkedin_profile_url": linkedin_url})
+            result = await self._post("/enrichment/phone", {"linkedin_profile_url": linkedin_url}, credits=3)
 
             return BlitzPhoneResult(
                 phone=result.get("phone"),
@@ -136,7 +141,7 @@ class BlitzClient:
         Cost: 0.5 credits on success
         """
         try:
-            result = await self._post("/email/validate", {"email": email})
+            result = await self._post("/email/validate", {"email": email}, credits=0.5)
 
             return BlitzValidationResult(
                 valid=result.get("valid", False),
@@ -190,7 +195,8 @@ class BlitzClient:
         }
 
         try:
-            result = await self._post(endpoint, data)
+            credits = max_results * (3 if real_time else 1)
+            result = await self._post(endpoint, data, credits=credits)
             contacts = []
 
             for contact_data in result.get("results", []):
@@ -9,10 +9,14 @@ Features:
 - Content extraction with highlights
 """
 
+import asyncio
 import aiohttp
 from dataclasses import dataclass, field
 from typing import Any
 
+from ..budget import BudgetGovernor, reserve
+from .profile_store import ProfileStore, get_profile_store
+
 
 @dataclass
 class ExaSearchResult:
@@ -41,9 +45,17 @@ class ExaClient:
 
     BASE_URL = "https://api.exa.ai"
 
-    def __init__(self, api_key: str, timeout: int = 60):
+    def __init__(
+        self,
+        api_key: str,
+        timeout: int = 60,
+        governor: BudgetGovernor | None = None,
+        profile_store: ProfileStore | None = None
+    ):
         self.api_key = api_key
         self.timeout = timeout
+        self.governor = governor
+        self.profile_store = profile_store
         self._session: aiohttp.ClientSession | None = None
 
     async def _get_session(self) -> aiohttp.ClientSession:
@@ -66,7 +78,7 @@ class ExaClient:
         session = await self._get_session()
         url = f"{self.BASE_URL}{endpoint}"
 
-        async with session.post(url, json=data) as response:
+        async with reserve(self.governor, "exa"), session.post(url, json=data) as response:
             if response.status == 401:
                 raise ValueError("Invalid Exa API key")
             if response.status == 429:
@@ -288,6 +300,12 @@ class ExaClient:
         Returns:
             LinkedIn profile URL or None
         """
+        store = self.profile_store or get_profile_store()
+        search_key = f"exa:{name}|{company or ''}|{title or ''}".lower()
+        cached = await asyncio.to_thread(store.get_response, search_key, "exa_person_search") if store else None
+        if cached is not None:
+            return cached.get("url")
+
         query = f'"{name}"'
         if company:
             query += f' "{company}"'
@@ -304,11 +322,13 @@ class ExaClient:
         )
 
         # Find first linkedin.com/in URL
-        for r in result.results:
-            if r.url and "linkedin.com/in" in r.url:
-                return r.url
+        url = next((r.url for r in result.results if r.url and "linkedin.com/in" in r.url), None)
 
-        return None
+        if store and "error" not in result.raw_response:
+            # Misses are cached too, so a dead-end search isn't paid for again
+            await asyncio.to_thread(store.put_response, search_key, "exa_person_search", {"url": url})
+
+        return url
 
 
 # Convenience function
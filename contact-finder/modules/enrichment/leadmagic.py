@@ -6,10 +6,14 @@ Endpoint:
 - POST /email-finder - Find work email from name + domain/company
 """
 
+import asyncio
 import aiohttp
 from dataclasses import dataclass
 from typing import Any
 
+from ..budget import BudgetGovernor, reserve
+from .profile_store import ProfileStore, get_profile_store
+
 
 @dataclass
 class LeadMagicEmailResult:
@@ -62,9 +66,17 @@ class LeadMagicClient:
 
     BASE_URL = "https://api.leadmagic.io"
 
-    def __init__(self, api_key: str, timeout: int = 30):
+    def __init__(
+        self,
+        api_key: str,
+        timeout: int = 30,
+        governor: BudgetGovernor | None = None,
+        profile_store: ProfileStore | None = None
+    ):
         self.api_key = api_key
         self.timeout = timeout
+        self.governor = governor
+        self.profile_store = profile_store
         self._session: aiohttp.ClientSession | None = None
 
     async def _get_session(self) -> aiohttp.ClientSession:
@@ -112,8 +124,9 @@ class LeadMagicClient:
             payload["company_name"] = company_name
 
         try:
-            async with session.post(url, json=payload) as response:
+            async with reserve(self.governor, "leadmagic", 1) as spend, session.post(url, json=payload) as response:
                 if response.status == 400:
+                    spend.settle(0)
                     return LeadMagicEmailResult(
                         email=None,
                         status="invalid_request",
@@ -126,6 +139,7 @@ class LeadMagicClient:
                     )
 
                 result = await response.json()
+                spend.settle(result.get("credits_consumed", 0))
 
                 # Extract company data if present
                 company_data = None
@@ -165,7 +179,7 @@ class LeadMagicClient:
     async def profile_search(self, linkedin_url: str) -> LeadMagicProfileResult:
         """
         Enrich a LinkedIn profile URL to get profile data
-        POST /v1/people/profile-search - 1 credit
+        POST /v1/people/profile-search - 1 credit (free if fresh in the profile store)
 
         Args:
             linkedin_url: LinkedIn profile URL (e.g., https://www.linkedin.com/in/username)
@@ -173,13 +187,19 @@ class LeadMagicClient:
         Returns:
             LeadMagicProfileResult with name, title, company, work experience, education, etc.
         """
+        store = self.profile_store or get_profile_store()
+        cached = await asyncio.to_thread(store.get_response, linkedin_url, "leadmagic_profile") if store else None
+        if cached is not None:
+            return self._parse_profile(cached, linkedin_url, credits_consumed=0)
+
         session = await self._get_session()
         url = f"{self.BASE_URL}/v1/people/profile-search"
         payload = {"profile_url": linkedin_url}
 
         try:
-            async with session.post(url, json=payload) as response:
+            async with reserve(self.governor, "leadmagic", 1) as spend, session.post(url, json=payload) as response:
                 if response.status == 400:
+                    spend.settle(0)
                     return LeadMagicProfileResult(
                         success=False,
                         full_name=None,
@@ -198,6 +218,7 @@ class LeadMagicClient:
                     )
 
                 if response.status == 404:
+                    spend.settle(0)
                     return LeadMagicProfileResult(
                         success=False,
                         full_name=None,
@@ -216,40 +237,19 @@ class LeadMagicClient:
                     )
 
                 result = await response.json()
-
-                # Extract work experience
-                work_experience = result.get("work_experience", []) or []
-
-                # Get current company from first work experience
-                company_name = None
-                professional_title = None
-                if work_experience and len(work_experience) > 0:
-                    current_job = work_experience[0]
-                    company_name = current_job.get("company_name")
-                    professional_title = current_job.get("title")
-
-                # Also check top-level fields
-                if not company_name:
-                    company_name = result.get("company_name")
-                if not professional_title:
-                    professional_title = result.get("professional_title") or result.get("title")
-
-                return LeadMagicProfileResult(
-                    success=True,
-                    full_name=result.get("full_name"),
-                    first_name=result.get("first_name"),
-                    last_name=result.get("last_name"),
-                    professional_title=professional_title,
-                    company_name=company_name,
-                    work_experience=work_experience,
-                    education=result.get("education", []) or [],
-                    certifications=result.get("certifications", []) or [],
-                    location=result.get("location"),
-                    linkedin_url=result.get("linkedin_url") or linkedin_url,
-                    credits_consumed=result.get("credits_consumed", 1),
-                    raw_response=result,
-                    error=None
-                )
+                spend.settle(result.get("credits_consumed", 1))
+
+                profile = self._parse_profile(result, linkedin_url, result.get("credits_consumed", 1))
+                if store and profile.full_name:
+                    await asyncio.to_thread(store.put_response, linkedin_url, "leadmagic_profile", result, fields={
+                        "name": profile.full_name,
+                        "first_name": profile.first_name,
+                        "last_name": profile.last_name,
+                        "title": profile.professional_title,
+                        "company": profile.company_name,
+                        "location": profile.location,
+                    })
+                return profile
 
         except Exception as e:
             return LeadMagicProfileResult(
@@ -269,6 +269,43 @@ class LeadMagicClient:
                 error=str(e)
             )
 
+    @staticmethod
+    def _parse_profile(result: dict, linkedin_url: str, credits_consumed: float) -> LeadMagicProfileResult:
+        """Build a LeadMagicProfileResult from a profile-search response"""
+        # Extract work experience
+        work_experience = result.get("work_experience", []) or []
+
+        # Get current company from first work experience
+        company_name = None
+        professional_title = None
+        if work_experience and len(work_experience) > 0:
+            current_job = work_experience[0]
+            company_name = current_job.get("company_name")
+            professional_title = current_job.get("title")
+
+        # Also check top-level fields
+        if not company_name:
+            company_name = result.get("company_name")
+        if not professional_title:
+            professional_title = result.get("professional_title") or result.get("title")
+
+        return LeadMagicProfileResult(
+            success=True,
+            full_name=result.get("full_name"),
+            first_name=result.get("first_name"),
+            last_name=result.get("last_name"),
+            professional_title=professional_title,
+            company_name=company_name,
+            work_experience=work_experience,
+            education=result.get("education", []) or [],
+            certifications=result.get("certifications", []) or [],
+            location=result.get("location"),
+            linkedin_url=result.get("linkedin_url") or linkedin_url,
+            credits_consumed=credits_consumed,
+            raw_response=result,
+            error=None
+        )
+
     async def email_to_linkedin(self, email: str) -> "LeadMagicB2BProfileResult":
         """
         Convert work email to LinkedIn profile URL.
@@ -287,8 +324,9 @@ class LeadMagicClient:
         payload = {"work_email": email}
 
         try:
-            async with session.post(url, json=payload) as response:
+            async with reserve(self.governor, "leadmagic", 10) as spend, session.post(url, json=payload) as response:
                 if response.status == 400:
+                    spend.settle(0)
                     return LeadMagicB2BProfileResult(
                         success=False,
                         linkedin_url=None,
@@ -303,6 +341,7 @@ class LeadMagicClient:
                     )
 
                 if response.status == 404:
+                    spend.settle(0)
                     return LeadMagicB2BProfileResult(
                         success=False,
                         linkedin_url=None,
@@ -317,6 +356,7 @@ class LeadMagicClient:
                     )
 
                 result = await response.json()
+                spend.settle(result.get("credits_consumed", 10))
 
                 # Extract profile URL
                 profile_url = result.get("profile_url") or result.get("linkedin_url")
@@ -0,0 +1,249 @@
+"""
+LinkedIn Profile Store
+Shared, persistent cache of person/company profiles across pipelines
+
+Profiles are keyed by the normalized LinkedIn URL (linkedin.com/in/<slug> or
+linkedin.com/company/<slug>, lowercased), so every URL variant of the same profile hits
+the same entry. Two things are kept per profile:
+
+- Provider responses: the raw JSON each provider returned. Clients check
+  this before calling their API and parse the stored response exactly like
+  a fresh one, so a profile we already paid for is not fetched again from
+  that provider within the provider's TTL.
+- Merged fields: name, title, company, ... from all providers, each with its
+  own source and timestamp. A newer non-empty value replaces an older one;
+  each field expires on its own TTL (titles change faster than names).
+
+Clients built without a store use the process-wide one set with
+set_profile_store(); with neither, nothing is cached.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from ..validation.linkedin_normalizer import normalize_linkedin_url
+
+
+DAY = 24 * 3600
+
+# How long a provider's raw response is reused
+DEFAULT_PROVIDER_TTLS = {
+    "scrapin_person": 30 * DAY,
+    "scrapin_company": 30 * DAY,
+    "leadmagic_profile": 30 * DAY,
+    "rapidapi_person": 90 * DAY,
+    "exa_person_search": 7 * DAY,
+    "default": 7 * DAY,
+}
+
+# How long each merged field is considered fresh
+DEFAULT_FIELD_TTLS = {
+    "name": 365 * DAY,
+    "first_name": 365 * DAY,
+    "last_name": 365 * DAY,
+    "title": 30 * DAY,
+    "headline": 30 * DAY,
+    "company": 30 * DAY,
+    "location": 90 * DAY,
+    "email": 30 * DAY,
+    "default": 30 * DAY,
+}
+
+
+def profile_key(linkedin_url: str | None) -> str | None:
+    """Store key for a LinkedIn URL (normalized, lowercased), or None if it isn't one."""
+    normalized = normalize_linkedin_url(linkedin_url)
+    # Slugs are case-insensitive on LinkedIn
+    return normalized.lower() if normalized else None
+
+
+class ProfileStore:
+    """
+    SQLite-backed profile store shared by all LinkedIn-aware clients.
+
+    Usage:
+        store = ProfileStore("data/profiles.db")
+        set_profile_store(store)   # or pass profile_store= to each client
+
+        store.profile("https://www.linkedin.com/in/jane-doe/")
+        # {"name": {"value": "Jane Doe", "source": "scrapin_person", "fetched_at": ...}, ...}
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path | None = None,
+        provider_ttls: dict | None = None,
+        field_ttls: dict | None = None
+    ):
+        """
+        Args:
+            db_path: SQLite file (None = in-memory, for one process)
+            provider_ttls: Overrides for DEFAULT_PROVIDER_TTLS (seconds)
+            field_ttls: Overrides for DEFAULT_FIELD_TTLS (seconds)
+        """
+        if db_path is not None:
+            db_path = Path(db_path)
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_path
+        self.provider_ttls = {**DEFAULT_PROVIDER_TTLS, **(provider_ttls or {})}
+        self.field_ttls = {**DEFAULT_FIELD_TTLS, **(field_ttls or {})}
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path) if db_path else ":memory:", check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._init_db()
+
+    def _init_db(self):
+        with self._lock, self._conn:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT NOT NULL,
+                    provider TEXT NOT NULL,
+                    response TEXT NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    PRIMARY KEY (key, provider)
+                )
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS fields (
+                    key TEXT NOT NULL,
+                    field TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    source TEXT NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    PRIMARY KEY (key, field)
+                )
+            """)
+
+    def close(self):
+        self._conn.close()
+
+    def _key(self, url_or_key: str) -> str:
+        # LinkedIn URLs are normalized; anything else (e.g. a search query) is used as-is
+        return profile_key(url_or_key) or url_or_key
+
+    # --- provider responses ---
+
+    def get_response(self, url_or_key: str, provider: str, max_age: float | None = None) -> dict | None:
+        """Stored response from `provider` if younger than its TTL (or `max_age`)."""
+        ttl = max_age if max_age is not None else self.provider_ttls.get(provider, self.provider_ttls["default"])
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, fetched_at FROM responses WHERE key = ? AND provider = ?",
+                (self._key(url_or_key), provider)
+            ).fetchone()
+        if row is None or time.time() - row["fetched_at"] > ttl:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(row["response"])
+
+    def put_response(
+        self,
+        url_or_key: str,
+        provider: str,
+        response: dict,
+        fields: dict[str, Any] | None = None
+    ):
+        """
+        Store a provider response and merge its parsed fields into the profile.
+
+        Args:
+            url_or_key: LinkedIn URL (normalized for the key) or another lookup key
+            provider: Response kind, e.g. "scrapin_person"
+            response: Raw JSON the provider returned
+            fields: Parsed profile fields to merge (None/empty values are ignored)
+        """
+        key = self._key(url_or_key)
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, provider, response, fetched_at) VALUES (?, ?, ?, ?)",
+                (key, provider, json.dumps(response, default=str), now)
+            )
+        if fields:
+            self.merge_fields(key, fields, source=provider, fetched_at=now)
+
+    # --- merged profile ---
+
+    def merge_fields(
+        self,
+        url_or_key: str,
+        fields: dict[str, Any],
+        source: str,
+        fetched_at: float | None = None
+    ):
+        """Merge non-empty fields; a value only replaces an older one."""
+        key = self._key(url_or_key)
+        fetched_at = fetched_at or time.time()
+        rows = [
+            (key, name, json.dumps(value, default=str), source, fetched_at)
+            for name, value in fields.items()
+            if value not in (None, "", [], {})
+        ]
+        if not rows:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany("""
+                INSERT INTO fields (key, field, value, source, fetched_at) VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (key, field) DO UPDATE SET
+                    value = excluded.value, source = excluded.source, fetched_at = excluded.fetched_at
+                WHERE excluded.fetched_at >= fields.fetched_at
+            """, rows)
+
+    def profile(self, linkedin_url: str, include_stale: bool = False) -> dict[str, dict]:
+        """
+        Merged profile: {field: {"value", "source", "fetched_at", "fresh"}}.
+
+        Stale fields (older than their field TTL) are left out unless
+        include_stale is set.
+        """
+        now = time.time()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT field, value, source, fetched_at FROM fields WHERE key = ?",
+                (self._key(linkedin_url),)
+            ).fetchall()
+        profile = {}
+        for row in rows:
+            ttl = self.field_ttls.get(row["field"], self.field_ttls["default"])
+            fresh = now - row["fetched_at"] <= ttl
+            if fresh or include_stale:
+                profile[row["field"]] = {
+                    "value": json.loads(row["value"]),
+                    "source": row["source"],
+                    "fetched_at": row["fetched_at"],
+                    "fresh": fresh,
+                }
+        return profile
+
+    def values(self, linkedin_url: str) -> dict[str, Any]:
+        """Fresh merged field values only: {field: value}."""
+        return {name: f["value"] for name, f in self.profile(linkedin_url).items()}
+
+    def stats(self) -> dict:
+        with self._lock:
+            profiles = self._conn.execute("SELECT COUNT(DISTINCT key) FROM fields").fetchone()[0]
+            by_provider = {
+                row[0]: row[1]
+                for row in self._conn.execute("SELECT provider, COUNT(*) FROM responses GROUP BY provider")
+            }
+        return {"profiles": profiles, "responses": by_provider, "hits": self.hits, "misses": self.misses}
+
+
+_profile_store: ProfileStore | None = None
+
+
+def set_profile_store(store: ProfileStore | None):
+    """Install the process-wide store used by clients built without one."""
+    global _profile_store
+    _profile_store = store
+
+
+def get_profile_store() -> ProfileStore | None:
+    return _profile_store
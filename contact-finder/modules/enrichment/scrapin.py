@@ -10,10 +10,14 @@ Endpoints:
 - Email Discovery (2 credits) - Get email from profile URL or name/company
 """
 
+import asyncio
 import aiohttp
 from dataclasses import dataclass, field
 from typing import Any
 
+from ..budget import BudgetGovernor, reserve
+from .profile_store import ProfileStore, get_profile_store
+
 
 @dataclass
 class ScrapinPersonProfile:
@@ -62,9 +66,17 @@ class ScrapinClient:
 
     BASE_URL = "https://api.scrapin.io"
 
-    def __init__(self, api_key: str, timeout: int = 30):
+    def __init__(
+        self,
+        api_key: str,
+        timeout: int = 30,
+        governor: BudgetGovernor | None = None,
+        profile_store: ProfileStore | None = None
+    ):
         self.api_key = api_key
         self.timeout = timeout
+        self.governor = governor
+        self.profile_store = profile_store
         self._session: aiohttp.ClientSession | None = None
 
     async def _get_session(self) -> aiohttp.ClientSession:
@@ -82,42 +94,64 @@ class ScrapinClient:
         if self._session and not self._session.closed:
             await self._session.close()
 
-    async def _request(self, method: str, endpoint: str, data: dict | None = None) -> dict:
-        """Make a request to Scrapin API"""
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        data: dict | None = None,
+        credits: float = 1.0
+    ) -> dict:
+        """
+        Make a request to Scrapin API, reserving `credits` from the budget.
+
+        Failed requests (error status or connection error) are settled at 0
+        credits; successful ones at what the response reports.
+        """
         session = await self._get_session()
         url = f"{self.BASE_URL}{endpoint}"
 
-        if method == "GET":
-            async with session.get(url, params=data) as response:
-                if response.status == 401:
-                    raise ValueError("Invalid Scrapin API key")
-                if response.status == 402:
-                    raise ValueError("Insufficient Scrapin credits")
-                return await response.json()
-        else:
-            async with session.post(url, json=data) as response:
-                if response.status == 401:
-                    raise ValueError("Invalid Scrapin API key")
-                if response.status == 402:
-                    raise ValueError("Insufficient Scrapin credits")
-                return await response.json()
+        async with reserve(self.governor, "scrapin", credits) as spend:
+            try:
+                if method == "GET":
+                    request = session.get(url, params=data)
+                else:
+                    request = session.post(url, json=data)
+                async with request as response:
+                    if response.status >= 400:
+                        spend.settle(0)
+                    if response.status == 401:
+                        raise ValueError("Invalid Scrapin API key")
+                    if response.status == 402:
+                        raise ValueError("Insufficient Scrapin credits")
+                    result = await response.json()
+            except aiohttp.ClientError:
+                spend.settle(0)
+                raise
+            if not spend.settled:
+                spend.settle(result.get("credits_consumed", credits))
+            return result
 
     async def get_person_profile(self, linkedin_url: str) -> ScrapinPersonProfile:
         """
         Get full LinkedIn profile data from URL
-        Cost: 1 credit (0.5 if cached)
+        Cost: 1 credit (0.5 if cached); free if fresh in the profile store
         """
+        store = self.profile_store or get_profile_store()
         try:
-            # API v1 uses POST /v1/enrichment/profile with includes object
-            payload = {
-                "linkedInUrl": linkedin_url,
-                "includes": {
-                    "includeCompany": True,
-                    "includeExperience": True,
-                    "includeSummary": True
+            cached = await asyncio.to_thread(store.get_response, linkedin_url, "scrapin_person") if store else None
+            if cached is not None:
+                result = cached
+            else:
+                # API v1 uses POST /v1/enrichment/profile with includes object
+                payload = {
+                    "linkedInUrl": linkedin_url,
+                    "includes": {
+                        "includeCompany": True,
+                        "includeExperience": True,
+                        "includeSummary": True
+                    }
                 }
-            }
-            result = await self._request("POST", "/v1/enrichment/profile", payload)
+                result = await self._request("POST", "/v1/enrichment/profile", payload)
 
             # Response is nested under "person" key
             person = result.get("person", result)
@@ -141,7 +175,7 @@ class ScrapinClient:
             if isinstance(location, dict):
                 location = f"{location.get('city', '')}, {location.get('state', '')}".strip(", ")
 
-            return ScrapinPersonProfile(
+            profile = ScrapinPersonProfile(
                 full_name=f"{person.get('firstName', '')} {person.get('lastName', '')}".strip(),
                 first_name=person.get("firstName"),
                 last_name=person.get("lastName"),
@@ -156,6 +190,17 @@ class ScrapinClient:
                 education=person.get("schools", []),
                 raw_response=result
             )
+            if store and cached is None and profile.full_name:
+                await asyncio.to_thread(store.put_response, linkedin_url, "scrapin_person", result, fields={
+                    "name": profile.full_name,
+                    "first_name": profile.first_name,
+                    "last_name": profile.last_name,
+                    "headline": profile.headline,
+                    "title": profile.title,
+                    "company": profile.company,
+                    "location": profile.location,
+                })
+            return profile
 
         except Exception as e:
             return ScrapinPersonProfile(
@@ -175,10 +220,22 @@ class ScrapinClient:
     async def get_company_profile(self, linkedin_url: str) -> ScrapinCompanyProfile:
         """
         Get LinkedIn company profile data
-        Cost: 1 credit (0.5 if cached)
+        Cost: 1 credit (0.5 if cached); free if fresh in the profile store
         """
+        store = self.profile_store or get_profile_store()
         try:
-            result = await self._request("GET", "/company/profile", {"linkedInUrl": linkedin_url})
+            cached = await asyncio.to_thread(store.get_response, linkedin_url, "scrapin_company") if store else None
+            if cached is not None:
+                result = cached
+            else:
+                result = await self._request("GET", "/company/profile", {"linkedInUrl": linkedin_url})
+                if store and result.get("name"):
+                    await asyncio.to_thread(store.put_response, linkedin_url, "scrapin_company", result, fields={
+                        "name": result.get("name"),
+                        "website": result.get("website"),
+                        "industry": result.get("industry"),
+                        "location": result.get("headquarters"),
+                    })
 
             return ScrapinCompanyProfile(
                 name=result.get("name"),
@@ -280,7 +337,7 @@ class ScrapinClient:
             if linkedin_url:
                 # Use URL-based email finder (API uses "url" field)
                 data = {"url": linkedin_url}
-                result = await self._request("POST", "/v1/enrichment/emails/finder/url", data)
+                result = await self._request("POST", "/v1/enrichment/emails/finder/url", data, credits=2)
             elif first_name:
                 # Use name/company-based email finder
                 data = {"firstName": first_name}
@@ -288,7 +345,7 @@ class ScrapinClient:
                     data["lastName"] = last_name
                 if company_domain:
                     data["companyDomain"] = company_domain
-                result = await self._request("POST", "/v1/enrichment/emails/finder", data)
+                result = await self._request("POST", "/v1/enrichment/emails/finder", data, credits=2)
             else:
                 return ScrapinEmailResult(
                     email=None,
@@ -1,20 +1,34 @@
 """
 Enrichment Waterfall
 Cost-optimized enrichment pipeline for contacts
+
+Two execution modes for the email step:
+- sequential: Scrapin -> Blitz -> LeadMagic, one after another. A miss pays
+  the sum of all three latencies.
+- speculative: the free Scrapin call and the cheap Blitz call run together;
+  LeadMagic only fires if both miss. Whatever is still pending is cancelled
+  as soon as a verified email arrives. `latency_target_s` delays the Blitz
+  hedge (Scrapin gets that long alone), `cost_ceiling` caps paid credits per
+  contact. The speculative mode trades some extra Blitz credits (both may
+  hit) for lower tail latency; compare_waterfall_modes() measures both.
 """
 
 import asyncio
+import time
 from dataclasses import dataclass, field
 from typing import Any
 
+from ..budget import BudgetGovernor, get_governor, track_dispatched
 from .blitz import BlitzClient
 from .leadmagic import LeadMagicClient
+from .profile_store import ProfileStore, get_profile_store
 from .scrapin import ScrapinClient
 from ..validation.email_validator import EmailOrigin, EmailValidator, EmailValidationResult
 from ..validation.linkedin_normalizer import normalize_linkedin_url
+from ..discovery.payload_store import load_payload
 
 
-@dataclass
+@dataclass(slots=True)
 class EnrichedContact:
     """Fully enriched contact"""
     # Identity
@@ -42,7 +56,17 @@ class EnrichedContact:
     enrichment_sources: list[str] = field(default_factory=list)
     evidence: list[str] = field(default_factory=list)
     cost_credits: float = 0.0
-    raw_data: dict = field(default_factory=dict)
+    raw_ref: str | dict | None = None  # Provider response: inline, or a PayloadStore ref
+
+    @property
+    def raw_data(self) -> dict:
+        """
+        Provider response this contact was enriched from ({} if none)
+
+        Also {} once the payload has been evicted from the bounded default
+        store (DEFAULT_MAX_PAYLOADS); see payload_store.
+        """
+        return load_payload(self.raw_ref) or {}
 
 
 @dataclass
@@ -52,6 +76,44 @@ class EnrichmentResult:
     success: bool
     errors: list[str] = field(default_factory=list)
     cost_breakdown: dict = field(default_factory=dict)
+    latency_s: float = 0.0
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+@dataclass
+class WaterfallStats:
+    """Per-contact latency and credits for one waterfall instance"""
+    latencies_s: list[float] = field(default_factory=list)
+    credits: list[float] = field(default_factory=list)
+    cancelled: int = 0  # Speculative calls cancelled after a verified hit
+
+    def record(self, latency_s: float, credits: float):
+        self.latencies_s.append(latency_s)
+        self.credits.append(credits)
+
+    def summary(self) -> dict:
+        return {
+            "contacts": len(self.latencies_s),
+            "latency_p50_s": round(_percentile(self.latencies_s, 50), 4),
+            "latency_p95_s": round(_percentile(self.latencies_s, 95), 4),
+            "credits_total": round(sum(self.credits), 4),
+            "credits_per_contact": round(sum(self.credits) / len(self.credits), 4) if self.credits else 0.0,
+            "cancelled": self.cancelled,
+        }
+
+
+EMAIL_SOURCE_LABELS = {
+    "scrapin_email": "Scrapin",
+    "blitz_email": "Blitz",
+    "leadmagic_email": "LeadMagic",
+}
 
 
 class EnrichmentWaterfall:
@@ -67,17 +129,50 @@ class EnrichmentWaterfall:
     The waterfall stops as soon as we have what we need.
     """
 
+    MODES = ("sequential", "speculative")
+
     def __init__(
         self,
         scrapin_client: ScrapinClient | None = None,
         blitz_client: BlitzClient | None = None,
         leadmagic_client: LeadMagicClient | None = None,
-        email_validator: EmailValidator | None = None
+        email_validator: EmailValidator | None = None,
+        mode: str = "sequential",
+        latency_target_s: float = 0.0,
+        cost_ceiling: float | None = None,
+        governor: BudgetGovernor | None = None,
+        profile_store: ProfileStore | None = None
     ):
+        """
+        Args:
+            mode: "sequential" or "speculative" (see module docstring)
+            latency_target_s: Speculative mode: how long Scrapin runs alone
+                              before Blitz is started next to it (0 = at once)
+            cost_ceiling: Speculative mode: max paid email credits per contact;
+                          a provider whose call would cross it is not started
+            governor: Budget governor the clients reserve spend against
+                      (default: the process-wide one, if installed); spend is
+                      attributed to the contact's company
+            profile_store: Profiles already fetched by any provider (default:
+                           the process-wide one); a fresh name and title
+                           there skip the Scrapin profile call
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown waterfall mode '{mode}' (expected one of {self.MODES})")
         self.scrapin = scrapin_client
         self.blitz = blitz_client
         self.leadmagic = leadmagic_client
         self.email_validator = email_validator or EmailValidator()
+        self.mode = mode
+        self.latency_target_s = latency_target_s
+        self.cost_ceiling = cost_ceiling
+        self.governor = governor or get_governor()
+        self.profile_store = profile_store
+        if self.governor is not None:
+            for client in (self.scrapin, self.blitz, self.leadmagic):
+                if client is not None and client.governor is None:
+                    client.governor = self.governor
+        self.stats = WaterfallStats()
 
     async def _enrich_via_scrapin(
         self,
@@ -89,13 +184,27 @@ class EnrichmentWaterfall:
         """
         Try to enrich via Scrapin (FREE).
 
-        If we have LinkedIn URL, get profile directly.
+        If we have LinkedIn URL, use the merged profile another provider
+        already fetched, else get the profile directly.
         Otherwise try person matching.
         """
         if not self.scrapin:
             return None
 
         try:
+            store = self.profile_store or get_profile_store()
+            known = await asyncio.to_thread(store.values, linkedin_url) if store and linkedin_url else {}
+            if known.get("name") and known.get("title"):
+                return {
+                    "name": known["name"],
+                    "first_name": known.get("first_name"),
+                    "last_name": known.get("last_name"),
+                    "title": known["title"],
+                    "email": known.get("email"),
+                    "phone": known.get("phone"),
+                    "linkedin_url": normalize_linkedin_url(linkedin_url),
+                    "source": "profile_store"
+                }
             if linkedin_url:
                 # Get profile directly
                 result = await self.scrapin.get_person_profile(linkedin_url)
@@ -137,7 +246,8 @@ class EnrichmentWaterfall:
         self,
         first_name: str,
         last_name: str | None,
-        domain: str
+        domain: str,
+        linkedin_url: str | None = None
     ) -> dict | None:
         """Try to find email via Scrapin (FREE)"""
         if not self.scrapin:
@@ -145,15 +255,17 @@ class EnrichmentWaterfall:
 
         try:
             result = await self.scrapin.find_email(
+                linkedin_url=linkedin_url,
                 first_name=first_name,
                 last_name=last_name,
-                domain=domain
+                company_domain=domain
             )
             if result.email:
                 return {
                     "email": result.email,
-                    "verified": result.verified,
-                    "source": "scrapin_email"
+                    "verified": result.email_type == "professional",
+                    "source": "scrapin_email",
+                    "cost": 0.0
                 }
         except Exception:
             pass
@@ -162,28 +274,20 @@ class EnrichmentWaterfall:
 
     async def _enrich_email_via_blitz(
         self,
-        first_name: str,
-        last_name: str | None,
-        domain: str | None = None,
-        company_name: str | None = None
+        linkedin_url: str | None
     ) -> dict | None:
-        """Try to find email via Blitz (1 credit)"""
-        if not self.blitz:
+        """Try to find email via Blitz (1 credit, needs the LinkedIn URL)"""
+        if not self.blitz or not linkedin_url:
             return None
 
         try:
-            result = await self.blitz.enrich_email(
-                first_name=first_name,
-                last_name=last_name,
-                domain=domain,
-                company_name=company_name
-            )
+            result = await self.blitz.find_email(linkedin_url)
             if result.email:
                 return {
                     "email": result.email,
-                    "verified": result.email_verified,
+                    "verified": result.status == "valid",
                     "source": "blitz_email",
-                    "cost": 1.0
+                    "cost": result.credits_consumed or 1.0
                 }
         except Exception:
             pass
@@ -211,9 +315,9 @@ class EnrichmentWaterfall:
             if result.email:
                 return {
                     "email": result.email,
-                    "verified": result.confidence == "high",
+                    "verified": result.status == "valid",
                     "source": "leadmagic_email",
-                    "cost": 1.0 if result.email else 0.0  # Pay if found
+                    "cost": result.credits_consumed or 1.0  # Pay if found
                 }
         except Exception:
             pass
@@ -222,34 +326,147 @@ class EnrichmentWaterfall:
 
     async def _enrich_phone_via_blitz(
         self,
-        first_name: str,
-        last_name: str | None,
-        domain: str | None = None,
-        company_name: str | None = None
+        linkedin_url: str | None
     ) -> dict | None:
-        """Try to find phone via Blitz (3 credits)"""
-        if not self.blitz:
+        """Try to find phone via Blitz (3 credits, needs the LinkedIn URL)"""
+        if not self.blitz or not linkedin_url:
             return None
 
         try:
-            result = await self.blitz.enrich_phone(
-                first_name=first_name,
-                last_name=last_name,
-                domain=domain,
-                company_name=company_name
-            )
+            result = await self.blitz.find_phone(linkedin_url)
             if result.phone:
                 return {
                     "phone": result.phone,
-                    "verified": result.phone_verified,
+                    "verified": result.status == "valid",
                     "source": "blitz_phone",
-                    "cost": 3.0
+                    "cost": result.credits_consumed or 3.0
                 }
         except Exception:
             pass
 
         return None
 
+    async def _find_email_sequential(
+        self,
+        first_name: str,
+        last_name: str | None,
+        domain: str,
+        company_name: str | None,
+        linkedin_url: str | None
+    ) -> tuple[dict | None, dict]:
+        """Scrapin -> Blitz -> LeadMagic, stopping at the first email."""
+        spent = {}
+        email_data = await self._enrich_email_via_scrapin(first_name, last_name, domain, linkedin_url)
+        if email_data:
+            spent["scrapin_email"] = 0.0
+            return email_data, spent
+
+        email_data = await self._enrich_email_via_blitz(linkedin_url)
+        if email_data:
+            spent["blitz_email"] = email_data["cost"]
+            return email_data, spent
+
+        email_data = await self._enrich_email_via_leadmagic(
+            first_name=first_name,
+            last_name=last_name,
+            domain=domain,
+            company_name=company_name
+        )
+        if email_data:
+            spent["leadmagic_email"] = email_data["cost"]
+        return email_data, spent
+
+    async def _find_email_speculative(
+        self,
+        first_name: str,
+        last_name: str | None,
+        domain: str,
+        company_name: str | None,
+        linkedin_url: str | None
+    ) -> tuple[dict | None, dict]:
+        """
+        Scrapin and Blitz together, LeadMagic only if both miss.
+
+        The first verified email wins and cancels the other call. Without a
+        verified hit, an unverified email is taken in waterfall order
+        (Scrapin before Blitz). Blitz credits are counted whenever Blitz
+        returned an email, even if Scrapin's was used, and at the reserved
+        estimate when its request was sent but then cancelled.
+        """
+        spent = {}
+        ceiling = self.cost_ceiling
+
+        def affordable(credits: float) -> bool:
+            return ceiling is None or sum(spent.values()) + credits <= ceiling
+
+        tasks: dict[asyncio.Task, str] = {}
+        if self.scrapin:
+            task = asyncio.create_task(
+                self._enrich_email_via_scrapin(first_name, last_name, domain, linkedin_url)
+            )
+            tasks[task] = "scrapin_email"
+        hedge_blitz = bool(self.blitz and linkedin_url and affordable(1.0))
+
+        found: dict[str, dict] = {}
+        winner = None
+        blitz_dispatched = []
+        try:
+            if hedge_blitz and tasks and self.latency_target_s > 0:
+                # Give Scrapin the latency target on its own first
+                done, _ = await asyncio.wait(set(tasks), timeout=self.latency_target_s)
+                for task in done:
+                    result = task.result()
+                    if result:
+                        found[tasks.pop(task)] = result
+                    else:
+                        tasks.pop(task)
+                if any(r.get("verified") for r in found.values()):
+                    hedge_blitz = False
+            if hedge_blitz:
+                with track_dispatched() as blitz_dispatched:
+                    tasks[asyncio.create_task(self._enrich_email_via_blitz(linkedin_url))] = "blitz_email"
+
+            pending = set(tasks)
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    result = task.result()
+                    if result:
+                        found[tasks[task]] = result
+                        if result.get("verified") and winner is None:
+                            winner = tasks[task]
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                    self.stats.cancelled += 1
+
+        for source, result in found.items():
+            spent[source] = result.get("cost", 0.0)
+        if "blitz_email" not in found and blitz_dispatched:
+            # Sent, then cancelled: the provider still bills it
+            spent["blitz_email"] = sum(r.credits for r in blitz_dispatched)
+
+        if winner is None:
+            for source in ("scrapin_email", "blitz_email"):
+                if source in found:
+                    winner = source
+                    break
+        if winner is not None:
+            return found[winner], spent
+
+        if affordable(1.0):
+            email_data = await self._enrich_email_via_leadmagic(
+                first_name=first_name,
+                last_name=last_name,
+                domain=domain,
+                company_name=company_name
+            )
+            if email_data:
+                spent["leadmagic_email"] = email_data["cost"]
+                return email_data, spent
+        return None, spent
+
     async def _validate_email(self, email: str, origin: EmailOrigin) -> EmailValidationResult:
         """Validate email syntax and optionally deliverability"""
         return await self.email_validator.validate(
@@ -291,6 +508,33 @@ class EnrichmentWaterfall:
         Returns:
             EnrichmentResult with enriched contact
         """
+        kwargs = dict(
+            name=name, first_name=first_name, last_name=last_name, title=title,
+            email=email, linkedin_url=linkedin_url, company_name=company_name,
+            domain=domain, existing_evidence=existing_evidence,
+            include_phone=include_phone, skip_if_email_exists=skip_if_email_exists
+        )
+        if self.governor is None or not company_name:
+            return await self._enrich(**kwargs)
+        with self.governor.company_scope(company_name):
+            return await self._enrich(**kwargs)
+
+    async def _enrich(
+        self,
+        name: str | None,
+        first_name: str | None,
+        last_name: str | None,
+        title: str | None,
+        email: str | None,
+        linkedin_url: str | None,
+        company_name: str | None,
+        domain: str | None,
+        existing_evidence: list[str] | None,
+        include_phone: bool,
+        skip_if_email_exists: bool
+    ) -> EnrichmentResult:
+        started = time.monotonic()
+
         # Normalize LinkedIn URL
         linkedin_url = normalize_linkedin_url(linkedin_url)
 
@@ -321,8 +565,7 @@ class EnrichmentWaterfall:
             confidence=50.0,
             enrichment_sources=[],
             evidence=list(existing_evidence or []),
-            cost_credits=0.0,
-            raw_data={}
+            cost_credits=0.0
         )
 
         errors = []
@@ -338,8 +581,12 @@ class EnrichmentWaterfall:
             )
 
             if scrapin_data:
-                enriched.enrichment_sources.append("scrapin")
-                enriched.evidence.append(f"Scrapin profile enrichment: {scrapin_data.get('source')}")
+                from_store = scrapin_data.get("source") == "profile_store"
+                enriched.enrichment_sources.append("profile_store" if from_store else "scrapin")
+                enriched.evidence.append(
+                    "Profile reused from the profile store" if from_store
+                    else f"Scrapin profile enrichment: {scrapin_data.get('source')}"
+                )
 
                 # Fill in missing data
                 if not enriched.name and scrapin_data.get("name"):
@@ -364,63 +611,34 @@ class EnrichmentWaterfall:
         need_email = not enriched.email or not skip_if_email_exists
 
         if need_email and enriched.first_name and domain:
-            # Try Scrapin email first (FREE)
-            email_data = await self._enrich_email_via_scrapin(
+            find_email = (
+                self._find_email_speculative if self.mode == "speculative" else self._find_email_sequential
+            )
+            email_data, spent = await find_email(
                 first_name=enriched.first_name,
                 last_name=enriched.last_name,
-                domain=domain
+                domain=domain,
+                company_name=company_name,
+                linkedin_url=enriched.linkedin_url
             )
 
+            for source, credits in spent.items():
+                cost_breakdown[source] = credits
+                enriched.cost_credits += credits
+
             if email_data:
+                source = email_data["source"]
                 enriched.email = email_data["email"]
                 enriched.email_verified = email_data.get("verified")
-                enriched.email_origin = EmailOrigin.LINKEDIN_ENRICHED
-                enriched.enrichment_sources.append("scrapin_email")
-                enriched.evidence.append(f"Email from Scrapin: {email_data['email']}")
-                cost_breakdown["scrapin_email"] = 0.0
-            else:
-                # Try Blitz email (1 credit)
-                email_data = await self._enrich_email_via_blitz(
-                    first_name=enriched.first_name,
-                    last_name=enriched.last_name,
-                    domain=domain,
-                    company_name=company_name
+                enriched.email_origin = (
+                    EmailOrigin.LINKEDIN_ENRICHED if source == "scrapin_email" else EmailOrigin.ENRICHED_API
                 )
-
-                if email_data:
-                    enriched.email = email_data["email"]
-                    enriched.email_verified = email_data.get("verified")
-                    enriched.email_origin = EmailOrigin.ENRICHED_API
-                    enriched.enrichment_sources.append("blitz_email")
-                    enriched.evidence.append(f"Email from Blitz: {email_data['email']}")
-                    enriched.cost_credits += email_data.get("cost", 1.0)
-                    cost_breakdown["blitz_email"] = email_data.get("cost", 1.0)
-                else:
-                    # Try LeadMagic as last resort (pay if found)
-                    email_data = await self._enrich_email_via_leadmagic(
-                        first_name=enriched.first_name,
-                        last_name=enriched.last_name,
-                        domain=domain,
-                        company_name=company_name
-                    )
-
-                    if email_data:
-                        enriched.email = email_data["email"]
-                        enriched.email_verified = email_data.get("verified")
-                        enriched.email_origin = EmailOrigin.ENRICHED_API
-                        enriched.enrichment_sources.append("leadmagic_email")
-                        enriched.evidence.append(f"Email from LeadMagic: {email_data['email']}")
-                        enriched.cost_credits += email_data.get("cost", 1.0)
-                        cost_breakdown["leadmagic_email"] = email_data.get("cost", 1.0)
+                enriched.enrichment_sources.append(source)
+                enriched.evidence.append(f"Email from {EMAIL_SOURCE_LABELS[source]}: {email_data['email']}")
 
         # Step 3: Phone enrichment (if requested, 3 credits)
         if include_phone and not enriched.phone and enriched.first_name:
-            phone_data = await self._enrich_phone_via_blitz(
-                first_name=enriched.first_name,
-                last_name=enriched.last_name,
-                domain=domain,
-                company_name=company_name
-            )
+            phone_data = await self._enrich_phone_via_blitz(enriched.linkedin_url)
 
             if phone_data:
                 enriched.phone = phone_data["phone"]
@@ -445,11 +663,15 @@ class EnrichmentWaterfall:
         # Calculate final confidence
         enriched.confidence = self._calculate_confidence(enriched)
 
+        latency = time.monotonic() - started
+        self.stats.record(latency, enriched.cost_credits)
+
         return EnrichmentResult(
             contact=enriched,
             success=bool(enriched.email or enriched.linkedin_url),
             errors=errors,
-            cost_breakdown=cost_breakdown
+            cost_breakdown=cost_breakdown,
+            latency_s=latency
         )
 
     def _calculate_confidence(self, contact: EnrichedContact) -> float:
@@ -526,6 +748,38 @@ class EnrichmentWaterfall:
         return await asyncio.gather(*tasks)
 
 
+async def compare_waterfall_modes(
+    sequential: EnrichmentWaterfall,
+    speculative: EnrichmentWaterfall,
+    contacts: list[dict]
+) -> dict:
+    """
+    Enrich the same contacts with both modes and report the trade-off.
+
+    Args:
+        sequential: Waterfall in sequential mode
+        speculative: Waterfall in speculative mode (same clients)
+        contacts: enrich() keyword arguments, one dict per contact
+
+    Returns:
+        {"sequential": summary, "speculative": summary, "credit_delta": float,
+         "p50_delta_s": float, "p95_delta_s": float}  (deltas = speculative - sequential)
+    """
+    for waterfall in (sequential, speculative):
+        waterfall.stats = WaterfallStats()
+        await asyncio.gather(*(waterfall.enrich(**contact) for contact in contacts))
+
+    seq = sequential.stats.summary()
+    spec = speculative.stats.summary()
+    return {
+        "sequential": seq,
+        "speculative": spec,
+        "credit_delta": round(spec["credits_total"] - seq["credits_total"], 4),
+        "p50_delta_s": round(spec["latency_p50_s"] - seq["latency_p50_s"], 4),
+        "p95_delta_s": round(spec["latency_p95_s"] - seq["latency_p95_s"], 4),
+    }
+
+
 # Convenience function
 async def test_enrichment_waterfall(
     name: str,
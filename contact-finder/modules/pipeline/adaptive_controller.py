@@ -14,6 +14,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Callable, Awaitable
 
+from modules.budget import BudgetGovernor, get_governor
 from modules.llm.provider import LLMProvider
 
 logger = logging.getLogger(__name__)
@@ -450,11 +451,15 @@ class AdaptiveController:
         self,
         llm_provider: LLMProvider,
         tools: dict[str, Callable[..., Awaitable[ToolResult]]],
-        cost_budget: float = 0.02
+        cost_budget: float = 0.02,
+        governor: BudgetGovernor | None = None
     ):
         self.llm = llm_provider
         self.tools = tools
         self.cost_budget = cost_budget
+        # Tool spend is charged to the company being processed; its remaining
+        # governor budget also caps the loop's own cost_budget
+        self.governor = governor or get_governor()
 
         # Stats
         self.total_by_type = {t: 0 for t in BusinessType}
@@ -471,6 +476,19 @@ class AdaptiveController:
         category: str | None = None
     ) -> dict:
         """Process a single company with adaptive strategy selection"""
+        if self.governor is None:
+            return await self._process_company(company_name, domain, city, state_code, category)
+        with self.governor.company_scope(company_name):
+            return await self._process_company(company_name, domain, city, state_code, category)
+
+    async def _process_company(
+        self,
+        company_name: str,
+        domain: str | None,
+        city: str | None,
+        state_code: str | None,
+        category: str | None
+    ) -> dict:
 
         # Step 1: Classify business type
         business_type = classify_business_type(company_name, category, city)
@@ -493,6 +511,10 @@ class AdaptiveController:
         # Step 2: Run agent loop with selected strategy
         while state.stage < strategy.max_stages:
             remaining_budget = self.cost_budget - state.total_cost
+            if self.governor is not None:
+                governor_remaining = self.governor.remaining_usd(company_name)
+                if governor_remaining is not None:
+                    remaining_budget = min(remaining_budget, governor_remaining)
             if remaining_budget <= 0:
                 break
 
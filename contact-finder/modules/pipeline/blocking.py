@@ -0,0 +1,43 @@
+"""
+Blocking-call detection for the CLI entry points
+
+`--detect-blocking [MS]` (or DETECT_BLOCKING_MS=MS) runs contact_finder.py or
+smb_pipeline.py under detect_blocking() from the evaluation harness
+(evaluation/harness/loop_monitor.py). The harness is only imported when
+detection is asked for, so runs without it do not depend on evaluation/.
+"""
+
+import logging
+import os
+import sys
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+
+def add_blocking_argument(parser):
+    """Add --detect-blocking [MS] to an argparse parser."""
+    parser.add_argument("--detect-blocking", type=float, nargs="?", const=100, default=None, metavar="MS",
+                        help="Report event-loop blocks longer than MS (default 100) to logs/loop_monitor.json "
+                             "(or set DETECT_BLOCKING_MS)")
+
+
+@asynccontextmanager
+async def detect_blocking(cli_value: float | None = None):
+    """The harness's detect_blocking() around the block; a no-op when detection is off."""
+    if cli_value is None and not os.environ.get("DETECT_BLOCKING_MS"):
+        yield None
+        return
+    if str(PROJECT_ROOT) not in sys.path:
+        sys.path.insert(0, str(PROJECT_ROOT))
+    try:
+        from evaluation.harness.loop_monitor import detect_blocking as harness_detect_blocking
+    except ImportError as e:
+        logger.warning(f"Blocking detection unavailable ({e}); running without it")
+        yield None
+        return
+    async with harness_detect_blocking(cli_value) as monitor:
+        yield monitor
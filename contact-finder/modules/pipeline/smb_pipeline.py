@@ -12,9 +12,11 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
+from ..budget import BudgetGovernor
 from ..input.csv_explorer import CSVExplorer, CSVAnalysis
 from ..discovery.serper_filler import SerperDataFiller
 from ..discovery.website_extractor import WebsiteContactExtractor, ExtractedContact
+from ..discovery.page_store import PageStore, get_page_store
 from ..discovery.openweb_ninja import (
     OpenWebNinjaClient,
     LocalBusinessResult,
@@ -22,6 +24,8 @@ from ..discovery.openweb_ninja import (
     SocialLinksResult,
 )
 from ..enrichment.leadmagic import LeadMagicClient, split_name
+from ..enrichment.profile_store import ProfileStore, get_profile_store
+from .blocking import add_blocking_argument, detect_blocking
 from ..discovery.email_finder import EmailFinder, EmailFinderResult
 from ..validation.simple_validator import (
     SimpleContactValidator,
@@ -95,6 +99,7 @@ class SMBPipelineResult:
     zenrows_requests: int = 0
     openweb_ninja_queries: int = 0  # $0.002 per query
     million_verifier_credits: int = 0  # ~$0.00029 per verification
+    budget_spent_usd: float | None = None  # Metered by the budget governor, when one is used
 
     # Results
     results: list[CompanyResult] = field(default_factory=list)
@@ -105,7 +110,9 @@ class SMBPipelineResult:
 
     @property
     def total_cost(self) -> float:
-        """Estimate total cost"""
+        """Metered spend when a budget governor ran, else an estimate from the counters"""
+        if self.budget_spent_usd is not None:
+            return self.budget_spent_usd
         serper_cost = self.serper_queries * 0.001
         leadmagic_cost = self.leadmagic_credits * 0.01  # Approx
         zenrows_cost = self.zenrows_requests * 0.01  # Approx
@@ -141,8 +148,32 @@ class SMBContactPipeline:
         min_validation_score: int = 50,
         concurrency: int = 10,
         use_llm_validation: bool = True,
-        use_email_verification: bool = True
+        use_email_verification: bool = True,
+        run_budget_usd: float | None = None,
+        company_budget_usd: float | None = None,
+        governor: BudgetGovernor | None = None,
+        page_store: PageStore | None = None,
+        profile_store: ProfileStore | None = None
     ):
+        """
+        Budget: pass a governor, or run_budget_usd / company_budget_usd to
+        create one. Every paid call then reserves from it; companies that
+        would overspend stop early and companies queued after the run budget
+        is gone are skipped. Provider rate/concurrency limits meter the actual
+        requests, so `concurrency` can be raised well above the default.
+
+        Pages: website fetches go through page_store (default: the
+        process-wide store, else the SQLite file at $PAGE_STORE_PATH or
+        data/pages.db), so a page is downloaded once per TTL and dead
+        domains are not retried on later runs either.
+
+        Profiles: LeadMagic profile lookups read through profile_store
+        (default: the process-wide store, else the SQLite file at
+        $PROFILE_STORE_PATH if set; otherwise none).
+        """
+        if governor is None and (run_budget_usd is not None or company_budget_usd is not None):
+            governor = BudgetGovernor(run_budget_usd=run_budget_usd, company_budget_usd=company_budget_usd)
+        self.governor = governor
         self.serper_api_key = serper_api_key or os.environ.get("SERPER_API_KEY")
         self.leadmagic_api_key = leadmagic_api_key or os.environ.get("LEADMAGIC_API_KEY")
         self.zenrows_api_key = zenrows_api_key or os.environ.get("ZENROWS_API_KEY")
@@ -154,19 +185,38 @@ class SMBContactPipeline:
         self.use_llm_validation = use_llm_validation
         self.use_email_verification = use_email_verification
 
+        self.page_store = (
+            page_store or get_page_store() or PageStore(os.environ.get("PAGE_STORE_PATH", "data/pages.db"))
+        )
+
+        self.profile_store = profile_store or get_profile_store()
+        if self.profile_store is None and os.environ.get("PROFILE_STORE_PATH"):
+            self.profile_store = ProfileStore(os.environ["PROFILE_STORE_PATH"])
+
         # Initialize components
         self.csv_explorer = CSVExplorer()
-        self.serper_filler = SerperDataFiller(self.serper_api_key) if self.serper_api_key else None
+        self.serper_filler = (
+            SerperDataFiller(self.serper_api_key, governor=governor) if self.serper_api_key else None
+        )
         self.website_extractor = WebsiteContactExtractor(
             zenrows_api_key=self.zenrows_api_key,
             max_pages=3,
-            concurrency=5
+            concurrency=5,
+            governor=governor,
+            crawl_mode="links",
+            page_store=self.page_store
+        )
+        self.leadmagic = (
+            LeadMagicClient(self.leadmagic_api_key, governor=governor, profile_store=self.profile_store)
+            if self.leadmagic_api_key else None
         )
-        self.leadmagic = LeadMagicClient(self.leadmagic_api_key) if self.leadmagic_api_key else None
         self.validator = SimpleContactValidator(min_confidence=min_validation_score)
 
         # OpenWeb Ninja client ($0.002/query - primary for SMBs)
-        self.openweb_ninja = OpenWebNinjaClient(self.rapidapi_key) if self.rapidapi_key else None
+        self.openweb_ninja = (
+            OpenWebNinjaClient(self.rapidapi_key, governor=governor, page_store=self.page_store)
+            if self.rapidapi_key else None
+        )
 
         # LLM Judge for validation (primary for SMBs when enabled)
         self.llm_judge: ContactJudge | None = None
@@ -185,7 +235,8 @@ class SMBContactPipeline:
                 self.email_finder = EmailFinder(
                     million_verifier_api_key=self.million_verifier_api_key,
                     max_concurrent=concurrency,
-                    verification_timeout=20
+                    verification_timeout=20,
+                    governor=governor
                 )
                 logger.info("Email verification enabled (MillionVerifier)")
             except Exception as e:
@@ -263,7 +314,14 @@ class SMBContactPipeline:
 
             async def process_company(company: dict) -> CompanyResult:
                 async with semaphore:
-                    return await self._process_single_company(company, skip_stages)
+                    if self.governor is None:
+                        return await self._process_single_company(company, skip_stages)
+                    name = company.get("company_name", "Unknown")
+                    remaining = self.governor.run_remaining_usd()
+                    if remaining is not None and remaining <= 0:
+                        return CompanyResult(company_name=name, errors=["Run budget exhausted"])
+                    with self.governor.company_scope(name):
+                        return await self._process_single_company(company, skip_stages)
 
             # Run all companies
             company_results = await asyncio.gather(
@@ -291,6 +349,9 @@ class SMBContactPipeline:
             result.zenrows_requests = self._zenrows_requests
             result.openweb_ninja_queries = self._openweb_ninja_queries
             result.million_verifier_credits = self._million_verifier_credits
+            if self.governor:
+                result.budget_spent_usd = self.governor.spent_usd
+                result.stage_stats["budget"] = self.governor.snapshot()
 
         except Exception as e:
             logger.error(f"Pipeline failed: {e}")
@@ -393,7 +454,7 @@ class SMBContactPipeline:
             if "website" not in skip_stages and result.domain and not openweb_had_contacts:
                 try:
                     web_result = await self.website_extractor.extract(result.domain)
-                    self._zenrows_requests += web_result.pages_scraped
+                    self._zenrows_requests += web_result.zenrows_requests
 
                     result.website_contacts = web_result.contacts
                     result.stages_completed.append("website_fallback")
@@ -869,6 +930,11 @@ def print_pipeline_result(result: SMBPipelineResult):
     print(f"  ZenRows requests: {result.zenrows_requests}")
     print(f"  MillionVerifier: {result.million_verifier_credits} credits (${result.million_verifier_credits * 0.00029:.3f})")
     print(f"  Total: ${result.total_cost:.3f}")
+    budget = result.stage_stats.get("budget")
+    if budget and budget["run"]["budget_usd"] is not None:
+        run = budget["run"]
+        print(f"  Budget: ${run['spent_usd']:.3f} of ${run['budget_usd']:.2f} "
+              f"(${run['remaining_usd']:.3f} left, {run['rejected']} calls refused)")
 
     print()
     print("Stage Stats:")
@@ -902,19 +968,20 @@ def print_pipeline_result(result: SMBPipelineResult):
 # CLI test
 async def test_pipeline():
     """Test the pipeline"""
-    import sys
-
-    if len(sys.argv) < 2:
-        print("Usage: python smb_pipeline.py <input_file> [limit]")
-        sys.exit(1)
+    import argparse
 
-    input_file = sys.argv[1]
-    limit = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    parser = argparse.ArgumentParser(description="SMB contact pipeline")
+    parser.add_argument("input_file", help="Companies file (CSV/JSON)")
+    parser.add_argument("limit", type=int, nargs="?", default=10, help="Max companies (default 10)")
+    parser.add_argument("run_budget_usd", type=float, nargs="?", default=None, help="Run budget cap in USD")
+    add_blocking_argument(parser)
+    args = parser.parse_args()
 
-    pipeline = SMBContactPipeline(concurrency=5)
+    pipeline = SMBContactPipeline(concurrency=5, run_budget_usd=args.run_budget_usd)
 
     try:
-        result = await pipeline.run(input_file, limit=limit)
+        async with detect_blocking(args.detect_blocking):
+            result = await pipeline.run(args.input_file, limit=args.limit)
         print_pipeline_result(result)
     finally:
         await pipeline.close()
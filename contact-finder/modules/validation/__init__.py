@@ -23,8 +23,14 @@ from .million_verifier import (
     VerificationResult,
     EmailResult,
     EmailQuality,
+    parse_verification,
     verify_email_quick
 )
+from .bulk_verifier import (
+    BulkEmailVerifier,
+    BulkVerificationStats,
+    interleave_by_domain
+)
 
 __all__ = [
     'EmailValidator',
@@ -44,5 +50,9 @@ __all__ = [
     'VerificationResult',
     'EmailResult',
     'EmailQuality',
+    'parse_verification',
     'verify_email_quick',
+    'BulkEmailVerifier',
+    'BulkVerificationStats',
+    'interleave_by_domain',
 ]
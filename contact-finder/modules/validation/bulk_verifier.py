@@ -0,0 +1,248 @@
+"""
+Bulk Email Verifier
+
+Verifies large email lists with MillionVerifier:
+
+- Dedup: every address is verified once per run, however many contacts or
+  permutations produce it.
+- Ordering: pending emails are interleaved round-robin by domain, so the
+  concurrent requests are spread over many mail servers instead of hitting
+  one domain with every permutation at once (fewer greylist "unknown"s).
+- Concurrency: a fixed pool of workers at the account's concurrency limit.
+- Checkpoints: each result is appended to a JSONL journal as it arrives.
+  Resuming re-reads the journal and only verifies what is missing, so a
+  restart costs no credits and no rewrite of earlier results.
+- Bulk mode: optionally hand the remaining list to the Bulk API
+  (upload/poll/download) instead of making one request per email.
+"""
+
+import asyncio
+import json
+import logging
+import os
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Iterable, Optional
+
+from .million_verifier import MillionVerifierClient, VerificationResult, parse_verification
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_email(email: str) -> str:
+    return (email or "").strip().lower()
+
+
+def interleave_by_domain(emails: Iterable[str]) -> list[str]:
+    """Round-robin emails across domains, keeping each domain's own order."""
+    by_domain: "OrderedDict[str, deque]" = OrderedDict()
+    for email in emails:
+        by_domain.setdefault(email.rsplit("@", 1)[-1], deque()).append(email)
+
+    ordered = []
+    while by_domain:
+        for domain in list(by_domain):
+            queue = by_domain[domain]
+            ordered.append(queue.popleft())
+            if not queue:
+                del by_domain[domain]
+    return ordered
+
+
+def result_to_record(result: VerificationResult) -> dict:
+    """Journal record in the API's field names (parse_verification reads it back)."""
+    return {
+        "email": normalize_email(result.email),
+        "result": result.result.value,
+        "quality": result.quality.value,
+        "resultcode": result.resultcode,
+        "free": result.is_free,
+        "role": result.is_role,
+        "didyoumean": result.did_you_mean,
+        "verified_at": datetime.now().isoformat(),
+    }
+
+
+@dataclass
+class BulkVerificationStats:
+    """Counters for one verify_all() call"""
+    requested: int = 0      # Emails passed in (with duplicates)
+    unique: int = 0         # Distinct addresses
+    from_journal: int = 0   # Already verified in an earlier run
+    verified: int = 0       # Verified in this run
+    errors: int = 0         # Failed verifications (not journaled, retried on resume)
+
+    @property
+    def credits_saved(self) -> int:
+        return self.requested - self.unique + self.from_journal
+
+
+class BulkEmailVerifier:
+    """
+    Verify many emails once each, concurrently, with an append-only journal.
+
+    Example:
+        client = MillionVerifierClient(max_concurrent=20)
+        verifier = BulkEmailVerifier(client, journal_path="verify_journal.jsonl")
+        results = await verifier.verify_all(emails)
+        results["john@acme.com"].is_valid
+    """
+
+    def __init__(
+        self,
+        client: MillionVerifierClient,
+        journal_path: Optional[str] = None,
+        concurrency: Optional[int] = None,
+        use_bulk_api: bool = False,
+        bulk_min_emails: int = 1000,
+        bulk_poll_interval: float = 10.0
+    ):
+        """
+        Args:
+            client: MillionVerifier client (its max_concurrent is the account limit)
+            journal_path: JSONL file of verified results; None disables resume
+            concurrency: Worker count (defaults to client.max_concurrent)
+            use_bulk_api: Send the pending list to the Bulk API when it has at
+                          least `bulk_min_emails` emails
+            bulk_min_emails: Smallest list worth a bulk job
+            bulk_poll_interval: Seconds between bulk job status checks
+        """
+        self.client = client
+        self.journal_path = journal_path
+        self.concurrency = concurrency or client.max_concurrent
+        self.use_bulk_api = use_bulk_api
+        self.bulk_min_emails = bulk_min_emails
+        self.bulk_poll_interval = bulk_poll_interval
+        self.stats = BulkVerificationStats()
+        self._journal = None
+        self._on_result: Optional[Callable[[VerificationResult], None]] = None
+
+    def load_journal(self) -> dict[str, VerificationResult]:
+        """Read verified results from the journal (a torn last line is skipped)."""
+        results = {}
+        if not self.journal_path or not os.path.exists(self.journal_path):
+            return results
+        with open(self.journal_path, "r", encoding="utf-8") as f:
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping unreadable journal line {line_no} in {self.journal_path}")
+                    continue
+                email = normalize_email(record.get("email", ""))
+                if email:
+                    results[email] = parse_verification(record, email)
+        return results
+
+    def _record(self, result: VerificationResult):
+        """Count, journal and report one new result."""
+        self.stats.verified += 1
+        if self._journal is not None:
+            self._journal.write(json.dumps(result_to_record(result)) + "\n")
+            self._journal.flush()
+        if self._on_result:
+            self._on_result(result)
+
+    async def verify_all(
+        self,
+        emails: Iterable[str],
+        on_result: Optional[Callable[[VerificationResult], None]] = None
+    ) -> dict[str, VerificationResult]:
+        """
+        Verify every distinct email not already in the journal.
+
+        Args:
+            emails: Addresses to verify (duplicates and case variants allowed)
+            on_result: Optional callback for each newly verified result
+
+        Returns:
+            Dict of normalized email -> VerificationResult for every input
+            email that has a result (journaled or verified now). Emails whose
+            verification errored are left out so a resume retries them.
+        """
+        emails = [normalize_email(e) for e in emails]
+        emails = [e for e in emails if "@" in e]
+        unique = list(dict.fromkeys(emails))
+
+        results = self.load_journal()
+        pending = [e for e in unique if e not in results]
+
+        self.stats = BulkVerificationStats(
+            requested=len(emails),
+            unique=len(unique),
+            from_journal=len(unique) - len(pending),
+        )
+        logger.info(
+            f"Bulk verify: {len(emails)} emails, {len(unique)} unique, "
+            f"{self.stats.from_journal} from journal, {len(pending)} to verify"
+        )
+        if not pending:
+            return {e: results[e] for e in unique}
+
+        self._on_result = on_result
+        if self.journal_path:
+            self._journal = open(self.journal_path, "a", encoding="utf-8")
+        try:
+            if self.use_bulk_api and len(pending) >= self.bulk_min_emails:
+                new_results = await self._verify_with_bulk_api(pending)
+            else:
+                new_results = await self._verify_with_workers(interleave_by_domain(pending))
+        finally:
+            self._on_result = None
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+
+        for result in new_results:
+            results[result.email] = result
+
+        return {e: results[e] for e in unique if e in results}
+
+    async def _verify_with_workers(self, pending: list[str]) -> list[VerificationResult]:
+        """Single API with a fixed worker pool; journals each result as it lands."""
+        queue: asyncio.Queue = asyncio.Queue()
+        for email in pending:
+            queue.put_nowait(email)
+        verified = []
+
+        async def worker():
+            while True:
+                try:
+                    email = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                result = await self.client.verify_email(email)
+                # Keep the address we asked about as the key
+                result.email = email
+                if result.error:
+                    self.stats.errors += 1
+                    logger.debug(f"Verification error for {email}: {result.error}")
+                    continue
+                self._record(result)
+                verified.append(result)
+
+        workers = [asyncio.create_task(worker()) for _ in range(min(self.concurrency, len(pending)))]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+        return verified
+
+    async def _verify_with_bulk_api(self, pending: list[str]) -> list[VerificationResult]:
+        """Bulk API: one upload, poll until finished, journal the downloaded results."""
+        results = await self.client.verify_bulk(pending, poll_interval=self.bulk_poll_interval)
+        wanted = set(pending)
+        verified = []
+        for result in results:
+            result.email = normalize_email(result.email)
+            if result.email not in wanted:
+                continue
+            self._record(result)
+            verified.append(result)
+        self.stats.errors += len(wanted) - len(verified)
+        return verified
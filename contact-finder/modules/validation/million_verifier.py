@@ -1,9 +1,12 @@
 """
 MillionVerifier API Client
-Verify email addresses in real-time using MillionVerifier's Single API
+Verify email addresses in real-time using MillionVerifier's Single API,
+or in bulk by uploading a file to the Bulk API.
 """
 
 import asyncio
+import csv
+import io
 import logging
 import os
 from dataclasses import dataclass
@@ -12,6 +15,8 @@ from typing import Optional
 
 import aiohttp
 
+from ..budget import BudgetGovernor, reserve
+
 logger = logging.getLogger(__name__)
 
 
@@ -73,21 +78,68 @@ class VerificationResult:
             return 0
 
 
+def _parse_bool(value) -> bool:
+    """API JSON uses booleans, bulk CSV uses "yes"/"no"/"true"/"false"."""
+    if isinstance(value, str):
+        return value.strip().lower() in ("yes", "true", "1")
+    return bool(value)
+
+
+def parse_verification(data: dict, email: str, credits_remaining: int = 0) -> VerificationResult:
+    """
+    Build a VerificationResult from a Single API response, a Bulk API
+    result row or a journal record (all share the same field names).
+    """
+    result_str = str(data.get("result") or "unknown").lower()
+    try:
+        result = EmailResult(result_str)
+    except ValueError:
+        result = EmailResult.UNKNOWN
+
+    quality_str = str(data.get("quality") or "bad").lower()
+    try:
+        quality = EmailQuality(quality_str)
+    except ValueError:
+        quality = EmailQuality.BAD
+
+    try:
+        resultcode = int(data.get("resultcode") or 0)
+    except (TypeError, ValueError):
+        resultcode = 0
+
+    return VerificationResult(
+        email=data.get("email") or email,
+        result=result,
+        quality=quality,
+        resultcode=resultcode,
+        is_free=_parse_bool(data.get("free", False)),
+        is_role=_parse_bool(data.get("role", False)),
+        did_you_mean=data.get("didyoumean") or None,
+        credits_remaining=data.get("credits", credits_remaining) or 0,
+        execution_time_seconds=data.get("executiontime", 0) or 0
+    )
+
+
 class MillionVerifierClient:
     """
-    Client for MillionVerifier Single API
+    Client for MillionVerifier Single and Bulk APIs
 
     API Docs: https://developer.millionverifier.com/
     Endpoint: https://api.millionverifier.com/api/v3/
+    Bulk Endpoint: https://bulkapi.millionverifier.com/bulkapi/v2/
     """
 
     BASE_URL = "https://api.millionverifier.com/api/v3/"
+    BULK_URL = "https://bulkapi.millionverifier.com/bulkapi/v2/"
 
     def __init__(
         self,
         api_key: Optional[str] = None,
         timeout_seconds: int = 20,
-        max_concurrent: int = 10
+        max_concurrent: int = 10,
+        base_url: Optional[str] = None,
+        bulk_url: Optional[str] = None,
+        governor: Optional[BudgetGovernor] = None
     ):
         """
         Initialize MillionVerifier client.
@@ -95,13 +147,21 @@ class MillionVerifierClient:
         Args:
             api_key: MillionVerifier API key (or use MILLIONVERIFIER_API_KEY env var)
             timeout_seconds: Timeout for each verification (2-60 seconds)
-            max_concurrent: Maximum concurrent requests
+            max_concurrent: Maximum concurrent requests (your account's limit)
+            base_url: Override the Single API endpoint (e.g. a local stub)
+            bulk_url: Override the Bulk API endpoint
+            governor: Budget governor to reserve credits from (defaults to
+                      the process-wide one, if any)
         """
         self.api_key = api_key or os.environ.get("MILLIONVERIFIER_API_KEY")
         if not self.api_key:
             raise ValueError("MillionVerifier API key required")
 
         self.timeout_seconds = max(2, min(60, timeout_seconds))
+        self.max_concurrent = max_concurrent
+        self.base_url = base_url or self.BASE_URL
+        self.bulk_url = bulk_url or self.BULK_URL
+        self.governor = governor
         self._semaphore = asyncio.Semaphore(max_concurrent)
         self._session: Optional[aiohttp.ClientSession] = None
         self._verifications_count = 0
@@ -140,11 +200,13 @@ class MillionVerifierClient:
             }
 
             try:
-                async with session.get(self.BASE_URL, params=params) as response:
+                async with reserve(self.governor, "millionverifier") as spend, \
+                        session.get(self.base_url, params=params) as response:
                     data = await response.json()
 
-                    # Check for errors
+                    # Check for errors (not charged)
                     if data.get("error"):
+                        spend.settle(0)
                         return VerificationResult(
                             email=email,
                             result=EmailResult.UNKNOWN,
@@ -158,33 +220,10 @@ class MillionVerifierClient:
                             error=data.get("error")
                         )
 
-                    # Parse result
-                    result_str = data.get("result", "unknown").lower()
-                    try:
-                        result = EmailResult(result_str)
-                    except ValueError:
-                        result = EmailResult.UNKNOWN
-
-                    quality_str = data.get("quality", "bad").lower()
-                    try:
-                        quality = EmailQuality(quality_str)
-                    except ValueError:
-                        quality = EmailQuality.BAD
-
                     self._verifications_count += 1
                     self._credits_used += 1
 
-                    return VerificationResult(
-                        email=data.get("email", email),
-                        result=result,
-                        quality=quality,
-                        resultcode=data.get("resultcode", 0),
-                        is_free=data.get("free", False),
-                        is_role=data.get("role", False),
-                        did_you_mean=data.get("didyoumean") or None,
-                        credits_remaining=data.get("credits", 0),
-                        execution_time_seconds=data.get("executiontime", 0)
-                    )
+                    return parse_verification(data, email)
 
             except asyncio.TimeoutError:
                 logger.warning(f"Timeout verifying email: {email}")
@@ -234,7 +273,7 @@ class MillionVerifierClient:
 
         try:
             async with session.get(
-                "https://api.millionverifier.com/api/v3/credits",
+                f"{self.base_url}credits",
                 params={"api": self.api_key}
             ) as response:
                 data = await response.json()
@@ -243,6 +282,100 @@ class MillionVerifierClient:
             logger.error(f"Error getting credits: {e}")
             return 0
 
+    async def upload_bulk_file(self, emails: list[str], file_name: str = "emails.txt") -> str:
+        """
+        Upload emails (one per line) to the Bulk API.
+
+        Returns:
+            file_id of the created bulk job
+
+        Raises:
+            RuntimeError if the upload is rejected
+        """
+        session = await self._get_session()
+        form = aiohttp.FormData()
+        form.add_field(
+            "file_contents",
+            "\n".join(emails).encode(),
+            filename=file_name,
+            content_type="text/plain"
+        )
+        async with reserve(self.governor, "millionverifier", len(emails)) as spend, session.post(
+            f"{self.bulk_url}upload",
+            params={"key": self.api_key},
+            data=form,
+            timeout=aiohttp.ClientTimeout(total=300)
+        ) as response:
+            data = await response.json(content_type=None)
+            if data.get("error") or not data.get("file_id"):
+                spend.settle(0)
+        if data.get("error") or not data.get("file_id"):
+            raise RuntimeError(f"MillionVerifier bulk upload failed: {data.get('error') or data}")
+        return str(data["file_id"])
+
+    async def get_bulk_file_info(self, file_id: str) -> dict:
+        """Status of a bulk job ({"status": "in_progress"|"finished"|..., "percent": int, ...})."""
+        session = await self._get_session()
+        async with session.get(
+            f"{self.bulk_url}fileinfo",
+            params={"key": self.api_key, "file_id": file_id}
+        ) as response:
+            return await response.json(content_type=None)
+
+    async def download_bulk_results(self, file_id: str) -> list[VerificationResult]:
+        """Download all results of a finished bulk job."""
+        session = await self._get_session()
+        async with session.get(
+            f"{self.bulk_url}download",
+            params={"key": self.api_key, "file_id": file_id, "filter": "all"},
+            timeout=aiohttp.ClientTimeout(total=300)
+        ) as response:
+            text = await response.text()
+
+        results = []
+        for row in csv.DictReader(io.StringIO(text)):
+            # Header names vary in case between exports
+            row = {k.strip().lower(): v for k, v in row.items() if k}
+            email = (row.get("email") or "").strip().lower()
+            if email:
+                results.append(parse_verification(row, email))
+        self._verifications_count += len(results)
+        self._credits_used += len(results)
+        return results
+
+    async def verify_bulk(
+        self,
+        emails: list[str],
+        poll_interval: float = 10.0,
+        max_wait_seconds: float = 3600
+    ) -> list[VerificationResult]:
+        """
+        Verify a list of emails through the Bulk API (upload, poll, download).
+
+        Cheaper on request overhead than the Single API for large lists, but
+        results only arrive once the whole file is processed.
+
+        Raises:
+            RuntimeError if the job fails, TimeoutError if it doesn't finish in time
+        """
+        file_id = await self.upload_bulk_file(emails)
+        logger.info(f"MillionVerifier bulk job {file_id}: {len(emails)} emails uploaded")
+
+        waited = 0.0
+        while True:
+            info = await self.get_bulk_file_info(file_id)
+            status = str(info.get("status", "")).lower()
+            if status == "finished":
+                break
+            if status in ("error", "canceled", "cancelled"):
+                raise RuntimeError(f"MillionVerifier bulk job {file_id} {status}: {info.get('error', '')}")
+            if waited >= max_wait_seconds:
+                raise TimeoutError(f"MillionVerifier bulk job {file_id} not finished after {max_wait_seconds}s")
+            await asyncio.sleep(poll_interval)
+            waited += poll_interval
+
+        return await self.download_bulk_results(file_id)
+
     @property
     def verifications_count(self) -> int:
         """Number of verifications performed in this session"""
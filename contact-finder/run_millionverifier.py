@@ -4,169 +4,22 @@ Run MillionVerifier on all emails found in contact-finder output files.
 Extracts emails from JSON files and verifies them.
 """
 
+import argparse
 import asyncio
 import json
 import os
 import sys
 from pathlib import Path
 from datetime import datetime
-from dataclasses import dataclass
-from enum import Enum
-from typing import Optional
-
-import aiohttp
-
-
-class EmailResult(Enum):
-    """MillionVerifier result codes"""
-    OK = "ok"
-    CATCH_ALL = "catch_all"
-    UNKNOWN = "unknown"
-    INVALID = "invalid"
-    DISPOSABLE = "disposable"
-
-
-class EmailQuality(Enum):
-    """MillionVerifier quality assessment"""
-    GOOD = "good"
-    RISKY = "risky"
-    BAD = "bad"
-
-
-@dataclass
-class VerificationResult:
-    """Result from MillionVerifier API"""
-    email: str
-    result: EmailResult
-    quality: EmailQuality
-    resultcode: int
-    is_free: bool
-    is_role: bool
-    did_you_mean: Optional[str]
-    credits_remaining: int
-    execution_time_seconds: float
-    error: Optional[str] = None
-
-    @property
-    def is_valid(self) -> bool:
-        return self.result == EmailResult.OK
-
-    @property
-    def is_deliverable(self) -> bool:
-        return self.result in (EmailResult.OK, EmailResult.CATCH_ALL)
-
-    @property
-    def confidence_score(self) -> int:
-        if self.result == EmailResult.OK:
-            if self.quality == EmailQuality.GOOD:
-                return 100
-            elif self.quality == EmailQuality.RISKY:
-                return 70
-            else:
-                return 50
-        elif self.result == EmailResult.CATCH_ALL:
-            return 60
-        elif self.result == EmailResult.UNKNOWN:
-            return 30
-        else:
-            return 0
-
-
-class MillionVerifierClient:
-    """Client for MillionVerifier Single API"""
-
-    BASE_URL = "https://api.millionverifier.com/api/v3/"
-
-    def __init__(self, api_key: str, timeout_seconds: int = 20, max_concurrent: int = 10):
-        self.api_key = api_key
-        self.timeout_seconds = max(2, min(60, timeout_seconds))
-        self._semaphore = asyncio.Semaphore(max_concurrent)
-        self._session: Optional[aiohttp.ClientSession] = None
-
-    async def _get_session(self) -> aiohttp.ClientSession:
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=self.timeout_seconds + 5)
-            )
-        return self._session
-
-    async def close(self):
-        if self._session and not self._session.closed:
-            await self._session.close()
-
-    async def get_credits(self) -> int:
-        session = await self._get_session()
-        try:
-            async with session.get(
-                "https://api.millionverifier.com/api/v3/credits",
-                params={"api": self.api_key}
-            ) as response:
-                data = await response.json()
-                return data.get("credits", 0)
-        except Exception:
-            return 0
-
-    async def verify_email(self, email: str) -> VerificationResult:
-        async with self._semaphore:
-            session = await self._get_session()
-
-            params = {
-                "api": self.api_key,
-                "email": email.lower().strip(),
-                "timeout": self.timeout_seconds
-            }
-
-            try:
-                async with session.get(self.BASE_URL, params=params) as response:
-                    data = await response.json()
-
-                    if data.get("error"):
-                        return VerificationResult(
-                            email=email, result=EmailResult.UNKNOWN, quality=EmailQuality.BAD,
-                            resultcode=0, is_free=False, is_role=False, did_you_mean=None,
-                            credits_remaining=data.get("credits", 0),
-                            execution_time_seconds=data.get("executiontime", 0),
-                            error=data.get("error")
-                        )
-
-                    result_str = data.get("result", "unknown").lower()
-                    try:
-                        result = EmailResult(result_str)
-                    except ValueError:
-                        result = EmailResult.UNKNOWN
-
-                    quality_str = data.get("quality", "bad").lower()
-                    try:
-                        quality = EmailQuality(quality_str)
-                    except ValueError:
-                        quality = EmailQuality.BAD
-
-                    return VerificationResult(
-                        email=data.get("email", email),
-                        result=result,
-                        quality=quality,
-                        resultcode=data.get("resultcode", 0),
-                        is_free=data.get("free", False),
-                        is_role=data.get("role", False),
-                        did_you_mean=data.get("didyoumean") or None,
-                        credits_remaining=data.get("credits", 0),
-                        execution_time_seconds=data.get("executiontime", 0)
-                    )
-
-            except asyncio.TimeoutError:
-                return VerificationResult(
-                    email=email, result=EmailResult.UNKNOWN, quality=EmailQuality.BAD,
-                    resultcode=0, is_free=False, is_role=False, did_you_mean=None,
-                    credits_remaining=0, execution_time_seconds=self.timeout_seconds,
-                    error="timeout"
-                )
-            except Exception as e:
-                return VerificationResult(
-                    email=email, result=EmailResult.UNKNOWN, quality=EmailQuality.BAD,
-                    resultcode=0, is_free=False, is_role=False, did_you_mean=None,
-                    credits_remaining=0, execution_time_seconds=0,
-                    error=str(e)
-                )
+
+# Add this directory to path for module imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+from modules.validation.million_verifier import MillionVerifierClient, EmailResult
+from modules.validation.bulk_verifier import BulkEmailVerifier
+
+# Verified results from earlier runs; re-runs only verify new emails
+JOURNAL_FILE = Path(__file__).parent / 'millionverifier_journal.jsonl'
 
 
 async def extract_emails_from_json(file_path: Path) -> list[dict]:
@@ -253,17 +106,30 @@ async def scan_for_emails(base_path: Path) -> list[dict]:
     return all_emails
 
 
-async def verify_emails(emails: list[dict], api_key: str) -> list[dict]:
-    """Verify all emails using MillionVerifier."""
+async def verify_emails(
+    emails: list[dict],
+    api_key: str,
+    max_concurrent: int = 10,
+    use_bulk_api: bool = False
+) -> tuple[list[dict], list[dict]]:
+    """Verify all emails using MillionVerifier (deduped, concurrent, journaled)."""
 
     client = MillionVerifierClient(
         api_key=api_key,
         timeout_seconds=30,
-        max_concurrent=10
+        max_concurrent=max_concurrent
     )
+    verifier = BulkEmailVerifier(client, journal_path=str(JOURNAL_FILE), use_bulk_api=use_bulk_api)
 
     valid_emails = []
     results_all = []
+    done = 0
+
+    def show(result):
+        nonlocal done
+        done += 1
+        status = "✓ VALID" if result.is_valid else ("⚠ CATCH-ALL" if result.result == EmailResult.CATCH_ALL else "✗ INVALID")
+        print(f"[{done}] {result.email} -> {status} ({result.quality.value})", flush=True)
 
     try:
         print(f"\nVerifying {len(emails)} emails with MillionVerifier...")
@@ -275,12 +141,14 @@ async def verify_emails(emails: list[dict], api_key: str) -> list[dict]:
         if credits < len(emails):
             print(f"WARNING: Not enough credits ({credits}) for all emails ({len(emails)})")
 
-        for i, email_data in enumerate(emails):
-            email = email_data['email']
-
-            print(f"[{i+1}/{len(emails)}] Verifying: {email}", end=" ")
+        results = await verifier.verify_all([e['email'] for e in emails], on_result=show)
+        stats = verifier.stats
+        print(f"\n{stats.from_journal} from journal, {stats.verified} verified, {stats.errors} errors")
 
-            result = await client.verify_email(email)
+        for email_data in emails:
+            result = results.get(email_data['email'])
+            if result is None:
+                continue
 
             email_data['verification_result'] = result.result.value
             email_data['verification_quality'] = result.quality.value
@@ -293,16 +161,10 @@ async def verify_emails(emails: list[dict], api_key: str) -> list[dict]:
 
             results_all.append(email_data)
 
-            status = "✓ VALID" if result.is_valid else ("⚠ CATCH-ALL" if result.result == EmailResult.CATCH_ALL else "✗ INVALID")
-            print(f"-> {status} ({result.quality.value})", flush=True)
-
             if result.is_valid or result.result == EmailResult.CATCH_ALL:
                 valid_emails.append(email_data)
 
-            # Small delay between requests
-            await asyncio.sleep(0.1)
-
-        print(f"\nCredits remaining: {result.credits_remaining}")
+        print(f"\nCredits remaining: {await client.get_credits()}")
 
     finally:
         await client.close()
@@ -311,6 +173,11 @@ async def verify_emails(emails: list[dict], api_key: str) -> list[dict]:
 
 
 async def main():
+    parser = argparse.ArgumentParser(description="Verify contact-finder emails with MillionVerifier")
+    parser.add_argument("--concurrency", type=int, default=10, help="Account concurrency limit")
+    parser.add_argument("--bulk", action="store_true", help="Use the Bulk API (file upload) for large lists")
+    args = parser.parse_args()
+
     # Get API key
     api_key = os.environ.get('MILLIONVERIFIER_API_KEY')
     if not api_key:
@@ -335,7 +202,9 @@ async def main():
     print(f"\nTotal unique emails found: {len(emails)}")
 
     # Verify emails
-    valid_emails, all_results = await verify_emails(emails, api_key)
+    valid_emails, all_results = await verify_emails(
+        emails, api_key, max_concurrent=args.concurrency, use_bulk_api=args.bulk
+    )
 
     # Output results
     print("\n" + "=" * 60)
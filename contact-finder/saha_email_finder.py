@@ -6,18 +6,23 @@ Find and verify emails for all 8,127 contacts using MillionVerifier
 
 import asyncio
 import csv
-import json
 import os
 import sys
 from pathlib import Path
-from datetime import datetime
-from dataclasses import dataclass
-from enum import Enum
 from typing import Optional
 import re
 import unicodedata
 
-import aiohttp
+# Add this directory to path for module imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+from modules.validation.million_verifier import (
+    MillionVerifierClient,
+    VerificationResult,
+    EmailResult,
+    EmailQuality
+)
+from modules.validation.bulk_verifier import BulkEmailVerifier
 
 # ============================================================================
 # Email Permutation Generator (inline to avoid import issues)
@@ -117,146 +122,32 @@ def generate_email_permutations(full_name: str, domain: str) -> list[str]:
     return unique
 
 
-# ============================================================================
-# MillionVerifier Client (inline)
-# ============================================================================
-
-class EmailResult(Enum):
-    OK = "ok"
-    CATCH_ALL = "catch_all"
-    UNKNOWN = "unknown"
-    INVALID = "invalid"
-    DISPOSABLE = "disposable"
-
-
-class EmailQuality(Enum):
-    GOOD = "good"
-    RISKY = "risky"
-    BAD = "bad"
-
-
-@dataclass
-class VerificationResult:
-    email: str
-    result: EmailResult
-    quality: EmailQuality
-    is_free: bool
-    is_role: bool
-    credits_remaining: int
-    error: Optional[str] = None
-
-    @property
-    def is_valid(self) -> bool:
-        return self.result == EmailResult.OK
-
-    @property
-    def is_deliverable(self) -> bool:
-        return self.result in (EmailResult.OK, EmailResult.CATCH_ALL)
-
-
-class MillionVerifierClient:
-    BASE_URL = "https://api.millionverifier.com/api/v3/"
-
-    def __init__(self, api_key: str, timeout_seconds: int = 30, max_concurrent: int = 10):
-        self.api_key = api_key
-        self.timeout_seconds = timeout_seconds
-        self._semaphore = asyncio.Semaphore(max_concurrent)
-        self._session: Optional[aiohttp.ClientSession] = None
-
-    async def _get_session(self) -> aiohttp.ClientSession:
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=self.timeout_seconds + 5)
-            )
-        return self._session
-
-    async def close(self):
-        if self._session and not self._session.closed:
-            await self._session.close()
-
-    async def verify_email(self, email: str) -> VerificationResult:
-        async with self._semaphore:
-            session = await self._get_session()
-            params = {
-                "api": self.api_key,
-                "email": email.lower().strip(),
-                "timeout": self.timeout_seconds
-            }
-
-            try:
-                async with session.get(self.BASE_URL, params=params) as response:
-                    data = await response.json()
-
-                    if data.get("error"):
-                        return VerificationResult(
-                            email=email, result=EmailResult.UNKNOWN, quality=EmailQuality.BAD,
-                            is_free=False, is_role=False, credits_remaining=data.get("credits", 0),
-                            error=data.get("error")
-                        )
-
-                    result_str = data.get("result", "unknown").lower()
-                    try:
-                        result = EmailResult(result_str)
-                    except ValueError:
-                        result = EmailResult.UNKNOWN
-
-                    quality_str = data.get("quality", "bad").lower()
-                    try:
-                        quality = EmailQuality(quality_str)
-                    except ValueError:
-                        quality = EmailQuality.BAD
-
-                    return VerificationResult(
-                        email=data.get("email", email),
-                        result=result,
-                        quality=quality,
-                        is_free=data.get("free", False),
-                        is_role=data.get("role", False),
-                        credits_remaining=data.get("credits", 0)
-                    )
-
-            except asyncio.TimeoutError:
-                return VerificationResult(
-                    email=email, result=EmailResult.UNKNOWN, quality=EmailQuality.BAD,
-                    is_free=False, is_role=False, credits_remaining=0, error="timeout"
-                )
-            except Exception as e:
-                return VerificationResult(
-                    email=email, result=EmailResult.UNKNOWN, quality=EmailQuality.BAD,
-                    is_free=False, is_role=False, credits_remaining=0, error=str(e)
-                )
-
-    async def verify_emails(self, emails: list[str]) -> list[VerificationResult]:
-        tasks = [self.verify_email(email) for email in emails]
-        return await asyncio.gather(*tasks)
-
-
 # ============================================================================
 # Main Email Finder
 # ============================================================================
 
-async def find_best_email(
-    client: MillionVerifierClient,
-    contact_name: str,
-    domain: str
-) -> tuple[Optional[str], Optional[str], list[dict]]:
+def pick_best_email(
+    permutations: list[str],
+    verified: dict[str, VerificationResult]
+) -> tuple[Optional[str], str, list[dict]]:
     """
-    Find and verify best email for a contact.
+    Pick the best verified email among a contact's permutations.
     Returns: (best_email, email_status, all_results)
     """
-    permutations = generate_email_permutations(contact_name, domain)
-
     if not permutations:
         return None, "no_permutations", []
 
-    results = await client.verify_emails(permutations)
-
     all_results = []
     best_email = None
     best_status = "not_found"
     best_score = -1
 
-    for email, result in zip(permutations, results):
+    for email in permutations:
+        result = verified.get(email)
+        if result is None:
+            # Verification errored (retried on the next run)
+            continue
+
         result_dict = {
             "email": email,
             "result": result.result.value,
@@ -293,83 +184,79 @@ async def find_best_email(
     return best_email, best_status, all_results
 
 
-async def process_contacts(input_file: str, output_file: str, api_key: str):
-    """Process all contacts and find emails"""
+async def process_contacts(
+    input_file: str,
+    output_file: str,
+    api_key: str,
+    max_concurrent: int = 10,
+    use_bulk_api: bool = False
+):
+    """
+    Process all contacts and find emails.
+
+    All permutations across the file are verified once each through the
+    bulk verifier; results are journaled to `<output>_verify_journal.jsonl`,
+    so an interrupted run resumes without re-verifying anything.
+    """
 
     # Read contacts
     print(f"Reading contacts from {input_file}...")
     contacts = []
     with open(input_file, 'r', encoding='utf-8') as f:
         reader = csv.DictReader(f)
-        fieldnames = reader.fieldnames
+        fieldnames = list(reader.fieldnames or [])
         for row in reader:
             contacts.append(row)
 
     print(f"Found {len(contacts)} contacts")
-
-    # Initialize client
-    client = MillionVerifierClient(api_key=api_key, max_concurrent=10)
-
-    # Process contacts
-    results = []
-    checkpoint_file = output_file.replace('.csv', '_checkpoint.json')
-
-    # Load checkpoint if exists
-    start_idx = 0
-    if os.path.exists(checkpoint_file):
-        with open(checkpoint_file, 'r') as f:
-            checkpoint = json.load(f)
-            results = checkpoint.get('results', [])
-            start_idx = checkpoint.get('last_idx', 0) + 1
-            print(f"Resuming from checkpoint at index {start_idx}")
+    for column in ('email', 'email_status'):
+        if column not in fieldnames:
+            fieldnames.append(column)
+
+    # Permutations for every contact, verified together (deduped across contacts)
+    permutations_by_contact = [
+        generate_email_permutations(c.get('contact_name', ''), c.get('website', ''))
+        if c.get('contact_name') and c.get('website') else None
+        for c in contacts
+    ]
+    all_permutations = [e for perms in permutations_by_contact if perms for e in perms]
+
+    client = MillionVerifierClient(api_key=api_key, timeout_seconds=30, max_concurrent=max_concurrent)
+    journal_file = output_file.replace('.csv', '_verify_journal.jsonl')
+    verifier = BulkEmailVerifier(client, journal_path=journal_file, use_bulk_api=use_bulk_api)
+
+    done = 0
+
+    def progress(result):
+        nonlocal done
+        done += 1
+        if done % 100 == 0:
+            print(f"  Verified {done} emails...", flush=True)
 
     try:
-        for i, contact in enumerate(contacts[start_idx:], start=start_idx):
-            contact_name = contact.get('contact_name', '')
-            domain = contact.get('website', '')
-            practice = contact.get('practice_name', '')
-
-            print(f"[{i+1}/{len(contacts)}] {contact_name} @ {domain}", end=" ", flush=True)
-
-            if not contact_name or not domain:
-                print("-> SKIP (missing data)")
-                contact['email'] = ''
-                contact['email_status'] = 'missing_data'
-                results.append(contact)
-                continue
-
-            # Find best email
-            best_email, status, all_results = await find_best_email(client, contact_name, domain)
-
-            if best_email:
-                print(f"-> {best_email} ({status})")
-                contact['email'] = best_email
-                contact['email_status'] = status
-            else:
-                print(f"-> NOT FOUND")
-                contact['email'] = ''
-                contact['email_status'] = status
-
-            results.append(contact)
+        verified = await verifier.verify_all(all_permutations, on_result=progress)
+    finally:
+        await client.close()
 
-            # Checkpoint every 100 contacts
-            if (i + 1) % 100 == 0:
-                print(f"\n  Saving checkpoint at {i+1}...")
-                with open(checkpoint_file, 'w') as f:
-                    json.dump({'last_idx': i, 'results': results}, f)
+    stats = verifier.stats
+    print(f"Emails: {stats.requested} permutations, {stats.unique} unique, "
+          f"{stats.from_journal} from journal, {stats.verified} verified now, {stats.errors} errors")
 
-                # Also write interim CSV
-                with open(output_file, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.DictWriter(f, fieldnames=fieldnames)
-                    writer.writeheader()
-                    writer.writerows(results)
-                print(f"  Checkpoint saved. Credits remaining: checking...")
+    results = []
+    for i, (contact, permutations) in enumerate(zip(contacts, permutations_by_contact)):
+        contact_name = contact.get('contact_name', '')
+        domain = contact.get('website', '')
 
-            # Small delay
-            await asyncio.sleep(0.05)
+        if permutations is None:
+            contact['email'] = ''
+            contact['email_status'] = 'missing_data'
+        else:
+            best_email, status, _ = pick_best_email(permutations, verified)
+            contact['email'] = best_email or ''
+            contact['email_status'] = status
+            print(f"[{i+1}/{len(contacts)}] {contact_name} @ {domain} -> {best_email or 'NOT FOUND'} ({status})")
 
-    finally:
-        await client.close()
+        results.append(contact)
 
     # Write final results
     print(f"\nWriting {len(results)} contacts to {output_file}...")
@@ -378,10 +265,6 @@ async def process_contacts(input_file: str, output_file: str, api_key: str):
         writer.writeheader()
         writer.writerows(results)
 
-    # Remove checkpoint file
-    if os.path.exists(checkpoint_file):
-        os.remove(checkpoint_file)
-
     # Summary
     found_ok = sum(1 for r in results if r.get('email_status') == 'ok')
     found_catch_all = sum(1 for r in results if r.get('email_status') == 'catch_all')
@@ -395,6 +278,7 @@ async def process_contacts(input_file: str, output_file: str, api_key: str):
     print(f"Catch-all emails: {found_catch_all} ({found_catch_all/len(results)*100:.1f}%)")
     print(f"Not found: {not_found} ({not_found/len(results)*100:.1f}%)")
     print(f"\nResults saved to: {output_file}")
+    print(f"Verification journal: {journal_file} (delete to re-verify from scratch)")
 
 
 async def main():
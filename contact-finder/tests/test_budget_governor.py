@@ -0,0 +1,186 @@
+"""
+Tests for the shared budget governor (caps, rate/concurrency metering, client wiring)
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.budget import BudgetExceeded, BudgetGovernor, ProviderLimits
+from modules.enrichment.scrapin import ScrapinClient
+from modules.enrichment.waterfall import EnrichmentWaterfall
+from modules.validation.million_verifier import MillionVerifierClient
+
+
+def test_run_cap_counts_in_flight_reservations():
+    governor = BudgetGovernor(run_budget_usd=0.005)
+
+    async def run():
+        results = []
+
+        async def call():
+            try:
+                async with governor.reserve("serper"):
+                    await asyncio.sleep(0.01)
+                results.append("ok")
+            except BudgetExceeded as e:
+                results.append(e.scope)
+
+        await asyncio.gather(*(call() for _ in range(8)))
+        return results
+
+    results = asyncio.run(run())
+    assert results.count("ok") == 5 and results.count("run") == 3
+    snap = governor.snapshot()
+    assert snap["run"]["spent_usd"] == pytest.approx(0.005)
+    assert snap["run"]["remaining_usd"] == pytest.approx(0.0)
+    assert snap["run"]["rejected"] == 3
+    assert snap["providers"]["serper"]["calls"] == 5
+
+
+def test_company_cap_is_scoped_per_task():
+    governor = BudgetGovernor(company_budget_usd=0.004)
+
+    async def company(name, calls):
+        spent = 0
+        with governor.company_scope(name):
+            for _ in range(calls):
+                try:
+                    async with governor.reserve("openweb_ninja"):
+                        spent += 1
+                except BudgetExceeded as e:
+                    assert e.scope == "company"
+                    break
+        return spent
+
+    async def run():
+        return await asyncio.gather(company("a", 5), company("b", 1))
+
+    assert asyncio.run(run()) == [2, 1]
+    assert governor.company_spend("a") == pytest.approx(0.004)
+    assert governor.company_spend("b") == pytest.approx(0.002)
+    assert governor.snapshot()["companies"]["a"]["by_provider"] == {"openweb_ninja": 0.004}
+
+
+def test_settle_and_provider_credit_limit():
+    governor = BudgetGovernor(providers={
+        "blitz": ProviderLimits(cost_per_credit=0.05, max_credits=4)
+    })
+
+    async def run():
+        # Pay-if-found: reserved 3, charged 0
+        async with governor.reserve("blitz", credits=3) as spend:
+            spend.settle(0)
+        async with governor.reserve("blitz", credits=3):
+            pass
+        with pytest.raises(BudgetExceeded) as exc:
+            async with governor.reserve("blitz", credits=3):
+                pass
+        return exc.value
+
+    exc = asyncio.run(run())
+    assert exc.scope == "provider"
+    blitz = governor.snapshot()["providers"]["blitz"]
+    assert blitz["credits"] == 3 and blitz["remaining_credits"] == 1
+    assert governor.spent_usd == pytest.approx(0.15)
+
+
+def test_rate_and_concurrency_limits_meter_wide_fan_out():
+    governor = BudgetGovernor(providers={
+        "serper": ProviderLimits(cost_per_credit=0.001, rate_per_second=100, max_concurrent=3)
+    })
+    state = {"now": 0, "peak": 0}
+
+    async def call():
+        async with governor.reserve("serper"):
+            state["now"] += 1
+            state["peak"] = max(state["peak"], state["now"])
+            await asyncio.sleep(0.05)
+            state["now"] -= 1
+
+    async def run():
+        await asyncio.gather(*(call() for _ in range(20)))
+
+    start = time.monotonic()
+    asyncio.run(run())
+    elapsed = time.monotonic() - start
+    assert state["peak"] == 3
+    # 20 starts at 100/s need at least ~0.19s
+    assert elapsed >= 0.18
+    assert governor.snapshot()["providers"]["serper"]["in_flight"] == 0
+
+
+def test_client_reserves_and_errors_are_not_charged():
+    calls = []
+
+    async def single(request):
+        email = request.query["email"]
+        calls.append(email)
+        if email.startswith("err"):
+            return web.json_response({"error": "Temporary failure"})
+        return web.json_response({"email": email, "result": "ok", "quality": "good", "resultcode": 1})
+
+    governor = BudgetGovernor(run_budget_usd=0.00029 * 3)
+
+    async def run():
+        app = web.Application()
+        app.router.add_get("/api/v3/", single)
+        server = TestServer(app)
+        await server.start_server()
+        client = MillionVerifierClient(
+            api_key="test", base_url=str(server.make_url("/api/v3/")), governor=governor
+        )
+        try:
+            return [await client.verify_email(e) for e in ["ok1@a.com", "err@a.com", "ok2@a.com", "ok3@a.com", "ok4@a.com"]]
+        finally:
+            await client.close()
+            await server.close()
+
+    results = asyncio.run(run())
+    assert calls == ["ok1@a.com", "err@a.com", "ok2@a.com", "ok3@a.com"]
+    assert results[1].error == "Temporary failure"
+    assert "budget exceeded" in results[4].error
+    assert governor.snapshot()["providers"]["millionverifier"]["credits"] == 3
+
+
+def test_scrapin_failures_are_settled_at_zero():
+    async def finder(request):
+        body = await request.json()
+        if body["url"].endswith("broke"):
+            return web.json_response({"error": "No credits"}, status=402)
+        return web.json_response({"email": "jane@acme.com", "emailType": "professional"})
+
+    governor = BudgetGovernor(providers={"scrapin": ProviderLimits(cost_per_credit=0.01)})
+
+    async def run():
+        app = web.Application()
+        app.router.add_post("/v1/enrichment/emails/finder/url", finder)
+        server = TestServer(app)
+        await server.start_server()
+        client = ScrapinClient(api_key="test")
+        client.BASE_URL = str(server.make_url("")).rstrip("/")
+        # The waterfall hands its governor to clients that have none
+        waterfall = EnrichmentWaterfall(scrapin_client=client, governor=governor)
+        try:
+            with governor.company_scope("Acme"):
+                broke = await client.find_email(linkedin_url="linkedin.com/in/broke")
+                found = await client.find_email(linkedin_url="linkedin.com/in/jane")
+            return waterfall, broke, found
+        finally:
+            await client.close()
+            await server.close()
+
+    waterfall, broke, found = asyncio.run(run())
+    assert waterfall.scrapin.governor is governor
+    assert broke.email is None and found.email == "jane@acme.com"
+    scrapin = governor.snapshot()["providers"]["scrapin"]
+    assert scrapin["calls"] == 2 and scrapin["credits"] == 2
+    assert governor.company_spend("Acme") == pytest.approx(0.02)
@@ -0,0 +1,200 @@
+"""
+Tests for BulkEmailVerifier against a local MillionVerifier stub server
+"""
+
+import asyncio
+import json
+import os
+import sys
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.validation.bulk_verifier import BulkEmailVerifier, interleave_by_domain
+from modules.validation.million_verifier import EmailResult, MillionVerifierClient
+
+
+class StubMillionVerifier:
+    """
+    Local stand-in for the Single and Bulk APIs.
+
+    Local part decides the verdict: "ok*" -> ok, "catch*" -> catch_all,
+    "flaky*" -> API error (once), anything else -> invalid.
+    """
+
+    def __init__(self, delay: float = 0.01):
+        self.delay = delay
+        self.single_calls = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.failed_once = set()
+        self.uploads = []
+        self.fileinfo_calls = 0
+
+    def verdict(self, email: str) -> dict:
+        local = email.split("@")[0]
+        if local.startswith("ok"):
+            result, quality = "ok", "good"
+        elif local.startswith("catch"):
+            result, quality = "catch_all", "risky"
+        else:
+            result, quality = "invalid", "bad"
+        return {"email": email, "result": result, "quality": quality, "resultcode": 1,
+                "free": False, "role": local.startswith("okinfo"), "credits": 1000}
+
+    async def single(self, request):
+        email = request.query["email"]
+        self.single_calls.append(email)
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        if email.startswith("flaky") and email not in self.failed_once:
+            self.failed_once.add(email)
+            return web.json_response({"error": "Temporary failure", "credits": 1000})
+        return web.json_response(self.verdict(email))
+
+    async def credits(self, request):
+        return web.json_response({"credits": 1000})
+
+    async def upload(self, request):
+        form = await request.post()
+        emails = form["file_contents"].file.read().decode().split("\n")
+        self.uploads.append(emails)
+        return web.json_response({"file_id": str(len(self.uploads)), "status": "in_progress"})
+
+    async def fileinfo(self, request):
+        self.fileinfo_calls += 1
+        status = "finished" if self.fileinfo_calls > 1 else "in_progress"
+        return web.json_response({"file_id": request.query["file_id"], "status": status})
+
+    async def download(self, request):
+        emails = self.uploads[int(request.query["file_id"]) - 1]
+        lines = ["email,quality,result,free,role"]
+        for email in emails:
+            v = self.verdict(email)
+            lines.append(f"{email},{v['quality']},{v['result']},no,{'yes' if v['role'] else 'no'}")
+        return web.Response(text="\n".join(lines), content_type="text/csv")
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/api/v3/", self.single)
+        app.router.add_get("/api/v3/credits", self.credits)
+        app.router.add_post("/bulkapi/v2/upload", self.upload)
+        app.router.add_get("/bulkapi/v2/fileinfo", self.fileinfo)
+        app.router.add_get("/bulkapi/v2/download", self.download)
+        return app
+
+
+async def run_with_stub(stub: StubMillionVerifier, body, max_concurrent: int = 4):
+    server = TestServer(stub.app())
+    await server.start_server()
+    client = MillionVerifierClient(
+        api_key="test",
+        max_concurrent=max_concurrent,
+        base_url=str(server.make_url("/api/v3/")),
+        bulk_url=str(server.make_url("/bulkapi/v2/"))
+    )
+    try:
+        return await body(client)
+    finally:
+        await client.close()
+        await server.close()
+
+
+def test_dedup_concurrency_and_journal_resume(tmp_path):
+    journal = str(tmp_path / "journal.jsonl")
+    emails = [f"ok{i}@a.com" for i in range(10)] + [f"bad{i}@b.com" for i in range(10)]
+    emails += ["OK0@A.com", " ok1@a.com ", "bad0@b.com"]  # duplicates
+    stub = StubMillionVerifier()
+
+    async def first(client):
+        verifier = BulkEmailVerifier(client, journal_path=journal)
+        return await verifier.verify_all(emails), verifier.stats
+
+    results, stats = asyncio.run(run_with_stub(stub, first, max_concurrent=4))
+    assert len(stub.single_calls) == 20
+    assert stub.peak_in_flight == 4
+    assert stats.unique == 20 and stats.verified == 20 and stats.credits_saved == 3
+    assert results["ok0@a.com"].is_valid
+    assert results["bad3@b.com"].result == EmailResult.INVALID
+    with open(journal) as f:
+        assert len(f.readlines()) == 20
+
+    # Resume: nothing left to verify
+    stub2 = StubMillionVerifier()
+
+    async def second(client):
+        verifier = BulkEmailVerifier(client, journal_path=journal)
+        return await verifier.verify_all(emails + ["ok99@c.com"]), verifier.stats
+
+    results, stats = asyncio.run(run_with_stub(stub2, second))
+    assert stub2.single_calls == ["ok99@c.com"]
+    assert stats.from_journal == 20
+    assert len(results) == 21
+
+
+def test_errors_are_retried_on_resume(tmp_path):
+    journal = str(tmp_path / "journal.jsonl")
+    stub = StubMillionVerifier()
+    emails = ["flaky@a.com", "ok@a.com"]
+
+    async def run(client):
+        verifier = BulkEmailVerifier(client, journal_path=journal)
+        return await verifier.verify_all(emails), verifier.stats
+
+    results, stats = asyncio.run(run_with_stub(stub, run))
+    assert set(results) == {"ok@a.com"} and stats.errors == 1
+
+    results, stats = asyncio.run(run_with_stub(stub, run))
+    assert results["flaky@a.com"].result == EmailResult.INVALID
+    assert stats.from_journal == 1 and stats.verified == 1
+
+
+def test_torn_journal_line_is_skipped(tmp_path):
+    journal = tmp_path / "journal.jsonl"
+    journal.write_text(
+        json.dumps({"email": "ok@a.com", "result": "ok", "quality": "good"}) + "\n"
+        + '{"email": "bad@a.com", "res'
+    )
+    stub = StubMillionVerifier()
+
+    async def run(client):
+        return await BulkEmailVerifier(client, journal_path=str(journal)).verify_all(["ok@a.com", "bad@a.com"])
+
+    results = asyncio.run(run_with_stub(stub, run))
+    assert stub.single_calls == ["bad@a.com"]
+    assert results["ok@a.com"].is_valid
+
+
+def test_bulk_api_mode(tmp_path):
+    journal = str(tmp_path / "journal.jsonl")
+    stub = StubMillionVerifier()
+    emails = ["ok@a.com", "catch@b.com", "okinfo@c.com", "nope@d.com", "ok@a.com"]
+
+    async def run(client):
+        verifier = BulkEmailVerifier(
+            client, journal_path=journal, use_bulk_api=True, bulk_min_emails=2, bulk_poll_interval=0.01
+        )
+        return await verifier.verify_all(emails)
+
+    results = asyncio.run(run_with_stub(stub, run))
+    assert stub.single_calls == []
+    assert len(stub.uploads) == 1 and len(stub.uploads[0]) == 4
+    assert results["catch@b.com"].result == EmailResult.CATCH_ALL
+    assert results["okinfo@c.com"].is_role is True
+    assert results["nope@d.com"].is_free is False
+    with open(journal) as f:
+        assert len(f.readlines()) == 4
+
+
+def test_interleave_by_domain():
+    emails = ["a1@x.com", "a2@x.com", "a3@x.com", "b1@y.com", "c1@z.com", "b2@y.com"]
+    assert interleave_by_domain(emails) == [
+        "a1@x.com", "b1@y.com", "c1@z.com", "a2@x.com", "b2@y.com", "a3@x.com"
+    ]
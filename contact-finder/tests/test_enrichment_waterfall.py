@@ -0,0 +1,155 @@
+"""
+Tests for the sequential vs speculative email waterfall (fake provider clients)
+"""
+
+import asyncio
+import os
+import sys
+from types import SimpleNamespace
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.budget import BudgetGovernor, reserve
+from modules.enrichment.waterfall import EnrichmentWaterfall, compare_waterfall_modes
+
+
+class FakeProvider:
+    """find_email() that sleeps `delay` and answers from `emails` (name -> (email, verified))"""
+
+    def __init__(self, delay: float, emails: dict):
+        self.delay = delay
+        self.emails = emails
+        self.calls = 0
+        self.cancelled = 0
+
+    async def _lookup(self, key):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return self.emails.get(key, (None, False))
+
+
+class FakeScrapin(FakeProvider):
+    async def find_email(self, linkedin_url=None, first_name=None, last_name=None, company_domain=None):
+        email, verified = await self._lookup(first_name)
+        return SimpleNamespace(email=email, email_type="professional" if verified else "personal", confidence=1.0)
+
+
+class FakeBlitz(FakeProvider):
+    async def find_email(self, linkedin_url):
+        email, verified = await self._lookup(linkedin_url.rsplit("/", 1)[-1])
+        return SimpleNamespace(email=email, status="valid" if verified else "unknown",
+                               credits_consumed=1.0 if email else 0.0)
+
+
+class FakeLeadMagic(FakeProvider):
+    async def find_email(self, first_name, last_name=None, domain=None, company_name=None):
+        email, verified = await self._lookup(first_name)
+        return SimpleNamespace(email=email, status="valid" if verified else "unknown",
+                               credits_consumed=1 if email else 0)
+
+
+def contact(first):
+    return {"first_name": first, "last_name": "X", "company_name": "Acme",
+            "domain": "acme.com", "linkedin_url": f"https://linkedin.com/in/{first}"}
+
+
+def make(mode, scrapin, blitz, leadmagic, **kwargs):
+    return EnrichmentWaterfall(
+        scrapin_client=scrapin, blitz_client=blitz, leadmagic_client=leadmagic, mode=mode, **kwargs
+    )
+
+
+def test_verified_blitz_hit_cancels_slow_scrapin():
+    scrapin = FakeScrapin(0.5, {})
+    blitz = FakeBlitz(0.01, {"ann": ("ann@acme.com", True)})
+    leadmagic = FakeLeadMagic(0.01, {})
+    waterfall = make("speculative", scrapin, blitz, leadmagic)
+
+    result = asyncio.run(waterfall.enrich(**contact("ann")))
+    assert result.contact.email == "ann@acme.com"
+    assert result.contact.enrichment_sources == ["blitz_email"]
+    assert result.cost_breakdown == {"blitz_email": 1.0}
+    assert scrapin.cancelled == 1 and leadmagic.calls == 0
+    assert result.latency_s < 0.4
+
+
+def test_leadmagic_only_after_both_miss_and_cost_ceiling():
+    scrapin = FakeScrapin(0.01, {})
+    blitz = FakeBlitz(0.01, {})
+    leadmagic = FakeLeadMagic(0.01, {"bob": ("bob@acme.com", True)})
+
+    result = asyncio.run(make("speculative", scrapin, blitz, leadmagic).enrich(**contact("bob")))
+    assert result.contact.email == "bob@acme.com"
+    assert scrapin.calls == blitz.calls == leadmagic.calls == 1
+
+    # Ceiling 0: no paid provider is started
+    blitz.calls = leadmagic.calls = 0
+    capped = make("speculative", scrapin, blitz, leadmagic, cost_ceiling=0)
+    result = asyncio.run(capped.enrich(**contact("bob")))
+    assert result.contact.email is None
+    assert blitz.calls == 0 and leadmagic.calls == 0
+
+
+def test_latency_target_skips_hedge_when_scrapin_is_fast():
+    scrapin = FakeScrapin(0.01, {"cy": ("cy@acme.com", True)})
+    blitz = FakeBlitz(0.01, {"cy": ("cy@acme.com", True)})
+    waterfall = make("speculative", scrapin, blitz, None, latency_target_s=0.2)
+
+    result = asyncio.run(waterfall.enrich(**contact("cy")))
+    assert result.contact.enrichment_sources == ["scrapin_email"]
+    assert blitz.calls == 0 and result.contact.cost_credits == 0
+
+
+class ReservingBlitz(FakeBlitz):
+    """FakeBlitz that reserves its credit like the real client"""
+
+    def __init__(self, delay, emails, governor):
+        super().__init__(delay, emails)
+        self.governor = governor
+
+    async def find_email(self, linkedin_url):
+        async with reserve(self.governor, "blitz", 1):
+            return await super().find_email(linkedin_url)
+
+
+def test_cancelled_blitz_call_is_counted_as_spent():
+    governor = BudgetGovernor()
+    scrapin = FakeScrapin(0.05, {"dee": ("dee@acme.com", True)})
+    blitz = ReservingBlitz(0.5, {"dee": ("dee@acme.com", True)}, governor)
+    waterfall = make("speculative", scrapin, blitz, None)
+
+    result = asyncio.run(waterfall.enrich(**contact("dee")))
+    assert result.contact.email == "dee@acme.com" and blitz.cancelled == 1
+    # Blitz was sent before Scrapin won: billed, and counted like the governor counts it
+    assert result.cost_breakdown == {"scrapin_email": 0.0, "blitz_email": 1.0}
+    assert waterfall.stats.summary()["credits_total"] == 1.0
+    assert governor.snapshot()["providers"]["blitz"]["credits"] == 1.0
+
+
+def test_compare_modes_reports_latency_and_credit_delta():
+    # Scrapin is slow and usually misses; Blitz is fast and hits half the time
+    names = [f"p{i}" for i in range(10)]
+    scrapin_hits = {n: (f"{n}@acme.com", True) for n in names[:2]}
+    blitz_hits = {n: (f"{n}@acme.com", True) for n in names[:5]}
+    leadmagic_hits = {n: (f"{n}@acme.com", True) for n in names}
+
+    def clients():
+        return FakeScrapin(0.05, scrapin_hits), FakeBlitz(0.02, blitz_hits), FakeLeadMagic(0.02, leadmagic_hits)
+
+    report = asyncio.run(compare_waterfall_modes(
+        make("sequential", *clients()),
+        make("speculative", *clients()),
+        [contact(n) for n in names]
+    ))
+    seq, spec = report["sequential"], report["speculative"]
+    assert seq["contacts"] == spec["contacts"] == 10
+    assert spec["latency_p50_s"] < seq["latency_p50_s"]
+    assert spec["latency_p95_s"] < seq["latency_p95_s"]
+    # Sequential pays Blitz 3 + LeadMagic 5; speculative also pays Blitz for the 2 Scrapin hits
+    assert seq["credits_total"] == 8 and spec["credits_total"] == 10
+    assert report["credit_delta"] == 2
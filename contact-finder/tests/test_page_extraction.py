@@ -0,0 +1,95 @@
+"""
+Tests for single-pass page extraction (parity with the per-keyword reference on the saved SMB corpus)
+"""
+
+import asyncio
+import os
+import random
+import sys
+
+import pytest
+
+# Add parent directory (modules) and the repository root (evaluation corpus + reference) to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(1, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from evaluation.scripts.benchmark_page_extraction import compare_page, inflate, load_corpus, reference_owners
+from modules.discovery.page_extraction import find_owner_names, strip_markup
+from modules.discovery.website_extractor import WebsiteContactExtractor
+
+is_valid_name = WebsiteContactExtractor()._is_valid_name
+
+
+def test_corpus_parity():
+    pages = load_corpus()
+    assert len(pages) >= 8
+    extra = {}
+    for name, html in pages.items():
+        parity = compare_page(html, is_valid_name)
+        assert parity["schemas"] and parity["emails"] and parity["phones"] and parity["linkedin_slugs"], name
+        assert parity["missing_owners"] == [], name
+        if parity["extra_owners"]:
+            extra[name] = parity["extra_owners"]
+    # Names split from their title only by inline tags
+    assert extra == {
+        "greenleaf_landscaping_about.html": [("Hannah Price", "principal"), ("Miguel Santos", "founder")],
+    }
+
+
+def test_owner_scan_matches_findall_semantics_on_text():
+    # Without markup the anchored scan must give exactly what the per-keyword findall did
+    words = ["Owner", "owner:", "Founder,", "CEO", "Jane", "Doe", "Mary", "Ann", "Smith", "the", "and",
+             "General", "Manager", "President:", "Bob", "Lee", ",", ":", "principal", "Chief Executive"]
+    rng = random.Random(3)
+    for _ in range(300):
+        text = " ".join(rng.choice(words) for _ in range(rng.randint(5, 40)))
+        assert find_owner_names(text) == reference_owners(text), text
+
+
+# Owner matches that changed when the patterns moved from raw HTML to stripped text:
+# (html, reference on raw HTML, single-pass result)
+CHANGED_OWNER_CASES = [
+    # Title and name split only by inline tags: found now
+    ('<p><b>Owner</b>: Jane Doe</p>', [], [("Jane Doe", "owner")]),
+    ('<p>Owner: <strong>Jane Doe</strong></p>', [], [("Jane Doe", "owner")]),
+    ('<p>Jane Doe, <em>Owner</em></p>', [], [("Jane Doe", "owner")]),
+    ('<style>.owner{}</style><p>Founder: <a href="/x">Bob Lee</a></p>', [], [("Bob Lee", "founder")]),
+    # Commented-out markup is not page text: no longer found
+    ('<!-- Tom Hardy, CEO -->', [("Tom Hardy", "ceo")], []),
+    # Unchanged: alt text, plain text, and block tags still end a phrase
+    ('<img alt="Ann Lee, Founder" src="a.jpg">', [("Ann Lee", "founder")], [("Ann Lee", "founder")]),
+    ('<p>Owner Jane Doe</p>', [("Jane Doe", "owner")], [("Jane Doe", "owner")]),
+    ('<h3>Max Power</h3><p>President since 2001</p>', [], []),
+]
+
+
+@pytest.mark.parametrize("html, before, after", CHANGED_OWNER_CASES)
+def test_owner_matches_on_stripped_text(html, before, after):
+    assert reference_owners(html) == before
+    assert find_owner_names(strip_markup(html)) == after
+
+
+def test_markup_stripping():
+    text = strip_markup(
+        '<style>p{}</style><p><b>Owner</b>: Jane Doe</p><h3>Max Power</h3><p>President since 2001</p>'
+        '<img alt="Ann Lee, Founder" src="a.jpg"><!-- Tom Hardy, CEO -->&amp;'
+    )
+    assert "p{}" not in text and "Tom Hardy" not in text and "&" in text
+    assert find_owner_names(text) == [("Jane Doe", "owner"), ("Ann Lee", "founder")]
+
+
+def test_heavy_pages_parsed_in_worker_pool():
+    html = inflate(load_corpus()["harbor_law_leadership.html"], 5)
+
+    async def parse(extractor):
+        try:
+            return await extractor._parse_page(html)
+        finally:
+            used_pool = extractor._pool is not None
+            await extractor.close()
+            assert used_pool == (extractor.extraction_workers > 0)
+
+    inline = asyncio.run(parse(WebsiteContactExtractor(extraction_workers=0)))
+    pooled = asyncio.run(parse(WebsiteContactExtractor(heavy_page_bytes=1000, extraction_workers=1)))
+    assert pooled == inline
+    assert ("Eleanor Whitaker", "managing partner") in pooled.owners
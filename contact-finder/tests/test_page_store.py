@@ -0,0 +1,167 @@
+"""
+Tests for the shared PageStore (fetch memo, negative cache) and the fetchers that read through it
+"""
+
+import asyncio
+import os
+import socket
+import sys
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.discovery.linkedin_company import LinkedInCompanyDiscovery
+from modules.discovery.openweb_ninja import OpenWebNinjaClient
+from modules.discovery.page_store import PageStore, StoredPage, download, page_key
+
+
+def test_pages_and_failures_are_fetched_once(tmp_path):
+    hits = {"page": 0, "missing": 0, "slow": 0}
+
+    async def page(request):
+        hits["page"] += 1
+        return web.Response(text="<html>Owner: Jane Doe</html>", content_type="text/html")
+
+    async def missing(request):
+        hits["missing"] += 1
+        return web.Response(status=404)
+
+    async def slow(request):
+        hits["slow"] += 1
+        await asyncio.sleep(1)
+        return web.Response(text="late")
+
+    async def run(store: PageStore):
+        app = web.Application()
+        app.router.add_get("/", page)
+        app.router.add_get("/missing", missing)
+        app.router.add_get("/slow", slow)
+        server = TestServer(app)
+        await server.start_server()
+        try:
+            async with aiohttp.ClientSession() as session:
+                def fetch(url):
+                    return download(session, url, timeout=aiohttp.ClientTimeout(total=0.2))
+
+                root = str(server.make_url("/")).rstrip("/")
+                # Same page requested by two stages at once: one download
+                first, second = await asyncio.gather(store.fetch(root, fetch), store.fetch(root + "/#top", fetch))
+                third = await store.fetch(root + "/", fetch)
+                gone = [await store.fetch(root + "/missing", fetch) for _ in range(2)]
+                late = [await store.fetch(root + "/slow", fetch) for _ in range(2)]
+                return root, first, second, third, gone, late
+        finally:
+            await server.close()
+
+    store = PageStore(tmp_path / "pages.db")
+    root, first, second, third, gone, late = asyncio.run(run(store))
+    assert first.ok and second.html == first.html and third.cached
+    assert hits == {"page": 1, "missing": 1, "slow": 1}
+    assert [p.status for p in gone] == [404, 404] and gone[1].error == "http_4xx"
+    assert [p.error for p in late] == ["timeout", "timeout"]
+    store.close()
+
+    # Persists across runs; failures expire on their own TTL
+    reopened = PageStore(tmp_path / "pages.db", negative_ttls={"timeout": 0})
+    assert reopened.get(root).html == "<html>Owner: Jane Doe</html>"
+    assert reopened.get(root + "/missing").error == "http_4xx"
+    assert reopened.get(root + "/slow") is None
+    assert reopened.stats()["pages"] == 1
+
+
+def test_dead_domain_skipped_by_every_stage():
+    store = PageStore()
+    calls = []
+
+    async def unresolvable(url):
+        calls.append(url)
+        raise socket.gaierror(-2, "Name or service not known")
+
+    async def run():
+        first = await store.fetch("https://dead-plumbing.com/", unresolvable)
+        again = await store.fetch("https://www.dead-plumbing.com/contact", unresolvable)
+
+        linkedin = LinkedInCompanyDiscovery(page_store=store)
+        openweb = OpenWebNinjaClient("key", page_store=store)
+        try:
+            site = await linkedin._scrape_website_for_linkedin("dead-plumbing.com")
+            contacts = await openweb.scrape_contacts("https://www.dead-plumbing.com")
+        finally:
+            await linkedin.close()
+            await openweb.close()
+        return first, again, site, contacts
+
+    first, again, site, contacts = asyncio.run(run())
+    assert calls == ["https://dead-plumbing.com/"]
+    assert first.error == again.error == "dns" and again.cached
+    assert site == [] and "dns" in contacts.error
+    assert store.stats()["dead_hosts"] == 1
+
+
+def test_stages_share_stored_pages():
+    store = PageStore()
+    store.put(StoredPage(
+        url="https://acme.com",
+        status=200,
+        html='<a href="https://www.linkedin.com/company/acme-plumbing">LinkedIn</a>',
+    ))
+    for path in ("/about", "/contact"):
+        store.put(StoredPage(url=f"https://acme.com{path}", status=404))
+    assert page_key("HTTPS://Acme.com#about") == "https://acme.com/"
+
+    async def run():
+        linkedin = LinkedInCompanyDiscovery(page_store=store)
+        try:
+            return await linkedin._scrape_website_for_linkedin("acme.com")
+        finally:
+            await linkedin.close()
+
+    # All three pages come from the store: no network
+    candidates = asyncio.run(run())
+    assert [c["url"] for c in candidates] == ["linkedin.com/company/acme-plumbing"]
+    assert store.hits == 1 and store.negative_hits == 2 and store.misses == 0
+
+
+def test_openweb_resolves_domain_before_paying():
+    store = PageStore()
+
+    async def run():
+        openweb = OpenWebNinjaClient("key", page_store=store)
+        try:
+            # No page fetch has seen the domain yet; .invalid never resolves
+            return await openweb.scrape_contacts("https://www.no-such-plumber.invalid")
+        finally:
+            await openweb.close()
+
+    contacts = asyncio.run(run())
+    assert "dns" in contacts.error
+    assert store.host_failure("no-such-plumber.invalid") == "dns"
+
+
+def test_cancelled_fetch_is_retried_by_waiters_and_uncertain_failures_are_not_cached():
+    store = PageStore()
+    calls = []
+
+    async def fetcher(url):
+        calls.append(url)
+        if len(calls) == 1:
+            await asyncio.sleep(10)
+        return StoredPage(url=url, status=200, html="<html>ok</html>")
+
+    async def run():
+        owner = asyncio.create_task(store.fetch("https://acme.com/", fetcher))
+        await asyncio.sleep(0.05)
+        waiter = asyncio.create_task(store.fetch("https://acme.com/", fetcher))
+        await asyncio.sleep(0.05)
+        owner.cancel()
+        return await waiter
+
+    page = asyncio.run(run())
+    assert page.ok and len(calls) == 2
+
+    store.put(StoredPage(url="https://acme.com/team", status=403, cacheable=False))
+    assert store.get("https://acme.com/team") is None
@@ -0,0 +1,80 @@
+"""
+Tests for the PayloadStore that keeps raw provider responses out of contact records
+"""
+
+import logging
+import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.discovery.contact_search import ContactCandidate, ContactSource
+from modules.discovery.payload_store import PayloadStore, get_payload_store, set_payload_store, put_payload
+
+
+EMPLOYEES = {"employees": [{"name": "Jane Doe", "title": "Owner"}, {"name": "John Roe", "title": "CTO"}]}
+
+
+def test_payloads_are_stored_once_and_survive_reopen(tmp_path):
+    store = PayloadStore(tmp_path / "payloads.db")
+
+    ref = store.put(EMPLOYEES)
+    # Same content in another key order shares the row
+    same = store.put({"employees": [{"title": "Owner", "name": "Jane Doe"}, {"title": "CTO", "name": "John Roe"}]})
+    assert same == ref
+    assert store.put({}) is None and store.get(None) is None
+    assert store.stats()["payloads"] == 1 and store.stats()["duplicates"] == 1
+    store.close()
+
+    reopened = PayloadStore(tmp_path / "payloads.db")
+    assert reopened.get(ref) == EMPLOYEES
+    assert reopened.get("missing") is None
+
+
+def test_candidates_keep_a_reference():
+    previous = get_payload_store()
+    set_payload_store(PayloadStore())
+    try:
+        candidate = ContactCandidate(
+            name="Jane Doe", first_name="Jane", last_name="Doe", title="Owner",
+            email=None, phone=None, linkedin_url="linkedin.com/in/janedoe",
+            source=ContactSource.SCRAPIN, email_origin=None, confidence=70,
+            raw_ref=put_payload(EMPLOYEES["employees"][0]),
+        )
+        assert candidate.raw_data == {"name": "Jane Doe", "title": "Owner"}
+        assert not hasattr(candidate, "__dict__")  # Slotted record
+
+        bare = ContactCandidate(
+            name=None, first_name=None, last_name=None, title=None, email="info@acme.com",
+            phone=None, linkedin_url=None, source=ContactSource.SITE_SCRAPE, email_origin=None, confidence=80,
+        )
+        assert bare.raw_ref is None and bare.raw_data == {}
+    finally:
+        set_payload_store(previous)
+
+
+def test_small_payloads_stay_inline_and_the_default_store_is_bounded():
+    previous = get_payload_store()
+    set_payload_store(None)
+    try:
+        small = {"email": "info@acme.com", "source": "site_scrape"}
+        assert put_payload(small) is small
+        assert get_payload_store().puts == 0
+        assert get_payload_store().max_payloads is not None
+
+        ref = put_payload(EMPLOYEES)
+        assert isinstance(ref, str) and get_payload_store().get(ref) == EMPLOYEES
+    finally:
+        set_payload_store(previous)
+
+
+def test_eviction_is_counted_and_logged(caplog):
+    bounded = PayloadStore(max_payloads=2)
+    with caplog.at_level(logging.WARNING, logger="modules.discovery.payload_store"):
+        refs = [bounded.put({"employees": [{"name": f"Person {i}"}]}) for i in range(4)]
+    assert [bounded.get(ref) is not None for ref in refs] == [False, False, True, True]
+    assert bounded.stats()["payloads"] == 2
+    assert bounded.stats()["evicted"] == 2 and bounded.stats()["misses"] == 2
+    # Warned once, on the first eviction
+    assert len([r for r in caplog.records if "evicting" in r.getMessage()]) == 1
@@ -0,0 +1,113 @@
+"""
+Tests for the shared LinkedIn ProfileStore and the clients that read through it
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.enrichment.profile_store import ProfileStore
+from modules.enrichment.scrapin import ScrapinClient
+from modules.enrichment.waterfall import EnrichmentWaterfall
+
+
+PERSON = {
+    "success": True,
+    "person": {
+        "firstName": "Jane",
+        "lastName": "Doe",
+        "headline": "Owner at Doe Plumbing",
+        "linkedInUrl": "https://www.linkedin.com/in/jane-doe",
+        "location": {"city": "Denver", "state": "CO"},
+        "positions": {"positionHistory": [{"title": "Owner", "companyName": "Doe Plumbing"}]},
+    },
+}
+
+
+def test_url_variants_share_one_entry(tmp_path):
+    store = ProfileStore(tmp_path / "profiles.db")
+    store.put_response("https://www.linkedin.com/in/Jane-Doe/?trk=abc", "scrapin_person", {"ok": 1})
+
+    assert store.get_response("linkedin.com/in/jane-doe", "scrapin_person") == {"ok": 1}
+    assert store.get_response("http://uk.linkedin.com/in/jane-doe", "scrapin_person") == {"ok": 1}
+    assert store.get_response("linkedin.com/in/jane-doe", "leadmagic_profile") is None
+    store.close()
+
+    # Persists across processes
+    reopened = ProfileStore(tmp_path / "profiles.db")
+    assert reopened.get_response("linkedin.com/in/jane-doe", "scrapin_person") == {"ok": 1}
+
+
+def test_provider_ttl_expires_response():
+    store = ProfileStore(provider_ttls={"scrapin_person": 60})
+    store.put_response("linkedin.com/in/jane-doe", "scrapin_person", {"ok": 1})
+    assert store.get_response("linkedin.com/in/jane-doe", "scrapin_person") is not None
+    assert store.get_response("linkedin.com/in/jane-doe", "scrapin_person", max_age=-1) is None
+    assert store.stats()["hits"] == 1 and store.stats()["misses"] == 1
+
+
+def test_fields_merge_newest_wins_and_expire_per_field():
+    store = ProfileStore(field_ttls={"title": 3600})
+    url = "linkedin.com/in/jane-doe"
+    now = time.time()
+
+    store.merge_fields(url, {"name": "Jane Doe", "title": "Manager"}, source="rapidapi_person", fetched_at=now - 7200)
+    store.merge_fields(url, {"title": "Owner", "company": ""}, source="scrapin_person", fetched_at=now)
+    # An older value never overwrites a newer one
+    store.merge_fields(url, {"title": "Intern"}, source="leadmagic_profile", fetched_at=now - 100)
+
+    profile = store.profile(url)
+    assert profile["title"]["value"] == "Owner" and profile["title"]["source"] == "scrapin_person"
+    assert "company" not in profile
+
+    # Name (long TTL) stays fresh; a stale title is dropped unless asked for
+    store.merge_fields(url, {"title": "Owner"}, source="scrapin_person", fetched_at=now - 7200)
+    other = "linkedin.com/in/john-roe"
+    store.merge_fields(other, {"name": "John Roe", "title": "CEO"}, source="scrapin_person", fetched_at=now - 7200)
+    assert store.values(other) == {"name": "John Roe"}
+    assert store.profile(other, include_stale=True)["title"]["fresh"] is False
+
+
+def test_scrapin_skips_fetch_for_stored_profile():
+    store = ProfileStore()
+    calls = []
+
+    class CountingScrapin(ScrapinClient):
+        async def _request(self, method, endpoint, data=None, credits=1.0):
+            calls.append(endpoint)
+            return PERSON
+
+    async def run():
+        client = CountingScrapin("test", profile_store=store)
+        first = await client.get_person_profile("https://www.linkedin.com/in/jane-doe/")
+        second = await client.get_person_profile("linkedin.com/in/JANE-DOE?utm=x")
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert calls == ["/v1/enrichment/profile"]
+    assert first.full_name == second.full_name == "Jane Doe"
+    assert second.company == "Doe Plumbing"
+    assert store.values("linkedin.com/in/jane-doe")["title"] == first.title
+
+
+def test_waterfall_reuses_a_profile_from_another_provider():
+    store = ProfileStore()
+    store.put_response(
+        "https://www.linkedin.com/in/jane-doe/", "leadmagic_profile", {"full_name": "Jane Doe"},
+        fields={"name": "Jane Doe", "first_name": "Jane", "last_name": "Doe", "title": "Owner"},
+    )
+    calls = []
+
+    class CountingScrapin(ScrapinClient):
+        async def _request(self, method, endpoint, data=None, credits=1.0):
+            calls.append(endpoint)
+            return PERSON
+
+    waterfall = EnrichmentWaterfall(scrapin_client=CountingScrapin("test"), profile_store=store)
+    data = asyncio.run(waterfall._enrich_via_scrapin("linkedin.com/in/jane-doe"))
+    assert calls == []
+    assert data["source"] == "profile_store" and (data["name"], data["title"]) == ("Jane Doe", "Owner")
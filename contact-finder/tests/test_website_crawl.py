@@ -0,0 +1,72 @@
+"""
+Tests for the website extractor's link crawl (priority order, early stop)
+"""
+
+import asyncio
+import json
+import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.discovery.website_extractor import WebsiteContactExtractor
+
+
+def _page(body: str, schema: dict | None = None) -> str:
+    ld = f'<script type="application/ld+json">{json.dumps(schema)}</script>' if schema else ""
+    nav = ('<nav><a href="/">Home</a> <a href="/services">Services</a> <a href="/about-us/">About</a> '
+           '<a href="https://acme.com/contact-us#form">Contact</a> <a href="/brochure.pdf">About PDF</a> '
+           '<a href="https://other.com/contact">Partner</a> <a href="mailto:jo@acme.com">Email</a></nav>')
+    return f"<html><head>{ld}</head><body>{nav}{body}{' ' * 500}</body></html>"
+
+
+FOUNDER = {"@type": "LocalBusiness", "name": "Acme", "founder": {"name": "Jo Smith", "email": "jo@acme.com"}}
+
+
+class FakeSite:
+    def __init__(self, pages: dict[str, str]):
+        self.pages = pages
+        self.fetched: list[str] = []
+
+    async def fetch(self, url: str, use_zenrows: bool = True, result=None) -> str | None:
+        self.fetched.append(url)
+        if result is not None:
+            result.zenrows_requests += 1
+        return self.pages.get(url)
+
+
+def _extract(pages: dict[str, str], **kwargs):
+    site = FakeSite(pages)
+    extractor = WebsiteContactExtractor(zenrows_api_key="k", **kwargs)
+    extractor._fetch_url = site.fetch
+    result = asyncio.run(extractor.extract("acme.com"))
+    return result, site.fetched
+
+
+def test_stops_after_homepage_with_founder_email():
+    result, fetched = _extract({"https://acme.com/": _page("<p>Welcome</p>", FOUNDER)}, crawl_mode="links")
+    assert fetched == ["https://acme.com/"]
+    assert result.stopped_early and result.zenrows_requests == 1
+    assert result.contacts[0].name == "Jo Smith" and result.contacts[0].email == "jo@acme.com"
+
+    # Fixed mode still tries every configured path
+    result, fetched = _extract({"https://acme.com/": _page("<p>Welcome</p>", FOUNDER)})
+    assert len(fetched) == 5 and result.zenrows_requests == 5 and not result.stopped_early
+
+
+def test_follows_only_linked_contact_pages_in_priority_order():
+    pages = {
+        "https://acme.com/": _page("<p>Welcome</p>"),
+        "https://acme.com/contact-us": _page("<p>Call us</p>"),
+        "https://acme.com/about-us/": _page("<p>Owner: Jo Smith</p>"),
+    }
+    result, fetched = _extract(pages, crawl_mode="links", crawl_batch=1)
+    assert fetched == ["https://acme.com/", "https://acme.com/contact-us", "https://acme.com/about-us/"]
+    assert result.pages_scraped == 3 and not result.stopped_early
+    assert [(c.name, c.title) for c in result.contacts] == [("Jo Smith", "Owner")]
+
+    # Early stop between batches once the contact page has a schema.org owner with email
+    pages["https://acme.com/contact-us"] = _page("<p>Call us</p>", FOUNDER)
+    result, fetched = _extract(pages, crawl_mode="links", crawl_batch=1)
+    assert fetched == ["https://acme.com/", "https://acme.com/contact-us"] and result.stopped_early
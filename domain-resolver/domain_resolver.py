@@ -2,27 +2,39 @@
 """
 Domain Resolver - High-Confidence Company Domain Resolution
 Waterfall architecture: Places → Search+KG → Scrape+LLM
+Routed mode (routing.enabled): per-tier strategies from PathRouter
 """
+import argparse
 import asyncio
+import functools
 import os
 import pandas as pd
 import yaml
 import logging
 import json
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from collections import Counter
+from typing import Dict, Any, Optional, List, Tuple
 from tqdm.asyncio import tqdm
 from datetime import datetime
 
 # Import modules
-from modules.serper import SerperClient, resolve_company, resolve_deep_link
+from modules.serper import SerperClient, resolve_company, resolve_deep_link, resolve_via_places, resolve_via_search
 from modules.scraper import scrape_url
 from modules.openai_judge import OpenAIJudge, verify_with_openai
+from modules.openai_batch import OpenAIBatchJudge
 from modules.parking_detector import is_parked_domain, get_parking_confidence
 from modules.discolike import DiscolikeClient, resolve_via_discolike
 from modules.ocean import OceanClient, resolve_via_ocean
-from modules.utils import verify_dns, detect_government_site_type
+from modules.directory_scraper import DirectoryScraper
+from modules.input_normalizer import classify_tier
+from modules.path_router import PathRouter
+from modules.verification_policy import VerificationPolicy, PolicyDecision
+from modules.stage_pipeline import StagePipeline
+from modules.results_manifest import row_fingerprint, write_manifest, load_previous, plan_incremental
+from modules.utils import verify_dns, detect_government_site_type, start_call_count, calls_cost
 
 # Setup logging
 def setup_logging(config: Dict):
@@ -48,6 +60,9 @@ logger = logging.getLogger(__name__)
 class DomainResolver:
     """Main domain resolution orchestrator"""
 
+    # Confidence added per extra source agreeing on a domain (routed mode, consensus tiers)
+    CONSENSUS_BONUS = 5
+
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize resolver with configuration
@@ -99,11 +114,37 @@ class DomainResolver:
             )
             logger.info("✓ Ocean client initialized")
 
+        # Tier-routed execution (PathRouter) instead of the Serper-first waterfall
+        routing = config.get('routing', {})
+        self.router = PathRouter(config) if routing.get('enabled', False) else None
+        # Tier 1 shortcut when the policy is off: accept a Places phone match without the LLM
+        self.skip_llm_on_phone_match = routing.get('skip_llm_on_phone_match', True)
+        self.directory_scraper = DirectoryScraper(serper_key, self.zenrows_key)
+
+        # Routed strategies ('llm_search' has no implementation yet and is skipped)
+        self.strategies = {
+            'places_phone_verify': self._strategy_places_phone,
+            'places_name_match': self._strategy_places_name,
+            'serper_search': self._strategy_search,
+            'directory_scraper': self._strategy_directories,
+            'discolike': self._strategy_discolike,
+        }
+
+        # Skip scrape + LLM verification on strong deterministic evidence
+        self.policy = VerificationPolicy(config)
+
+        # Offline LLM mode (resolve_batch(offline_llm=True)): judgments queued for the Batch API
+        self._llm_batch: Optional[OpenAIBatchJudge] = None
+        self._pending_llm: Dict[str, tuple] = {}
+
         # Thresholds
         self.auto_accept_threshold = config['thresholds']['auto_accept']
         self.needs_scraping_threshold = config['thresholds']['needs_scraping']
         self.manual_review_threshold = config['thresholds']['manual_review']
 
+        # Stage queues of the last pipelined run (pipeline.enabled), for live stats
+        self.pipeline: Optional[StagePipeline] = None
+
         # Results storage
         self.results = []
         self.lookup_logs = []
@@ -111,6 +152,7 @@ class DomainResolver:
     async def resolve_single_company(self, company_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Resolve domain for a single company using waterfall logic
+        (or the PathRouter route for its data tier when routing is enabled)
 
         Args:
             company_data: Dict with name, city, phone, address, context
@@ -124,8 +166,30 @@ class DomainResolver:
         logger.info(f"{'='*60}")
 
         start_time = datetime.now()
-        result = {
-            'company_name': company_name,
+        result = self._new_result(company_data)
+        calls = start_call_count()
+
+        try:
+            found = await self._find_candidate(company_data, result)
+            if found and await self._verify_result(company_data, result, *found):
+                return result
+
+            await self._enrich_and_decide(company_data, result)
+
+        except Exception as e:
+            logger.error(f"Error resolving {company_name}: {e}", exc_info=True)
+            result['error'] = str(e)
+            result['needs_manual_review'] = True
+
+        finally:
+            self._close_row(company_data, result, calls, start_time)
+
+        return result
+
+    def _new_result(self, company_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Empty result row for a company"""
+        return {
+            'company_name': company_data.get('name', 'Unknown'),
             'input_city': company_data.get('city'),
             'input_phone': company_data.get('phone'),
             'domain': None,
@@ -135,107 +199,369 @@ class DomainResolver:
             'verified': False,
             'needs_manual_review': False,
             'stage_reached': None,
+            'data_tier': company_data.get('_data_tier') or classify_tier(company_data),
+            'resolution_path': 'waterfall',
+            'input_fingerprint': row_fingerprint(company_data),
             'error': None
         }
 
-        try:
-            # === STAGE 1 & 2: Serper (Places + Search) ===
-            serper_result = await resolve_company(
-                self.serper_client,
-                company_data,
-                self.config
-            )
+    def _close_row(self, company_data: Dict[str, Any], result: Dict[str, Any],
+                   calls: Counter, start_time: datetime):
+        """Record latency, API calls and cost on a finished row and log the lookup"""
+        duration = (datetime.now() - start_time).total_seconds()
+        result['latency_ms'] = int(duration * 1000)
+        result['resolved_at'] = datetime.now().isoformat(timespec='seconds')
+        result['api_calls'] = dict(calls)
+        result['cost_usd'] = calls_cost(calls)
+        self._log_lookup(company_data, result, duration)
+
+    async def _find_candidate(self, company_data: Dict[str, Any],
+                              result: Dict[str, Any]) -> Optional[Tuple[Dict[str, Any], str]]:
+        """
+        Stages 1 & 2: best candidate from the PathRouter route (routing enabled) or the Serper waterfall
 
-            if serper_result:
-                domain = serper_result['domain']
-                confidence = serper_result['confidence']
-                source = serper_result['source']
-                method = serper_result['method']
-
-                result.update({
-                    'domain': domain,
-                    'confidence': confidence,
-                    'source': source,
-                    'method': method,
-                    'stage_reached': 'serper'
-                })
-
-                logger.info(f"✓ Serper result: {domain} (confidence: {confidence}, source: {source})")
-
-                # ALWAYS trigger LLM verification (GPT-4o-mini for accuracy)
-                if self.config['stages'].get('use_scraping', True):
-                    logger.info(f"→ Triggering GPT-4o-mini verification (confidence: {confidence})")
-                    scrape_result = await self._verify_with_scraping(company_data, domain)
-
-                    if scrape_result:
-                        result.update(scrape_result)
-                        result['stage_reached'] = 'llm_verified'
-
-                        # DNS verification for high confidence results
-                        if result['confidence'] >= self.manual_review_threshold:
-                            verified = verify_dns(domain)
-                            result['verified'] = verified
-                            logger.info(f"✓ LLM Verified: {domain} (confidence: {result['confidence']}, DNS: {verified})")
-                            return result
-
-            # === STAGE 3: Optional B2B Enrichment (Discolike or Ocean) ===
-            # Try Discolike if enabled
-            if self.config['stages'].get('use_discolike', False) and self.discolike_client:
-                if not result['domain'] or result['confidence'] < self.manual_review_threshold:
-                    logger.info("→ Trying Discolike verification")
-                    discolike_result = await resolve_via_discolike(
-                        self.discolike_client,
-                        company_data,
-                        self.config
-                    )
-
-                    if discolike_result and discolike_result.get('domain'):
-                        # Use Discolike result if better than current
-                        if not result['domain'] or discolike_result['confidence'] > result['confidence']:
-                            result.update(discolike_result)
-                            result['stage_reached'] = 'discolike'
-                            logger.info(f"✓ Discolike result: {result['domain']} (confidence: {result['confidence']})")
-
-            # Try Ocean if enabled and still need better result
-            if self.config['stages'].get('use_ocean', False) and self.ocean_client:
-                if not result['domain'] or result['confidence'] < self.manual_review_threshold:
-                    logger.info("→ Trying Ocean.io verification")
-                    ocean_result = await resolve_via_ocean(
-                        self.ocean_client,
-                        company_data,
-                        self.config
-                    )
-
-                    if ocean_result and ocean_result.get('domain'):
-                        # Use Ocean result if better than current
-                        if not result['domain'] or ocean_result['confidence'] > result['confidence']:
-                            result.update(ocean_result)
-                            result['stage_reached'] = 'ocean'
-                            logger.info(f"✓ Ocean result: {result['domain']} (confidence: {result['confidence']})")
-
-            # Final decision
-            if result['domain']:
-                if result['confidence'] < self.manual_review_threshold:
-                    result['needs_manual_review'] = True
-                    logger.warning(f"⚠ MANUAL REVIEW NEEDED: {result['domain']} (confidence: {result['confidence']})")
-                else:
-                    logger.info(f"✓ RESOLVED: {result['domain']} (confidence: {result['confidence']})")
-            else:
+        Args:
+            company_data: Company information
+            result: Result dict, updated in place with the candidate
+
+        Returns:
+            (candidate, validation) to verify, or None if nothing was found
+        """
+        if self.router is not None:
+            return await self._resolve_routed(company_data, result)
+        return await self._resolve_serper_first(company_data, result)
+
+    async def _enrich_and_decide(self, company_data: Dict[str, Any], result: Dict[str, Any]):
+        """
+        Stage 3 (Discolike / Ocean) for unresolved or low-confidence rows, then the final decision
+
+        Args:
+            company_data: Company information
+            result: Result dict, updated in place
+        """
+        # === STAGE 3: Optional B2B Enrichment (Discolike or Ocean) ===
+        # Try Discolike if enabled
+        if (self.config['stages'].get('use_discolike', False) and self.discolike_client
+                and 'discolike' not in result.get('strategies_tried', [])):
+            if not result['domain'] or result['confidence'] < self.manual_review_threshold:
+                logger.info("→ Trying Discolike verification")
+                discolike_result = await resolve_via_discolike(
+                    self.discolike_client,
+                    company_data,
+                    self.config
+                )
+
+                if discolike_result and discolike_result.get('domain'):
+                    # Use Discolike result if better than current
+                    if not result['domain'] or discolike_result['confidence'] > result['confidence']:
+                        result.update(discolike_result)
+                        result['stage_reached'] = 'discolike'
+                        logger.info(f"✓ Discolike result: {result['domain']} (confidence: {result['confidence']})")
+
+        # Try Ocean if enabled and still need better result
+        if self.config['stages'].get('use_ocean', False) and self.ocean_client:
+            if not result['domain'] or result['confidence'] < self.manual_review_threshold:
+                logger.info("→ Trying Ocean.io verification")
+                ocean_result = await resolve_via_ocean(
+                    self.ocean_client,
+                    company_data,
+                    self.config
+                )
+
+                if ocean_result and ocean_result.get('domain'):
+                    # Use Ocean result if better than current
+                    if not result['domain'] or ocean_result['confidence'] > result['confidence']:
+                        result.update(ocean_result)
+                        result['stage_reached'] = 'ocean'
+                        logger.info(f"✓ Ocean result: {result['domain']} (confidence: {result['confidence']})")
+
+        # Final decision
+        if result['domain']:
+            if result['confidence'] < self.manual_review_threshold:
                 result['needs_manual_review'] = True
-                result['error'] = 'No domain found'
-                logger.warning(f"✗ NOT FOUND: {company_name}")
+                logger.warning(f"⚠ MANUAL REVIEW NEEDED: {result['domain']} (confidence: {result['confidence']})")
+            else:
+                logger.info(f"✓ RESOLVED: {result['domain']} (confidence: {result['confidence']})")
+        else:
+            result['needs_manual_review'] = True
+            result['error'] = 'No domain found'
+            logger.warning(f"✗ NOT FOUND: {result['company_name']}")
 
+    async def _resolve_serper_first(self, company_data: Dict[str, Any],
+                                    result: Dict[str, Any]) -> Optional[Tuple[Dict[str, Any], str]]:
+        """
+        Stages 1 & 2 of the waterfall: Serper (Places + Search)
+
+        Args:
+            company_data: Company information
+            result: Result dict, updated in place
+
+        Returns:
+            (candidate, validation) to verify, or None if Serper found nothing
+        """
+        serper_result = await resolve_company(
+            self.serper_client,
+            company_data,
+            self.config
+        )
+
+        if not serper_result:
+            return None
+
+        domain = serper_result['domain']
+        confidence = serper_result['confidence']
+        source = serper_result['source']
+        method = serper_result['method']
+
+        result.update({
+            'domain': domain,
+            'confidence': confidence,
+            'source': source,
+            'method': method,
+            'stage_reached': 'serper'
+        })
+
+        logger.info(f"✓ Serper result: {domain} (confidence: {confidence}, source: {source})")
+
+        return serper_result, 'always'
+
+    async def _resolve_routed(self, company_data: Dict[str, Any],
+                              result: Dict[str, Any]) -> Optional[Tuple[Dict[str, Any], str]]:
+        """
+        Tier-routed resolution: run the PathRouter strategies for the row's data tier
+
+        Tier 1 tries its strategies in order (each is a fallback); Tiers 2-4
+        run theirs in parallel and take the best-supported candidate. The
+        candidate then goes through _verify_result(), where a Places phone
+        match with a matching name can skip the LLM.
+
+        Args:
+            company_data: Company information
+            result: Result dict (with data_tier), updated in place
+
+        Returns:
+            (candidate, route validation) to verify, or None if no strategy found one
+        """
+        route = self.router.route({**company_data, '_data_tier': result['data_tier']})
+        strategies = [
+            name for name in route['strategies']
+            if name in self.strategies and self.router.should_use_strategy(name, company_data)
+        ]
+        result['resolution_path'] = route['path'].value
+        logger.info(f"→ Route: {self.router.get_strategy_description(route['path'])} "
+                    f"({', '.join(strategies)}{', parallel' if route['parallel'] else ''})")
+
+        state = {}
+        if route['parallel']:
+            outcomes = await asyncio.gather(
+                *(self._run_strategy(name, company_data, state) for name in strategies)
+            )
+        else:
+            # Each strategy is a fallback for the previous one
+            outcomes = []
+            for name in strategies:
+                outcomes.append(await self._run_strategy(name, company_data, state))
+                if outcomes[-1]:
+                    break
+        result['strategies_tried'] = strategies[:len(outcomes)]
+
+        best = self._pick_candidate(
+            [candidate for found in outcomes for candidate in found],
+            consensus=route.get('consensus_required', False)
+        )
+        if not best:
+            return None
+
+        result.update({
+            'domain': best['domain'],
+            'confidence': best['confidence'],
+            'source': best['source'],
+            'method': best['method'],
+            'sources': best['sources'],
+            'stage_reached': 'routed'
+        })
+        logger.info(f"✓ Routed result: {best['domain']} (confidence: {best['confidence']}, "
+                    f"sources: {', '.join(best['sources'])})")
+
+        return best, route.get('validation', 'always')
+
+    async def _verify_result(self, company_data: Dict[str, Any], result: Dict[str, Any],
+                             candidate: Dict[str, Any], validation: str = 'always') -> bool:
+        """
+        Verify result['domain']: deterministic policy, else deep scrape + LLM
+
+        Args:
+            company_data: Company information
+            result: Result dict, updated in place
+            candidate: Raw candidate (with Places details) the result came from
+            validation: 'always' (policy may accept), 'unless_phone_verified' (policy,
+                        or a Places phone match when the policy is off) or
+                        'mandatory' (LLM only)
+
+        Returns:
+            True if the verified result is final (confidence >= manual review threshold)
+        """
+        decision = await self._check_policy(company_data, result, candidate, validation)
+        if decision is not None and decision.skip_llm:
+            return result['confidence'] >= self.manual_review_threshold
+
+        if not self.config['stages'].get('use_scraping', True):
+            return False
+
+        logger.info(f"→ Triggering GPT-4o-mini verification (confidence: {result['confidence']})")
+        scrape_result = await self._verify_with_scraping(company_data, result['domain'])
+
+        if scrape_result and 'llm_pending' in scrape_result:
+            self._defer_judgment(company_data, result, decision, scrape_result)
+            return True
+
+        return await self._finish_verification(result, decision, scrape_result)
+
+    async def _check_policy(self, company_data: Dict[str, Any], result: Dict[str, Any],
+                            candidate: Dict[str, Any], validation: str) -> Optional[PolicyDecision]:
+        """
+        Consult the skip-LLM policy; on a skip, accept the candidate in result
+
+        Returns:
+            The policy decision, or None when validation is 'mandatory'
+        """
+        if validation == 'mandatory':
+            return None
+
+        decision = await self.policy.decide(company_data, candidate)
+        if (decision.reason == 'disabled' and validation == 'unless_phone_verified'
+                and self.skip_llm_on_phone_match and candidate.get('method') == 'phone_verified'
+                and result['confidence'] >= self.manual_review_threshold):
+            # Routing's own Tier 1 shortcut, kept for runs without the policy
+            dns = await asyncio.to_thread(verify_dns, result['domain'])
+            result.update({'llm_policy': 'phone_verified', 'verified': dns, 'stage_reached': 'phone_verified'})
+            logger.info(f"✓ Phone verified: {result['domain']} (skipping LLM verification, DNS: {dns})")
+            return PolicyDecision(skip_llm=True, reason='phone_verified', evidence={'phone_match': True, 'dns': dns})
+        result['llm_policy'] = decision.reason
+        if decision.skip_llm:
+            result.update({
+                'confidence': max(result['confidence'], self.policy.accept_confidence),
+                'verified': decision.evidence.get('dns', False),
+                'stage_reached': 'policy_accepted'
+            })
+            logger.info(f"✓ Deterministic match: {result['domain']} (name score: {decision.evidence['name_score']}, "
+                        f"skipping LLM verification)")
+        return decision
+
+    def _defer_judgment(self, company_data: Dict[str, Any], result: Dict[str, Any],
+                        decision: Optional[PolicyDecision], pending: Dict[str, Any]):
+        """Offline mode: park a row until resolve_batch() merges its Batch API judgment"""
+        self._pending_llm[pending['llm_pending']] = (company_data, result, decision, pending['scrape_method'])
+        result['stage_reached'] = 'llm_pending'
+
+    async def _finish_verification(self, result: Dict[str, Any], decision: Optional[PolicyDecision],
+                             scrape_result: Optional[Dict[str, Any]]) -> bool:
+        """
+        Apply a scrape + LLM outcome to result (drift sample bookkeeping, DNS check)
+
+        Args:
+            result: Result dict with the verified candidate's domain, updated in place
+            decision: Policy decision for the candidate (None if the policy was not consulted)
+            scrape_result: _verify_with_scraping() outcome (None if scraping/LLM failed)
+
+        Returns:
+            True if the verified result is final (confidence >= manual review threshold)
+        """
+        domain = result['domain']
+        if not scrape_result:
+            return False
+
+        if decision is not None and decision.sampled:
+            agreed = scrape_result.get('domain') == domain and scrape_result.get('method') == 'deep_scrape_verified'
+            result['policy_agreed'] = agreed
+            self.policy.record_sample(agreed)
+
+        result.update(scrape_result)
+        result['stage_reached'] = 'llm_verified'
+
+        # DNS verification for high confidence results
+        if result['confidence'] >= self.manual_review_threshold:
+            verified = await asyncio.to_thread(verify_dns, domain)
+            result['verified'] = verified
+            logger.info(f"✓ LLM Verified: {domain} (confidence: {result['confidence']}, DNS: {verified})")
+            return True
+
+        return False
+
+    async def _run_strategy(self, name: str, company_data: Dict[str, Any],
+                            state: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Run one routed strategy; candidates found, [] on failure"""
+        try:
+            return await self.strategies[name](company_data, state)
         except Exception as e:
-            logger.error(f"Error resolving {company_name}: {e}", exc_info=True)
-            result['error'] = str(e)
-            result['needs_manual_review'] = True
+            logger.error(f"Strategy {name} failed for {company_data.get('name')}: {e}")
+            return []
+
+    async def _places(self, company_data: Dict[str, Any], state: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Places lookup, made once per company and shared by both Places strategies"""
+        if 'places' not in state:
+            state['places'] = await resolve_via_places(self.serper_client, company_data, self.config)
+        return state['places']
+
+    async def _strategy_places_phone(self, company_data: Dict[str, Any],
+                                     state: Dict[str, Any]) -> List[Dict[str, Any]]:
+        place = await self._places(company_data, state)
+        return [place] if place and place['method'] == 'phone_verified' else []
+
+    async def _strategy_places_name(self, company_data: Dict[str, Any],
+                                    state: Dict[str, Any]) -> List[Dict[str, Any]]:
+        place = await self._places(company_data, state)
+        return [place] if place else []
+
+    async def _strategy_search(self, company_data: Dict[str, Any],
+                               state: Dict[str, Any]) -> List[Dict[str, Any]]:
+        found = await resolve_via_search(self.serper_client, company_data, self.config)
+        return [found] if found else []
+
+    async def _strategy_directories(self, company_data: Dict[str, Any],
+                                    state: Dict[str, Any]) -> List[Dict[str, Any]]:
+        context = company_data.get('context')
+        found = await self.directory_scraper.search_directories(
+            str(company_data.get('name')),
+            context if isinstance(context, str) and context.strip() else None
+        )
+        return [{**listing, 'method': 'directory_listing'} for listing in found]
 
-        finally:
-            # Log lookup details
-            duration = (datetime.now() - start_time).total_seconds()
-            self._log_lookup(company_data, result, duration)
+    async def _strategy_discolike(self, company_data: Dict[str, Any],
+                                  state: Dict[str, Any]) -> List[Dict[str, Any]]:
+        if not self.discolike_client:
+            return []
+        found = await resolve_via_discolike(self.discolike_client, company_data, self.config)
+        return [found] if found and found.get('domain') else []
 
-        return result
+    def _pick_candidate(self, candidates: List[Dict[str, Any]],
+                        consensus: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Best candidate across strategies
+
+        Candidates are grouped by domain. With consensus, every extra source
+        naming the same domain adds CONSENSUS_BONUS confidence (capped at 99),
+        so agreement can outrank a single higher-scored hit.
+
+        Returns:
+            Top candidate of the winning domain, with 'confidence' and 'sources' set
+        """
+        by_domain: Dict[str, List[Dict[str, Any]]] = {}
+        for candidate in candidates:
+            if candidate.get('domain'):
+                by_domain.setdefault(candidate['domain'].lower(), []).append(candidate)
+
+        best = None
+        for group in by_domain.values():
+            top = max(group, key=lambda c: c.get('confidence', 0))
+            sources = sorted({c['source'] for c in group})
+            confidence = top.get('confidence', 0)
+            if consensus and len(sources) > 1:
+                confidence = min(99, confidence + self.CONSENSUS_BONUS * (len(sources) - 1))
+            if best is None or confidence > best['confidence']:
+                best = {**top, 'confidence': confidence, 'sources': sources}
+
+        return best
 
     async def _verify_with_scraping(self, company_data: Dict[str, Any],
                                    domain: str) -> Optional[Dict[str, Any]]:
@@ -249,6 +575,28 @@ class DomainResolver:
         Returns:
             Updated result dict or None if failed
         """
+        page = await self._scrape_page(company_data, domain)
+        if not page or 'text' not in page:
+            return page
+
+        if self._llm_batch is not None:
+            return self._queue_judgment(company_data, page)
+
+        return await self._judge_page(company_data, domain, page)
+
+    async def _scrape_page(self, company_data: Dict[str, Any],
+                           domain: str) -> Optional[Dict[str, Any]]:
+        """
+        Scrape a candidate's homepage for LLM verification
+
+        Args:
+            company_data: Company information
+            domain: Domain to verify
+
+        Returns:
+            Page dict (url, text, scrape_method), a rejection result dict
+            (federal oversight or parked domain), or None if scraping failed
+        """
         url = f"https://{domain}"
 
         # Pre-check: detect government site type before scraping
@@ -295,78 +643,118 @@ class DomainResolver:
                     'error': f'Parked domain: {parking_reason}'
                 }
 
-            # LLM verification with OpenAI GPT-4o-mini (full content)
-            logger.info(f"Verifying with GPT-4o-mini (full content: {len(webpage_text)} chars)...")
+            return {'url': url, 'text': webpage_text, 'scrape_method': scrape_method}
+
+        except Exception as e:
+            logger.error(f"Scraping error for {domain}: {e}")
+            return None
+
+    def _queue_judgment(self, company_data: Dict[str, Any], page: Dict[str, Any]) -> Dict[str, Any]:
+        """Offline mode: queue a scraped page for the Batch API, merged in resolve_batch()"""
+        custom_id = self._llm_batch.add(company_data, page['url'], page['text'])
+        return {'llm_pending': custom_id, 'scrape_method': page['scrape_method']}
+
+    async def _judge_page(self, company_data: Dict[str, Any], domain: str,
+                          page: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        LLM verification of a scraped page with OpenAI GPT-4o-mini (full content)
+
+        Args:
+            company_data: Company information
+            domain: Domain the page belongs to
+            page: _scrape_page() output (url, text, scrape_method)
+
+        Returns:
+            Updated result dict or None if failed
+        """
+        try:
+            logger.info(f"Verifying with GPT-4o-mini (full content: {len(page['text'])} chars)...")
             llm_result = await verify_with_openai(
                 company_data,
-                url,
-                webpage_text,  # Pass full content - GPT-4o-mini has 128K context
+                page['url'],
+                page['text'],  # Pass full content - GPT-4o-mini has 128K context
                 self.config
             )
 
-            logger.info(f"LLM judgment: match={llm_result['match']}, confidence={llm_result['confidence']}")
-            logger.info(f"Evidence: {llm_result['evidence']}")
+            return await self._apply_judgment(company_data, domain, llm_result, page['scrape_method'])
+
+        except Exception as e:
+            logger.error(f"LLM error for {domain}: {e}")
+            return None
+
+    async def _apply_judgment(self, company_data: Dict[str, Any], domain: str,
+                              llm_result: Dict[str, Any], scrape_method: str) -> Optional[Dict[str, Any]]:
+        """
+        Turn an LLM judgment of a scraped domain into a verification result
+
+        Args:
+            company_data: Company information
+            domain: Domain that was scraped and judged
+            llm_result: OpenAIJudge judgment (synchronous call or Batch API)
+            scrape_method: How the page was scraped
 
-            # Check if LLM detected government oversight site
-            if llm_result.get('is_government_oversight_site'):
-                logger.warning(f"⚠ LLM detected government oversight site: {domain}")
+        Returns:
+            Updated result dict (same shape as _verify_with_scraping)
+        """
+        logger.info(f"LLM judgment: match={llm_result['match']}, confidence={llm_result['confidence']}")
+        logger.info(f"Evidence: {llm_result['evidence']}")
+
+        # Check if LLM detected government oversight site
+        if llm_result.get('is_government_oversight_site'):
+            logger.warning(f"⚠ LLM detected government oversight site: {domain}")
+            return {
+                'domain': None,
+                'confidence': 0,
+                'source': 'llm_verified',
+                'method': 'government_oversight_rejected',
+                'error': f'Government oversight/registry site - not facility website',
+                'llm_evidence': llm_result['evidence'],
+                'is_government_oversight_site': True
+            }
+
+        # Check if LLM flagged this as needing deep link discovery
+        if llm_result.get('needs_deep_link') and llm_result.get('is_government_portal'):
+            logger.info(f"→ Government portal detected, attempting deep link discovery for {domain}")
+            deep_link_result = await self._discover_deep_link(
+                company_data,
+                domain,
+                llm_result.get('suggested_deep_link_search')
+            )
+            if deep_link_result:
+                logger.info(f"✓ Deep link found: {deep_link_result['domain']}")
+                return deep_link_result
+            else:
+                logger.warning(f"⚠ No deep link found on portal {domain}")
                 return {
                     'domain': None,
                     'confidence': 0,
                     'source': 'llm_verified',
-                    'method': 'government_oversight_rejected',
-                    'error': f'Government oversight/registry site - not facility website',
+                    'method': 'government_portal_no_deep_link',
+                    'error': f'Government portal without specific facility page',
                     'llm_evidence': llm_result['evidence'],
-                    'is_government_oversight_site': True
+                    'is_government_portal': True
                 }
 
-            # Check if LLM flagged this as needing deep link discovery
-            if llm_result.get('needs_deep_link') and llm_result.get('is_government_portal'):
-                logger.info(f"→ Government portal detected, attempting deep link discovery for {domain}")
-                deep_link_result = await self._discover_deep_link(
-                    company_data,
-                    domain,
-                    llm_result.get('suggested_deep_link_search')
-                )
-                if deep_link_result:
-                    logger.info(f"✓ Deep link found: {deep_link_result['domain']}")
-                    return deep_link_result
-                else:
-                    logger.warning(f"⚠ No deep link found on portal {domain}")
-                    return {
-                        'domain': None,
-                        'confidence': 0,
-                        'source': 'llm_verified',
-                        'method': 'government_portal_no_deep_link',
-                        'error': f'Government portal without specific facility page',
-                        'llm_evidence': llm_result['evidence'],
-                        'is_government_portal': True
-                    }
-
-            if llm_result['match'] and llm_result['confidence'] >= 70:
-                # LLM confirmed match
-                return {
-                    'domain': domain,
-                    'confidence': llm_result['confidence'],
-                    'source': 'llm_verified',
-                    'method': 'deep_scrape_verified',
-                    'verified': True,
-                    'llm_evidence': llm_result['evidence'],
-                    'scrape_method': scrape_method
-                }
-            else:
-                # LLM rejected or low confidence
-                return {
-                    'domain': None if not llm_result['match'] else domain,
-                    'confidence': llm_result['confidence'],
-                    'source': 'llm_verified',
-                    'method': 'llm_rejected' if not llm_result['match'] else 'llm_low_confidence',
-                    'llm_evidence': llm_result['evidence']
-                }
-
-        except Exception as e:
-            logger.error(f"Scraping/LLM error for {domain}: {e}")
-            return None
+        if llm_result['match'] and llm_result['confidence'] >= 70:
+            # LLM confirmed match
+            return {
+                'domain': domain,
+                'confidence': llm_result['confidence'],
+                'source': 'llm_verified',
+                'method': 'deep_scrape_verified',
+                'verified': True,
+                'llm_evidence': llm_result['evidence'],
+                'scrape_method': scrape_method
+            }
+        else:
+            # LLM rejected or low confidence
+            return {
+                'domain': None if not llm_result['match'] else domain,
+                'confidence': llm_result['confidence'],
+                'source': 'llm_verified',
+                'method': 'llm_rejected' if not llm_result['match'] else 'llm_low_confidence',
+                'llm_evidence': llm_result['evidence']
+            }
 
     async def _discover_deep_link(self, company_data: Dict[str, Any],
                                   portal_domain: str,
@@ -408,13 +796,23 @@ class DomainResolver:
             self.lookup_logs.append(log_entry)
 
     async def resolve_batch(self, companies: List[Dict[str, Any]],
-                           max_workers: int = 10) -> pd.DataFrame:
+                           max_workers: int = 10, offline_llm: bool = False) -> pd.DataFrame:
         """
         Resolve domains for a batch of companies with progress bar
 
+        By default each row holds one of max_workers slots from search to
+        final decision. With pipeline.enabled, rows flow through per-stage
+        worker pools instead (see _resolve_pipelined).
+
+        With offline_llm, LLM verifications are not called per row: scraped
+        pages are queued into OpenAI Batch API request files, submitted once
+        every row has been resolved up to verification, and the judgments are
+        merged back (Stage 3 and the final decision run after the merge).
+
         Args:
             companies: List of company data dicts
             max_workers: Maximum concurrent workers
+            offline_llm: Verify through the Batch API instead of synchronous calls
 
         Returns:
             DataFrame with results
@@ -422,8 +820,14 @@ class DomainResolver:
         logger.info(f"\n{'='*60}")
         logger.info(f"Starting batch resolution: {len(companies)} companies")
         logger.info(f"Max workers: {max_workers}")
+        if offline_llm:
+            logger.info("LLM verification: offline (OpenAI Batch API)")
         logger.info(f"{'='*60}\n")
 
+        if offline_llm:
+            self._llm_batch = self._create_batch_judge()
+            self._pending_llm = {}
+
         # Create semaphore for concurrency control
         semaphore = asyncio.Semaphore(max_workers)
 
@@ -431,14 +835,25 @@ class DomainResolver:
             async with semaphore:
                 return await self.resolve_single_company(company)
 
-        # Run with progress bar
-        tasks = [resolve_with_semaphore(company) for company in companies]
         results = []
 
-        for coro in tqdm.as_completed(tasks, total=len(tasks), desc="Resolving domains"):
-            result = await coro
-            results.append(result)
-            self.results.append(result)
+        try:
+            if self.config.get('pipeline', {}).get('enabled', False):
+                results = await self._resolve_pipelined(companies, max_workers)
+            else:
+                # Run with progress bar
+                tasks = [resolve_with_semaphore(company) for company in companies]
+                for coro in tqdm.as_completed(tasks, total=len(tasks), desc="Resolving domains"):
+                    result = await coro
+                    results.append(result)
+                    self.results.append(result)
+
+            if offline_llm:
+                await self._merge_batch_judgments(semaphore)
+        finally:
+            if self._llm_batch is not None:
+                await self._llm_batch.close()
+                self._llm_batch = None
 
         # Convert to DataFrame
         df = pd.DataFrame(results)
@@ -448,6 +863,166 @@ class DomainResolver:
 
         return df
 
+    async def _resolve_pipelined(self, companies: List[Dict[str, Any]],
+                                 max_workers: int) -> List[Dict[str, Any]]:
+        """
+        Resolve companies through stage queues, each with its own worker pool
+
+        search (Places/Search or routed strategies + skip-LLM policy) → scrape
+        → judge (LLM) → enrich (Discolike/Ocean + final decision). A row
+        leaves as soon as it is final, so a policy-accepted row never waits
+        behind a slow scrape, and a full stage queue blocks the stage feeding
+        it. Worker counts come from pipeline.workers; a stage left out gets
+        an even share of max_workers, so with no pipeline.workers the total
+        concurrency matches the semaphore path.
+
+        Args:
+            companies: List of company data dicts
+            max_workers: Total workers shared by stages without a configured count
+
+        Returns:
+            Result dicts in the order rows finished
+        """
+        settings = self.config.get('pipeline', {})
+        workers = settings.get('workers', {})
+        pipeline = StagePipeline(queue_size=settings.get('queue_size', 2 * max_workers))
+        stages = (('search', self._stage_search), ('scrape', self._stage_scrape),
+                  ('judge', self._stage_judge), ('enrich', self._stage_enrich))
+        default_workers = max(1, max_workers // len(stages))
+        for name, handler in stages:
+            pipeline.add_stage(name, functools.partial(self._run_stage, handler),
+                               workers.get(name, default_workers))
+        self.pipeline = pipeline
+        logger.info("Pipeline workers: " + ', '.join(f"{name} {stage.workers}"
+                                                     for name, stage in pipeline.stages.items()))
+
+        jobs = [
+            {'company': company, 'result': self._new_result(company), 'calls': Counter(),
+             'start_time': datetime.now()}
+            for company in companies
+        ]
+        with tqdm(total=len(jobs), desc="Resolving domains") as progress:
+            def on_finished(job):
+                self._close_row(job['company'], job['result'], job['calls'], job['start_time'])
+                self.results.append(job['result'])
+                progress.set_postfix_str(pipeline.describe(), refresh=False)
+                progress.update(1)
+
+            reporter = asyncio.create_task(pipeline.report(settings.get('report_interval', 30)))
+            try:
+                finished = await pipeline.run(jobs, on_finished)
+            finally:
+                reporter.cancel()
+
+        for name, stats in pipeline.stats().items():
+            logger.info(f"Stage {name}: {stats['done']} rows, {stats['per_sec']}/s, "
+                        f"{stats['utilization']:.0%} of {stats['workers']} workers busy")
+        return [job['result'] for job in finished]
+
+    async def _run_stage(self, handler, job: Dict[str, Any]) -> Optional[str]:
+        """Run a pipeline stage for one row, counting its API calls; errors finish the row"""
+        start_call_count(job['calls'])
+        try:
+            return await handler(job)
+        except Exception as e:
+            logger.error(f"Error resolving {job['result']['company_name']}: {e}", exc_info=True)
+            job['result']['error'] = str(e)
+            job['result']['needs_manual_review'] = True
+            return None
+
+    async def _stage_search(self, job: Dict[str, Any]) -> Optional[str]:
+        """Pipeline stage: find a candidate, then let the policy accept it or send it to scraping"""
+        company_data, result = job['company'], job['result']
+        job['start_time'] = datetime.now()
+        logger.info(f"Resolving: {result['company_name']}")
+
+        found = await self._find_candidate(company_data, result)
+        if not found:
+            return 'enrich'
+
+        job['decision'] = await self._check_policy(company_data, result, *found)
+        if job['decision'] is not None and job['decision'].skip_llm:
+            return None if result['confidence'] >= self.manual_review_threshold else 'enrich'
+        if not self.config['stages'].get('use_scraping', True):
+            return 'enrich'
+        return 'scrape'
+
+    async def _stage_scrape(self, job: Dict[str, Any]) -> Optional[str]:
+        """Pipeline stage: scrape the candidate (pre-filter and parking rejections skip the LLM)"""
+        logger.info(f"→ Triggering GPT-4o-mini verification (confidence: {job['result']['confidence']})")
+        page = await self._scrape_page(job['company'], job['result']['domain'])
+        if page and 'text' in page:
+            job['page'] = page
+            return 'judge'
+        return await self._after_verification(job, page)
+
+    async def _stage_judge(self, job: Dict[str, Any]) -> Optional[str]:
+        """Pipeline stage: LLM judgment of the scraped page (queued for the Batch API in offline mode)"""
+        company_data, result = job['company'], job['result']
+        page = job.pop('page')
+        if self._llm_batch is not None:
+            self._defer_judgment(company_data, result, job['decision'], self._queue_judgment(company_data, page))
+            return None
+        return await self._after_verification(job, await self._judge_page(company_data, result['domain'], page))
+
+    async def _after_verification(self, job: Dict[str, Any], scrape_result: Optional[Dict[str, Any]]) -> Optional[str]:
+        """Finish a row on a final verified result, else send it to enrichment"""
+        return None if await self._finish_verification(job['result'], job['decision'], scrape_result) else 'enrich'
+
+    async def _stage_enrich(self, job: Dict[str, Any]) -> Optional[str]:
+        """Pipeline stage: Discolike/Ocean for unresolved or low-confidence rows, then the final decision"""
+        await self._enrich_and_decide(job['company'], job['result'])
+        return None
+
+    def _create_batch_judge(self) -> OpenAIBatchJudge:
+        """OpenAIBatchJudge from the llm / llm.batch config"""
+        llm_config = self.config.get('llm', {})
+        batch_config = llm_config.get('batch', {})
+        return OpenAIBatchJudge(
+            api_key=llm_config.get('openai_api_key', ''),
+            model=llm_config.get('model', 'gpt-4o-mini'),
+            batch_dir=batch_config.get('dir', 'output/llm_batches'),
+            poll_interval=batch_config.get('poll_interval', 60),
+            max_requests_per_file=batch_config.get('max_requests_per_file', 50_000)
+        )
+
+    async def _merge_batch_judgments(self, semaphore: asyncio.Semaphore):
+        """Run the queued Batch API requests and finish every row waiting on a judgment"""
+        if not self._pending_llm:
+            return
+
+        judgments = await self._llm_batch.run()
+
+        async def finish(custom_id: str):
+            company_data, result, decision, scrape_method = self._pending_llm[custom_id]
+            calls = start_call_count()
+            calls['openai_batch'] += 1
+            try:
+                async with semaphore:
+                    llm_result = judgments.get(custom_id)
+                    if llm_result is None:
+                        # No judgment (failed request or batch): keep the unverified candidate
+                        logger.warning(f"⚠ No batch judgment for {result['company_name']}, keeping candidate")
+                        result['stage_reached'] = 'llm_batch_missing'
+                        scrape_result = None
+                    else:
+                        scrape_result = await self._apply_judgment(
+                            company_data, result['domain'], llm_result, scrape_method
+                        )
+                    if not await self._finish_verification(result, decision, scrape_result):
+                        await self._enrich_and_decide(company_data, result)
+            except Exception as e:
+                logger.error(f"Error merging batch judgment for {result['company_name']}: {e}", exc_info=True)
+                result['error'] = str(e)
+                result['needs_manual_review'] = True
+            finally:
+                for kind, n in calls.items():
+                    result['api_calls'][kind] = result['api_calls'].get(kind, 0) + n
+                result['cost_usd'] = calls_cost(result['api_calls'])
+
+        await asyncio.gather(*(finish(custom_id) for custom_id in self._pending_llm))
+        self._pending_llm = {}
+
     def _print_summary(self, df: pd.DataFrame):
         """Print summary statistics"""
         total = len(df)
@@ -462,13 +1037,21 @@ class DomainResolver:
         logger.info(f"Domains found: {found} ({found/total*100:.1f}%)")
         logger.info(f"High confidence (≥{self.auto_accept_threshold}): {high_conf} ({high_conf/total*100:.1f}%)")
         logger.info(f"Manual review needed: {manual_review} ({manual_review/total*100:.1f}%)")
+        if 'data_tier' in df.columns:
+            logger.info(f"\nBy data tier:\n{tier_report(df).to_string(index=False)}")
+        if self.policy.enabled:
+            policy = self.policy.summary()
+            logger.info(f"LLM skipped (deterministic): {policy['skipped']}/{policy['eligible']} eligible, "
+                        f"{policy['sampled']} drift samples, LLM agreement: {policy['sample_agreement']}")
         logger.info(f"{'='*60}\n")
 
-    def save_results(self, df: pd.DataFrame, output_path: str = "output/resolved.csv"):
-        """Save results to CSV"""
+    def save_results(self, df: pd.DataFrame, output_path: str = "output/resolved.csv",
+                     input_file: Optional[str] = None):
+        """Save results to CSV, plus the manifest incremental runs diff against"""
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
         df.to_csv(output_path, index=False)
         logger.info(f"✓ Results saved to: {output_path}")
+        write_manifest(df, output_path, input_file)
 
         # Save manual review queue
         manual_review = df[df['needs_manual_review'] == True]
@@ -489,8 +1072,84 @@ class DomainResolver:
             logger.info(f"✓ Lookup logs saved to: {log_path}")
 
 
+def tier_report(df_results: pd.DataFrame, df_truth: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+    """
+    Per-tier latency, cost and hit rate (and accuracy, given ground truth)
+
+    Rows carried forward from a previous incremental run are left out: their
+    latency and cost belong to the run that resolved them.
+
+    Args:
+        df_results: resolve_batch() output
+        df_truth: Optional ground truth with name, expected_domain
+
+    Returns:
+        One row per data tier
+    """
+    df = df_results
+    if 'carried_forward' in df.columns:
+        df = df[df['carried_forward'] != True]
+    if df_truth is not None:
+        truth = df_truth[['name', 'expected_domain']].drop_duplicates('name')
+        df = df.merge(truth, left_on='company_name', right_on='name', how='left')
+        df['correct'] = (df['domain'] == df['expected_domain']) | (df['domain'].isna() & df['expected_domain'].isna())
+
+    def llm_calls(calls) -> int:
+        if not isinstance(calls, dict):
+            return 0
+        return calls.get('openai', 0) + calls.get('openai_batch', 0)
+
+    rows = []
+    for tier, group in df.groupby('data_tier'):
+        row = {
+            'tier': tier,
+            'rows': len(group),
+            'found_pct': round(group['domain'].notna().mean() * 100, 1),
+            'p50_ms': int(group['latency_ms'].quantile(0.5)),
+            'p95_ms': int(group['latency_ms'].quantile(0.95)),
+            'llm_calls_per_row': round(group['api_calls'].map(llm_calls).mean(), 2),
+            'cost_per_1k_usd': round(group['cost_usd'].mean() * 1000, 2),
+        }
+        if 'correct' in group.columns:
+            row['accuracy_pct'] = round(group['correct'].mean() * 100, 1)
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+@asynccontextmanager
+async def detect_blocking(cli_value: Optional[float] = None):
+    """
+    evaluation/harness/loop_monitor.py detect_blocking() around the block (--detect-blocking / DETECT_BLOCKING_MS)
+
+    A no-op when detection is off; the harness is only imported when it is on.
+    """
+    if cli_value is None and not os.environ.get('DETECT_BLOCKING_MS'):
+        yield None
+        return
+    project_root = str(Path(__file__).resolve().parent.parent)
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
+    try:
+        from evaluation.harness.loop_monitor import detect_blocking as harness_detect_blocking
+    except ImportError as e:
+        logger.warning(f"⚠ Blocking detection unavailable ({e}); running without it")
+        yield None
+        return
+    async with harness_detect_blocking(cli_value) as monitor:
+        yield monitor
+
+
 async def main():
     """Main entry point"""
+    parser = argparse.ArgumentParser(description="Resolve company domains",
+                                     epilog="Example: python domain_resolver.py companies.csv")
+    parser.add_argument('input_csv', help="Input CSV file")
+    parser.add_argument('output_csv', nargs='?', default="output/resolved.csv", help="Output CSV file")
+    parser.add_argument('--detect-blocking', type=float, nargs='?', const=100, default=None, metavar='MS',
+                        help="Report event-loop blocks longer than MS (default 100) to logs/loop_monitor.json "
+                             "(or set DETECT_BLOCKING_MS)")
+    args = parser.parse_args()
+
     # Load config
     config_path = "config.yaml"
     if not Path(config_path).exists():
@@ -502,13 +1161,7 @@ async def main():
 
     setup_logging(config)
 
-    # Check for input file
-    if len(sys.argv) < 2:
-        print("Usage: python domain_resolver.py <input_csv>")
-        print("Example: python domain_resolver.py companies.csv")
-        sys.exit(1)
-
-    input_file = sys.argv[1]
+    input_file = args.input_csv
     if not Path(input_file).exists():
         print(f"Error: Input file not found: {input_file}")
         sys.exit(1)
@@ -521,16 +1174,30 @@ async def main():
     companies = df_input.to_dict('records')
     logger.info(f"Loaded {len(companies)} companies")
 
+    output_path = args.output_csv
+
+    # Incremental run: only new, changed or stale rows; the rest is carried forward
+    carried = []
+    incremental = config.get('incremental', {})
+    if incremental.get('enabled', False):
+        plan = plan_incremental(companies, load_previous(output_path), incremental.get('stale_after_days', 30))
+        companies, carried = plan.to_resolve, plan.carried
+
     # Create resolver
     resolver = DomainResolver(config)
 
     # Process batch
     max_workers = config['processing']['max_workers']
-    df_results = await resolver.resolve_batch(companies, max_workers=max_workers)
+    offline_llm = config.get('llm', {}).get('batch', {}).get('enabled', False)
+    df_results = pd.DataFrame()
+    if companies:
+        async with detect_blocking(args.detect_blocking):
+            df_results = await resolver.resolve_batch(companies, max_workers=max_workers, offline_llm=offline_llm)
+    if carried:
+        df_results = pd.concat([df_results, pd.DataFrame(carried)], ignore_index=True)
 
     # Save results
-    output_path = sys.argv[2] if len(sys.argv) > 2 else "output/resolved.csv"
-    resolver.save_results(df_results, output_path)
+    resolver.save_results(df_results, output_path, input_file=input_file)
 
     logger.info("\n✓✓ Domain resolution complete!")
 
@@ -15,6 +15,8 @@ import re
 from bs4 import BeautifulSoup
 import asyncio
 
+from .utils import count_call
+
 logger = logging.getLogger(__name__)
 
 
@@ -196,6 +198,7 @@ class DirectoryScraper:
             'num': 3  # Only need top 3 results
         }
 
+        count_call('serper_search')
         try:
             async with aiohttp.ClientSession() as session:
                 async with session.post(url, json=payload, headers=headers,
@@ -312,6 +315,7 @@ class DirectoryScraper:
             'premium_proxy': 'false'
         }
 
+        count_call('zenrows')
         try:
             async with aiohttp.ClientSession() as session:
                 async with session.get(zenrows_url, params=params,
@@ -6,7 +6,7 @@ import aiohttp
 import logging
 from typing import Optional, Dict, Any
 
-from .utils import clean_domain
+from .utils import clean_domain, count_call
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +50,7 @@ class DiscolikeClient:
         if country:
             payload['country'] = country
 
+        count_call('discolike')
         async with aiohttp.ClientSession() as session:
             async with session.post(url, json=payload, headers=headers,
                                    timeout=aiohttp.ClientTimeout(total=self.timeout)) as response:
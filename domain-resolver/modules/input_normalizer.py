@@ -245,21 +245,7 @@ class InputNormalizer:
         Returns:
             Tier number (1-4)
         """
-        has_name = bool(str(row.get('name', '')).strip())
-        has_city = bool(str(row.get('city', '')).strip())
-        has_phone = bool(str(row.get('phone', '')).strip())
-        has_context = bool(str(row.get('context', '')).strip())
-
-        if has_name and has_city and has_phone:
-            return 1  # Optimal: 90-95% expected accuracy
-        elif has_name and has_city:
-            return 2  # Good: 65-80% expected accuracy
-        elif has_name and has_context:
-            return 3  # Challenging: 50-70% expected accuracy
-        elif has_name:
-            return 4  # Very challenging: 30-50% expected accuracy
-        else:
-            return 5  # Invalid: No name
+        return classify_tier(row)
 
     def get_tier_distribution(self, df: pd.DataFrame) -> Dict[int, int]:
         """
@@ -307,6 +293,37 @@ class InputNormalizer:
         return df_clean.to_dict('records')
 
 
+def _has_value(value: Any) -> bool:
+    """True for a non-blank field (None/NaN from pandas count as blank)"""
+    if value is None or (isinstance(value, float) and pd.isna(value)):
+        return False
+    return bool(str(value).strip())
+
+
+def classify_tier(company_data: Dict[str, Any]) -> int:
+    """
+    Data completeness tier (1-4, 5 = no name) for a company dict or row
+
+    Works on raw rows too (e.g. straight from pd.read_csv), where missing
+    fields are NaN rather than empty strings.
+    """
+    has_name = _has_value(company_data.get('name'))
+    has_city = _has_value(company_data.get('city'))
+    has_phone = _has_value(company_data.get('phone'))
+    has_context = _has_value(company_data.get('context'))
+
+    if has_name and has_city and has_phone:
+        return 1  # Optimal: 90-95% expected accuracy
+    elif has_name and has_city:
+        return 2  # Good: 65-80% expected accuracy
+    elif has_name and has_context:
+        return 3  # Challenging: 50-70% expected accuracy
+    elif has_name:
+        return 4  # Very challenging: 30-50% expected accuracy
+    else:
+        return 5  # Invalid: No name
+
+
 def demo():
     """Demo usage of InputNormalizer"""
 
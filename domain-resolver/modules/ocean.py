@@ -6,7 +6,7 @@ import aiohttp
 import logging
 from typing import Optional, Dict, Any
 
-from .utils import clean_domain
+from .utils import clean_domain, count_call
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +58,7 @@ class OceanClient:
             'company': company_obj
         }
 
+        count_call('ocean')
         try:
             async with aiohttp.ClientSession() as session:
                 async with session.post(url, json=payload, headers=headers,
@@ -0,0 +1,262 @@
+"""
+OpenAI Batch API - Offline LLM verification for large domain runs
+
+Instead of one chat call per row, verification prompts are written to JSONL
+request files, submitted through the Batch API (half the price of
+synchronous calls, no per-minute rate limits, results within 24h), polled
+until done, and parsed back into the same judgment dicts that
+OpenAIJudge.judge_match returns.
+
+Request and result files are kept in batch_dir, so a run can be audited
+afterwards. Each submitted batch also gets a batch_<id>.json manifest there
+(batch id, request file, and the row key of every request in it) as soon as
+it is created. A run that dies while polling - batches can take up to 24h -
+leaves those manifests unmerged, and the next run() over the same rows
+waits for and merges the existing batches instead of submitting new ones.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+from .openai_judge import OpenAIJudge
+from .results_manifest import row_fingerprint
+
+logger = logging.getLogger(__name__)
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+TERMINAL_STATUSES = {'completed', 'failed', 'expired', 'cancelled'}
+
+# Batch API input limits (per file)
+MAX_REQUESTS_PER_FILE = 50_000
+MAX_BYTES_PER_FILE = 190 * 1024 * 1024  # API limit is 200 MB
+
+
+def request_key(company_data: Dict[str, Any], url: str) -> str:
+    """Key of one judgment across runs: the input row's fingerprint and the judged URL"""
+    return f"{row_fingerprint(company_data)} {url}"
+
+
+class OpenAIBatchJudge:
+    """Queues judge_match prompts and runs them as OpenAI batches"""
+
+    def __init__(self, api_key: str, model: str = "gpt-4o-mini",
+                 batch_dir: str = "output/llm_batches",
+                 poll_interval: float = 60,
+                 completion_window: str = "24h",
+                 max_requests_per_file: int = MAX_REQUESTS_PER_FILE,
+                 max_bytes_per_file: int = MAX_BYTES_PER_FILE):
+        """
+        Initialize batch judge
+
+        Args:
+            api_key: OpenAI API key
+            model: Model name (default: gpt-4o-mini)
+            batch_dir: Where request/result JSONL files are written
+            poll_interval: Seconds between batch status checks
+            completion_window: Batch completion window ('24h')
+            max_requests_per_file: Requests per batch file (API limit 50,000)
+            max_bytes_per_file: Bytes per batch file (API limit 200 MB)
+        """
+        self.judge = OpenAIJudge(api_key=api_key, model=model)
+        self.client = self.judge.client
+        self.batch_dir = Path(batch_dir)
+        self.poll_interval = poll_interval
+        self.completion_window = completion_window
+        self.max_requests_per_file = max_requests_per_file
+        self.max_bytes_per_file = max_bytes_per_file
+        self.requests: List[str] = []  # Serialized JSONL lines
+        self.keys: Dict[str, str] = {}  # custom_id -> request_key, in request order
+
+    def add(self, company_data: Dict[str, Any], url: str, webpage_text: str) -> str:
+        """
+        Queue one judgment
+
+        Returns:
+            custom_id the judgment will be returned under
+        """
+        custom_id = f"verify-{len(self.requests)}"
+        self.keys[custom_id] = request_key(company_data, url)
+        self.requests.append(json.dumps({
+            'custom_id': custom_id,
+            'method': 'POST',
+            'url': BATCH_ENDPOINT,
+            'body': self.judge.build_request(company_data, url, webpage_text)
+        }, default=str))
+        return custom_id
+
+    def write_requests(self, requests: Optional[List[str]] = None) -> List[Path]:
+        """Write queued requests (or the given subset) to JSONL files, split at the per-file limits"""
+        self.batch_dir.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+        chunks: List[List[str]] = [[]]
+        size = 0
+        for line in self.requests if requests is None else requests:
+            line_bytes = len(line.encode('utf-8')) + 1
+            if chunks[-1] and (len(chunks[-1]) >= self.max_requests_per_file
+                               or size + line_bytes > self.max_bytes_per_file):
+                chunks.append([])
+                size = 0
+            chunks[-1].append(line)
+            size += line_bytes
+
+        paths = []
+        for i, chunk in enumerate(chunks):
+            path = self.batch_dir / f"requests_{stamp}_{i}.jsonl"
+            path.write_text('\n'.join(chunk) + '\n')
+            paths.append(path)
+        return paths
+
+    async def submit(self, path: Path) -> str:
+        """Upload a request file and create its batch; returns the batch id"""
+        data = path.read_bytes()
+        uploaded = await self.client.files.create(file=(path.name, data), purpose='batch')
+        batch = await self.client.batches.create(
+            input_file_id=uploaded.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window=self.completion_window,
+            metadata={'source': 'domain_resolver', 'requests_file': path.name}
+        )
+        custom_ids = [json.loads(line)['custom_id'] for line in data.decode('utf-8').splitlines() if line.strip()]
+        self._write_manifest({
+            'batch_id': batch.id,
+            'requests_file': path.name,
+            'submitted_at': datetime.now().isoformat(timespec='seconds'),
+            'merged': False,
+            'rows': {custom_id: self.keys.get(custom_id) for custom_id in custom_ids},
+        })
+        logger.info(f"✓ Submitted batch {batch.id} ({path.name})")
+        return batch.id
+
+    def _manifest_path(self, batch_id: str) -> Path:
+        return self.batch_dir / f"batch_{batch_id}.json"
+
+    def _write_manifest(self, manifest: Dict[str, Any]):
+        self.batch_dir.mkdir(parents=True, exist_ok=True)
+        self._manifest_path(manifest['batch_id']).write_text(json.dumps(manifest, indent=2))
+
+    def unmerged_batches(self) -> List[Dict[str, Any]]:
+        """Manifests in batch_dir whose judgments were never merged (the run died while waiting)"""
+        manifests = []
+        for path in sorted(self.batch_dir.glob('batch_*.json')):
+            try:
+                manifest = json.loads(path.read_text())
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"Skipping unreadable batch manifest {path.name}: {e}")
+                continue
+            if not manifest.get('merged'):
+                manifests.append(manifest)
+        return manifests
+
+    async def _resumable(self, keys: set) -> List[Dict[str, Any]]:
+        """Unmerged batches that cover queued requests and can still deliver judgments"""
+        resumable = []
+        for manifest in self.unmerged_batches():
+            if not keys & set(manifest['rows'].values()):
+                continue  # Another input's batch: leave it for that run
+            batch = await self.client.batches.retrieve(manifest['batch_id'])
+            if batch.status in TERMINAL_STATUSES and batch.status != 'completed':
+                logger.warning(f"Previous batch {batch.id} ended with status {batch.status}, resubmitting its rows")
+                self._write_manifest({**manifest, 'merged': True, 'status': batch.status})
+                continue
+            resumable.append(manifest)
+        return resumable
+
+    async def wait(self, batch_id: str):
+        """Poll a batch until it reaches a terminal status"""
+        start = time.monotonic()
+        while True:
+            batch = await self.client.batches.retrieve(batch_id)
+            if batch.status in TERMINAL_STATUSES:
+                break
+            counts = batch.request_counts
+            if counts:
+                logger.info(f"Batch {batch_id}: {batch.status} ({counts.completed}/{counts.total} done, "
+                            f"{time.monotonic() - start:.0f}s)")
+            await asyncio.sleep(self.poll_interval)
+
+        if batch.status != 'completed':
+            logger.error(f"Batch {batch_id} ended with status {batch.status}")
+        return batch
+
+    async def fetch_judgments(self, batch) -> Dict[str, Dict[str, Any]]:
+        """
+        Parse a finished batch's output file into judgments
+
+        Requests that failed (or a batch that never completed) are left out,
+        so callers can tell "no judgment" apart from a negative judgment.
+        """
+        if not batch.output_file_id:
+            return {}
+
+        results_path = self.batch_dir / f"results_{batch.id}.jsonl"
+        if results_path.exists():
+            text = results_path.read_text()
+        else:
+            content = await self.client.files.content(batch.output_file_id)
+            text = content.text
+            results_path.write_text(text)
+
+        judgments = {}
+        for line in text.splitlines():
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            response = item.get('response') or {}
+            if item.get('error') or response.get('status_code') != 200:
+                logger.warning(f"Batch request {item.get('custom_id')} failed: {item.get('error')}")
+                continue
+            message = response['body']['choices'][0]['message']['content']
+            judgments[item['custom_id']] = self.judge._parse_llm_response(message)
+        return judgments
+
+    async def run(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Write, submit and wait for all queued requests
+
+        Requests already submitted by an earlier run that never merged its
+        batches (same row and URL) are not submitted again: those batches
+        are waited for and merged instead.
+
+        Returns:
+            Judgments by custom_id (missing for requests that failed)
+        """
+        if not self.requests:
+            return {}
+
+        resumed = await self._resumable(set(self.keys.values()))
+        covered = {key for manifest in resumed for key in manifest['rows'].values()}
+        if resumed:
+            logger.info(f"Resuming {len(resumed)} batch(es) from an earlier run ({len(covered)} requests)")
+
+        manifests = {manifest['batch_id']: manifest for manifest in resumed}
+        remaining = [line for line, key in zip(self.requests, self.keys.values()) if key not in covered]
+        if remaining:
+            paths = self.write_requests(remaining)
+            logger.info(f"Submitting {len(remaining)} LLM verifications in {len(paths)} batch file(s)")
+            for path in paths:
+                batch_id = await self.submit(path)
+                manifests[batch_id] = json.loads(self._manifest_path(batch_id).read_text())
+        batches = await asyncio.gather(*(self.wait(batch_id) for batch_id in manifests))
+
+        # Batch custom_ids -> row keys -> this run's custom_ids
+        by_key: Dict[str, Dict[str, Any]] = {}
+        for batch in batches:
+            manifest = manifests[batch.id]
+            for custom_id, judgment in (await self.fetch_judgments(batch)).items():
+                key = manifest['rows'].get(custom_id)
+                if key is not None:
+                    by_key[key] = judgment
+            self._write_manifest({**manifest, 'merged': True, 'status': batch.status})
+
+        judgments = {custom_id: by_key[key] for custom_id, key in self.keys.items() if key in by_key}
+        logger.info(f"✓ Batch judgments received: {len(judgments)}/{len(self.requests)}")
+        return judgments
+
+    async def close(self):
+        await self.client.close()
@@ -7,6 +7,8 @@ import logging
 from typing import Dict, Any, Optional
 import re
 
+from .utils import count_call
+
 logger = logging.getLogger(__name__)
 
 try:
@@ -58,25 +60,10 @@ class OpenAIJudge:
                 'suggested_deep_link_search': str
             }
         """
-        # Build structured prompt with full content
-        prompt = self._build_prompt(company_data, url, webpage_text)
-
         try:
+            count_call('openai')
             response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a domain validation expert. Always respond with valid JSON only."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.1,  # Low temperature for consistent output
-                max_tokens=500
+                **self.build_request(company_data, url, webpage_text)
             )
 
             llm_response = response.choices[0].message.content
@@ -98,6 +85,28 @@ class OpenAIJudge:
             logger.error(f"OpenAI API error for {company_data.get('name')}: {e}")
             return self._fallback_response(str(e))
 
+    def build_request(self, company_data: Dict[str, Any], url: str, webpage_text: str) -> Dict[str, Any]:
+        """Chat completion request body for one judgment (also used for Batch API lines)"""
+        # Build structured prompt with full content
+        prompt = self._build_prompt(company_data, url, webpage_text)
+
+        return {
+            'model': self.model,
+            'messages': [
+                {
+                    "role": "system",
+                    "content": "You are a domain validation expert. Always respond with valid JSON only."
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            'response_format': {"type": "json_object"},
+            'temperature': 0.1,  # Low temperature for consistent output
+            'max_tokens': 500
+        }
+
     def _build_prompt(self, company_data: Dict[str, Any], url: str, text: str) -> str:
         """Build structured prompt for LLM with full website content"""
 
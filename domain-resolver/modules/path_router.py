@@ -50,7 +50,9 @@ class PathRouter:
                 'path': ResolutionPath,
                 'strategies': List[str],  # Ordered list of strategies to try
                 'parallel': bool,         # Execute strategies in parallel?
-                'tier': int              # Data tier (1-4)
+                'tier': int,             # Data tier (1-4)
+                'validation': str        # 'always' (LLM or deterministic policy) | 'mandatory' (LLM)
+                                         # | 'unless_phone_verified' (as 'always'; a phone match may skip the LLM)
             }
         """
         tier = company_data.get('_data_tier', 4)
@@ -69,7 +71,7 @@ class PathRouter:
         Tier 1: name + city + phone (optimal data)
 
         Strategy:
-        1. Try Places API with phone verification (99% confidence)
+        1. Try Places API with phone verification (no LLM call needed on a match)
         2. If not found, fall through to Tier 2 strategy
 
         Expected: 90-95% success rate
@@ -83,7 +85,7 @@ class PathRouter:
             ],
             'parallel': False,  # Sequential (each is a fallback)
             'tier': 1,
-            'validation': 'always'  # Always validate final result
+            'validation': 'unless_phone_verified'  # Validate unless Places matched the phone
         }
 
     def _tier2_strategy(self, company_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -0,0 +1,193 @@
+"""
+Results Manifest - Incremental re-resolution of new and changed input rows
+
+Every result row carries an input_fingerprint (hash of the normalized name,
+city, phone and context it was resolved from) and resolved_at. Next to the
+output CSV, save_results() writes <output>.manifest.json with the
+fingerprint scheme and, per fingerprint, when it was resolved.
+
+When a customer resends an updated file against the same output,
+plan_incremental() diffs it against the previous run:
+
+- New or changed rows (fingerprint not in the manifest) are resolved
+- Rows resolved longer ago than the staleness TTL are re-resolved
+- Rows whose previous attempt failed with an error are retried
+- Everything else is carried forward from the previous output as-is,
+  tagged carried_forward so per-run metrics (tier_report) leave it out
+"""
+
+import ast
+import hashlib
+import json
+import logging
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+
+# Input fields a result depends on; changing one re-resolves the row
+FINGERPRINT_FIELDS = ('name', 'city', 'phone', 'context')
+
+# Errors that are an answer, not a failure (carried forward like any result)
+FINAL_ERRORS = {'No domain found'}
+
+
+def _normalize_field(name: str, value: Any) -> str:
+    """Case/punctuation/whitespace-insensitive form of one input field ('' when blank)"""
+    if value is None or (isinstance(value, float) and pd.isna(value)):
+        return ''
+    if name == 'phone':
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)  # pandas reads phone-only-digits columns as float
+        digits = re.sub(r'\D', '', str(value))
+        return digits[-10:]  # Drop the country code (+1 vs none)
+    text = re.sub(r'[^\w\s]', ' ', str(value).casefold())
+    return ' '.join(text.split())
+
+
+def row_fingerprint(company_data: Dict[str, Any]) -> str:
+    """
+    Content fingerprint of an input row
+
+    "ACME Plumbing, Inc." / "(217) 555-0101" and "acme plumbing inc" /
+    "+1 217.555.0101" fingerprint the same; any real edit changes it.
+    """
+    key = '\x1f'.join(_normalize_field(name, company_data.get(name)) for name in FINGERPRINT_FIELDS)
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+
+
+def manifest_path(output_path: str) -> Path:
+    """output/resolved.csv -> output/resolved.manifest.json"""
+    return Path(output_path).with_suffix('.manifest.json')
+
+
+def write_manifest(df: pd.DataFrame, output_path: str, input_file: Optional[str] = None) -> Path:
+    """
+    Record which input rows the output at output_path was resolved from
+
+    Args:
+        df: Results as saved (with input_fingerprint and resolved_at)
+        output_path: Output CSV path
+        input_file: Input file the run read
+
+    Returns:
+        Manifest path
+    """
+    rows = {}
+    columns = ['input_fingerprint', 'resolved_at', 'company_name']
+    records = df[columns].to_dict('records') if set(columns) <= set(df.columns) else []
+    for record in records:
+        if isinstance(record['input_fingerprint'], str):
+            rows[record['input_fingerprint']] = {
+                'resolved_at': record['resolved_at'],
+                'name': _normalize_field('name', record['company_name']),
+            }
+
+    path = manifest_path(output_path)
+    path.write_text(json.dumps({
+        'version': MANIFEST_VERSION,
+        'fingerprint_fields': list(FINGERPRINT_FIELDS),
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'input_file': str(input_file) if input_file else None,
+        'output_file': Path(output_path).name,
+        'rows': rows,
+    }, indent=2))
+    logger.info(f"✓ Results manifest saved to: {path} ({len(rows)} rows)")
+    return path
+
+
+def load_previous(output_path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Previous results by input fingerprint
+
+    Returns {} when there is no previous output or manifest, or the manifest
+    was written with a different fingerprint scheme (everything re-resolves).
+    """
+    path = manifest_path(output_path)
+    if not path.exists() or not Path(output_path).exists():
+        return {}
+
+    manifest = json.loads(path.read_text())
+    if (manifest.get('version') != MANIFEST_VERSION
+            or manifest.get('fingerprint_fields') != list(FINGERPRINT_FIELDS)):
+        logger.warning(f"⚠ {path} uses another fingerprint scheme; re-resolving every row")
+        return {}
+
+    rows = manifest['rows']
+    previous = {}
+    # Fingerprints are hex: read as str so '0123…' or '12e4…' don't turn into numbers
+    for record in pd.read_csv(output_path, dtype={'input_fingerprint': str}).to_dict('records'):
+        fingerprint = record.get('input_fingerprint')
+        if fingerprint in rows:
+            record['resolved_at'] = rows[fingerprint]['resolved_at']
+            record['api_calls'] = _parse_calls(record.get('api_calls'))
+            previous[fingerprint] = record
+    return previous
+
+
+def _parse_calls(calls: Any) -> Dict[str, int]:
+    """api_calls as written to CSV ("{'serper': 1}") back to a dict"""
+    if isinstance(calls, dict):
+        return calls
+    try:
+        parsed = ast.literal_eval(calls) if isinstance(calls, str) else None
+    except (ValueError, SyntaxError):
+        parsed = None
+    return parsed if isinstance(parsed, dict) else {}
+
+
+@dataclass
+class IncrementalPlan:
+    """Rows to resolve in this run, and previous results carried forward"""
+    to_resolve: List[Dict[str, Any]] = field(default_factory=list)
+    carried: List[Dict[str, Any]] = field(default_factory=list)
+    counts: Counter = field(default_factory=Counter)  # new | changed | stale | retry | unchanged
+
+
+def plan_incremental(companies: List[Dict[str, Any]], previous: Dict[str, Dict[str, Any]],
+                     stale_after_days: Optional[float] = 30,
+                     now: Optional[datetime] = None) -> IncrementalPlan:
+    """
+    Diff new input rows against previous results
+
+    Args:
+        companies: Input rows
+        previous: load_previous() output
+        stale_after_days: Re-resolve results older than this (None = never stale)
+        now: Reference time (default: now)
+
+    Returns:
+        IncrementalPlan
+    """
+    now = now or datetime.now()
+    cutoff = now - timedelta(days=stale_after_days) if stale_after_days is not None else None
+    previous_names = {_normalize_field('name', row.get('company_name')) for row in previous.values()}
+
+    plan = IncrementalPlan()
+    for company in companies:
+        old = previous.get(row_fingerprint(company))
+        if old is None:
+            changed = _normalize_field('name', company.get('name')) in previous_names
+            plan.counts['changed' if changed else 'new'] += 1
+        elif cutoff is not None and datetime.fromisoformat(old['resolved_at']) < cutoff:
+            plan.counts['stale'] += 1
+        elif isinstance(old.get('error'), str) and old['error'] not in FINAL_ERRORS:
+            plan.counts['retry'] += 1
+        else:
+            plan.counts['unchanged'] += 1
+            plan.carried.append({**old, 'carried_forward': True})
+            continue
+        plan.to_resolve.append(company)
+
+    logger.info(f"Incremental run: {len(plan.to_resolve)} to resolve "
+                f"({plan.counts['new']} new, {plan.counts['changed']} changed, {plan.counts['stale']} stale, "
+                f"{plan.counts['retry']} retried), {plan.counts['unchanged']} unchanged carried forward")
+    return plan
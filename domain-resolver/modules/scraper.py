@@ -14,6 +14,8 @@ import asyncio
 import re
 from bs4 import BeautifulSoup
 
+from .utils import count_call
+
 logger = logging.getLogger(__name__)
 
 
@@ -91,6 +93,7 @@ async def fetch_with_zenrows(url: str, api_key: str, timeout: int = 20) -> Optio
         'premium_proxy': 'false'  # Start with residential, upgrade if needed
     }
 
+    count_call('zenrows')
     try:
         async with aiohttp.ClientSession() as session:
             async with session.get(zenrows_url, params=params,
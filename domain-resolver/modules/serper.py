@@ -6,7 +6,7 @@ import aiohttp
 import logging
 from typing import Optional, Dict, Any, List
 
-from .utils import clean_domain, phone_fuzzy_match, is_blacklisted, create_search_query
+from .utils import clean_domain, phone_fuzzy_match, is_blacklisted, create_search_query, count_call
 from .fuzzy_matcher import calculate_advanced_score
 from .parking_detector import is_parked_domain
 
@@ -42,6 +42,7 @@ class SerperClient:
             'q': query
         }
 
+        count_call('serper_places')
         async with aiohttp.ClientSession() as session:
             async with session.post(url, json=payload, headers=headers,
                                    timeout=aiohttp.ClientTimeout(total=self.timeout)) as response:
@@ -74,6 +75,7 @@ class SerperClient:
             'num': num_results
         }
 
+        count_call('serper_search')
         async with aiohttp.ClientSession() as session:
             async with session.post(url, json=payload, headers=headers,
                                    timeout=aiohttp.ClientTimeout(total=self.timeout)) as response:
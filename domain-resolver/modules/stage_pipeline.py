@@ -0,0 +1,182 @@
+"""
+Stage Pipeline - Bounded producer/consumer queues for batch resolution
+
+Instead of one semaphore around a whole row, each stage (search, scrape,
+judge, enrichment) has its own worker pool reading from its own bounded
+queue. A handler processes one job and names the stage it goes to next
+(or None when the row is finished), so:
+
+- Each stage's concurrency is sized to its provider's limits
+- A slow stage fills its queue and blocks its producers (backpressure)
+  instead of holding slots the cheap stages need
+- Queue depth, active workers and throughput per stage can be read at any
+  time while a run is in progress (stats(), describe())
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Handler: process one job, return the next stage name (None = finished)
+StageHandler = Callable[[Any], Awaitable[Optional[str]]]
+
+
+class Stage:
+    """One stage: a bounded queue and the workers that drain it"""
+
+    def __init__(self, name: str, handler: StageHandler, workers: int, queue_size: int):
+        self.name = name
+        self.handler = handler
+        self.workers = max(1, workers)
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, queue_size))
+        self.active = 0
+        self.done = 0
+        self.errors = 0
+        self.busy_s = 0.0
+
+
+class StagePipeline:
+    """
+    Runs jobs through named stages connected by bounded queues.
+
+    Usage:
+        pipeline = StagePipeline(queue_size=50)
+        pipeline.add_stage('search', search, workers=20)
+        pipeline.add_stage('scrape', scrape, workers=30)
+        finished = await pipeline.run(jobs)   # Jobs enter the first stage
+    """
+
+    def __init__(self, queue_size: int = 100):
+        """
+        Args:
+            queue_size: Default max jobs waiting in each stage's queue
+        """
+        self.queue_size = queue_size
+        self.stages: Dict[str, Stage] = {}
+        self.finished = 0
+        self._started: Optional[float] = None
+
+    def add_stage(self, name: str, handler: StageHandler, workers: int,
+                  queue_size: Optional[int] = None):
+        """Add a stage; the first stage added receives the input jobs"""
+        self.stages[name] = Stage(name, handler, workers, queue_size or self.queue_size)
+
+    async def run(self, jobs: List[Any], on_finished: Optional[Callable[[Any], None]] = None) -> List[Any]:
+        """
+        Feed jobs into the first stage and wait until every job has finished
+
+        A handler that raises finishes its job (handlers are expected to
+        record their own errors on the job). If on_finished raises or a
+        handler names a stage that doesn't exist, the run is stopped and
+        that error is raised.
+
+        Args:
+            jobs: Jobs for the first stage
+            on_finished: Called with each job as it leaves the pipeline
+
+        Returns:
+            Jobs in the order they finished
+        """
+        finished: List[Any] = []
+        if not jobs:
+            return finished
+
+        all_done = asyncio.Event()
+        self._started = time.monotonic()
+
+        def finish(job):
+            finished.append(job)
+            self.finished += 1
+            if on_finished:
+                on_finished(job)
+            if len(finished) == len(jobs):
+                all_done.set()
+
+        async def worker(stage: Stage):
+            while True:
+                job = await stage.queue.get()
+                stage.active += 1
+                start = time.monotonic()
+                try:
+                    next_stage = await stage.handler(job)
+                except Exception as e:
+                    logger.error(f"Stage {stage.name} failed: {e}", exc_info=True)
+                    stage.errors += 1
+                    next_stage = None
+                finally:
+                    stage.active -= 1
+                    stage.done += 1
+                    stage.busy_s += time.monotonic() - start
+                    stage.queue.task_done()
+
+                if next_stage is None:
+                    finish(job)
+                else:
+                    target = self.stages.get(next_stage)
+                    if target is None:
+                        raise KeyError(f"Stage {stage.name} sent a job to unknown stage '{next_stage}'")
+                    # Blocks while the next stage is full (backpressure)
+                    await target.queue.put(job)
+
+        async def feed():
+            first = next(iter(self.stages.values()))
+            for job in jobs:
+                await first.queue.put(job)
+
+        tasks = [
+            asyncio.create_task(worker(stage), name=f"{stage.name}-{i}")
+            for stage in self.stages.values() for i in range(stage.workers)
+        ]
+        tasks.append(asyncio.create_task(feed(), name="feed"))
+        done_waiter = asyncio.create_task(all_done.wait())
+        try:
+            # Workers only return by raising; surface the first failure
+            # instead of waiting for jobs that will never finish
+            pending = set(tasks)
+            while not all_done.is_set():
+                done, pending = await asyncio.wait(pending | {done_waiter}, return_when=asyncio.FIRST_COMPLETED)
+                pending.discard(done_waiter)
+                for task in done:
+                    if task is not done_waiter:
+                        task.result()
+        finally:
+            done_waiter.cancel()
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(done_waiter, *tasks, return_exceptions=True)
+
+        return finished
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-stage workers, queue depth, active workers, jobs done and throughput"""
+        elapsed = time.monotonic() - self._started if self._started else 0.0
+        return {
+            name: {
+                'workers': stage.workers,
+                'queued': stage.queue.qsize(),
+                'active': stage.active,
+                'done': stage.done,
+                'errors': stage.errors,
+                'per_sec': round(stage.done / elapsed, 2) if elapsed else 0.0,
+                'utilization': round(stage.busy_s / (elapsed * stage.workers), 2) if elapsed else 0.0,
+            }
+            for name, stage in self.stages.items()
+        }
+
+    def describe(self) -> str:
+        """One-line progress: 'search 3/20 q12 | scrape 30/30 q50 | ...' (active/workers, queued)"""
+        return ' | '.join(
+            f"{name} {s['active']}/{s['workers']} q{s['queued']}" for name, s in self.stats().items()
+        )
+
+    async def report(self, interval: float):
+        """Log stage stats every `interval` seconds (run as a task alongside run())"""
+        while True:
+            await asyncio.sleep(interval)
+            logger.info(f"Pipeline: {self.finished} finished | " + ' | '.join(
+                f"{name}: {s['queued']} queued, {s['active']}/{s['workers']} active, {s['per_sec']}/s"
+                for name, s in self.stats().items()
+            ))
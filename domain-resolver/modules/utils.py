@@ -5,10 +5,46 @@ import re
 import tldextract
 import dns.resolver
 import logging
-from typing import Optional
+from collections import Counter
+from contextvars import ContextVar
+from typing import Dict, Optional
 
 logger = logging.getLogger(__name__)
 
+# Ballpark price per billable call in USD (see README "Cost Breakdown").
+# Ocean.io bills in credits, so its calls are counted but not priced.
+API_CALL_COSTS = {
+    'serper_places': 0.0,
+    'serper_search': 0.0003,
+    'zenrows': 0.003,
+    'openai': 0.0013,
+    'openai_batch': 0.00065,  # Batch API: half the synchronous price
+    'discolike': 0.005,
+    'ocean': 0.0,
+}
+
+# Calls made on behalf of the company currently being resolved (per asyncio task)
+_api_calls: ContextVar[Optional[Counter]] = ContextVar('api_calls', default=None)
+
+
+def start_call_count(calls: Optional[Counter] = None) -> Counter:
+    """Start (or, given a row's Counter, resume) counting billable API calls for the company resolved in this task"""
+    calls = Counter() if calls is None else calls
+    _api_calls.set(calls)
+    return calls
+
+
+def count_call(kind: str, n: int = 1):
+    """Record a billable API call (no-op outside start_call_count())"""
+    calls = _api_calls.get()
+    if calls is not None:
+        calls[kind] += n
+
+
+def calls_cost(calls: Dict[str, int]) -> float:
+    """Estimated USD cost of a call count"""
+    return round(sum(API_CALL_COSTS.get(kind, 0.0) * n for kind, n in calls.items()), 6)
+
 
 def normalize_company_name(name: str) -> str:
     """
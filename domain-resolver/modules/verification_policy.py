@@ -0,0 +1,131 @@
+"""
+Verification Policy - Skip the scrape + LLM check on strong deterministic evidence
+
+Deep scraping + GPT-4o-mini verification is the slowest and most expensive
+stage. A candidate skips it when deterministic evidence is strong enough:
+
+- Phone match: the Places listing phone matches the input phone
+- Name match: fuzzy score of the company name against the domain or listing title
+- Live DNS: the domain resolves
+
+A configurable random sample of the rows that could skip is still sent to
+the LLM, and its agreement rate is tracked so drift in the shortcut shows up
+in the run summary.
+"""
+
+import asyncio
+import logging
+import random
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, Any
+
+from rapidfuzz import fuzz
+
+from .fuzzy_matcher import calculate_advanced_score
+from .utils import normalize_company_name, phone_fuzzy_match, verify_dns
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PolicyDecision:
+    """Whether a candidate may skip LLM verification, and why"""
+    skip_llm: bool
+    reason: str                   # deterministic | drift_sample | no_phone_match | weak_name_match | no_dns | disabled
+                                  # | phone_verified (routing's Tier 1 shortcut, policy off)
+    sampled: bool = False         # Could skip, but sent to the LLM for drift monitoring
+    evidence: Dict[str, Any] = field(default_factory=dict)
+
+
+class VerificationPolicy:
+    """Decides per candidate whether deterministic evidence replaces the LLM check"""
+
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Initialize policy
+
+        Args:
+            config: Configuration dict (reads verification_policy and fuzzy_matching)
+        """
+        policy = config.get('verification_policy', {})
+        self.enabled = policy.get('enabled', False)
+        self.min_phone_digits = policy.get('min_phone_digits', 7)
+        self.min_name_score = policy.get('min_name_score', 85)
+        self.require_dns = policy.get('require_dns', True)
+        self.sample_rate = policy.get('sample_rate', 0.05)
+        self.accept_confidence = policy.get('accept_confidence', 92)
+        self.fuzzy_config = config.get('fuzzy_matching', {})
+        self._rng = random.Random(policy.get('seed'))
+        self.stats = Counter()
+
+    def name_score(self, company_data: Dict[str, Any], candidate: Dict[str, Any]) -> int:
+        """Best fuzzy score of the company name against the domain and the Places listing title"""
+        name = str(company_data.get('name') or '')
+        domain_score = calculate_advanced_score(
+            company_name=name,
+            url=candidate['domain'],
+            config=self.fuzzy_config
+        )['score']
+
+        place_name = (candidate.get('details') or {}).get('place_name')
+        title_score = 0
+        if place_name:
+            title_score = fuzz.token_sort_ratio(normalize_company_name(name), normalize_company_name(place_name))
+
+        return int(max(domain_score, title_score))
+
+    async def decide(self, company_data: Dict[str, Any], candidate: Dict[str, Any]) -> PolicyDecision:
+        """
+        Check the deterministic evidence for a candidate
+
+        Args:
+            company_data: Company information (name, phone)
+            candidate: Resolver result with domain and optional details.place_phone/place_name
+
+        Returns:
+            PolicyDecision (skip_llm=True means accept without scraping/LLM)
+        """
+        if not self.enabled or not candidate.get('domain'):
+            return PolicyDecision(skip_llm=False, reason='disabled')
+
+        place_phone = (candidate.get('details') or {}).get('place_phone')
+        evidence = {
+            'phone_match': phone_fuzzy_match(company_data.get('phone'), place_phone, self.min_phone_digits)
+        }
+        if not evidence['phone_match']:
+            return PolicyDecision(skip_llm=False, reason='no_phone_match', evidence=evidence)
+
+        evidence['name_score'] = self.name_score(company_data, candidate)
+        if evidence['name_score'] < self.min_name_score:
+            return PolicyDecision(skip_llm=False, reason='weak_name_match', evidence=evidence)
+
+        if self.require_dns:
+            # dnspython is blocking; keep it off the event loop
+            evidence['dns'] = await asyncio.to_thread(verify_dns, candidate['domain'])
+            if not evidence['dns']:
+                return PolicyDecision(skip_llm=False, reason='no_dns', evidence=evidence)
+
+        self.stats['eligible'] += 1
+        if self._rng.random() < self.sample_rate:
+            self.stats['sampled'] += 1
+            return PolicyDecision(skip_llm=False, reason='drift_sample', sampled=True, evidence=evidence)
+
+        self.stats['skipped'] += 1
+        return PolicyDecision(skip_llm=True, reason='deterministic', evidence=evidence)
+
+    def record_sample(self, agreed: bool):
+        """Record whether the LLM confirmed a sampled row's deterministic match"""
+        self.stats['sample_agreed' if agreed else 'sample_disagreed'] += 1
+        if not agreed:
+            logger.warning("⚠ LLM disagreed with a deterministic match (drift sample)")
+
+    def summary(self) -> Dict[str, Any]:
+        """Counts of eligible/skipped/sampled rows and the LLM agreement rate on samples"""
+        judged = self.stats['sample_agreed'] + self.stats['sample_disagreed']
+        return {
+            'eligible': self.stats['eligible'],
+            'skipped': self.stats['skipped'],
+            'sampled': self.stats['sampled'],
+            'sample_agreement': round(self.stats['sample_agreed'] / judged, 3) if judged else None,
+        }
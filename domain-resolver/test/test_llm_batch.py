@@ -0,0 +1,105 @@
+"""
+Tests for offline LLM verification through the OpenAI Batch API (against the local stub server)
+
+Run: cd domain-resolver && python -m pytest test/test_llm_batch.py -q
+"""
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+# Add parent directory (and the repo root, for the evaluation stubs) to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import domain_resolver
+from domain_resolver import DomainResolver
+from evaluation.harness.stub_providers import ProviderProfile, StubRouter, StubServer
+
+FAST = {name: ProviderProfile("none") for name in ("serper", "openweb_ninja", "millionverifier", "leadmagic",
+                                                   "zenrows", "openai", "other_api", "website", "dns")}
+
+COMPANIES = [{'name': name, 'city': 'Springfield', 'phone': float('nan')} for name in (
+    'Acme Plumbing', 'Birch Dental', 'Cobalt Roofing', 'Dune Landscaping', 'Elm Street Bakery', 'Fox Auto Repair',
+)]
+
+
+async def _fake_resolve_company(client, company, config):
+    domain = company['name'].lower().replace(' ', '') + '.com'
+    return {'domain': domain, 'confidence': 75, 'source': 'serper_search', 'method': 'fuzzy_match'}
+
+
+def _run(monkeypatch, tmp_path, offline_llm: bool):
+    config = {
+        'processing': {'timeout_seconds': 5},
+        'stages': {'use_places': True, 'use_search': True, 'use_scraping': True},
+        'thresholds': {'auto_accept': 85, 'needs_scraping': 50, 'manual_review': 70},
+        'llm': {'openai_api_key': 'test', 'batch': {'dir': str(tmp_path), 'poll_interval': 0}},
+        'logging': {'save_lookups': False},
+    }
+    monkeypatch.setenv('SERPER_API_KEY', 'test')
+    monkeypatch.delenv('OPENAI_API_KEY', raising=False)
+    monkeypatch.delenv('ZENROWS_API_KEY', raising=False)
+    monkeypatch.setattr(domain_resolver, 'resolve_company', _fake_resolve_company)
+    monkeypatch.setattr(domain_resolver, 'verify_dns', lambda domain: True)
+
+    with StubServer(FAST, batch_polls=2) as server, StubRouter(server.url):
+        resolver = DomainResolver(config)
+        df = asyncio.run(resolver.resolve_batch(COMPANIES, max_workers=3, offline_llm=offline_llm))
+    return df.set_index('company_name').loc[[c['name'] for c in COMPANIES]]
+
+
+def test_batch_judgments_match_synchronous_calls(monkeypatch, tmp_path):
+    online = _run(monkeypatch, tmp_path / 'online', offline_llm=False)
+    offline = _run(monkeypatch, tmp_path / 'offline', offline_llm=True)
+
+    columns = ['domain', 'confidence', 'method', 'needs_manual_review']
+    assert offline[columns].equals(online[columns])
+    assert set(online['method']) == {'deep_scrape_verified', 'llm_rejected'}
+    assert set(offline['stage_reached']) == set(online['stage_reached'])
+
+    # Same judgments at the Batch API price, one request file for the whole run
+    assert online['api_calls'].map(lambda calls: calls.get('openai')).tolist() == [1] * len(COMPANIES)
+    assert offline['api_calls'].map(lambda calls: calls.get('openai_batch')).tolist() == [1] * len(COMPANIES)
+    assert not any('openai' in calls for calls in offline['api_calls'])
+    assert offline['cost_usd'].sum() < online['cost_usd'].sum()
+
+    requests_files = list((tmp_path / 'offline').glob('requests_*.jsonl'))
+    assert len(requests_files) == 1
+    lines = [json.loads(line) for line in requests_files[0].read_text().splitlines()]
+    assert len(lines) == len(COMPANIES) and lines[0]['url'] == '/v1/chat/completions'
+    assert list((tmp_path / 'offline').glob('results_*.jsonl'))
+
+
+def test_run_resumes_batches_submitted_before_a_crash(tmp_path):
+    from modules.openai_batch import OpenAIBatchJudge
+
+    def queue(judge):
+        for company in COMPANIES:
+            domain = company['name'].lower().replace(' ', '') + '.com'
+            judge.add(company, f"https://{domain}/", f"{company['name']} in {company['city']}")
+
+    async def crash_then_rerun():
+        crashed = OpenAIBatchJudge(api_key='test', batch_dir=str(tmp_path), poll_interval=0)
+        queue(crashed)
+        # Only the first half is submitted before the process dies, nothing is polled
+        batch_id = await crashed.submit(crashed.write_requests(crashed.requests[:3])[0])
+        await crashed.close()
+
+        rerun = OpenAIBatchJudge(api_key='test', batch_dir=str(tmp_path), poll_interval=0)
+        queue(rerun)
+        try:
+            return batch_id, await rerun.run(), rerun.unmerged_batches()
+        finally:
+            await rerun.close()
+
+    with StubServer(FAST, batch_polls=2) as server, StubRouter(server.url):
+        batch_id, judgments, unmerged = asyncio.run(crash_then_rerun())
+        submitted = dict(server._batches)
+
+    manifest = json.loads((tmp_path / f"batch_{batch_id}.json").read_text())
+    assert manifest['merged'] and len(manifest['rows']) == 3
+    # The crashed run's batch is merged, only the other half is submitted again
+    assert len(submitted) == 2
+    assert sorted(judgments) == [f"verify-{i}" for i in range(len(COMPANIES))]
+    assert unmerged == []
@@ -0,0 +1,130 @@
+"""
+Tests for the stage-queue pipeline (per-stage worker pools, backpressure) and pipelined batch resolution
+
+Run: cd domain-resolver && python -m pytest test/test_pipeline.py -q
+"""
+import asyncio
+import sys
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+# Add parent directory (and the repo root, for the evaluation stubs) to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import domain_resolver
+from domain_resolver import DomainResolver
+from modules.stage_pipeline import StagePipeline
+from evaluation.harness.stub_providers import ProviderProfile, StubRouter, StubServer
+
+FAST = {name: ProviderProfile("none") for name in ("serper", "openweb_ninja", "millionverifier", "leadmagic",
+                                                   "zenrows", "openai", "other_api", "website", "dns")}
+
+
+def test_stage_pools_and_backpressure():
+    active = Counter()
+    peak = Counter()
+    peak_queued = Counter()
+
+    def stage(name, delay, next_stage):
+        async def handler(job):
+            active[name] += 1
+            peak[name] = max(peak[name], active[name])
+            for other, s in pipeline.stats().items():
+                peak_queued[other] = max(peak_queued[other], s['queued'])
+            await asyncio.sleep(delay)
+            active[name] -= 1
+            if job == 3 and name == 'fast':
+                raise RuntimeError('boom')
+            return next_stage(job) if callable(next_stage) else next_stage
+        return handler
+
+    pipeline = StagePipeline(queue_size=3)
+    # Even jobs need the slow stage; odd ones finish after the fast stage
+    pipeline.add_stage('fast', stage('fast', 0.001, lambda job: 'slow' if job % 2 == 0 else None), workers=4)
+    pipeline.add_stage('slow', stage('slow', 0.02, None), workers=2)
+
+    finished = asyncio.run(pipeline.run(list(range(20))))
+
+    assert sorted(finished) == list(range(20))
+    assert peak == {'fast': 4, 'slow': 2}
+    assert peak_queued['slow'] <= 3
+    stats = pipeline.stats()
+    assert (stats['fast']['done'], stats['fast']['errors'], stats['slow']['done']) == (20, 1, 10)
+    # Rows that skip the slow stage are not held up behind it
+    assert set(finished[:8]) & {1, 5, 7, 9}
+
+
+def test_run_raises_instead_of_hanging():
+    async def to_nowhere(job):
+        return 'missing' if job == 2 else None
+
+    pipeline = StagePipeline(queue_size=2)
+    pipeline.add_stage('first', to_nowhere, workers=2)
+    with pytest.raises(KeyError, match="unknown stage 'missing'"):
+        asyncio.run(asyncio.wait_for(pipeline.run(list(range(5))), timeout=5))
+
+    def on_finished(job):
+        if job == 1:
+            raise ValueError('callback failed')
+
+    async def done(job):
+        return None
+
+    pipeline = StagePipeline(queue_size=2)
+    pipeline.add_stage('only', done, workers=1)
+    with pytest.raises(ValueError, match='callback failed'):
+        asyncio.run(asyncio.wait_for(pipeline.run(list(range(5)), on_finished=on_finished), timeout=5))
+
+
+COMPANIES = [{'name': name, 'city': 'Springfield', 'phone': float('nan')} for name in (
+    'Acme Plumbing', 'Birch Dental', 'Cobalt Roofing', 'Dune Landscaping', 'Elm Street Bakery', 'Fox Auto Repair',
+    'Gold Coast Realty', 'Harbor Vet Clinic',
+)]
+
+
+async def _fake_resolve_company(client, company, config):
+    if company['name'] == 'Harbor Vet Clinic':
+        return None
+    domain = company['name'].lower().replace(' ', '') + '.com'
+    return {'domain': domain, 'confidence': 75, 'source': 'serper_search', 'method': 'fuzzy_match'}
+
+
+def _run(monkeypatch, pipeline: bool):
+    config = {
+        'processing': {'timeout_seconds': 5},
+        'stages': {'use_places': True, 'use_search': True, 'use_scraping': True},
+        'thresholds': {'auto_accept': 85, 'needs_scraping': 50, 'manual_review': 70},
+        'llm': {'openai_api_key': 'test'},
+        'pipeline': {'enabled': pipeline, 'workers': {'search': 4, 'scrape': 3, 'judge': 2, 'enrich': 1},
+                     'queue_size': 2},
+        'logging': {'save_lookups': False},
+    }
+    monkeypatch.setenv('SERPER_API_KEY', 'test')
+    monkeypatch.delenv('OPENAI_API_KEY', raising=False)
+    monkeypatch.delenv('ZENROWS_API_KEY', raising=False)
+    monkeypatch.setattr(domain_resolver, 'resolve_company', _fake_resolve_company)
+    monkeypatch.setattr(domain_resolver, 'verify_dns', lambda domain: True)
+
+    with StubServer(FAST) as server, StubRouter(server.url):
+        resolver = DomainResolver(config)
+        df = asyncio.run(resolver.resolve_batch(COMPANIES, max_workers=3))
+    return resolver, df.set_index('company_name').loc[[c['name'] for c in COMPANIES]]
+
+
+def test_pipelined_batch_matches_semaphore_batch(monkeypatch):
+    _, serial = _run(monkeypatch, pipeline=False)
+    resolver, pipelined = _run(monkeypatch, pipeline=True)
+
+    columns = ['domain', 'confidence', 'method', 'stage_reached', 'needs_manual_review', 'error']
+    assert pipelined[columns].equals(serial[columns])
+    assert pipelined['api_calls'].tolist() == serial['api_calls'].tolist()
+    assert set(serial['method'].dropna()) == {'deep_scrape_verified', 'llm_rejected'}
+
+    stats = resolver.pipeline.stats()
+    assert {name: s['workers'] for name, s in stats.items()} == {'search': 4, 'scrape': 3, 'judge': 2, 'enrich': 1}
+    assert stats['search']['done'] == len(COMPANIES) and stats['judge']['done'] == len(COMPANIES) - 1
+    assert all(s['queued'] == 0 and s['active'] == 0 for s in stats.values())
+    assert len(resolver.results) == len(COMPANIES)
@@ -0,0 +1,93 @@
+"""
+Tests for incremental re-resolution (row fingerprints, results manifest, diff plan)
+
+Run: cd domain-resolver && python -m pytest test/test_results_manifest.py -q
+"""
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from domain_resolver import tier_report
+from modules.results_manifest import load_previous, manifest_path, plan_incremental, row_fingerprint, write_manifest
+
+NOW = datetime(2026, 10, 1, 12, 0)
+
+
+def _row(name, city='Springfield', phone='(217) 555-0101', context=float('nan')):
+    return {'name': name, 'city': city, 'phone': phone, 'context': context}
+
+
+def _result(company, resolved_at, domain=None, error=None):
+    return {'company_name': company['name'], 'domain': domain, 'confidence': 90 if domain else 0,
+            'input_fingerprint': row_fingerprint(company), 'resolved_at': resolved_at, 'error': error}
+
+
+def test_fingerprint_ignores_formatting_only():
+    base = row_fingerprint(_row('Acme Plumbing, Inc.'))
+    assert row_fingerprint(_row('ACME plumbing inc', city=' springfield ', phone='+1 217.555.0101')) == base
+    assert row_fingerprint({**_row('Acme Plumbing, Inc.'), 'phone': 2175550101.0, 'address': '1 Main'}) == base
+    assert row_fingerprint(_row('Acme Plumbing, Inc.', city='Chicago')) != base
+    assert row_fingerprint(_row('Acme Plumbing, Inc.', context='hvac')) != base
+    assert row_fingerprint(_row('Acme Plumbing, Inc.', phone=None)) == row_fingerprint(
+        _row('Acme Plumbing, Inc.', phone=float('nan')))
+
+
+def test_plan_resolves_only_new_changed_stale_and_failed_rows(tmp_path):
+    acme, birch, cobalt, dune = _row('Acme Plumbing'), _row('Birch Dental'), _row('Cobalt Roofing'), _row('Dune Co')
+    output = tmp_path / 'resolved.csv'
+    df = pd.DataFrame([
+        _result(acme, '2026-09-20T09:00:00', 'acmeplumbing.com'),
+        _result(birch, '2026-09-20T09:00:00', 'birchdental.com'),
+        _result(cobalt, '2026-06-01T09:00:00', 'cobaltroofing.com'),
+        _result(dune, '2026-09-20T09:00:00', error='Timeout'),
+        _result(_row('Elm Bakery'), '2026-09-20T09:00:00', error='No domain found'),
+    ])
+    df.to_csv(output, index=False)
+    write_manifest(df, str(output), 'companies.csv')
+    assert json.loads(manifest_path(str(output)).read_text())['output_file'] == 'resolved.csv'
+
+    resend = [
+        _row('ACME PLUMBING'),                          # Formatting only: unchanged
+        _row('Birch Dental', city='Chicago'),           # Changed
+        cobalt,                                         # Stale (> 30 days)
+        dune,                                           # Errored last time: retried
+        _row('Elm Bakery'),                             # No domain found: carried forward
+        _row('Fox Auto'),                               # New
+    ]
+    plan = plan_incremental(resend, load_previous(str(output)), stale_after_days=30, now=NOW)
+
+    assert [c['name'] for c in plan.to_resolve] == ['Birch Dental', 'Cobalt Roofing', 'Dune Co', 'Fox Auto']
+    assert [r['company_name'] for r in plan.carried] == ['Acme Plumbing', 'Elm Bakery']
+    assert plan.carried[0]['domain'] == 'acmeplumbing.com'
+    assert dict(plan.counts) == {'unchanged': 2, 'changed': 1, 'stale': 1, 'retry': 1, 'new': 1}
+
+    # Without a TTL nothing goes stale; without a manifest everything is resolved
+    assert plan_incremental(resend, load_previous(str(output)), stale_after_days=None, now=NOW).counts['stale'] == 0
+    manifest_path(str(output)).unlink()
+    assert len(plan_incremental(resend, load_previous(str(output)), now=NOW).to_resolve) == len(resend)
+
+
+def test_carried_rows_keep_their_calls_and_stay_out_of_run_metrics(tmp_path):
+    acme = _row('Acme Plumbing')
+    output = tmp_path / 'resolved.csv'
+    old = {**_result(acme, '2026-09-20T09:00:00', 'acmeplumbing.com'), 'data_tier': 'tier_2',
+           'latency_ms': 9000, 'api_calls': {'serper': 2, 'openai': 1}, 'cost_usd': 0.01}
+    pd.DataFrame([old]).to_csv(output, index=False)
+    write_manifest(pd.DataFrame([old]), str(output), 'companies.csv')
+
+    carried = plan_incremental([acme], load_previous(str(output)), now=NOW).carried
+    assert carried[0]['api_calls'] == {'serper': 2, 'openai': 1} and carried[0]['carried_forward']
+
+    fresh = {**_result(_row('Fox Auto'), NOW.isoformat(), 'foxauto.com'), 'data_tier': 'tier_2',
+             'latency_ms': 100, 'api_calls': {'serper': 1}, 'cost_usd': 0.001}
+    report = tier_report(pd.concat([pd.DataFrame([fresh]), pd.DataFrame(carried)], ignore_index=True))
+    assert report.to_dict('records')[0] == {
+        'tier': 'tier_2', 'rows': 1, 'found_pct': 100.0, 'p50_ms': 100, 'p95_ms': 100,
+        'llm_calls_per_row': 0.0, 'cost_per_1k_usd': 1.0,
+    }
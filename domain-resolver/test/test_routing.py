@@ -0,0 +1,169 @@
+"""
+Tests for tier-routed resolution (PathRouter strategies, consensus, skip-LLM policy, per-tier report)
+
+Run: cd domain-resolver && python -m pytest test/test_routing.py -q
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import domain_resolver
+import modules.verification_policy
+from domain_resolver import DomainResolver, tier_report
+from modules.utils import count_call
+
+CONFIG = {
+    'processing': {'timeout_seconds': 5},
+    'stages': {'use_places': True, 'use_search': True, 'use_scraping': True, 'use_discolike': False},
+    'thresholds': {'auto_accept': 85, 'needs_scraping': 50, 'manual_review': 70},
+    'routing': {'enabled': True},
+    'verification_policy': {'enabled': True, 'sample_rate': 0.0},
+    'logging': {'save_lookups': False},
+}
+
+COMPANIES = [
+    {'name': 'Acme Plumbing', 'city': 'Springfield', 'phone': '(217) 555-0101'},
+    {'name': 'Birch Dental', 'city': 'Springfield', 'phone': float('nan')},
+    {'name': 'Cobalt Analytics', 'city': float('nan'), 'phone': float('nan'), 'context': 'data consulting'},
+]
+
+
+class FakeProviders:
+    """Stands in for Serper, the directory search and the scrape+LLM check"""
+
+    def __init__(self, monkeypatch, resolver: DomainResolver):
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        monkeypatch.setattr(domain_resolver, 'resolve_via_places', self.places)
+        monkeypatch.setattr(domain_resolver, 'resolve_via_search', self.search)
+        monkeypatch.setattr(domain_resolver, 'verify_dns', lambda domain: True)
+        monkeypatch.setattr(modules.verification_policy, 'verify_dns', lambda domain: True)
+        monkeypatch.setattr(resolver.directory_scraper, 'search_directories', self.directories)
+        monkeypatch.setattr(resolver, '_verify_with_scraping', self.llm_verify)
+
+    async def _call(self, kind: str, name: str):
+        self.calls.append((kind, name))
+        count_call(kind)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+
+    async def places(self, client, company, config):
+        await self._call('serper_places', company['name'])
+        if company['name'] == 'Acme Plumbing':
+            return {'domain': 'acmeplumbing.com', 'confidence': 75, 'source': 'google_places',
+                    'method': 'phone_verified',
+                    'details': {'place_name': 'Acme Plumbing Inc', 'place_phone': '+1 217-555-0101'}}
+        return None
+
+    async def search(self, client, company, config):
+        await self._call('serper_search', company['name'])
+        domain = company['name'].lower().replace(' ', '') + '.com'
+        return {'domain': domain, 'confidence': 80, 'source': 'serper_search', 'method': 'fuzzy_match'}
+
+    async def directories(self, company_name, context=None):
+        await self._call('serper_search', company_name)
+        return [
+            {'domain': 'cobaltanalytics.com', 'source': 'directory_zoominfo', 'confidence': 75},
+            {'domain': 'cobaltanalytics.com', 'source': 'directory_crunchbase', 'confidence': 75},
+            {'domain': 'cobalt-mining.com', 'source': 'directory_apollo', 'confidence': 75},
+        ]
+
+    async def llm_verify(self, company, domain):
+        await self._call('openai', company['name'])
+        return {'domain': domain, 'confidence': 90, 'source': 'llm_verified', 'method': 'deep_scrape_verified',
+                'verified': True}
+
+
+def _run(monkeypatch, config=CONFIG):
+    monkeypatch.setenv('SERPER_API_KEY', 'test')
+    resolver = DomainResolver(config)
+    fake = FakeProviders(monkeypatch, resolver)
+    df = asyncio.run(resolver.resolve_batch(COMPANIES, max_workers=3))
+    return df.set_index('company_name'), fake
+
+
+def test_routes_by_tier(monkeypatch):
+    df, fake = _run(monkeypatch)
+
+    # Tier 1: one Places call; phone + name + DNS accepted without search or LLM
+    acme = df.loc['Acme Plumbing']
+    assert (acme['data_tier'], acme['resolution_path']) == (1, 'tier1_high_confidence')
+    assert (acme['domain'], acme['confidence'], acme['method']) == ('acmeplumbing.com', 92, 'phone_verified')
+    assert (acme['stage_reached'], acme['llm_policy'], acme['verified']) == ('policy_accepted', 'deterministic', True)
+    assert not acme['needs_manual_review'] and acme['api_calls'] == {'serper_places': 1}
+    assert [kind for kind, name in fake.calls if name == 'Acme Plumbing'] == ['serper_places']
+
+    # Tier 2: Places and Search in parallel, then LLM verification
+    birch = df.loc['Birch Dental']
+    assert (birch['data_tier'], birch['domain'], birch['stage_reached']) == (2, 'birchdental.com', 'llm_verified')
+    assert birch['llm_policy'] == 'no_phone_match'
+    assert birch['api_calls'] == {'serper_places': 1, 'serper_search': 1, 'openai': 1}
+
+    # Tier 3: Search and directories in parallel; two directories agreeing with Search win
+    cobalt = df.loc['Cobalt Analytics']
+    assert (cobalt['data_tier'], cobalt['resolution_path']) == (3, 'tier3_general')
+    assert cobalt['strategies_tried'] == ['directory_scraper', 'serper_search']
+    assert cobalt['sources'] == ['directory_crunchbase', 'directory_zoominfo', 'serper_search']
+    assert cobalt['domain'] == 'cobaltanalytics.com' and cobalt['api_calls']['openai'] == 1
+    assert fake.max_in_flight >= 2
+
+    report = tier_report(df.reset_index(), pd.DataFrame({
+        'name': ['Acme Plumbing', 'Birch Dental', 'Cobalt Analytics'],
+        'expected_domain': ['acmeplumbing.com', 'birchdental.com', 'cobalt.io'],
+    })).set_index('tier')
+    assert report['llm_calls_per_row'].to_dict() == {1: 0, 2: 1, 3: 1}
+    assert report['accuracy_pct'].to_dict() == {1: 100.0, 2: 100.0, 3: 0.0}
+    assert report.loc[1, 'cost_per_1k_usd'] < report.loc[2, 'cost_per_1k_usd']
+
+
+def test_drift_sample_goes_to_llm(monkeypatch):
+    config = {**CONFIG, 'verification_policy': {'enabled': True, 'sample_rate': 1.0}}
+    monkeypatch.setenv('SERPER_API_KEY', 'test')
+    resolver = DomainResolver(config)
+    FakeProviders(monkeypatch, resolver)
+    df = asyncio.run(resolver.resolve_batch(COMPANIES[:1])).set_index('company_name')
+
+    acme = df.loc['Acme Plumbing']
+    assert (acme['llm_policy'], acme['stage_reached'], acme['policy_agreed']) == ('drift_sample', 'llm_verified', True)
+    assert acme['api_calls'] == {'serper_places': 1, 'openai': 1}
+    assert resolver.policy.summary() == {'eligible': 1, 'skipped': 0, 'sampled': 1, 'sample_agreement': 1.0}
+
+
+def test_tier1_phone_match_skips_llm_with_policy_off(monkeypatch):
+    config = {**CONFIG, 'verification_policy': {'enabled': False}}
+    df, fake = _run(monkeypatch, config)
+
+    acme = df.loc['Acme Plumbing']
+    assert (acme['stage_reached'], acme['llm_policy'], acme['verified']) == ('phone_verified', 'phone_verified', True)
+    assert acme['api_calls'] == {'serper_places': 1}
+    # Tier 2 has no phone shortcut
+    assert df.loc['Birch Dental', 'api_calls']['openai'] == 1
+
+    config = {**config, 'routing': {'enabled': True, 'skip_llm_on_phone_match': False}}
+    df, _ = _run(monkeypatch, config)
+    assert df.loc['Acme Plumbing', 'stage_reached'] == 'llm_verified'
+
+
+def test_waterfall_when_routing_disabled(monkeypatch):
+    config = {**CONFIG, 'routing': {'enabled': False}, 'verification_policy': {'enabled': False}}
+    monkeypatch.setattr(domain_resolver, 'resolve_company', _fake_resolve_company)
+    df, fake = _run(monkeypatch, config)
+
+    # With the policy off every row pays for LLM verification, the phone-matched one included
+    assert set(df['resolution_path']) == {'waterfall'}
+    assert df['api_calls'].map(lambda calls: calls.get('openai', 0)).tolist() == [1, 1, 1]
+    assert df.loc['Acme Plumbing', 'stage_reached'] == 'llm_verified'
+    assert df['data_tier'].to_dict() == {'Acme Plumbing': 1, 'Birch Dental': 2, 'Cobalt Analytics': 3}
+
+
+async def _fake_resolve_company(client, company, config):
+    domain = company['name'].lower().replace(' ', '') + '.com'
+    return {'domain': domain, 'confidence': 75, 'source': 'google_places', 'method': 'phone_verified'}
@@ -12,7 +12,7 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from domain_resolver import DomainResolver, setup_logging
+from domain_resolver import DomainResolver, setup_logging, tier_report
 
 
 def calculate_metrics(df_results: pd.DataFrame, df_truth: pd.DataFrame) -> dict:
@@ -203,6 +203,8 @@ async def run_tests():
 
     # Print reports
     print_metrics_report(metrics)
+    print("By data tier:")
+    print(tier_report(df_results, df_truth).to_string(index=False) + "\n")
     analyze_failures(df_results, df_truth)
 
     # Save test results
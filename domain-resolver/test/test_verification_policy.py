@@ -0,0 +1,66 @@
+"""
+Tests for the skip-LLM verification policy (phone + name + DNS evidence, drift sampling)
+
+Run: cd domain-resolver && python -m pytest test/test_verification_policy.py -q
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import modules.verification_policy
+from modules.verification_policy import VerificationPolicy
+
+COMPANY = {'name': 'Summit Roofing LLC', 'city': 'Boston', 'phone': '(617) 555-0123'}
+
+
+def _candidate(domain='summitroofing.com', place_phone='+1 617-555-0123', place_name='Summit Roofing'):
+    return {'domain': domain, 'confidence': 75, 'source': 'google_places', 'method': 'phone_verified',
+            'details': {'place_phone': place_phone, 'place_name': place_name}}
+
+
+def _decide(policy, candidate, company=COMPANY):
+    return asyncio.run(policy.decide(company, candidate))
+
+
+def test_requires_phone_name_and_dns(monkeypatch):
+    live = {'summitroofing.com', 'bostonroofers.com'}
+    monkeypatch.setattr(modules.verification_policy, 'verify_dns', lambda domain: domain in live)
+    policy = VerificationPolicy({'verification_policy': {'enabled': True, 'sample_rate': 0}})
+
+    decision = _decide(policy, _candidate())
+    assert decision.skip_llm and decision.reason == 'deterministic'
+    assert decision.evidence == {'phone_match': True, 'name_score': 100, 'dns': True}
+
+    # Last 4 digits alone (what Places' phone_verified uses) are not enough
+    assert _decide(policy, _candidate(place_phone='(212) 999-0123')).reason == 'no_phone_match'
+    assert _decide(policy, _candidate(place_phone=None)).reason == 'no_phone_match'
+    assert _decide(policy, _candidate(), {**COMPANY, 'phone': float('nan')}).reason == 'no_phone_match'
+
+    # Shared phone (parent company / answering service) with another business's listing
+    weak = _decide(policy, _candidate(domain='bostonroofers.com', place_name='Boston Roofers Inc'))
+    assert (weak.skip_llm, weak.reason) == (False, 'weak_name_match') and weak.evidence['name_score'] < 85
+
+    assert _decide(policy, _candidate(domain='summit-roofing.net', place_name='Summit Roofing')).reason == 'no_dns'
+    assert policy.summary() == {'eligible': 1, 'skipped': 1, 'sampled': 0, 'sample_agreement': None}
+
+
+def test_samples_skippable_rows_for_drift(monkeypatch):
+    monkeypatch.setattr(modules.verification_policy, 'verify_dns', lambda domain: True)
+    policy = VerificationPolicy({'verification_policy': {'enabled': True, 'sample_rate': 0.2, 'seed': 7}})
+
+    decisions = [_decide(policy, _candidate()) for _ in range(500)]
+    sampled = [d for d in decisions if d.sampled]
+    assert all(not d.skip_llm and d.reason == 'drift_sample' for d in sampled)
+    assert 70 <= len(sampled) <= 130
+
+    for agreed in [True] * 9 + [False]:
+        policy.record_sample(agreed)
+    summary = policy.summary()
+    assert summary['eligible'] == 500 and summary['skipped'] == 500 - len(sampled)
+    assert summary['sample_agreement'] == 0.9
+
+    disabled = VerificationPolicy({})
+    assert _decide(disabled, _candidate()).reason == 'disabled'
@@ -9,6 +9,12 @@ from .metrics import (
 from .cache import EvaluationCache
 from .ground_truth_builder import GroundTruthBuilder, GroundTruthCompany
 from .blitz_evaluator import BlitzEvaluator, BlitzEvalSummary
+from .rate_limiter import AdaptiveRateLimiter
+from .run_store import RunStore
+from .cassette import Cassette, CassetteMiss
+from .stub_providers import StubServer, StubRouter, ProviderProfile
+from .loop_monitor import LoopLagSampler, LoopMonitor
+from .linkedin_export import iter_connection_rows, iter_connections, load_connections, reservoir_sample
 
 __all__ = [
     "calculate_domain_metrics",
@@ -20,4 +26,17 @@ __all__ = [
     "GroundTruthCompany",
     "BlitzEvaluator",
     "BlitzEvalSummary",
+    "AdaptiveRateLimiter",
+    "RunStore",
+    "Cassette",
+    "CassetteMiss",
+    "StubServer",
+    "StubRouter",
+    "ProviderProfile",
+    "LoopLagSampler",
+    "LoopMonitor",
+    "iter_connection_rows",
+    "iter_connections",
+    "load_connections",
+    "reservoir_sample",
 ]
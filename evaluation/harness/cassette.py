@@ -0,0 +1,591 @@
+"""
+Record/replay cassettes for offline pipeline runs.
+
+A cassette captures every HTTP request/response pair made through aiohttp,
+httpx or httpx2 (the OpenAI SDK included), plus dnspython lookups, into a JSONL
+file. Replaying it serves the same responses without touching the network,
+with a simulated latency per request, so SMBContactPipeline.run,
+DomainResolver.resolve_batch and ContactFinder.process_batch can be
+benchmarked for throughput and concurrency regressions without API keys.
+
+Modes:
+- record: every request goes to the network; the cassette is rewritten
+- replay: requests are served from the cassette; unknown requests fail
+  with a connection error (and CassetteMiss on exit when strict=True)
+- auto:   replay what is recorded, record the rest
+
+Requests are matched on method, URL and body. API keys are left out of
+the match (headers are ignored; secret query/body fields are dropped) and
+are never written to the cassette. Repeated identical requests replay
+their recorded responses in order.
+
+Latency specs (seconds):
+    "none"                  no delay
+    "recorded[:scale]"      the recorded response time, optionally scaled
+    "fixed:0.2"
+    "uniform:0.1,0.5"
+    "normal:0.3,0.1"        mean, std (clipped at 0)
+    "lognormal:0.3,0.6"     median, sigma
+Delays are drawn from a generator seeded per request, so a replay is
+identical whatever order concurrent requests arrive in.
+
+Usage:
+    with Cassette("evaluation/data/cassettes/smb.jsonl", mode="record"):
+        asyncio.run(pipeline.run("companies.json", limit=50))
+
+    with Cassette("evaluation/data/cassettes/smb.jsonl", latency="lognormal:0.4,0.5",
+                  host_latency={"api.openai.com": "lognormal:1.2,0.4"}) as cassette:
+        asyncio.run(pipeline.run("companies.json", limit=50))
+    print(cassette.stats)
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import logging
+import math
+import random
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import aiohttp
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - httpx is optional
+    httpx = None
+
+try:
+    import httpx2  # Fork of httpx that newer OpenAI SDKs ship with
+except ImportError:  # pragma: no cover - httpx2 is optional
+    httpx2 = None
+
+try:
+    import dns.exception
+    import dns.resolver
+except ImportError:  # pragma: no cover - dnspython is optional
+    dns = None
+
+
+logger = logging.getLogger(__name__)
+
+# Query/body fields that carry credentials: never matched on, never stored
+SECRET_FIELDS = {
+    "api", "api_key", "apikey", "key", "token", "access_token", "auth", "secret", "x-api-key",
+}
+# Response headers that no longer apply once the body is stored decoded
+DROP_RESPONSE_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "set-cookie"}
+
+
+class CassetteMiss(Exception):
+    """Replay saw requests that are not in the cassette (strict mode)"""
+
+
+@dataclass
+class Interaction:
+    """One recorded request/response pair"""
+    key: str
+    method: str
+    url: str
+    status: int
+    headers: dict = field(default_factory=dict)
+    body: str = ""
+    body_encoding: str = "text"         # text | base64
+    elapsed_ms: float = 0.0
+    error: str | None = None            # Transport error / DNS exception instead of a response
+
+    def body_bytes(self) -> bytes:
+        if self.body_encoding == "base64":
+            return base64.b64decode(self.body)
+        return self.body.encode("utf-8")
+
+    @staticmethod
+    def encode_body(body: bytes) -> tuple[str, str]:
+        try:
+            return body.decode("utf-8"), "text"
+        except UnicodeDecodeError:
+            return base64.b64encode(body).decode("ascii"), "base64"
+
+
+@dataclass
+class CassetteStats:
+    """Counters for one cassette session"""
+    hits: int = 0
+    misses: int = 0
+    recorded: int = 0
+    simulated_latency_s: float = 0.0
+    by_host: dict = field(default_factory=lambda: defaultdict(int))
+
+    def to_dict(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "recorded": self.recorded,
+            "simulated_latency_s": round(self.simulated_latency_s, 3),
+            "by_host": dict(self.by_host),
+        }
+
+
+class LatencyModel:
+    """Parsed latency spec (see module docstring)"""
+
+    def __init__(self, spec: str = "recorded"):
+        self.spec = spec
+        kind, _, args = spec.partition(":")
+        self.kind = kind.strip().lower()
+        self.args = [float(a) for a in args.split(",") if a.strip()]
+        if self.kind not in ("none", "recorded", "fixed", "uniform", "normal", "lognormal"):
+            raise ValueError(f"Unknown latency spec: {spec}")
+
+    def sample(self, rng: random.Random, recorded_s: float) -> float:
+        if self.kind == "none":
+            return 0.0
+        if self.kind == "recorded":
+            return recorded_s * (self.args[0] if self.args else 1.0)
+        if self.kind == "fixed":
+            return self.args[0]
+        if self.kind == "uniform":
+            return rng.uniform(self.args[0], self.args[1])
+        if self.kind == "normal":
+            return max(0.0, rng.gauss(self.args[0], self.args[1]))
+        # lognormal: median, sigma
+        return rng.lognormvariate(math.log(self.args[0]), self.args[1])
+
+
+def _strip_secrets(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {k: _strip_secrets(v) for k, v in value.items() if str(k).lower() not in SECRET_FIELDS}
+    if isinstance(value, list):
+        return [_strip_secrets(v) for v in value]
+    return value
+
+
+def normalize_url(url: str) -> str:
+    """URL without credentials in the query, with query params sorted."""
+    parts = urlsplit(str(url))
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in SECRET_FIELDS
+    )
+    return urlunsplit((parts.scheme, parts.netloc.lower(), parts.path, urlencode(query), ""))
+
+
+def _canonical_body(body: Any) -> str:
+    """Stable text for a request body (JSON/form payloads sorted, secrets dropped)."""
+    if body is None or body == b"" or body == "":
+        return ""
+    if isinstance(body, (bytes, bytearray)):
+        try:
+            body = json.loads(body)
+        except (ValueError, UnicodeDecodeError):
+            try:
+                form = parse_qsl(body.decode("utf-8"), keep_blank_values=True, strict_parsing=True)
+                body = dict(form)
+            except (ValueError, UnicodeDecodeError):
+                return hashlib.sha256(bytes(body)).hexdigest()
+    if isinstance(body, str):
+        try:
+            body = json.loads(body)
+        except ValueError:
+            return body
+    if isinstance(body, aiohttp.FormData):
+        return repr(body._fields)
+    return json.dumps(_strip_secrets(body), sort_keys=True, default=str)
+
+
+def request_key(method: str, url: str, body: Any = None) -> str:
+    raw = f"{method.upper()} {normalize_url(url)}\n{_canonical_body(body)}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
+
+class Cassette:
+    """
+    Record or replay HTTP/DNS traffic while active (a context manager).
+
+    Patching is process-wide, so only one cassette may be active at a time.
+    """
+
+    _active: "Cassette | None" = None
+
+    def __init__(
+        self,
+        path: str | Path,
+        mode: str = "replay",
+        latency: str = "recorded",
+        host_latency: dict[str, str] | None = None,
+        seed: int = 0,
+        strict: bool = False
+    ):
+        """
+        Args:
+            path: JSONL cassette file
+            mode: record | replay | auto
+            latency: Default latency spec for replayed responses
+            host_latency: Per-host latency specs ("dns" for DNS lookups)
+            seed: Seed for sampled latencies
+            strict: Raise CassetteMiss on exit if any request was not found
+        """
+        if mode not in ("record", "replay", "auto"):
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        self.path = Path(path)
+        self.mode = mode
+        self.latency = LatencyModel(latency)
+        self.host_latency = {h.lower(): LatencyModel(s) for h, s in (host_latency or {}).items()}
+        self.seed = seed
+        self.strict = strict
+        self.meta: dict = {}
+        self.stats = CassetteStats()
+        self._interactions: dict[str, list[Interaction]] = defaultdict(list)
+        self._served: dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+        self._originals: dict[str, Any] = {}
+        self._dirty = False
+
+        if mode != "record":
+            self.load()
+
+    # --- storage ---
+
+    def load(self):
+        if not self.path.exists():
+            if self.mode == "replay":
+                raise FileNotFoundError(f"Cassette not found: {self.path}")
+            return
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                data = json.loads(line)
+                if "_meta" in data:
+                    self.meta = data["_meta"]
+                    continue
+                self._interactions[data["key"]].append(Interaction(**data))
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"_meta": self.meta}, sort_keys=True) + "\n")
+            for key in sorted(self._interactions):
+                for interaction in self._interactions[key]:
+                    f.write(json.dumps(asdict(interaction), sort_keys=True) + "\n")
+
+    def __len__(self) -> int:
+        return sum(len(v) for v in self._interactions.values())
+
+    def rewind(self):
+        """Replay from the first recorded response again and reset stats."""
+        self._served.clear()
+        self.stats = CassetteStats()
+
+    # --- matching ---
+
+    def _lookup(self, key: str) -> Interaction | None:
+        """Next recorded response for `key` (the last one repeats), or None."""
+        with self._lock:
+            recorded = self._interactions.get(key)
+            if not recorded:
+                return None
+            n = self._served[key]
+            self._served[key] = n + 1
+        return recorded[min(n, len(recorded) - 1)]
+
+    def _store(self, interaction: Interaction):
+        with self._lock:
+            self._interactions[interaction.key].append(interaction)
+            self._served[interaction.key] += 1
+            self.stats.recorded += 1
+            self._dirty = True
+
+    def _record_error(self, key: str, method: str, url: str, error: BaseException, start: float):
+        """Store a transport failure so replay fails the same way."""
+        timed_out = isinstance(error, asyncio.TimeoutError) or any(
+            module is not None and isinstance(error, module.TimeoutException) for module in (httpx, httpx2)
+        )
+        self._store(Interaction(
+            key=key,
+            method=method.upper(),
+            url=normalize_url(url),
+            status=0,
+            error="timeout" if timed_out else f"{type(error).__name__}: {error}",
+            elapsed_ms=(time.perf_counter() - start) * 1000,
+        ))
+
+    def _delay(self, host: str, interaction: Interaction) -> float:
+        n = self._served[interaction.key]
+        model = self.host_latency.get(host.lower(), self.latency)
+        rng = random.Random(f"{self.seed}:{interaction.key}:{n}")
+        delay = model.sample(rng, interaction.elapsed_ms / 1000)
+        self.stats.simulated_latency_s += delay
+        return delay
+
+    def _replayable(self, key: str) -> Interaction | None:
+        """Recorded response to serve, or None to go to the network."""
+        if self.mode == "record":
+            return None
+        interaction = self._lookup(key)
+        if interaction is None and self.mode == "replay":
+            self.stats.misses += 1
+        elif interaction is not None:
+            self.stats.hits += 1
+        return interaction
+
+    # --- transports ---
+
+    async def _aiohttp_request(self, session: aiohttp.ClientSession, method: str, str_or_url, **kwargs):
+        original = self._originals["aiohttp"]
+        url = URL(str(session._build_url(str_or_url)) if hasattr(session, "_build_url") else str(str_or_url))
+        if kwargs.get("params"):
+            url = url.update_query(kwargs["params"])
+        body = kwargs.get("json") if kwargs.get("json") is not None else kwargs.get("data")
+        key = request_key(method, str(url), body)
+        host = url.host or ""
+        self.stats.by_host[host] += 1
+
+        interaction = self._replayable(key)
+        if interaction is not None:
+            await asyncio.sleep(self._delay(host, interaction))
+            if interaction.error:
+                if interaction.error == "timeout":
+                    raise asyncio.TimeoutError()
+                raise aiohttp.ClientConnectionError(interaction.error)
+            response = _ReplayResponse(method, url, interaction)
+            if kwargs.get("raise_for_status") or (
+                kwargs.get("raise_for_status") is None and getattr(session, "_raise_for_status", None) is True
+            ):
+                response.raise_for_status()
+            return response
+        if self.mode == "replay":
+            logger.warning(f"Cassette miss: {method} {normalize_url(str(url))}")
+            raise aiohttp.ClientConnectionError(f"Cassette miss: {method} {host}{url.path}")
+
+        start = time.perf_counter()
+        try:
+            response = await original(session, method, str_or_url, **kwargs)
+            content = await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as e:
+            self._record_error(key, method, str(url), e, start)
+            raise
+        text, encoding = Interaction.encode_body(content)
+        self._store(Interaction(
+            key=key,
+            method=method.upper(),
+            url=normalize_url(str(url)),
+            status=response.status,
+            headers={k: v for k, v in response.headers.items() if k.lower() not in DROP_RESPONSE_HEADERS},
+            body=text,
+            body_encoding=encoding,
+            elapsed_ms=(time.perf_counter() - start) * 1000,
+        ))
+        return response
+
+    async def _httpx_request(self, module, transport, request):
+        original = self._originals[module.__name__]
+        key = request_key(request.method, str(request.url), request.content)
+        host = request.url.host or ""
+        self.stats.by_host[host] += 1
+
+        interaction = self._replayable(key)
+        if interaction is not None:
+            await asyncio.sleep(self._delay(host, interaction))
+            if interaction.error:
+                if interaction.error == "timeout":
+                    raise module.ReadTimeout("timeout", request=request)
+                raise module.ConnectError(interaction.error, request=request)
+            return module.Response(
+                interaction.status,
+                headers=interaction.headers,
+                content=interaction.body_bytes(),
+                request=request,
+            )
+        if self.mode == "replay":
+            logger.warning(f"Cassette miss: {request.method} {normalize_url(str(request.url))}")
+            raise module.ConnectError(f"Cassette miss: {request.method} {host}{request.url.path}", request=request)
+
+        start = time.perf_counter()
+        try:
+            response = await original(transport, request)
+            content = await response.aread()
+            await response.aclose()
+        except module.TransportError as e:
+            self._record_error(key, request.method, str(request.url), e, start)
+            raise
+        headers = [(k, v) for k, v in response.headers.items() if k.lower() not in DROP_RESPONSE_HEADERS]
+        text, encoding = Interaction.encode_body(content)
+        self._store(Interaction(
+            key=key,
+            method=request.method,
+            url=normalize_url(str(request.url)),
+            status=response.status_code,
+            headers=dict(headers),
+            body=text,
+            body_encoding=encoding,
+            elapsed_ms=(time.perf_counter() - start) * 1000,
+        ))
+        return module.Response(response.status_code, headers=headers, content=content, request=request)
+
+    def _dns_resolve(self, qname, rdtype="A", *args, **kwargs):
+        original = self._originals["dns"]
+        name = str(qname).rstrip(".").lower()
+        rdtype_name = str(rdtype)
+        url = f"dns://{name}/{rdtype_name}"
+        key = request_key("DNS", url)
+        self.stats.by_host["dns"] += 1
+
+        interaction = self._replayable(key)
+        if interaction is not None:
+            # Lookups are synchronous, so the delay blocks just like the real one
+            time.sleep(self._delay("dns", interaction))
+            if interaction.error:
+                error = getattr(dns.resolver, interaction.error, None) or dns.exception.DNSException
+                raise error()
+            return json.loads(interaction.body)
+        if self.mode == "replay":
+            logger.warning(f"Cassette miss: DNS {name} {rdtype_name}")
+            raise dns.resolver.NoNameservers()
+
+        start = time.perf_counter()
+        try:
+            answer = original(qname, rdtype, *args, **kwargs)
+        except dns.exception.DNSException as e:
+            self._store(Interaction(key=key, method="DNS", url=url, status=0, error=type(e).__name__,
+                                    elapsed_ms=(time.perf_counter() - start) * 1000))
+            raise
+        self._store(Interaction(key=key, method="DNS", url=url, status=200,
+                                body=json.dumps([r.to_text() for r in answer]),
+                                elapsed_ms=(time.perf_counter() - start) * 1000))
+        return answer
+
+    # --- activation ---
+
+    def _patch_httpx(self, module):
+        cassette = self
+        self._originals[module.__name__] = module.AsyncHTTPTransport.handle_async_request
+
+        async def httpx_request(transport, request):
+            return await cassette._httpx_request(module, transport, request)
+
+        module.AsyncHTTPTransport.handle_async_request = httpx_request
+
+    def __enter__(self) -> "Cassette":
+        if Cassette._active is not None:
+            raise RuntimeError("Another cassette is already active")
+        Cassette._active = self
+        if self.mode == "record":
+            self._interactions.clear()
+            self._dirty = True
+        self.rewind()
+
+        cassette = self
+
+        self._originals["aiohttp"] = aiohttp.ClientSession._request
+
+        async def aiohttp_request(session, method, str_or_url, **kwargs):
+            return await cassette._aiohttp_request(session, method, str_or_url, **kwargs)
+
+        aiohttp.ClientSession._request = aiohttp_request
+
+        for module in (httpx, httpx2):
+            if module is not None:
+                self._patch_httpx(module)
+
+        if dns is not None:
+            self._originals["dns"] = dns.resolver.resolve
+
+            def dns_resolve(qname, rdtype="A", *args, **kwargs):
+                return cassette._dns_resolve(qname, rdtype, *args, **kwargs)
+
+            dns.resolver.resolve = dns_resolve
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        aiohttp.ClientSession._request = self._originals.pop("aiohttp")
+        for module in (httpx, httpx2):
+            if module is not None and module.__name__ in self._originals:
+                module.AsyncHTTPTransport.handle_async_request = self._originals.pop(module.__name__)
+        if "dns" in self._originals:
+            dns.resolver.resolve = self._originals.pop("dns")
+        Cassette._active = None
+
+        if self._dirty:
+            self.save()
+            self._dirty = False
+        if self.strict and self.stats.misses and exc_type is None:
+            raise CassetteMiss(f"{self.stats.misses} request(s) not in cassette {self.path}")
+        return False
+
+
+class _ReplayResponse:
+    """The parts of aiohttp.ClientResponse the clients use, backed by a recording"""
+
+    def __init__(self, method: str, url: URL, interaction: Interaction):
+        self.method = method.upper()
+        self.url = url
+        self.real_url = url
+        self.status = interaction.status
+        self.reason = ""
+        self.headers = CIMultiDictProxy(CIMultiDict(interaction.headers))
+        self.history = ()
+        self.closed = False
+        self._body = interaction.body_bytes()
+        self.request_info = aiohttp.RequestInfo(url, self.method, CIMultiDictProxy(CIMultiDict()), url)
+
+    @property
+    def ok(self) -> bool:
+        return self.status < 400
+
+    @property
+    def content_type(self) -> str:
+        return self.headers.get("Content-Type", "application/octet-stream").split(";")[0].strip().lower()
+
+    @property
+    def charset(self) -> str | None:
+        for part in self.headers.get("Content-Type", "").split(";")[1:]:
+            name, _, value = part.partition("=")
+            if name.strip().lower() == "charset":
+                return value.strip().strip('"')
+        return None
+
+    async def read(self) -> bytes:
+        return self._body
+
+    async def text(self, encoding: str | None = None, errors: str = "strict") -> str:
+        return self._body.decode(encoding or self.charset or "utf-8", errors)
+
+    async def json(self, *, encoding: str | None = None, loads=json.loads,
+                   content_type: str | None = "application/json") -> Any:
+        if content_type and content_type not in self.content_type:
+            raise aiohttp.ContentTypeError(
+                self.request_info, self.history, status=self.status, headers=self.headers,
+                message=f"Attempt to decode JSON with unexpected mimetype: {self.content_type}",
+            )
+        text = self._body.decode(encoding or self.charset or "utf-8")
+        return loads(text) if text.strip() else None
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise aiohttp.ClientResponseError(
+                self.request_info, self.history, status=self.status, message=self.reason, headers=self.headers
+            )
+
+    def release(self):
+        self.closed = True
+
+    def close(self):
+        self.closed = True
+
+    async def wait_for_close(self):
+        return None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.release()
@@ -6,16 +6,14 @@ Compares results from multiple sources to identify differences.
 """
 
 import asyncio
-import csv
 import json
 import os
-import zipfile
 from dataclasses import dataclass, field
 from datetime import datetime
-from io import TextIOWrapper
 from pathlib import Path
 from typing import Any
 
+from .linkedin_export import load_connections
 from .multi_source_enricher import MultiSourceEnricher, EnrichedProfile, SourceResult
 
 
@@ -36,6 +34,20 @@ class LinkedInConnection:
         return self.full_name or f"{self.first_name} {self.last_name}".strip()
 
 
+def _connection_from_row(row: dict[str, str]) -> LinkedInConnection:
+    first, last = row['first_name'], row['last_name']
+    return LinkedInConnection(
+        first_name=first.strip(),
+        last_name=last.strip(),
+        full_name=f"{first} {last}".strip(),
+        email=row['email'].strip() or None,
+        company=row['company'].strip() or None,
+        title=row['position'].strip() or None,
+        linkedin_url=row['linkedin_url'].strip() or None,
+        connected_on=row['connected_on'].strip() or None
+    )
+
+
 @dataclass
 class EnrichmentComparison:
     """Comparison of enrichment results for one connection"""
@@ -82,69 +94,34 @@ class CompanyPeopleQATester:
     async def close(self):
         await self.enricher.close()
 
-    def load_linkedin_export(self, zip_path: str) -> list[LinkedInConnection]:
+    def load_linkedin_export(
+        self,
+        zip_path: str,
+        sample_size: int | None = None,
+        seed: int | None = None
+    ) -> list[LinkedInConnection]:
         """
         Load connections from LinkedIn data export ZIP file.
 
+        Connections.csv is streamed from the ZIP. With sample_size only
+        connections with a LinkedIn URL are eligible, and only the
+        reservoir-sampled rows are parsed.
+
         Args:
             zip_path: Path to LinkedIn export ZIP
+            sample_size: If set, return a random sample of this size
+            seed: Random seed for the sample
 
         Returns:
             List of LinkedInConnection objects
         """
-        connections = []
-
-        with zipfile.ZipFile(zip_path, 'r') as zf:
-            # Find Connections.csv in the archive
-            csv_filename = None
-            for name in zf.namelist():
-                if 'Connections' in name and name.endswith('.csv'):
-                    csv_filename = name
-                    break
-
-            if not csv_filename:
-                raise ValueError(f"No Connections.csv found in {zip_path}")
-
-            with zf.open(csv_filename) as f:
-                # LinkedIn CSVs are UTF-8 with BOM sometimes
-                text_file = TextIOWrapper(f, encoding='utf-8-sig')
-                lines = text_file.readlines()
-
-                # Skip header notes (LinkedIn exports have 3 header lines before actual CSV)
-                # Find the line with actual column headers
-                header_idx = 0
-                for i, line in enumerate(lines):
-                    if 'First Name' in line or 'first_name' in line.lower():
-                        header_idx = i
-                        break
-
-                # Parse from header line onwards
-                from io import StringIO
-                csv_content = ''.join(lines[header_idx:])
-                reader = csv.DictReader(StringIO(csv_content))
-
-                for row in reader:
-                    # Handle various column name formats
-                    first = row.get('First Name', row.get('first_name', ''))
-                    last = row.get('Last Name', row.get('last_name', ''))
-                    email = row.get('Email Address', row.get('email', ''))
-                    company = row.get('Company', row.get('company', ''))
-                    title = row.get('Position', row.get('Title', row.get('position', '')))
-                    url = row.get('URL', row.get('Profile URL', row.get('linkedin_url', '')))
-                    connected = row.get('Connected On', row.get('connected_on', ''))
-
-                    connections.append(LinkedInConnection(
-                        first_name=first.strip() if first else '',
-                        last_name=last.strip() if last else '',
-                        full_name=f"{first} {last}".strip() if first or last else '',
-                        email=email.strip() if email else None,
-                        company=company.strip() if company else None,
-                        title=title.strip() if title else None,
-                        linkedin_url=url.strip() if url else None,
-                        connected_on=connected.strip() if connected else None
-                    ))
-
-        return connections
+        return load_connections(
+            zip_path,
+            parse=_connection_from_row,
+            where=(lambda row: bool(row['linkedin_url'].strip())) if sample_size else None,
+            sample_size=sample_size or None,
+            seed=seed,
+        )
 
     def _normalize_for_comparison(self, text: str | None) -> str:
         """Normalize text for comparison"""
@@ -443,14 +420,8 @@ async def main():
 
     try:
         print(f"Loading LinkedIn export: {args.linkedin_export}")
-        connections = tester.load_linkedin_export(args.linkedin_export)
-        print(f"Loaded {len(connections)} connections")
-
-        # Sample if requested
-        if args.sample and args.sample < len(connections):
-            import random
-            connections = random.sample(connections, args.sample)
-            print(f"Sampled {len(connections)} connections")
+        connections = tester.load_linkedin_export(args.linkedin_export, sample_size=args.sample)
+        print(f"Loaded {len(connections)} connections" + (" (sampled)" if args.sample else ""))
 
         # Filter to those with URLs
         connections = [c for c in connections if c.linkedin_url]
@@ -11,13 +11,10 @@ Test Scenarios:
 """
 
 import asyncio
-import csv
-import io
 import os
 import re
 import sys
 import time
-import zipfile
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from difflib import SequenceMatcher
@@ -31,12 +28,14 @@ import pandas as pd
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "contact-finder"))
 
 from .cache import EvaluationCache
+from .ground_truth_builder import intern_field
+from .linkedin_export import load_connections
 from .rapidapi_linkedin import RapidAPILinkedInClient, RapidAPIPersonResult
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class LinkedInContact:
     """A contact from LinkedIn export - ground truth"""
     first_name: str
@@ -53,6 +52,33 @@ class LinkedInContact:
         return bool(self.email)
 
 
+def clean_name(name: str) -> str:
+    """Remove credentials and suffixes from name"""
+    # Remove common credentials
+    credentials = r',?\s*(PMP|CSP-SM|CSP|MBA|PhD|MD|CPA|Esq|Jr|Sr|II|III|IV|A-CSPO|CSPO)\.?'
+    name = re.sub(credentials, '', name, flags=re.IGNORECASE)
+    # Remove trailing commas/spaces
+    name = re.sub(r',\s*$', '', name).strip()
+    return name
+
+
+def contact_from_export_row(row: dict[str, str]) -> LinkedInContact:
+    """LinkedInContact from a canonical export row (see linkedin_export)"""
+    first_name = row["first_name"].strip()
+    # Clean up names with credentials like "PMP, CSP-SM"
+    last_name = clean_name(row["last_name"].strip())
+    return LinkedInContact(
+        first_name=intern_field(first_name),
+        last_name=last_name,
+        full_name=f"{first_name} {last_name}".strip(),
+        linkedin_url=row["linkedin_url"].strip(),
+        email=row["email"].strip() or None,
+        company=intern_field(row["company"].strip() or None),
+        position=intern_field(row["position"].strip() or None),
+        connected_on=intern_field(row["connected_on"].strip() or None)
+    )
+
+
 @dataclass
 class QATestResult:
     """Result of testing one API call against ground truth"""
@@ -154,12 +180,22 @@ class ContactQATester:
     # Ground Truth Loading
     # -------------------------------------------------------------------------
 
-    def load_linkedin_export(self, zip_path: str | Path) -> int:
+    def load_linkedin_export(
+        self,
+        zip_path: str | Path,
+        sample_size: int | None = None,
+        seed: int = 42
+    ) -> int:
         """
         Load LinkedIn connections export as ground truth.
 
+        Connections.csv is streamed from the zip; with sample_size only a
+        reservoir sample of the rows is turned into contacts.
+
         Args:
             zip_path: Path to LinkedIn export zip file
+            sample_size: If set, keep a random sample of this many contacts
+            seed: Random seed for the sample
 
         Returns:
             Number of contacts loaded
@@ -168,45 +204,13 @@ class ContactQATester:
         if not zip_path.exists():
             raise FileNotFoundError(f"LinkedIn export not found: {zip_path}")
 
-        with zipfile.ZipFile(zip_path, 'r') as zf:
-            with zf.open("Connections.csv") as f:
-                content = f.read().decode('utf-8')
-
-        # Skip header notes (first 3-4 lines until "First Name,")
-        lines = content.split('\n')
-        header_idx = 0
-        for i, line in enumerate(lines):
-            if line.startswith("First Name"):
-                header_idx = i
-                break
-
-        csv_content = '\n'.join(lines[header_idx:])
-        reader = csv.DictReader(io.StringIO(csv_content))
-
-        self.ground_truth = []
-        for row in reader:
-            first_name = row.get("First Name", "").strip()
-            last_name = row.get("Last Name", "").strip()
-
-            if not first_name:
-                continue
-
-            # Clean up names with credentials like "PMP, CSP-SM"
-            last_name = self._clean_name(last_name)
-
-            contact = LinkedInContact(
-                first_name=first_name,
-                last_name=last_name,
-                full_name=f"{first_name} {last_name}".strip(),
-                linkedin_url=row.get("URL", "").strip(),
-                email=row.get("Email Address", "").strip() or None,
-                company=row.get("Company", "").strip() or None,
-                position=row.get("Position", "").strip() or None,
-                connected_on=row.get("Connected On", "").strip() or None
-            )
-
-            if contact.linkedin_url:
-                self.ground_truth.append(contact)
+        self.ground_truth = load_connections(
+            zip_path,
+            parse=contact_from_export_row,
+            where=lambda row: bool(row["first_name"].strip() and row["linkedin_url"].strip()),
+            sample_size=sample_size,
+            seed=seed,
+        )
 
         logger.info(f"Loaded {len(self.ground_truth)} contacts from LinkedIn export")
         logger.info(f"  - {sum(1 for c in self.ground_truth if c.has_email)} have verified email")
@@ -215,12 +219,7 @@ class ContactQATester:
 
     def _clean_name(self, name: str) -> str:
         """Remove credentials and suffixes from name"""
-        # Remove common credentials
-        credentials = r',?\s*(PMP|CSP-SM|CSP|MBA|PhD|MD|CPA|Esq|Jr|Sr|II|III|IV|A-CSPO|CSPO)\.?'
-        name = re.sub(credentials, '', name, flags=re.IGNORECASE)
-        # Remove trailing commas/spaces
-        name = re.sub(r',\s*$', '', name).strip()
-        return name
+        return clean_name(name)
 
     def get_contacts_with_email(self) -> list[LinkedInContact]:
         """Get only contacts that have verified email"""
@@ -28,7 +28,7 @@ from .cache import EvaluationCache
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class GroundTruthCompany:
     """A company with ground truth domain and contact data"""
     name: str
@@ -55,7 +55,7 @@ class GroundTruthCompany:
     notes: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class GroundTruthContact:
     """A contact with ground truth data"""
     name: str
@@ -67,6 +67,17 @@ class GroundTruthContact:
     sources: list[str] = field(default_factory=list)
 
 
+def intern_field(value: Any) -> Any:
+    """
+    Shared copy of a repeated string field (city, industry, company, ...)
+
+    Large truth sets repeat a few thousand distinct values across hundreds of
+    thousands of records; interning keeps one string object per value.
+    Non-strings (None, pandas NaN) are returned unchanged.
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
 # Persona title patterns
 PERSONA_PATTERNS = {
     "owner_operator": [
@@ -195,10 +206,10 @@ class GroundTruthBuilder:
         for _, row in df.iterrows():
             company = GroundTruthCompany(
                 name=row["name"],
-                city=row.get("city"),
-                state=row.get("state"),
-                industry=row.get("industry"),
-                size_bucket=row.get("size_bucket"),
+                city=intern_field(row.get("city")),
+                state=intern_field(row.get("state")),
+                industry=intern_field(row.get("industry")),
+                size_bucket=intern_field(row.get("size_bucket")),
             )
             self.companies.append(company)
 
@@ -0,0 +1,157 @@
+"""
+LinkedIn Export Reader
+
+Streams Connections.csv out of a LinkedIn data export ZIP without
+extracting or reading it whole. The QA testers used to read every line,
+search them for the header, then parse all rows into records before
+sampling; for a 30k-connection export that meant 30k records to keep 200.
+
+- The archive member is decoded and parsed as a stream; the notes LinkedIn
+  puts above the header are skipped line by line
+- Rows come out with canonical keys (first_name, last_name, email,
+  company, position, linkedin_url, connected_on) whatever the column
+  spelling in the export
+- load_connections() with a sample_size reservoir-samples the raw rows and
+  only turns the sampled ones into records, so memory stays bounded by the
+  sample size
+
+Usage:
+    for contact in iter_connections(zip_path, parse=to_contact):
+        ...
+
+    sample = load_connections(zip_path, parse=to_contact, sample_size=200, seed=42)
+"""
+
+import csv
+import random
+import zipfile
+from io import TextIOWrapper
+from itertools import chain
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+# Canonical key -> column names seen in exports (first match wins)
+COLUMN_ALIASES = {
+    "first_name": ("First Name", "first_name"),
+    "last_name": ("Last Name", "last_name"),
+    "email": ("Email Address", "email", "Email"),
+    "company": ("Company", "company"),
+    "position": ("Position", "position", "Title"),
+    "linkedin_url": ("URL", "url", "Profile URL", "linkedin_url"),
+    "connected_on": ("Connected On", "connected_on"),
+}
+
+
+def find_connections_csv(zf: zipfile.ZipFile) -> str:
+    """Name of the Connections CSV inside an export archive."""
+    for name in zf.namelist():
+        if "connections" in name.lower() and name.endswith(".csv"):
+            return name
+    raise ValueError(f"No Connections.csv found in {zf.filename}")
+
+
+def _is_header(line: str) -> bool:
+    return "First Name" in line or "first_name" in line.lower()
+
+
+def iter_connection_rows(zip_path: str | Path) -> Iterator[dict[str, str]]:
+    """
+    Rows of the export's Connections.csv, read lazily, with canonical keys.
+
+    Values are the raw cell text ('' when the column is missing or empty).
+    """
+    with zipfile.ZipFile(zip_path, "r") as zf:
+        with zf.open(find_connections_csv(zf)) as f:
+            # LinkedIn CSVs are UTF-8, sometimes with a BOM
+            text = TextIOWrapper(f, encoding="utf-8-sig", newline="")
+
+            # Skip the notes above the column headers
+            header = next((line for line in text if _is_header(line)), None)
+            if header is None:
+                return
+
+            reader = csv.reader(chain([header], text))
+            columns = next(reader)
+            index = {}
+            for key, aliases in COLUMN_ALIASES.items():
+                found = next((columns.index(alias) for alias in aliases if alias in columns), None)
+                if found is not None:
+                    index[key] = found
+
+            for cells in reader:
+                if not cells:
+                    continue
+                yield {
+                    key: cells[index[key]] if key in index and index[key] < len(cells) else ""
+                    for key in COLUMN_ALIASES
+                }
+
+
+def reservoir_sample(items: Iterable[T], k: int, rng: random.Random | None = None) -> list[T]:
+    """
+    Uniform sample of k items from a stream of unknown length (Algorithm R).
+
+    Holds at most k items; returns all of them if the stream is shorter.
+    """
+    rng = rng or random.Random()
+    sample: list[T] = []
+    for i, item in enumerate(items):
+        if i < k:
+            sample.append(item)
+        else:
+            j = rng.randrange(i + 1)
+            if j < k:
+                sample[j] = item
+    return sample
+
+
+def iter_connections(
+    zip_path: str | Path,
+    parse: Callable[[dict[str, str]], T],
+    where: Callable[[dict[str, str]], bool] | None = None
+) -> Iterator[T]:
+    """
+    Typed records from the export, built one row at a time.
+
+    Args:
+        zip_path: LinkedIn export ZIP
+        parse: Builds a record from a canonical row
+        where: Rows to keep (default: all)
+    """
+    for row in iter_connection_rows(zip_path):
+        if where is None or where(row):
+            yield parse(row)
+
+
+def load_connections(
+    zip_path: str | Path,
+    parse: Callable[[dict[str, str]], T],
+    where: Callable[[dict[str, str]], bool] | None = None,
+    sample_size: int | None = None,
+    seed: int | None = None
+) -> list[T]:
+    """
+    Records from the export, or a uniform sample of them.
+
+    With sample_size, rows matching `where` are reservoir-sampled while
+    streaming and only the sampled rows are parsed.
+
+    Args:
+        zip_path: LinkedIn export ZIP
+        parse: Builds a record from a canonical row
+        where: Rows eligible for loading/sampling (default: all)
+        sample_size: Keep a random sample of this many records
+        seed: Random seed for the sample
+
+    Returns:
+        Records in file order (sampled records in reservoir order)
+    """
+    if sample_size is None:
+        return list(iter_connections(zip_path, parse, where))
+
+    rows = iter_connection_rows(zip_path)
+    if where is not None:
+        rows = filter(where, rows)
+    return [parse(row) for row in reservoir_sample(rows, sample_size, random.Random(seed))]
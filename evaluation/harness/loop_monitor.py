@@ -0,0 +1,333 @@
+"""
+Event-loop lag sampling and blocking-call detection.
+
+A timer task asks to wake up every `interval` seconds; how late it
+actually wakes is the loop lag. Lag well above a few milliseconds means
+something ran on the loop without yielding (blocking I/O, DNS lookups,
+CPU-heavy parsing) and every other coroutine waited for it.
+
+LoopMonitor adds a watchdog thread. When the loop has not answered a
+heartbeat for `threshold_ms`, the watchdog captures the loop thread's
+stack while it is still blocked, so the report names the culprit
+(`socket.getaddrinfo` under `utils.verify_dns`), not just the symptom.
+The owning stage is the innermost frame from the pipeline/harness
+sources (contact-finder, domain-resolver, evaluation/harness); the
+innermost frame overall is reported as `blocked_in`.
+
+Usage:
+    async with LoopLagSampler(interval=0.05) as sampler:
+        await pipeline.run("companies.json")
+    print(sampler.summary())
+
+    async with LoopMonitor(threshold_ms=100) as monitor:
+        await resolver.resolve_batch(companies)
+    monitor.write_summary("logs/loop_monitor.json")
+
+The pipeline entry points (domain_resolver.py, contact_finder.py,
+smb_pipeline.py) take `--detect-blocking [MS]` or DETECT_BLOCKING_MS and run
+under detect_blocking(), which logs the worst stages and writes the summary.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+import numpy as np
+
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+_HANDLE_RUN_FILE = asyncio.events.__file__
+STAGE_ROOTS = [PROJECT_ROOT / "contact-finder", PROJECT_ROOT / "domain-resolver", PROJECT_ROOT / "evaluation" / "harness"]
+# Test doubles and instrumentation never own a stage; the caller above them does
+NOT_STAGES = {"loop_monitor.py", "stub_providers.py", "cassette.py"}
+
+
+class LoopLagSampler:
+    """Measures how late the running event loop wakes a periodic timer"""
+
+    def __init__(self, interval: float = 0.05):
+        """
+        Args:
+            interval: Seconds between wake-ups
+        """
+        self.interval = interval
+        self.lags: list[float] = []
+        self._task: asyncio.Task | None = None
+
+    async def _run(self):
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self.lags.append(max(0.0, time.perf_counter() - start - self.interval))
+
+    def start(self):
+        """Start sampling on the running loop."""
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def summary(self) -> dict:
+        """Lag statistics in milliseconds."""
+        if not self.lags:
+            return {"samples": 0, "mean_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+        lags = np.array(self.lags) * 1000
+        return {
+            "samples": len(lags),
+            "mean_ms": round(float(lags.mean()), 2),
+            "p95_ms": round(float(np.percentile(lags, 95)), 2),
+            "max_ms": round(float(lags.max()), 2),
+        }
+
+    async def __aenter__(self) -> "LoopLagSampler":
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.stop()
+        return False
+
+
+@dataclass
+class BlockingCall:
+    """One stretch where the loop did not run anything else"""
+    at_s: float                         # Seconds since the monitor started
+    duration_ms: float
+    stage: str                          # Innermost pipeline frame, e.g. utils.verify_dns
+    blocked_in: str                     # Innermost frame overall
+    task: str | None = None
+    stack: list[str] = field(default_factory=list)
+
+
+def _frame_label(filename: str, name: str, roots: list[Path]) -> str | None:
+    """`module.function` for a frame under one of `roots`, else None."""
+    path = Path(filename).resolve()
+    if path.name in NOT_STAGES:
+        return None
+    for root in roots:
+        try:
+            path.relative_to(root)
+        except ValueError:
+            continue
+        return f"{path.stem}.{name}"
+    return None
+
+
+class LoopMonitor:
+    """
+    Loop lag sampler plus a watchdog that reports blocking calls.
+
+    Opt-in and cheap: one heartbeat callback on the loop every
+    threshold/4 seconds and one polling thread.
+    """
+
+    def __init__(
+        self,
+        threshold_ms: float = 100,
+        interval: float = 0.05,
+        stage_roots: list[str | Path] | None = None,
+        max_events: int = 1000,
+        stack_depth: int = 25
+    ):
+        """
+        Args:
+            threshold_ms: Report callbacks that hold the loop at least this long
+            interval: Loop lag sampling interval (seconds)
+            stage_roots: Source trees whose frames name the owning stage
+            max_events: Keep at most this many events with stacks (all are counted)
+            stack_depth: Frames kept per event
+        """
+        self.threshold_s = threshold_ms / 1000
+        self.sampler = LoopLagSampler(interval)
+        self.stage_roots = [Path(r).resolve() for r in stage_roots] if stage_roots else STAGE_ROOTS
+        self.max_events = max_events
+        self.stack_depth = stack_depth
+        self.events: list[BlockingCall] = []
+        self.by_stage: dict[str, dict] = defaultdict(lambda: {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+        self._tick = max(0.005, self.threshold_s / 4)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+        self._beat = 0.0
+        self._started = 0.0
+        self._pending: BlockingCall | None = None
+        self._pending_since = 0.0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._watchdog: threading.Thread | None = None
+        self._handle: asyncio.TimerHandle | None = None
+
+    # --- loop side ---
+
+    def _heartbeat(self):
+        now = time.perf_counter()
+        with self._lock:
+            pending, self._pending = self._pending, None
+            self._beat = now
+        if pending is not None:
+            pending.duration_ms = round((now - self._pending_since) * 1000, 1)
+            self._record(pending)
+        self._handle = self._loop.call_later(self._tick, self._heartbeat)
+
+    def _record(self, event: BlockingCall):
+        stats = self.by_stage[event.stage]
+        stats["count"] += 1
+        stats["total_ms"] += event.duration_ms
+        stats["max_ms"] = max(stats["max_ms"], event.duration_ms)
+        if len(self.events) < self.max_events:
+            self.events.append(event)
+        logger.warning(
+            f"Event loop blocked {event.duration_ms:.0f}ms in {event.stage} ({event.blocked_in})"
+            + (f" [task {event.task}]" if event.task else "")
+            + "\n" + "".join(event.stack[-8:])
+        )
+
+    # --- watchdog side ---
+
+    def _capture(self, since: float) -> BlockingCall | None:
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is None:
+            return None
+        summary = traceback.extract_stack(frame)
+        # Drop the event loop's own frames above the callback that is running
+        for i in range(len(summary) - 1, -1, -1):
+            if summary[i].name == "_run" and summary[i].filename == _HANDLE_RUN_FILE:
+                summary = summary[i + 1:] or summary
+                break
+        stage = None
+        for entry in reversed(summary):
+            stage = _frame_label(entry.filename, entry.name, self.stage_roots)
+            if stage:
+                break
+        innermost = summary[-1]
+        task = asyncio.tasks._current_tasks.get(self._loop)
+        return BlockingCall(
+            at_s=round(since - self._started, 3),
+            duration_ms=0.0,
+            stage=stage or "unknown",
+            blocked_in=f"{Path(innermost.filename).name}:{innermost.lineno} {innermost.name}",
+            task=task.get_name() if task is not None else None,
+            stack=traceback.format_list(summary[-self.stack_depth:]),
+        )
+
+    def _watch(self):
+        while not self._stop.wait(self._tick):
+            beat = self._beat
+            # One heartbeat period is expected; anything beyond it is blocking
+            if self._pending is None and time.perf_counter() - beat - self._tick >= self.threshold_s:
+                event = self._capture(beat + self._tick)
+                with self._lock:
+                    # Discard if the loop came back while the stack was captured
+                    if event is not None and self._beat == beat:
+                        self._pending_since = beat + self._tick
+                        self._pending = event
+
+    # --- lifecycle ---
+
+    def start(self):
+        """Start monitoring the running loop (call from inside it)."""
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._started = self._beat = time.perf_counter()
+        self.sampler.start()
+        self._handle = self._loop.call_later(self._tick, self._heartbeat)
+        self._stop.clear()
+        self._watchdog = threading.Thread(target=self._watch, name="loop-monitor", daemon=True)
+        self._watchdog.start()
+
+    async def stop(self):
+        self._stop.set()
+        if self._watchdog is not None:
+            self._watchdog.join()
+            self._watchdog = None
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        await self.sampler.stop()
+
+    def summary(self, top: int = 10) -> dict:
+        """Per-run summary: loop lag, blocking totals per stage, worst calls with stacks."""
+        by_stage = {
+            stage: {"count": s["count"], "total_ms": round(s["total_ms"], 1), "max_ms": s["max_ms"]}
+            for stage, s in sorted(self.by_stage.items(), key=lambda kv: -kv[1]["total_ms"])
+        }
+        worst = sorted(self.events, key=lambda e: -e.duration_ms)[:top]
+        return {
+            "threshold_ms": round(self.threshold_s * 1000, 1),
+            "duration_s": round(time.perf_counter() - self._started, 3) if self._started else 0.0,
+            "loop_lag": self.sampler.summary(),
+            "blocking_calls": sum(s["count"] for s in by_stage.values()),
+            "blocked_ms": round(sum(s["total_ms"] for s in by_stage.values()), 1),
+            "by_stage": by_stage,
+            "worst": [asdict(e) for e in worst],
+        }
+
+    def write_summary(self, path: str | Path, **extra) -> Path:
+        """Write summary() (plus `extra` fields) as JSON."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({**extra, **self.summary()}, indent=2) + "\n")
+        return path
+
+    async def __aenter__(self) -> "LoopMonitor":
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.stop()
+        return False
+
+
+DEFAULT_SUMMARY_PATH = "logs/loop_monitor.json"
+
+
+def blocking_threshold_ms(cli_value: float | None = None) -> float | None:
+    """Threshold from --detect-blocking, else DETECT_BLOCKING_MS, else None (off)."""
+    if cli_value is not None:
+        return cli_value
+    env = os.environ.get("DETECT_BLOCKING_MS")
+    return float(env) if env else None
+
+
+@asynccontextmanager
+async def detect_blocking(cli_value: float | None = None, summary_path: str | Path = DEFAULT_SUMMARY_PATH):
+    """
+    Run the block under a LoopMonitor when blocking detection is asked for.
+
+    Yields the monitor (None when off). On exit the per-stage summary is
+    written to summary_path and the worst stages are logged.
+    """
+    threshold_ms = blocking_threshold_ms(cli_value)
+    if threshold_ms is None:
+        yield None
+        return
+
+    async with LoopMonitor(threshold_ms=threshold_ms) as monitor:
+        try:
+            yield monitor
+        finally:
+            summary = monitor.summary()
+            path = monitor.write_summary(summary_path)
+            logger.warning(
+                f"Event loop blocked {summary['blocking_calls']} times "
+                f"(>{threshold_ms:g} ms, {summary['blocked_ms']} ms total); details in {path}"
+            )
+            for stage, stats in list(summary["by_stage"].items())[:5]:
+                logger.warning(f"  {stage}: {stats['count']}x, {stats['total_ms']} ms")
@@ -2,8 +2,17 @@
 Metrics calculation for domain resolver and contact finder evaluation.
 
 Extracted and extended from domain-resolver/test/compare_apis.py
+
+All per-row checks are computed column-wise: domains are normalized as
+string columns, contact lists are exploded into one row per contact, and
+matches are reduced back to one flag per company with groupby. The per-row
+helpers at the bottom are the reference definitions the columnar versions
+reproduce exactly.
 """
 
+import re
+
+import numpy as np
 import pandas as pd
 from dataclasses import dataclass, field
 from typing import Any
@@ -83,26 +92,14 @@ def calculate_domain_metrics(
         return MetricsResult()
 
     # Core correctness flags
-    merged['correct'] = merged.apply(
-        lambda row: _domains_match(row.get('domain'), row.get('expected_domain')),
-        axis=1
-    )
-
-    merged['false_positive'] = merged.apply(
-        lambda row: (pd.notna(row.get('domain')) and
-                    not _domains_match(row.get('domain'), row.get('expected_domain'))),
-        axis=1
-    )
-
-    merged['false_negative'] = merged.apply(
-        lambda row: (pd.isna(row.get('domain')) and pd.notna(row.get('expected_domain'))),
-        axis=1
-    )
+    domain = _column(merged, 'domain')
+    expected = _column(merged, 'expected_domain')
+    correct = _domains_match_columns(domain, expected)
 
-    merged['true_negative'] = merged.apply(
-        lambda row: (pd.isna(row.get('domain')) and pd.isna(row.get('expected_domain'))),
-        axis=1
-    )
+    merged['correct'] = correct.to_numpy()
+    merged['false_positive'] = (domain.notna() & ~correct).to_numpy()
+    merged['false_negative'] = (domain.isna() & expected.notna()).to_numpy()
+    merged['true_negative'] = (domain.isna() & expected.isna()).to_numpy()
 
     # Aggregate counts
     tp = merged['correct'].sum()
@@ -189,9 +186,12 @@ def calculate_contact_metrics(
     # - Person precision: is the contact the right individual?
     # - Email accuracy: does email match or validate?
 
-    merged['persona_found'] = merged.apply(_check_persona_found, axis=1)
-    merged['person_correct'] = merged.apply(_check_person_match, axis=1)
-    merged['email_correct'] = merged.apply(_check_email_match, axis=1)
+    contacts = _explode_contacts(_column(merged, 'contacts'))
+    expected = _explode_contacts(_column(merged, 'expected_contacts'))
+
+    merged['persona_found'] = _persona_found_column(contacts, _column(merged, 'persona_type'), total).to_numpy()
+    merged['person_correct'] = _person_match_column(contacts, expected, total).to_numpy()
+    merged['email_correct'] = _email_match_column(contacts, expected, total).to_numpy()
 
     persona_recall = merged['persona_found'].sum() / total
     person_precision = merged['person_correct'].sum() / merged['persona_found'].sum() if merged['persona_found'].sum() > 0 else 0.0
@@ -256,9 +256,9 @@ def calculate_e2e_metrics(
         "success": 0
     }
 
-    for _, row in merged.iterrows():
-        stage = _attribute_failure_stage(row)
-        error_counts[stage] += 1
+    stages = _attribute_failure_stages(merged)
+    for stage, count in stages.value_counts().items():
+        error_counts[stage] = int(count)
 
     success_rate = error_counts["success"] / total
 
@@ -337,11 +337,14 @@ def _breakdown_by_column(df: pd.DataFrame, col: str, correct_col: str = 'correct
     if col not in df.columns:
         return {}
 
+    # One pass: groups come out in first-appearance order, NaN dropped
+    groups = df.groupby(col, sort=False, dropna=True, observed=True)
+    counts = groups.size()
+    corrects = groups[correct_col].sum() if correct_col in df.columns else pd.Series(0, index=counts.index)
+
     breakdown = {}
-    for val in df[col].dropna().unique():
-        subset = df[df[col] == val]
-        n = len(subset)
-        correct = subset[correct_col].sum() if correct_col in subset.columns else 0
+    for val, n, correct in zip(counts.index, counts.to_numpy(), corrects.to_numpy()):
+        n = int(n)
         breakdown[str(val)] = {
             "count": n,
             "correct": int(correct),
@@ -351,6 +354,134 @@ def _breakdown_by_column(df: pd.DataFrame, col: str, correct_col: str = 'correct
     return breakdown
 
 
+# Columnar checks
+
+PERSONA_PATTERNS = {
+    'owner_operator': ['owner', 'founder', 'ceo', 'president', 'principal', 'managing partner'],
+    'vp_marketing': ['vp marketing', 'head of marketing', 'cmo', 'director marketing', 'vp of marketing'],
+    'vp_sales': ['vp sales', 'head of sales', 'cro', 'director sales', 'vp of sales']
+}
+
+CONTACT_FIELDS = ('title', 'name', 'linkedin_url', 'email')
+
+
+def _column(df: pd.DataFrame, col: str) -> pd.Series:
+    """Column by position (0..n-1), or all-None when missing (like row.get)"""
+    if col not in df.columns:
+        return pd.Series([None] * len(df), dtype=object)
+    return df[col].reset_index(drop=True)
+
+
+def _normalize_domains(domains: pd.Series) -> pd.Series:
+    return (
+        domains.astype(str).str.lower()
+        .str.replace("www.", "", regex=False)
+        .str.rstrip("/").str.strip()
+    )
+
+
+def _domains_match_columns(d1: pd.Series, d2: pd.Series) -> pd.Series:
+    """Column-wise _domains_match"""
+    both = d1.notna() & d2.notna()
+    match = pd.Series(False, index=d1.index)
+    if both.any():
+        match[both] = _normalize_domains(d1[both]).to_numpy() == _normalize_domains(d2[both]).to_numpy()
+    return match
+
+
+def _explode_contacts(lists: pd.Series) -> pd.DataFrame:
+    """
+    One row per contact dict: `row` (position in the merged frame) plus
+    lowercased title/name/linkedin_url/email ('' when missing).
+    """
+    # Empty lists explode to NaN and drop out with the non-dict entries
+    exploded = lists.explode()
+    exploded = exploded[exploded.map(type) == dict]
+    records = exploded.tolist()
+
+    # One flat column per field (same `or ''` fallback as the row helpers)
+    table = pd.DataFrame({'row': exploded.index.to_numpy(dtype=np.int64)})
+    for field_name in CONTACT_FIELDS:
+        table[field_name] = [(r.get(field_name) or '').lower() for r in records]
+    table['linkedin_url'] = table['linkedin_url'].str.rstrip('/')
+    return table
+
+
+def _any_by_row(rows: pd.Series, total: int) -> pd.Series:
+    """Boolean Series of length `total`, True where any of `rows` points"""
+    flags = np.zeros(total, dtype=bool)
+    flags[rows.to_numpy(dtype=np.int64)] = True
+    return pd.Series(flags)
+
+
+def _persona_found_column(contacts: pd.DataFrame, personas: pd.Series, total: int) -> pd.Series:
+    """Column-wise _check_persona_found"""
+    contact_persona = personas.to_numpy()[contacts['row'].to_numpy()] if len(contacts) else np.array([])
+    found = np.zeros(len(contacts), dtype=bool)
+    for persona, patterns in PERSONA_PATTERNS.items():
+        mask = contact_persona == persona
+        if mask.any():
+            pattern = "|".join(re.escape(p) for p in patterns)
+            found[mask] = contacts['title'][mask].str.contains(pattern, regex=True).to_numpy()
+    return _any_by_row(contacts['row'][found], total)
+
+
+def _person_match_column(contacts: pd.DataFrame, expected: pd.DataFrame, total: int) -> pd.Series:
+    """Column-wise _check_person_match over every (contact, expected) pair per row"""
+    pairs = contacts.merge(expected, on='row', suffixes=('_c', '_e'))
+    if pairs.empty:
+        return pd.Series(np.zeros(total, dtype=bool))
+
+    li_match = (pairs['linkedin_url_c'] != '') & (pairs['linkedin_url_c'] == pairs['linkedin_url_e'])
+    names = (pairs['name_c'] != '') & (pairs['name_e'] != '') & ~li_match
+    # Containment has no vectorized form; only the pairs that need it are checked
+    name_match = np.zeros(len(pairs), dtype=bool)
+    name_match[names.to_numpy()] = [
+        c in e or e in c
+        for c, e in zip(pairs['name_c'][names], pairs['name_e'][names])
+    ]
+    return _any_by_row(pairs['row'][li_match.to_numpy() | name_match], total)
+
+
+def _email_match_column(contacts: pd.DataFrame, expected: pd.DataFrame, total: int) -> pd.Series:
+    """Column-wise _check_email_match (missing emails compare as '', as in the row version)"""
+    shared = contacts[['row', 'email']].merge(expected[['row', 'email']], on=['row', 'email'])
+    return _any_by_row(shared['row'], total)
+
+
+def _truthy(df: pd.DataFrame, col: str) -> np.ndarray:
+    """Python truthiness of a column (False when missing), like `not row.get(col, False)`"""
+    if col not in df.columns:
+        return np.zeros(len(df), dtype=bool)
+    return df[col].to_numpy().astype(bool)
+
+
+def _attribute_failure_stages(merged: pd.DataFrame) -> pd.Series:
+    """Column-wise _attribute_failure_stage"""
+    domain_found = _column(merged, 'domain').notna().to_numpy()
+    if 'contacts' in merged.columns:
+        contacts_found = (merged['contacts'].map(len) > 0).to_numpy()
+    else:
+        contacts_found = np.zeros(len(merged), dtype=bool)
+
+    stages = np.select(
+        [
+            ~domain_found,
+            ~_truthy(merged, 'domain_correct'),
+            ~contacts_found,
+            ~_truthy(merged, 'persona_found'),
+            ~_truthy(merged, 'person_correct'),
+            ~_truthy(merged, 'email_correct'),
+        ],
+        ["domain_missing", "domain_wrong", "contact_not_found", "wrong_persona", "wrong_person", "email_invalid"],
+        default="success"
+    )
+    return pd.Series(stages)
+
+
+# Per-row reference checks
+
+
 def _check_persona_found(row) -> bool:
     """Check if at least one contact matches target persona"""
     contacts = row.get('contacts', [])
@@ -359,14 +490,7 @@ def _check_persona_found(row) -> bool:
     if not contacts or not target_persona:
         return False
 
-    # Define title patterns per persona
-    persona_patterns = {
-        'owner_operator': ['owner', 'founder', 'ceo', 'president', 'principal', 'managing partner'],
-        'vp_marketing': ['vp marketing', 'head of marketing', 'cmo', 'director marketing', 'vp of marketing'],
-        'vp_sales': ['vp sales', 'head of sales', 'cro', 'director sales', 'vp of sales']
-    }
-
-    patterns = persona_patterns.get(target_persona, [])
+    patterns = PERSONA_PATTERNS.get(target_persona, [])
 
     for contact in contacts:
         title = (contact.get('title') or '').lower()
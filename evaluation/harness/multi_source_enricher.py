@@ -20,17 +20,13 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspa
 
 from evaluation.harness.rapidapi_linkedin import RapidAPILinkedInClient, RapidAPIPersonResult
 
-# Import scrapin from contact-finder (hyphen in directory name)
-import importlib.util
-_scrapin_path = os.path.join(
+# Import scrapin from contact-finder (hyphen in directory name: add it to the path)
+sys.path.insert(0, os.path.join(
     os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
-    "contact-finder", "modules", "enrichment", "scrapin.py"
-)
-_spec = importlib.util.spec_from_file_location("scrapin", _scrapin_path)
-_scrapin_module = importlib.util.module_from_spec(_spec)
-_spec.loader.exec_module(_scrapin_module)
-ScrapinClient = _scrapin_module.ScrapinClient
-ScrapinPersonProfile = _scrapin_module.ScrapinPersonProfile
+    "contact-finder"
+))
+from modules.enrichment.scrapin import ScrapinClient, ScrapinPersonProfile
+from modules.enrichment.profile_store import ProfileStore
 
 
 @dataclass
@@ -110,10 +106,13 @@ class MultiSourceEnricher:
         self,
         rapidapi_key: str | None = None,
         scrapin_key: str | None = None,
-        timeout: int = 30
+        timeout: int = 30,
+        profile_store: ProfileStore | None = None
     ):
-        self.rapidapi = RapidAPILinkedInClient(rapidapi_key, timeout) if rapidapi_key else None
-        self.scrapin = ScrapinClient(scrapin_key, timeout) if scrapin_key else None
+        self.rapidapi = (
+            RapidAPILinkedInClient(rapidapi_key, timeout, profile_store=profile_store) if rapidapi_key else None
+        )
+        self.scrapin = ScrapinClient(scrapin_key, timeout, profile_store=profile_store) if scrapin_key else None
         self.timeout = timeout
 
     async def close(self):
@@ -313,16 +312,20 @@ class MultiSourceEnricher:
     async def enrich_batch(
         self,
         linkedin_urls: list[str],
-        concurrency: int = 5,
-        delay_between: float = 0.5
+        concurrency: int = 10,
+        delay_between: float = 0.0
     ) -> list[EnrichedProfile]:
         """
-        Enrich multiple profiles with rate limiting.
+        Enrich multiple profiles.
+
+        Provider pacing is left to each client's limiter (RapidAPI's
+        AdaptiveRateLimiter ramps up and backs off on 429s), so the batch
+        only bounds how many profiles are in progress at once.
 
         Args:
             linkedin_urls: List of LinkedIn URLs
-            concurrency: Max concurrent enrichments
-            delay_between: Delay between batches (seconds)
+            concurrency: Max profiles in progress
+            delay_between: Optional fixed pause after each profile (seconds)
 
         Returns:
             List of EnrichedProfile results
@@ -333,7 +336,8 @@ class MultiSourceEnricher:
         async def enrich_with_limit(url: str) -> EnrichedProfile:
             async with semaphore:
                 result = await self.enrich(url)
-                await asyncio.sleep(delay_between)
+                if delay_between:
+                    await asyncio.sleep(delay_between)
                 return result
 
         tasks = [enrich_with_limit(url) for url in linkedin_urls]
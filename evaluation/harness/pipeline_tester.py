@@ -10,54 +10,32 @@ Ground truth: LinkedIn connections export
 """
 
 import asyncio
-import csv
 import json
-import zipfile
 import os
 import sys
 from dataclasses import dataclass, field
 from datetime import datetime
-from io import TextIOWrapper, StringIO
 from typing import Any
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
+from evaluation.harness.linkedin_export import load_connections
 from evaluation.harness.rapidapi_linkedin import RapidAPILinkedInClient, RapidAPIPersonResult
 
-# Import Scrapin client
-import importlib.util
-_scrapin_path = os.path.join(
+# Import contact-finder clients (hyphen in directory name: add it to the path)
+sys.path.insert(0, os.path.join(
     os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
-    "contact-finder", "modules", "enrichment", "scrapin.py"
+    "contact-finder"
+))
+from modules.enrichment.scrapin import ScrapinClient
+from modules.enrichment.leadmagic import LeadMagicClient
+from modules.discovery.openweb_ninja import (
+    OpenWebNinjaClient,
+    LocalBusinessResult,
+    OpenWebContactResult,
+    SocialLinksResult,
 )
-_spec = importlib.util.spec_from_file_location("scrapin", _scrapin_path)
-_scrapin_module = importlib.util.module_from_spec(_spec)
-_spec.loader.exec_module(_scrapin_module)
-ScrapinClient = _scrapin_module.ScrapinClient
-
-# Import LeadMagic client
-_leadmagic_path = os.path.join(
-    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
-    "contact-finder", "modules", "enrichment", "leadmagic.py"
-)
-_lm_spec = importlib.util.spec_from_file_location("leadmagic", _leadmagic_path)
-_leadmagic_module = importlib.util.module_from_spec(_lm_spec)
-_lm_spec.loader.exec_module(_leadmagic_module)
-LeadMagicClient = _leadmagic_module.LeadMagicClient
-
-# Import OpenWeb Ninja client
-_openweb_path = os.path.join(
-    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
-    "contact-finder", "modules", "discovery", "openweb_ninja.py"
-)
-_openweb_spec = importlib.util.spec_from_file_location("openweb_ninja", _openweb_path)
-_openweb_module = importlib.util.module_from_spec(_openweb_spec)
-_openweb_spec.loader.exec_module(_openweb_module)
-OpenWebNinjaClient = _openweb_module.OpenWebNinjaClient
-LocalBusinessResult = _openweb_module.LocalBusinessResult
-OpenWebContactResult = _openweb_module.OpenWebContactResult
-SocialLinksResult = _openweb_module.SocialLinksResult
 
 
 @dataclass
@@ -73,6 +51,20 @@ class LinkedInConnection:
     connected_on: str | None = None
 
 
+def _connection_from_row(row: dict[str, str]) -> LinkedInConnection:
+    first, last = row['first_name'], row['last_name']
+    return LinkedInConnection(
+        first_name=first.strip(),
+        last_name=last.strip(),
+        full_name=f"{first} {last}".strip(),
+        company=row['company'].strip(),
+        title=row['position'].strip(),
+        linkedin_url=row['linkedin_url'].strip(),
+        email=row['email'].strip() or None,
+        connected_on=row['connected_on'].strip() or None,
+    )
+
+
 @dataclass
 class EnrichmentResult:
     """Result from a single enrichment source"""
@@ -184,71 +176,32 @@ class PipelineTester:
             await self._openweb_ninja.close()
 
     @staticmethod
-    def load_linkedin_export(zip_path: str, sample_size: int | None = None) -> list[LinkedInConnection]:
+    def load_linkedin_export(
+        zip_path: str,
+        sample_size: int | None = None,
+        seed: int | None = None
+    ) -> list[LinkedInConnection]:
         """
         Load LinkedIn connections from export ZIP file.
 
+        Connections.csv is streamed from the ZIP; with sample_size the rows
+        are reservoir-sampled and only the sample is parsed.
+
         Args:
             zip_path: Path to LinkedIn export ZIP
             sample_size: If set, return random sample of this size
+            seed: Random seed for the sample
 
         Returns:
             List of LinkedInConnection objects
         """
-        connections = []
-
-        with zipfile.ZipFile(zip_path, 'r') as zf:
-            # Find Connections.csv
-            csv_files = [f for f in zf.namelist() if 'connections' in f.lower() and f.endswith('.csv')]
-            if not csv_files:
-                raise ValueError(f"No Connections.csv found in {zip_path}")
-
-            csv_filename = csv_files[0]
-
-            with zf.open(csv_filename) as f:
-                text_file = TextIOWrapper(f, encoding='utf-8-sig')
-                lines = text_file.readlines()
-
-                # Skip header notes (LinkedIn exports have notes before actual CSV)
-                header_idx = 0
-                for i, line in enumerate(lines):
-                    if 'First Name' in line or 'first_name' in line.lower():
-                        header_idx = i
-                        break
-
-                csv_content = ''.join(lines[header_idx:])
-                reader = csv.DictReader(StringIO(csv_content))
-
-                for row in reader:
-                    # Handle various column name formats
-                    first = row.get('First Name', row.get('first_name', ''))
-                    last = row.get('Last Name', row.get('last_name', ''))
-                    company = row.get('Company', row.get('company', ''))
-                    title = row.get('Position', row.get('position', row.get('Title', '')))
-                    email = row.get('Email Address', row.get('email', row.get('Email', '')))
-                    url = row.get('URL', row.get('url', row.get('Profile URL', '')))
-                    connected = row.get('Connected On', row.get('connected_on', ''))
-
-                    if not url or 'linkedin.com' not in url:
-                        continue
-
-                    connections.append(LinkedInConnection(
-                        first_name=first.strip() if first else '',
-                        last_name=last.strip() if last else '',
-                        full_name=f"{first} {last}".strip() if first or last else '',
-                        company=company.strip() if company else '',
-                        title=title.strip() if title else '',
-                        linkedin_url=url.strip(),
-                        email=email.strip() if email else None,
-                        connected_on=connected.strip() if connected else None,
-                    ))
-
-        # Sample if requested
-        if sample_size and sample_size < len(connections):
-            import random
-            connections = random.sample(connections, sample_size)
-
-        return connections
+        return load_connections(
+            zip_path,
+            parse=_connection_from_row,
+            where=lambda row: 'linkedin.com' in row['linkedin_url'],
+            sample_size=sample_size or None,
+            seed=seed,
+        )
 
     async def enrich_with_rapidapi(self, linkedin_url: str) -> EnrichmentResult:
         """Enrich a LinkedIn URL using RapidAPI"""
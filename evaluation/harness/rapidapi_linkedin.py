@@ -5,14 +5,28 @@ https://rapidapi.com/freshdata-freshdata-default/api/linkedin-data-scraper
 Endpoints:
 - POST /person - Get person details from LinkedIn URL
 
-Rate Limit: 1 concurrent request, use semaphore and delays.
+Rate Limit: ~1 request/second on the basic plan. Requests are paced by an
+AdaptiveRateLimiter that starts there and ramps up while the plan allows,
+backing off on 429 / Retry-After.
 """
 
 import aiohttp
 import asyncio
+import os
 import re
+import sys
+import time
 from dataclasses import dataclass
 
+# Shared profile store lives in contact-finder (hyphen in directory name: add it to the path)
+sys.path.insert(0, os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "contact-finder"
+))
+from modules.enrichment.profile_store import ProfileStore, get_profile_store
+
+from .rate_limiter import AdaptiveRateLimiter
+
 
 @dataclass
 class RapidAPIPersonResult:
@@ -64,14 +78,23 @@ class RapidAPILinkedInClient:
     BASE_URL = "https://realtime-linkedin-fresh-data.p.rapidapi.com"
     HOST = "realtime-linkedin-fresh-data.p.rapidapi.com"
 
-    def __init__(self, api_key: str, timeout: int = 30):
+    def __init__(
+        self,
+        api_key: str,
+        timeout: int = 30,
+        profile_store: ProfileStore | None = None,
+        limiter: AdaptiveRateLimiter | None = None,
+        max_retries: int = 3
+    ):
         self.api_key = api_key
         self.timeout = timeout
+        self.profile_store = profile_store
+        self.max_retries = max_retries
         self._session: aiohttp.ClientSession | None = None
-        # Rate limit: 1 concurrent request, 1 request per second
-        self._semaphore = asyncio.Semaphore(1)
-        self._last_request_time = 0
-        self._min_delay = 1.5  # 1.5s between requests (rate limit is 1/sec)
+        # Starts at the documented 1 request/second, adapts from there
+        self.limiter = limiter or AdaptiveRateLimiter(
+            initial_rate=1.0, max_rate=10.0, initial_concurrency=1, max_concurrency=5
+        )
 
     async def _get_session(self) -> aiohttp.ClientSession:
         if self._session is None or self._session.closed:
@@ -89,36 +112,30 @@ class RapidAPILinkedInClient:
         if self._session and not self._session.closed:
             await self._session.close()
 
-    async def _rate_limit(self):
-        """Enforce rate limiting"""
-        import time
-        now = time.time()
-        elapsed = now - self._last_request_time
-        if elapsed < self._min_delay:
-            await asyncio.sleep(self._min_delay - elapsed)
-        self._last_request_time = time.time()
-
     async def _post(self, endpoint: str, json_body: dict) -> tuple[dict, int]:
         """
-        Make a POST request to RapidAPI.
+        Make a POST request to RapidAPI, retrying 429s after the limiter's backoff.
         Returns (response_dict, status_code)
         """
-        async with self._semaphore:
-            await self._rate_limit()
-
+        for _ in range(self.max_retries):
+            result, status = await self._post_once(endpoint, json_body)
+            if status != 429:
+                return result, status
+        return result, status
+
+    async def _post_once(self, endpoint: str, json_body: dict) -> tuple[dict, int]:
+        async with self.limiter.slot():
             session = await self._get_session()
             url = f"{self.BASE_URL}{endpoint}"
 
-            import time
             start = time.time()
 
             try:
                 async with session.post(url, json=json_body) as response:
                     latency = int((time.time() - start) * 1000)
+                    self.limiter.record(response.status, response.headers)
 
                     if response.status == 429:
-                        # Rate limited - back off
-                        self._min_delay = min(self._min_delay * 2, 10.0)
                         return {"error": "rate_limited"}, response.status
 
                     if response.status == 401:
@@ -136,8 +153,10 @@ class RapidAPILinkedInClient:
                     return result, response.status
 
             except asyncio.TimeoutError:
+                self.limiter.record(0)
                 return {"error": "timeout"}, 0
             except Exception as e:
+                self.limiter.record(0)
                 return {"error": str(e)}, 0
 
     def _extract_username(self, linkedin_url: str) -> str | None:
@@ -181,8 +200,14 @@ class RapidAPILinkedInClient:
             else:
                 linkedin_url = f"https://{linkedin_url}"
 
-        # Use POST /person with {"link": url}
-        result, status = await self._post("/person", {"link": linkedin_url})
+        # Profiles already fetched (by any pipeline) are reused within their TTL
+        store = self.profile_store or get_profile_store()
+        cached = await asyncio.to_thread(store.get_response, linkedin_url, "rapidapi_person") if store else None
+        if cached is not None:
+            result = cached
+        else:
+            # Use POST /person with {"link": url}
+            result, status = await self._post("/person", {"link": linkedin_url})
 
         latency = result.pop("_latency_ms", 0)
 
@@ -252,6 +277,17 @@ class RapidAPILinkedInClient:
                 None
             )
 
+        location = data.get("location") or data.get("city")
+        if store and cached is None and full_name:
+            await asyncio.to_thread(store.put_response, linkedin_url, "rapidapi_person", result, fields={
+                "name": full_name,
+                "first_name": first_name,
+                "last_name": last_name,
+                "title": title,
+                "company": company,
+                "location": location,
+            })
+
         return RapidAPIPersonResult(
             name=full_name,
             first_name=first_name,
@@ -259,7 +295,7 @@ class RapidAPILinkedInClient:
             title=title,
             company=company,
             linkedin_url=data.get("linkedin_url") or linkedin_url,
-            location=data.get("location") or data.get("city"),
+            location=location,
             status="success" if full_name else "no_data",
             latency_ms=latency,
             raw_response=result
@@ -0,0 +1,230 @@
+"""
+Adaptive Rate Limiter
+
+AIMD (additive-increase / multiplicative-decrease) limiter for providers
+whose real limits are unknown or change with the plan:
+
+- Pacing: requests start on evenly spaced slots at `rate` per second, with
+  at most `concurrency` in flight.
+- Increase: until the first 429 the rate grows geometrically (slow start,
+  x`slow_start` per success) to find the ceiling quickly; after that every
+  success nudges it up by `rate_step`. Each full window of successes (one
+  per in-flight slot) adds one to concurrency, up to the configured maxima.
+- Decrease: a 429 halves rate and concurrency (`backoff`) and pauses new
+  starts for the Retry-After period (or one slot when there is none).
+- Headers: X-RateLimit-* / RateLimit-* remaining/reset headers are honoured;
+  when the provider says the window is used up, starts pause until reset.
+
+Usage:
+    limiter = AdaptiveRateLimiter(initial_rate=1.0, max_rate=10, max_concurrency=5)
+
+    async with limiter.slot():
+        async with session.post(url, json=body) as response:
+            limiter.record(response.status, response.headers)
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Mapping
+
+
+REMAINING_HEADERS = (
+    "x-ratelimit-requests-remaining",   # RapidAPI
+    "x-ratelimit-remaining",
+    "ratelimit-remaining",
+)
+RESET_HEADERS = (
+    "x-ratelimit-requests-reset",
+    "x-ratelimit-reset",
+    "ratelimit-reset",
+)
+
+
+def _header(headers: Mapping, names: tuple[str, ...]) -> str | None:
+    lowered = {k.lower(): v for k, v in headers.items()}
+    for name in names:
+        if name in lowered:
+            return lowered[name]
+    return None
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a Retry-After value (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_reset(value: str | None) -> float | None:
+    """Seconds until a rate-limit window resets (delta seconds or epoch seconds)."""
+    if not value:
+        return None
+    try:
+        reset = float(value)
+    except ValueError:
+        return None
+    # Large values are absolute epoch timestamps
+    if reset > 1e9:
+        reset -= time.time()
+    return max(0.0, reset)
+
+
+@dataclass
+class LimiterStats:
+    """Counters since the limiter was created"""
+    calls: int = 0
+    throttled: int = 0          # 429 responses
+    pauses: int = 0             # Pauses from Retry-After / exhausted windows
+    peak_rate: float = 0.0
+    peak_concurrency: int = 0
+
+
+class AdaptiveRateLimiter:
+    """
+    Shared pacing for one provider; ramps up while the provider keeps
+    answering and backs off on throttling.
+
+    One instance should be shared by every caller of the same API key.
+    """
+
+    def __init__(
+        self,
+        initial_rate: float = 1.0,
+        min_rate: float = 0.1,
+        max_rate: float = 20.0,
+        initial_concurrency: int = 1,
+        max_concurrency: int = 10,
+        rate_step: float = 0.1,
+        backoff: float = 0.5,
+        slow_start: float = 1.25
+    ):
+        """
+        Args:
+            initial_rate: Starting requests per second
+            min_rate / max_rate: Bounds for the adapted rate
+            initial_concurrency: Starting number of requests in flight
+            max_concurrency: Upper bound for requests in flight
+            rate_step: Requests/second added after each success
+            backoff: Factor applied to rate and concurrency on a 429
+            slow_start: Rate multiplier per success until the first 429
+        """
+        self.rate = initial_rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.concurrency = initial_concurrency
+        self.max_concurrency = max_concurrency
+        self.rate_step = rate_step
+        self.backoff = backoff
+        self.slow_start = slow_start
+        self._probing = True
+        self.stats = LimiterStats(peak_rate=initial_rate, peak_concurrency=initial_concurrency)
+        self._in_flight = 0
+        self._next_start = 0.0
+        self._paused_until = 0.0
+        self._window_successes = 0
+        self._released = asyncio.Event()
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @asynccontextmanager
+    async def slot(self):
+        """Wait for a concurrency slot and a rate slot, then hold it for one request."""
+        while self._in_flight >= self.concurrency:
+            self._released.clear()
+            await self._released.wait()
+        self._in_flight += 1
+        try:
+            await self._wait_for_start()
+            self.stats.calls += 1
+            yield self
+        finally:
+            self._in_flight -= 1
+            self._released.set()
+
+    async def _wait_for_start(self):
+        while True:
+            # Claim the next start slot, then sleep until it
+            now = time.monotonic()
+            start = max(now, self._next_start, self._paused_until)
+            self._next_start = start + 1.0 / self.rate
+            if start <= now:
+                return
+            await asyncio.sleep(start - now)
+            # A 429 that arrived while we slept moves the start back
+            if self._paused_until <= time.monotonic():
+                return
+
+    def pause(self, seconds: float):
+        """Hold back all new starts for `seconds`."""
+        until = time.monotonic() + seconds
+        if until > self._paused_until:
+            self._paused_until = until
+            self.stats.pauses += 1
+
+    def record(self, status: int, headers: Mapping | None = None):
+        """
+        Feed back one response.
+
+        Args:
+            status: HTTP status (0 for transport errors/timeouts)
+            headers: Response headers (Retry-After, X-RateLimit-*)
+        """
+        headers = headers or {}
+
+        if status == 429:
+            self.stats.throttled += 1
+            self.rate = max(self.min_rate, self.rate * self.backoff)
+            self.concurrency = max(1, int(self.concurrency * self.backoff))
+            self._window_successes = 0
+            self._probing = False
+            retry_after = parse_retry_after(_header(headers, ("retry-after",)))
+            self.pause(retry_after if retry_after is not None else 1.0 / self.rate)
+            return
+
+        remaining = _header(headers, REMAINING_HEADERS)
+        if remaining is not None and remaining.strip() in ("0", "0.0"):
+            # At the ceiling: stop probing and wait out the window
+            self._probing = False
+            reset = parse_reset(_header(headers, RESET_HEADERS))
+            if reset:
+                self.pause(reset)
+            return
+
+        # Errors say nothing about the rate limit
+        if status == 0 or status >= 500:
+            return
+
+        increased = self.rate * self.slow_start if self._probing else self.rate + self.rate_step
+        self.rate = min(self.max_rate, increased)
+        self._window_successes += 1
+        if self._window_successes >= self.concurrency and self.concurrency < self.max_concurrency:
+            self.concurrency += 1
+            self._window_successes = 0
+            # More room: wake anyone waiting for a slot
+            self._released.set()
+        self.stats.peak_rate = max(self.stats.peak_rate, self.rate)
+        self.stats.peak_concurrency = max(self.stats.peak_concurrency, self.concurrency)
+
+    def snapshot(self) -> dict:
+        return {
+            "rate": round(self.rate, 3),
+            "concurrency": self.concurrency,
+            "in_flight": self._in_flight,
+            "calls": self.stats.calls,
+            "throttled": self.stats.throttled,
+            "pauses": self.stats.pauses,
+            "peak_rate": round(self.stats.peak_rate, 3),
+            "peak_concurrency": self.stats.peak_concurrency,
+        }
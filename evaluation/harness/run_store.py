@@ -0,0 +1,422 @@
+"""
+Partitioned Parquet store for evaluation run outputs.
+
+Every evaluation script can append its results here instead of (or as well
+as) writing its own CSV/JSON. Data is laid out as hive partitions:
+
+    <root>/
+        _runs.jsonl                                  # one line per append
+        companies/_schema.arrow                      # stable table schema
+        companies/run_id=<id>/pipeline=<p>/vertical=<v>/part-*.parquet
+        contacts/...
+        <other table>/...
+
+- companies / contacts: SMB pipeline results (the JSON written by
+  run_smb_v2_test.py) flattened to one row per company and one row per
+  contact, with fixed schemas. Fields outside the schema are kept in an
+  `extra` JSON column, so load_results() round-trips the original dicts.
+- Any other table (domain_results, qa_scores, ...) takes a DataFrame. Its
+  schema is fixed by the first append; later appends may add columns
+  (older files read them as null) but may not change a column's type.
+
+Reads go through pyarrow.dataset: only the requested columns are read and
+run/pipeline/vertical filters prune whole partitions before any file is
+opened.
+
+Usage:
+    store = RunStore("./evaluation/data/run_store")
+    run_id = store.new_run_id("smb_v2")
+    store.append_results(results, run_id=run_id, pipeline="smb_v2")
+
+    df = store.load("companies", columns=["company_name", "valid_contacts"],
+                    verticals=["plumbing", "hvac"])
+"""
+
+import json
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterable
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+
+PARTITION_SCHEMA = pa.schema([
+    ("run_id", pa.string()),
+    ("pipeline", pa.string()),
+    ("vertical", pa.string()),
+])
+PARTITION_COLUMNS = PARTITION_SCHEMA.names
+UNKNOWN_VERTICAL = "unknown"
+
+COMPANY_SCHEMA = pa.schema([
+    ("company_id", pa.string()),
+    ("company_name", pa.string()),
+    ("domain", pa.string()),
+    ("city", pa.string()),
+    ("state", pa.string()),
+    ("contacts_found", pa.int32()),
+    ("valid_contacts", pa.int32()),
+    ("best_confidence", pa.float64()),
+    ("stages_completed", pa.list_(pa.string())),
+    ("errors", pa.list_(pa.string())),
+    ("processing_time_ms", pa.float64()),
+    ("extra", pa.string()),
+])
+
+CONTACT_SCHEMA = pa.schema([
+    ("company_id", pa.string()),
+    ("contact_index", pa.int32()),
+    ("company_name", pa.string()),
+    ("name", pa.string()),
+    ("title", pa.string()),
+    ("email", pa.string()),
+    ("phone", pa.string()),
+    ("linkedin_url", pa.string()),
+    ("sources", pa.list_(pa.string())),
+    ("is_valid", pa.bool_()),
+    ("confidence", pa.float64()),
+    ("validation_score", pa.float64()),
+    ("validation_reasons", pa.list_(pa.string())),
+    ("extra", pa.string()),
+])
+
+FIXED_SCHEMAS = {"companies": COMPANY_SCHEMA, "contacts": CONTACT_SCHEMA}
+
+# Company fields stored in their own columns (the rest go to `extra`)
+_COMPANY_FIELDS = {"company_name", "domain", "city", "state", "vertical", "stages_completed",
+                   "errors", "processing_time_ms", "contacts"}
+_CONTACT_FIELDS = {"name", "title", "email", "phone", "linkedin_url", "sources", "is_valid",
+                   "confidence", "validation_score", "validation_reasons"}
+
+
+def _str(value) -> str | None:
+    return None if value is None else str(value)
+
+
+def _float(value) -> float | None:
+    try:
+        return None if value is None else float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _str_list(value) -> list[str]:
+    return [str(v) for v in value] if isinstance(value, (list, tuple)) else []
+
+
+def _extra(record: dict, known: set) -> str | None:
+    extra = {k: v for k, v in record.items() if k not in known}
+    return json.dumps(extra, default=str) if extra else None
+
+
+def _vertical(value) -> str:
+    return str(value) if value not in (None, "") and not pd.isna(value) else UNKNOWN_VERTICAL
+
+
+class RunStore:
+    """Append-only, partitioned Parquet store shared by evaluation scripts."""
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def new_run_id(prefix: str = "run") -> str:
+        return f"{prefix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+
+    # --- schema ---
+
+    def _schema_path(self, table: str) -> Path:
+        return self.root / table / "_schema.arrow"
+
+    def schema(self, table: str) -> pa.Schema | None:
+        """Stored data schema of `table` (without partition columns), or None if empty."""
+        path = self._schema_path(table)
+        if path.exists():
+            return pa.ipc.read_schema(pa.py_buffer(path.read_bytes()))
+        return FIXED_SCHEMAS.get(table)
+
+    def _save_schema(self, table: str, schema: pa.Schema):
+        path = self._schema_path(table)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(schema.serialize().to_pybytes())
+
+    # --- writes ---
+
+    def _write(self, table: str, data: pa.Table, run_id: str, pipeline: str,
+               verticals: list[str], meta: dict | None):
+        data = (
+            data.append_column("run_id", pa.array([run_id] * len(data), pa.string()))
+            .append_column("pipeline", pa.array([pipeline] * len(data), pa.string()))
+            .append_column("vertical", pa.array(verticals, pa.string()))
+        )
+        ds.write_dataset(
+            data,
+            self.root / table,
+            format="parquet",
+            partitioning=ds.partitioning(PARTITION_SCHEMA, flavor="hive"),
+            basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+            existing_data_behavior="overwrite_or_ignore",
+        )
+        with open(self.root / "_runs.jsonl", "a", encoding="utf-8") as f:
+            f.write(json.dumps({
+                "run_id": run_id,
+                "pipeline": pipeline,
+                "table": table,
+                "rows": len(data),
+                "created_at": datetime.now().isoformat(),
+                "meta": meta or {},
+            }, default=str) + "\n")
+
+    def append_results(
+        self,
+        results: Iterable[dict],
+        run_id: str,
+        pipeline: str,
+        meta: dict | None = None
+    ) -> int:
+        """
+        Append SMB pipeline result dicts (company + nested contacts).
+
+        Returns:
+            Number of companies written
+        """
+        batch = uuid.uuid4().hex[:8]
+        companies, company_verticals = [], []
+        contacts, contact_verticals = [], []
+
+        for i, result in enumerate(results):
+            company_id = f"{batch}-{i}"
+            vertical = _vertical(result.get("vertical"))
+            result_contacts = result.get("contacts") or []
+            confidences = [_float(c.get("confidence")) for c in result_contacts]
+            confidences = [c for c in confidences if c is not None]
+
+            companies.append({
+                "company_id": company_id,
+                "company_name": _str(result.get("company_name")),
+                "domain": _str(result.get("domain")),
+                "city": _str(result.get("city")),
+                "state": _str(result.get("state")),
+                "contacts_found": len(result_contacts),
+                "valid_contacts": sum(1 for c in result_contacts if c.get("is_valid")),
+                "best_confidence": max(confidences) if confidences else None,
+                "stages_completed": _str_list(result.get("stages_completed")),
+                "errors": _str_list(result.get("errors")),
+                "processing_time_ms": _float(result.get("processing_time_ms")),
+                "extra": _extra(result, _COMPANY_FIELDS),
+            })
+            company_verticals.append(vertical)
+
+            for j, contact in enumerate(result_contacts):
+                contacts.append({
+                    "company_id": company_id,
+                    "contact_index": j,
+                    "company_name": _str(result.get("company_name")),
+                    "name": _str(contact.get("name")),
+                    "title": _str(contact.get("title")),
+                    "email": _str(contact.get("email")),
+                    "phone": _str(contact.get("phone")),
+                    "linkedin_url": _str(contact.get("linkedin_url")),
+                    "sources": _str_list(contact.get("sources")),
+                    "is_valid": bool(contact.get("is_valid")) if contact.get("is_valid") is not None else None,
+                    "confidence": _float(contact.get("confidence")),
+                    "validation_score": _float(contact.get("validation_score")),
+                    "validation_reasons": _str_list(contact.get("validation_reasons")),
+                    "extra": _extra(contact, _CONTACT_FIELDS),
+                })
+                contact_verticals.append(vertical)
+
+        if companies:
+            self._write("companies", pa.Table.from_pylist(companies, schema=COMPANY_SCHEMA),
+                        run_id, pipeline, company_verticals, meta)
+        if contacts:
+            self._write("contacts", pa.Table.from_pylist(contacts, schema=CONTACT_SCHEMA),
+                        run_id, pipeline, contact_verticals, meta)
+        return len(companies)
+
+    def append_frame(
+        self,
+        table: str,
+        df: pd.DataFrame,
+        run_id: str,
+        pipeline: str,
+        meta: dict | None = None,
+        vertical_column: str = "vertical"
+    ) -> int:
+        """
+        Append a DataFrame to `table`.
+
+        Rows are partitioned by `vertical_column` when the frame has it
+        (e.g. "industry"); that column is stored as the `vertical` partition.
+        Nested dict values (and lists of dicts) are stored as JSON strings so
+        the column type stays the same from run to run.
+
+        Raises:
+            ValueError: A column's type conflicts with the stored schema
+        """
+        if table in FIXED_SCHEMAS:
+            raise ValueError(f"Use append_results() for '{table}'")
+        if df.empty:
+            return 0
+
+        df = df.drop(columns=[c for c in PARTITION_COLUMNS if c in df.columns and c != vertical_column])
+        df = df.reset_index(drop=True)
+        if vertical_column in df.columns:
+            verticals = [_vertical(v) for v in df[vertical_column]]
+            df = df.drop(columns=[vertical_column])
+        else:
+            verticals = [UNKNOWN_VERTICAL] * len(df)
+
+        for col in df.columns[df.dtypes == object]:
+            sample = df[col].dropna()
+            first = sample.iloc[0] if len(sample) else None
+            if isinstance(first, dict) or (isinstance(first, list) and first and isinstance(first[0], dict)):
+                df[col] = df[col].map(lambda v: None if v is None else json.dumps(v, default=str))
+
+        data = pa.Table.from_pandas(df, preserve_index=False)
+        stored = self.schema(table)
+        if stored is not None:
+            try:
+                # Permissive: int64 then double widens to double (files already
+                # written are cast when read); incompatible types still raise
+                schema = pa.unify_schemas([stored, data.schema], promote_options="permissive")
+            except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+                raise ValueError(f"Schema conflict appending to '{table}': {e}") from e
+        else:
+            schema = data.schema.remove_metadata()
+        # Same column order and types as the stored schema; new columns at the end
+        data = pa.table(
+            {f.name: data[f.name].cast(f.type) if f.name in data.column_names else pa.nulls(len(data), f.type)
+             for f in schema},
+            schema=schema
+        )
+        if stored is None or not schema.equals(stored):
+            self._save_schema(table, schema)
+
+        self._write(table, data, run_id, pipeline, verticals, meta)
+        return len(data)
+
+    # --- reads ---
+
+    def dataset(self, table: str) -> ds.Dataset | None:
+        schema = self.schema(table)
+        if schema is None or not (self.root / table).exists():
+            return None
+        full_schema = pa.schema(list(schema) + list(PARTITION_SCHEMA))
+        return ds.dataset(
+            self.root / table,
+            format="parquet",
+            schema=full_schema,
+            partitioning=ds.partitioning(PARTITION_SCHEMA, flavor="hive"),
+            exclude_invalid_files=False,
+            ignore_prefixes=["_", "."],
+        )
+
+    def load(
+        self,
+        table: str,
+        columns: list[str] | None = None,
+        run_ids: list[str] | None = None,
+        pipelines: list[str] | None = None,
+        verticals: list[str] | None = None,
+        filter: ds.Expression | None = None
+    ) -> pd.DataFrame:
+        """
+        Read `table` as a DataFrame.
+
+        Args:
+            columns: Columns to read (None = all, including run_id/pipeline/vertical)
+            run_ids / pipelines / verticals: Partition filters (pruned before reading)
+            filter: Extra pyarrow expression, e.g. ds.field("valid_contacts") > 0
+        """
+        dataset = self.dataset(table)
+        if dataset is None:
+            return pd.DataFrame(columns=columns or [])
+
+        expr = None
+        for name, values in (("run_id", run_ids), ("pipeline", pipelines), ("vertical", verticals)):
+            if values is not None:
+                term = ds.field(name).isin(list(values))
+                expr = term if expr is None else expr & term
+        if filter is not None:
+            expr = filter if expr is None else expr & filter
+
+        return dataset.to_table(columns=columns, filter=expr).to_pandas()
+
+    def load_results(
+        self,
+        run_ids: list[str] | None = None,
+        pipelines: list[str] | None = None,
+        verticals: list[str] | None = None,
+        columns: list[str] | None = None,
+        contact_columns: list[str] | None = None
+    ) -> list[dict]:
+        """
+        Rebuild SMB result dicts (with nested `contacts`) from the store.
+
+        Args:
+            columns: Company fields to include (None = all, `extra` merged back)
+            contact_columns: Contact fields to include (None = all, [] = no contacts)
+        """
+        def with_keys(cols: list[str] | None, keys: list[str]) -> list[str] | None:
+            return None if cols is None else list(dict.fromkeys(keys + cols))
+
+        filters = dict(run_ids=run_ids, pipelines=pipelines, verticals=verticals)
+        companies = self.load("companies", columns=with_keys(columns, ["company_id"]), **filters)
+
+        contacts_by_company: dict[str, list[dict]] = {}
+        if contact_columns != []:
+            contacts = self.load(
+                "contacts", columns=with_keys(contact_columns, ["company_id", "contact_index"]), **filters
+            )
+            if not contacts.empty:
+                contacts = contacts.sort_values(["company_id", "contact_index"], kind="stable")
+                for record in contacts.to_dict("records"):
+                    company_id = record.pop("company_id")
+                    contacts_by_company.setdefault(company_id, []).append(
+                        _to_result_dict(record, drop=("contact_index", "company_name", *PARTITION_COLUMNS),
+                                        keep=contact_columns)
+                    )
+
+        results = []
+        for record in companies.to_dict("records"):
+            company_id = record.pop("company_id")
+            result = _to_result_dict(record, drop=("run_id", "pipeline"), keep=columns)
+            if contact_columns != []:
+                result["contacts"] = contacts_by_company.get(company_id, [])
+            results.append(result)
+        return results
+
+    def runs(self) -> pd.DataFrame:
+        """One row per append: run_id, pipeline, table, rows, created_at, meta."""
+        path = self.root / "_runs.jsonl"
+        if not path.exists():
+            return pd.DataFrame(columns=["run_id", "pipeline", "table", "rows", "created_at", "meta"])
+        with open(path, encoding="utf-8") as f:
+            return pd.DataFrame([json.loads(line) for line in f if line.strip()])
+
+
+def _to_result_dict(record: dict, drop: tuple, keep: list[str] | None) -> dict[str, Any]:
+    """
+    Store row -> original-style dict: numpy lists to lists, `extra` merged back.
+
+    Nulls are left out, so `.get(key, default)` in the analysis scripts
+    behaves as it did on the JSON files.
+    """
+    extra = record.pop("extra", None)
+    result = {}
+    for key, value in record.items():
+        if key in drop and (keep is None or key not in keep):
+            continue
+        if hasattr(value, "tolist"):
+            value = value.tolist()
+        elif value is None or (isinstance(value, float) and pd.isna(value)):
+            continue
+        result[key] = value
+    if extra:
+        result.update(json.loads(extra))
+    return result
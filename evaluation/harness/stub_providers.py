@@ -0,0 +1,654 @@
+"""
+Local stub servers for the paid APIs the pipelines call.
+
+StubServer runs one aiohttp app (in a background thread) that answers
+like Serper, OpenWeb Ninja, MillionVerifier, LeadMagic, ZenRows and
+OpenAI (chat completions, plus the Files and Batch endpoints), and
+serves synthetic company websites for every other host.
+Each provider gets its own latency distribution and error rates (5xx and
+429 with Retry-After), so benchmarks see realistic waits and retries.
+
+StubRouter points aiohttp, httpx (the OpenAI SDK included) and dnspython
+at a StubServer while active: `https://google.serper.dev/search` becomes
+`http://127.0.0.1:<port>/google.serper.dev/search`. The pipelines run
+unmodified; only placeholder API keys are needed.
+
+Responses are synthetic but shaped like the real ones the clients parse.
+Latencies and injected errors are drawn from a generator seeded per
+request, so a run is repeatable whatever order requests arrive in.
+
+Usage:
+    with StubServer(profiles={"openai": ProviderProfile("lognormal:1.5,0.4")}) as server:
+        with StubRouter(server.url):
+            asyncio.run(pipeline.run("companies.json"))
+        print(server.stats())
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import random
+import re
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, replace
+from email.parser import BytesParser
+from email.policy import HTTP
+from typing import Any
+
+import aiohttp
+from aiohttp import web
+from yarl import URL
+
+from .cassette import LatencyModel, request_key
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - httpx is optional
+    httpx = None
+
+try:
+    import httpx2  # Fork of httpx that newer OpenAI SDKs ship with
+except ImportError:  # pragma: no cover
+    httpx2 = None
+
+try:
+    import dns.resolver
+except ImportError:  # pragma: no cover - dnspython is optional
+    dns = None
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ProviderProfile:
+    """Latency spec (see cassette.LatencyModel) and injected error rates"""
+    latency: str = "lognormal:0.3,0.5"
+    error_rate: float = 0.0             # 503 responses
+    rate_limit_rate: float = 0.0        # 429 responses with Retry-After
+    retry_after_s: int = 1
+
+
+# Ballpark figures from production logs
+DEFAULT_PROFILES = {
+    "serper": ProviderProfile("lognormal:0.6,0.35", error_rate=0.005),
+    "openweb_ninja": ProviderProfile("lognormal:1.8,0.5", error_rate=0.02, rate_limit_rate=0.03),
+    "millionverifier": ProviderProfile("lognormal:0.9,0.6", error_rate=0.01),
+    "leadmagic": ProviderProfile("lognormal:1.2,0.5", error_rate=0.02, rate_limit_rate=0.01),
+    "zenrows": ProviderProfile("lognormal:2.5,0.5", error_rate=0.03),
+    "openai": ProviderProfile("lognormal:1.4,0.4", error_rate=0.005, rate_limit_rate=0.01),
+    "other_api": ProviderProfile("lognormal:0.5,0.4", error_rate=0.01),
+    "website": ProviderProfile("lognormal:0.5,0.7", error_rate=0.05),
+    "dns": ProviderProfile("lognormal:0.02,0.5"),
+}
+
+PROVIDER_HOSTS = {
+    "google.serper.dev": "serper",
+    "local-business-data.p.rapidapi.com": "openweb_ninja",
+    "website-contacts-scraper.p.rapidapi.com": "openweb_ninja",
+    "social-links-search.p.rapidapi.com": "openweb_ninja",
+    "api.millionverifier.com": "millionverifier",
+    "bulkapi.millionverifier.com": "millionverifier",
+    "api.leadmagic.io": "leadmagic",
+    "api.zenrows.com": "zenrows",
+    "api.openai.com": "openai",
+}
+
+FIRST_NAMES = ["Maria", "James", "Linda", "Robert", "Patricia", "Michael", "Jennifer", "David", "Susan", "Carlos"]
+LAST_NAMES = ["Garcia", "Smith", "Johnson", "Nguyen", "Brown", "Miller", "Davis", "Martinez", "Wilson", "Clark"]
+TITLES = ["Owner", "Founder", "President", "General Manager", "Office Manager"]
+
+
+def provider_for(host: str) -> str:
+    host = host.lower()
+    if host in PROVIDER_HOSTS:
+        return PROVIDER_HOSTS[host]
+    if host.startswith("api.") or host.endswith(".rapidapi.com"):
+        return "other_api"
+    return "website"
+
+
+def _digest(*parts: Any) -> int:
+    return int(hashlib.sha256("|".join(str(p) for p in parts).encode("utf-8")).hexdigest()[:12], 16)
+
+
+def _slug(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "", str(text).lower())[:30] or "company"
+
+
+def _person(seed: str) -> dict:
+    h = _digest(seed)
+    first = FIRST_NAMES[h % len(FIRST_NAMES)]
+    last = LAST_NAMES[(h // 7) % len(LAST_NAMES)]
+    return {
+        "first_name": first,
+        "last_name": last,
+        "full_name": f"{first} {last}",
+        "title": TITLES[(h // 49) % len(TITLES)],
+        "linkedin_url": f"https://www.linkedin.com/in/{first.lower()}-{last.lower()}-{h % 9000 + 1000}",
+    }
+
+
+def _domain_from_query(query: str) -> str:
+    """Stable fake domain for a search query (quoted company name first)."""
+    quoted = re.findall(r'"([^"]+)"', query)
+    words = (quoted[0] if quoted else query).split()
+    words = [w for w in words if not w.startswith(("site:", "-")) and w.lower() not in ("owner", "linkedin")]
+    return f"{_slug(''.join(words[:3]))}.com"
+
+
+def _phone(seed: str) -> str:
+    h = _digest("phone", seed)
+    return f"({200 + h % 700}) {100 + (h // 1000) % 900}-{1000 + (h // 10**6) % 9000}"
+
+
+class StubResponses:
+    """Synthetic response bodies per provider endpoint"""
+
+    def __init__(self, page_kb: int = 40):
+        self.page_kb = page_kb
+
+    def serper(self, path: str, body: dict) -> dict:
+        query = str(body.get("q", ""))
+        domain = _domain_from_query(query)
+        company = domain.split(".")[0].title()
+        owner = _person(domain)
+        if path.endswith(("/places", "/maps")):
+            return {"places": [{
+                "title": company, "address": "100 Main St, Springfield, IL 62701",
+                "phoneNumber": _phone(domain), "website": f"https://{domain}",
+                "rating": 4.5, "ratingCount": 120, "cid": str(_digest("cid", domain)),
+            }]}
+        organic = [
+            {"title": f"{company} - Home", "link": f"https://{domain}/", "position": 1,
+             "snippet": f"{company} is locally owned by {owner['full_name']}. Call {_phone(domain)}."},
+            {"title": f"{owner['full_name']} - {owner['title']} - {company} | LinkedIn",
+             "link": owner["linkedin_url"], "position": 2,
+             "snippet": f"{owner['title']} at {company}. Experience: {company}."},
+            {"title": f"{company} | Yelp", "link": f"https://www.yelp.com/biz/{_slug(company)}", "position": 3,
+             "snippet": f"Reviews of {company}. Owner {owner['first_name']} responded."},
+        ]
+        return {
+            "searchParameters": {"q": query, "type": "search"},
+            "knowledgeGraph": {"title": company, "website": f"https://{domain}",
+                               "phone": _phone(domain), "address": "100 Main St, Springfield, IL 62701"},
+            "organic": organic[: int(body.get("num") or 10)],
+        }
+
+    def openweb_ninja(self, host: str, query: dict, body: dict) -> dict:
+        if host.startswith("local-business-data"):
+            name = query.get("query", "")
+            domain = _domain_from_query(name)
+            owner = _person(domain)
+            return {"status": "OK", "data": [{
+                "place_id": f"ChIJ{_digest('place', name) % 10**12}", "name": name.split(",")[0],
+                "owner_name": owner["full_name"] if _digest("has_owner", domain) % 3 else None,
+                "phone_number": _phone(domain), "email": f"info@{domain}", "website": f"https://{domain}",
+                "full_address": "100 Main St, Springfield, IL 62701", "city": "Springfield", "state": "IL",
+                "rating": 4.4, "review_count": 87, "type": "Local business",
+                "facebook_url": f"https://www.facebook.com/{domain.split('.')[0]}",
+            }]}
+        if host.startswith("website-contacts"):
+            domain = str(body.get("query") or query.get("query") or "example.com")
+            owner = _person(domain)
+            return {
+                "domain": domain,
+                "emails": [{"value": f"info@{domain}", "sources": [f"https://{domain}/contact"]},
+                           {"value": f"{owner['first_name'].lower()}@{domain}", "sources": [f"https://{domain}/about"]}],
+                "phone_numbers": [{"value": _phone(domain), "sources": [f"https://{domain}"]}],
+                "linkedin": owner["linkedin_url"],
+                "facebook": f"https://www.facebook.com/{domain.split('.')[0]}",
+            }
+        name = str(body.get("query") or query.get("query") or "")
+        owner = _person(_domain_from_query(name))
+        return {"linkedin": [owner["linkedin_url"]],
+                "facebook": [f"https://www.facebook.com/{_slug(name)}"]}
+
+    def millionverifier(self, query: dict) -> dict:
+        email = query.get("email", "")
+        bucket = _digest("mv", email) % 10
+        result = "ok" if bucket < 6 else "catch_all" if bucket < 8 else "invalid"
+        return {
+            "email": email, "quality": "good" if result == "ok" else "risky" if result == "catch_all" else "bad",
+            "result": result, "resultcode": {"ok": 1, "catch_all": 2, "invalid": 6}[result],
+            "free": False, "role": email.split("@")[0] in ("info", "office", "contact"),
+            "didyoumean": "", "credits": 100000, "executiontime": 1, "error": "", "livemode": True,
+        }
+
+    def leadmagic(self, path: str, body: dict) -> dict:
+        domain = str(body.get("domain") or body.get("company_domain") or "")
+        if not domain and body.get("email"):
+            domain = str(body["email"]).split("@")[-1]
+        seed = body.get("profile_url") or body.get("email") or domain or json.dumps(body, sort_keys=True)
+        person = _person(seed)
+        company = (domain.split(".")[0] or "company").title()
+        if path.endswith("/email-finder"):
+            first = str(body.get("first_name") or person["first_name"]).lower()
+            found = _digest("lm", seed) % 4 != 0
+            return {
+                "email": f"{first}@{domain}" if found and domain else None,
+                "status": "valid" if found else "not_found", "credits_consumed": 1 if found else 0,
+                "is_domain_catch_all": False, "mx_record": True, "mx_provider": "google",
+                "company": {"name": company, "industry": "Local Services", "size": "1-10"},
+            }
+        return {
+            **person, "profile_url": person["linkedin_url"], "company_name": company,
+            "professional_title": person["title"], "location": "Springfield, Illinois",
+            "work_experience": [{"company_name": company, "title": person["title"], "is_current": True}],
+            "education": [], "certifications": [], "credits_consumed": 1,
+        }
+
+    def openai(self, body: dict) -> dict:
+        messages = body.get("messages") or []
+        prompt = " ".join(str(m.get("content", "")) for m in messages if isinstance(m, dict))
+        h = _digest("llm", prompt)
+        confidence = 55 + h % 45
+        # One object with the fields every judge/extractor prompt in the repo asks for
+        content = {
+            "match": confidence >= 70, "confidence": confidence, "evidence": "Name and phone found on page",
+            "phone_found": True, "address_found": confidence >= 60, "name_found": True,
+            "is_parent_company": False, "is_directory_site": False, "is_government_oversight_site": False,
+            "is_government_portal": False, "needs_deep_link": False, "suggested_deep_link_search": "",
+            "accept": confidence >= 70, "overall_confidence": confidence, "email_confidence": confidence - 5,
+            "person_match_confidence": confidence, "linkedin_confidence": confidence - 10,
+            "reasoning": "Owner named on company website and LinkedIn", "red_flags": [],
+            "best_candidate_index": 0, "company_type": "independent", "candidates": [],
+            "extraction_notes": "stub",
+        }
+        prompt_tokens = max(1, len(prompt) // 4)
+        return {
+            "id": f"chatcmpl-stub{h % 10**8}", "object": "chat.completion", "created": int(time.time()),
+            "model": body.get("model", "gpt-4o-mini"),
+            "choices": [{"index": 0, "finish_reason": "stop",
+                         "message": {"role": "assistant", "content": json.dumps(content)}}],
+            "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": 120,
+                      "total_tokens": prompt_tokens + 120},
+        }
+
+    def website(self, host: str, path: str) -> str:
+        domain = host.lower().removeprefix("www.")
+        company = domain.split(".")[0].title()
+        owner = _person(domain)
+        phone = _phone(domain)
+        schema = {
+            "@context": "https://schema.org", "@type": "LocalBusiness", "name": company, "telephone": phone,
+            "email": f"info@{domain}", "url": f"https://{domain}",
+            "founder": {"@type": "Person", "name": owner["full_name"], "jobTitle": owner["title"]},
+            "address": {"@type": "PostalAddress", "streetAddress": "100 Main St",
+                        "addressLocality": "Springfield", "addressRegion": "IL"},
+        }
+        filler = (f"<p>{company} has served Springfield families for over twenty years. "
+                  f"Our licensed team handles repairs, installs and maintenance.</p>\n")
+        padding = filler * max(1, self.page_kb * 1024 // len(filler))
+        return (
+            f"<!DOCTYPE html><html><head><title>{company} | Springfield, IL</title>"
+            f'<meta property="og:url" content="https://{domain}{path}">'
+            f'<script type="application/ld+json">{json.dumps(schema)}</script></head><body>'
+            f"<nav><a href='/'>Home</a> <a href='/about'>About</a> <a href='/contact'>Contact</a> "
+            f"<a href='/team'>Our Team</a></nav><h1>{company}</h1>"
+            f"<section id='about'><h2>About Us</h2><p>{company} is owned and operated by "
+            f"{owner['full_name']}, {owner['title']}.</p></section>{padding}"
+            f"<section id='contact'><a href='mailto:info@{domain}'>info@{domain}</a> "
+            f"<a href='mailto:{owner['first_name'].lower()}@{domain}'>{owner['first_name'].lower()}@{domain}</a> "
+            f"<a href='tel:{phone}'>{phone}</a> <a href='{owner['linkedin_url']}'>LinkedIn</a></section>"
+            f"<footer>&copy; {company}. 100 Main St, Springfield, IL 62701</footer></body></html>"
+        )
+
+
+class StubServer:
+    """
+    Serves every stubbed provider from one local aiohttp app.
+
+    Runs its own event loop in a daemon thread so the server's work is not
+    counted against the loop being benchmarked.
+    """
+
+    def __init__(
+        self,
+        profiles: dict[str, ProviderProfile] | None = None,
+        seed: int = 0,
+        page_kb: int = 40,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        batch_polls: int = 1
+    ):
+        """
+        Args:
+            profiles: Per-provider overrides of DEFAULT_PROFILES
+            seed: Seed for sampled latencies and injected errors
+            page_kb: Approximate size of synthetic website pages
+            host, port: Bind address (port 0 picks a free port)
+            batch_polls: Status checks an OpenAI batch reports "in_progress" before completing
+        """
+        self.profiles = {**DEFAULT_PROFILES, **(profiles or {})}
+        self._latency = {name: LatencyModel(p.latency) for name, p in self.profiles.items()}
+        self.seed = seed
+        self.responses = StubResponses(page_kb)
+        self.host = host
+        self.port = port
+        self.url: str | None = None
+        self._stats: dict[str, dict] = defaultdict(lambda: defaultdict(float))
+        self._counts: dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._runner: web.AppRunner | None = None
+        self._thread: threading.Thread | None = None
+        self.batch_polls = batch_polls
+        self._files: dict[str, bytes] = {}
+        self._batches: dict[str, dict] = {}
+
+    # --- stats ---
+
+    def stats(self) -> dict:
+        """Per-provider request, error and latency counters."""
+        with self._lock:
+            return {
+                name: {
+                    "requests": int(s["requests"]),
+                    "errors": int(s["errors"]),
+                    "rate_limited": int(s["rate_limited"]),
+                    "mean_latency_ms": round(s["latency_s"] * 1000 / s["requests"], 1) if s["requests"] else 0.0,
+                }
+                for name, s in sorted(self._stats.items())
+            }
+
+    def reset_stats(self):
+        with self._lock:
+            self._stats.clear()
+
+    def _draw(self, provider: str, key: str) -> tuple[float, float]:
+        """(latency, uniform draw for error injection) for the nth request with `key`."""
+        with self._lock:
+            n = self._counts[key]
+            self._counts[key] = n + 1
+        rng = random.Random(f"{self.seed}:{key}:{n}")
+        return self._latency[provider].sample(rng, 0.0), rng.random()
+
+    # --- app ---
+
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        host = request.match_info["host"]
+        path = "/" + request.match_info["tail"]
+        provider = provider_for(host)
+        raw = await request.read()
+        query = dict(request.query)
+        key = request_key(request.method, f"https://{host}{path}?{request.query_string}", raw)
+
+        delay, draw = self._draw(provider, key)
+        profile = self.profiles[provider]
+        await asyncio.sleep(delay)
+        with self._lock:
+            s = self._stats[provider]
+            s["requests"] += 1
+            s["latency_s"] += delay
+            if draw < profile.rate_limit_rate:
+                s["rate_limited"] += 1
+            elif draw < profile.rate_limit_rate + profile.error_rate:
+                s["errors"] += 1
+        if draw < profile.rate_limit_rate:
+            return web.json_response({"error": "Too many requests"}, status=429,
+                                     headers={"Retry-After": str(profile.retry_after_s)})
+        if draw < profile.rate_limit_rate + profile.error_rate:
+            return web.json_response({"error": "Service temporarily unavailable"}, status=503)
+
+        try:
+            body = json.loads(raw) if raw else {}
+        except ValueError:
+            body = {}
+        if not isinstance(body, dict):
+            body = {}
+
+        if provider == "serper":
+            return web.json_response(self.responses.serper(path, body))
+        if provider == "openweb_ninja":
+            return web.json_response(self.responses.openweb_ninja(host, query, body))
+        if provider == "millionverifier":
+            return web.json_response(self.responses.millionverifier(query))
+        if provider == "leadmagic":
+            return web.json_response(self.responses.leadmagic(path, body))
+        if provider == "openai":
+            if path.startswith(("/v1/files", "/v1/batches")):
+                return self._openai_batch(request, path, raw, body)
+            return web.json_response(self.responses.openai(body))
+        if provider == "zenrows":
+            target = URL(query.get("url", "https://example.com"))
+            return web.Response(text=self.responses.website(target.host or "example.com", target.path),
+                                content_type="text/html")
+        if provider == "other_api":
+            return web.json_response({})
+        return web.Response(text=self.responses.website(host, path), content_type="text/html")
+
+    def _openai_batch(self, request: web.Request, path: str, raw: bytes, body: dict) -> web.Response:
+        """OpenAI Files + Batch API: batches run at creation, then report in_progress for batch_polls checks."""
+        now = int(time.time())
+        if request.method == "POST" and path == "/v1/files":
+            # Multipart upload: parse the form with the stdlib MIME parser
+            form = BytesParser(policy=HTTP).parsebytes(
+                f"Content-Type: {request.headers['Content-Type']}\r\n\r\n".encode() + raw
+            )
+            parts = {part.get_param("name", header="content-disposition"): part for part in form.iter_parts()}
+            file_part = parts["file"]
+            content = file_part.get_payload(decode=True)
+            file_id = f"file-stub{len(self._files)}"
+            self._files[file_id] = content
+            return web.json_response({
+                "id": file_id, "object": "file", "bytes": len(content), "created_at": now,
+                "filename": file_part.get_filename() or "upload.jsonl", "status": "processed",
+                "purpose": parts["purpose"].get_payload(decode=True).decode() if "purpose" in parts else "batch",
+            })
+        if request.method == "GET" and path.startswith("/v1/files/") and path.endswith("/content"):
+            file_id = path.split("/")[3]
+            if file_id not in self._files:
+                return web.json_response({"error": {"message": "No such file"}}, status=404)
+            return web.Response(body=self._files[file_id], content_type="application/jsonl")
+        if request.method == "POST" and path == "/v1/batches":
+            lines = self._files.get(body.get("input_file_id"), b"").decode().splitlines()
+            output = []
+            for n, line in enumerate(line for line in lines if line.strip()):
+                item = json.loads(line)
+                output.append(json.dumps({
+                    "id": f"batch_req_{n}", "custom_id": item["custom_id"], "error": None,
+                    "response": {"status_code": 200, "request_id": f"req_{n}",
+                                 "body": self.responses.openai(item.get("body") or {})},
+                }))
+            batch_id = f"batch_stub{len(self._batches)}"
+            output_file_id = f"file-stub{len(self._files)}"
+            self._files[output_file_id] = ("\n".join(output) + "\n").encode()
+            self._batches[batch_id] = {
+                "id": batch_id, "object": "batch", "endpoint": body.get("endpoint"),
+                "input_file_id": body.get("input_file_id"), "completion_window": body.get("completion_window"),
+                "created_at": now, "metadata": body.get("metadata"), "status": "validating",
+                "output_file_id": None, "error_file_id": None,
+                "request_counts": {"total": len(output), "completed": 0, "failed": 0},
+                "_output_file_id": output_file_id, "_polls": 0,
+            }
+            return web.json_response(self._public_batch(self._batches[batch_id]))
+        if request.method == "GET" and path.startswith("/v1/batches/"):
+            batch = self._batches.get(path.split("/")[3])
+            if batch is None:
+                return web.json_response({"error": {"message": "No such batch"}}, status=404)
+            batch["_polls"] += 1
+            if batch["_polls"] > self.batch_polls:
+                counts = batch["request_counts"]
+                batch.update(status="completed", output_file_id=batch["_output_file_id"], completed_at=now)
+                counts["completed"] = counts["total"]
+            else:
+                batch["status"] = "in_progress"
+            return web.json_response(self._public_batch(batch))
+        return web.json_response({"error": {"message": f"Unknown endpoint {path}"}}, status=404)
+
+    @staticmethod
+    def _public_batch(batch: dict) -> dict:
+        return {k: v for k, v in batch.items() if not k.startswith("_")}
+
+    def _app(self) -> web.Application:
+        app = web.Application(client_max_size=16 * 1024 * 1024)
+        app.router.add_route("*", "/{host}/{tail:.*}", self._handle)
+        return app
+
+    # --- lifecycle ---
+
+    def start(self) -> str:
+        """Start serving; returns the base URL."""
+        ready = threading.Event()
+        failure: list[BaseException] = []
+
+        async def serve():
+            self._runner = web.AppRunner(self._app(), access_log=None)
+            await self._runner.setup()
+            site = web.TCPSite(self._runner, self.host, self.port, backlog=1024)
+            await site.start()
+            self.port = site._server.sockets[0].getsockname()[1]
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+            try:
+                self._loop.run_until_complete(serve())
+            except BaseException as e:  # pragma: no cover - bind failures
+                failure.append(e)
+                ready.set()
+                return
+            ready.set()
+            self._loop.run_forever()
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run, name="stub-providers", daemon=True)
+        self._thread.start()
+        ready.wait()
+        if failure:
+            raise failure[0]
+        self.url = f"http://{self.host}:{self.port}"
+        logger.info(f"Stub providers listening on {self.url}")
+        return self.url
+
+    def stop(self):
+        if self._loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop = None
+
+    def __enter__(self) -> "StubServer":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+        return False
+
+
+class StubRouter:
+    """
+    Send aiohttp/httpx requests and DNS lookups to a StubServer while active.
+
+    Patching is process-wide, so only one router may be active at a time
+    (and not together with a Cassette).
+    """
+
+    _active: "StubRouter | None" = None
+
+    def __init__(self, base_url: str, dns_latency: str | None = None, seed: int = 0):
+        """
+        Args:
+            base_url: StubServer.url
+            dns_latency: Latency spec for DNS lookups (default: DEFAULT_PROFILES["dns"]);
+                lookups are synchronous, so the delay blocks like a real one
+            seed: Seed for sampled DNS latencies
+        """
+        self.base_url = URL(base_url)
+        self.dns_latency = LatencyModel(dns_latency or DEFAULT_PROFILES["dns"].latency)
+        self.seed = seed
+        self.requests: dict[str, int] = defaultdict(int)
+        self._originals: dict[str, Any] = {}
+        self._dns_counts: dict[str, int] = defaultdict(int)
+
+    def route(self, url: URL) -> URL:
+        """Stub URL for an outgoing request URL."""
+        self.requests[provider_for(url.host or "")] += 1
+        return self.base_url.with_path(f"/{url.host}{url.raw_path}", encoded=True).with_query(url.query)
+
+    def _dns_resolve(self, qname, rdtype="A", *args, **kwargs):
+        name = str(qname).rstrip(".").lower()
+        n = self._dns_counts[name]
+        self._dns_counts[name] = n + 1
+        self.requests["dns"] += 1
+        time.sleep(self.dns_latency.sample(random.Random(f"{self.seed}:dns:{name}:{n}"), 0.0))
+        if str(rdtype).upper().endswith("MX"):
+            return [f"10 mx.{name}."]
+        return ["127.0.0.1"]
+
+    def _patch_httpx(self, module):
+        router = self
+        original = self._originals[module.__name__] = module.AsyncHTTPTransport.handle_async_request
+
+        async def httpx_request(transport, request):
+            if request.url.host != router.base_url.host:
+                request.url = module.URL(str(router.route(URL(str(request.url)))))
+                request.headers["Host"] = f"{router.base_url.host}:{router.base_url.port}"
+            return await original(transport, request)
+
+        module.AsyncHTTPTransport.handle_async_request = httpx_request
+
+    def __enter__(self) -> "StubRouter":
+        if StubRouter._active is not None:
+            raise RuntimeError("Another stub router is already active")
+        StubRouter._active = self
+        router = self
+
+        original_aiohttp = self._originals["aiohttp"] = aiohttp.ClientSession._request
+
+        async def aiohttp_request(session, method, str_or_url, **kwargs):
+            url = URL(str(session._build_url(str_or_url)) if hasattr(session, "_build_url") else str(str_or_url))
+            if url.host not in (router.base_url.host, None):
+                str_or_url = router.route(url)
+            return await original_aiohttp(session, method, str_or_url, **kwargs)
+
+        aiohttp.ClientSession._request = aiohttp_request
+
+        for module in (httpx, httpx2):
+            if module is not None:
+                self._patch_httpx(module)
+
+        if dns is not None:
+            self._originals["dns"] = dns.resolver.resolve
+
+            def dns_resolve(qname, rdtype="A", *args, **kwargs):
+                return router._dns_resolve(qname, rdtype, *args, **kwargs)
+
+            dns.resolver.resolve = dns_resolve
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        aiohttp.ClientSession._request = self._originals.pop("aiohttp")
+        for module in (httpx, httpx2):
+            if module is not None and module.__name__ in self._originals:
+                module.AsyncHTTPTransport.handle_async_request = self._originals.pop(module.__name__)
+        if "dns" in self._originals:
+            dns.resolver.resolve = self._originals.pop("dns")
+        StubRouter._active = None
+        return False
+
+
+def parse_profile_overrides(
+    latency: list[str] | None = None,
+    error_rate: list[str] | None = None,
+    rate_limit_rate: list[str] | None = None
+) -> dict[str, ProviderProfile]:
+    """Build profile overrides from PROVIDER=VALUE strings (CLI flags)."""
+    profiles = dict(DEFAULT_PROFILES)
+    for specs, attr, cast in (
+        (latency, "latency", str), (error_rate, "error_rate", float), (rate_limit_rate, "rate_limit_rate", float),
+    ):
+        for spec in specs or []:
+            name, _, value = spec.partition("=")
+            if name not in profiles:
+                raise ValueError(f"Unknown provider '{name}' (known: {', '.join(sorted(profiles))})")
+            if attr == "latency":
+                LatencyModel(value)
+            profiles[name] = replace(profiles[name], **{attr: cast(value)})
+    return profiles
@@ -2,11 +2,22 @@
 """
 Analyze failure patterns in SMB contact discovery results.
 """
+import argparse
 import json
+import sys
 from collections import Counter, defaultdict
 from pathlib import Path
 from typing import Dict, List, Any
 
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+DEFAULT_RESULTS_FILE = "/Users/jordancrawford/Desktop/Blueprint-GTM-Skills/evaluation/results/yelp_940_results.json"
+
+# Fields read from the run store (everything else stays on disk)
+RESULT_COLUMNS = ['company_name', 'vertical', 'errors']
+CONTACT_COLUMNS = ['name', 'title', 'email', 'phone', 'sources', 'is_valid', 'validation_score']
+
 def load_results(file_path: str) -> List[Dict[str, Any]]:
     """Load results from JSON file."""
     with open(file_path, 'r') as f:
@@ -314,10 +325,23 @@ def print_report(analysis: Dict[str, Any], invalid_analysis: Dict[str, Any]):
 
 def main():
     """Main analysis function."""
-    results_file = "/Users/jordancrawford/Desktop/Blueprint-GTM-Skills/evaluation/results/yelp_940_results.json"
+    parser = argparse.ArgumentParser(description="Analyze failure patterns in SMB results")
+    parser.add_argument("results_file", nargs="?", default=DEFAULT_RESULTS_FILE, help="Results JSON file")
+    parser.add_argument("--run-store", help="Read from this Parquet run store instead of a JSON file")
+    parser.add_argument("--run-id", action="append", help="Run id(s) to analyze (default: all runs)")
+    args = parser.parse_args()
 
     print("Loading results...")
-    results = load_results(results_file)
+    if args.run_store:
+        from evaluation.harness.run_store import RunStore
+        results = RunStore(args.run_store).load_results(
+            run_ids=args.run_id, columns=RESULT_COLUMNS, contact_columns=CONTACT_COLUMNS
+        )
+        label = "_".join(args.run_id) if args.run_id else "all_runs"
+        results_file = str(Path(args.run_store) / f"{label}.json")
+    else:
+        results_file = args.results_file
+        results = load_results(results_file)
 
     print(f"Analyzing {len(results)} companies...")
     analysis = analyze_failures(results)
@@ -3,20 +3,32 @@
 Analyze SMB contact discovery results by vertical/category.
 """
 
+import argparse
 import json
+import sys
 from collections import defaultdict
 from typing import Dict, List, Any
 from pathlib import Path
 
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+DEFAULT_RESULTS_FILE = "/Users/jordancrawford/Desktop/Blueprint-GTM-Skills/evaluation/results/yelp_940_results.json"
+
+# Fields read from the run store (everything else stays on disk)
+RESULT_COLUMNS = ['company_name', 'vertical', 'processing_time_ms']
+CONTACT_COLUMNS = ['name', 'email', 'phone', 'sources', 'is_valid', 'confidence']
 
-def analyze_by_vertical(results_file: str) -> Dict[str, Any]:
-    """Analyze results grouped by vertical."""
 
-    # Load results
+def load_results(results_file: str) -> List[Dict[str, Any]]:
+    """Load results from a JSON results file."""
     with open(results_file, 'r') as f:
         data = json.load(f)
+    return data.get('results', [])
 
-    results = data.get('results', [])
+
+def analyze_by_vertical(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Analyze results grouped by vertical."""
 
     # Group by vertical
     vertical_stats = defaultdict(lambda: {
@@ -251,10 +263,26 @@ def print_analysis(summary: Dict[str, Any]):
 
 
 def main():
-    results_file = "/Users/jordancrawford/Desktop/Blueprint-GTM-Skills/evaluation/results/yelp_940_results.json"
+    parser = argparse.ArgumentParser(description="Analyze SMB results by vertical")
+    parser.add_argument("results_file", nargs="?", default=DEFAULT_RESULTS_FILE, help="Results JSON file")
+    parser.add_argument("--run-store", help="Read from this Parquet run store instead of a JSON file")
+    parser.add_argument("--run-id", action="append", help="Run id(s) to analyze (default: all runs)")
+    parser.add_argument("--vertical", action="append", help="Only these verticals (run store only)")
+    args = parser.parse_args()
 
     print("Loading and analyzing results...")
-    summary = analyze_by_vertical(results_file)
+    if args.run_store:
+        from evaluation.harness.run_store import RunStore
+        results = RunStore(args.run_store).load_results(
+            run_ids=args.run_id, verticals=args.vertical,
+            columns=RESULT_COLUMNS, contact_columns=CONTACT_COLUMNS
+        )
+        label = "_".join(args.run_id) if args.run_id else "all_runs"
+        results_file = str(Path(args.run_store) / f"{label}.json")
+    else:
+        results_file = args.results_file
+        results = load_results(results_file)
+    summary = analyze_by_vertical(results)
 
     print_analysis(summary)
 
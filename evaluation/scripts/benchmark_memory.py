@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Memory of Compact vs Plain Records on a Large Synthetic Set
+
+Builds a synthetic LinkedIn export (Connections.csv rows), a truth
+company list and search candidates with Scrapin-sized raw payloads, and
+measures the resident memory the records keep alive in two variants:
+
+- legacy:  plain dataclasses (per-instance __dict__), every parsed string
+           its own object, raw payload dicts held on each candidate
+- compact: the current record types (slots=True), LinkedIn contacts built
+           by the export loader's contact_from_export_row(), repeated
+           fields interned with intern_field(), payloads in the
+           PayloadStore and referenced by raw_ref
+
+Each variant runs in its own process so the RSS numbers do not share an
+allocator. Rows are parsed with csv one at a time, like the loaders do,
+so each field is a fresh string as it would be in a real run.
+
+Usage:
+    python -m evaluation.scripts.benchmark_memory
+    python -m evaluation.scripts.benchmark_memory --contacts 100000
+    python -m evaluation.scripts.benchmark_memory --payload-db /tmp/payloads.db
+"""
+
+import argparse
+import csv
+import gc
+import io
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+from dataclasses import MISSING, field, fields, make_dataclass
+
+# Add project root to path
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, PROJECT_ROOT)
+
+from evaluation.harness.contact_qa_tester import LinkedInContact, contact_from_export_row
+from evaluation.harness.ground_truth_builder import intern_field
+from evaluation.scripts.build_full_ground_truth import EnrichedCompany
+from modules.discovery.contact_search import ContactCandidate, ContactSource
+from modules.discovery.payload_store import PayloadStore, set_payload_store, put_payload
+
+
+FIRST = ["John", "Maria", "Wei", "Aisha", "Li", "Sam", "Olga", "Raj", "Emma", "Noah", "Priya", "Carlos"]
+LAST = ["Smith", "Garcia", "Chen", "Khan", "Ng", "Lee", "Ivanova", "Patel", "Brown", "Silva", "Kim", "Cohen"]
+TITLES = ["Owner", "Founder & CEO", "VP Sales", "Head of Marketing", "Office Manager", "CMO",
+          "Software Engineer", "Account Executive", "Director of Operations", "General Manager"]
+STATES = ["CA", "TX", "NY", "FL", "IL", "WA", "CO", "GA", "OH", "NC"]
+CONTEXTS = ["plumbing contractor", "family dental practice", "vertical SaaS for salons",
+            "HVAC repair and installation", "boutique law firm", "craft brewery and taproom"]
+WORDS = ("experienced leader helping small businesses grow revenue through better operations "
+         "customer success marketing sales strategy partnerships community hiring culture").split()
+
+
+def legacy_record(cls, drop: tuple = (), extra: tuple = ()):
+    """`cls` rebuilt as a plain (non-slotted) dataclass, minus `drop`, plus `extra` fields"""
+    spec = []
+    for f in fields(cls):
+        if f.name in drop:
+            continue
+        if f.default is not MISSING:
+            spec.append((f.name, f.type, field(default=f.default)))
+        elif f.default_factory is not MISSING:
+            spec.append((f.name, f.type, field(default_factory=f.default_factory)))
+        else:
+            spec.append((f.name, f.type))
+    return make_dataclass(f"Legacy{cls.__name__}", spec + list(extra))
+
+
+LegacyLinkedInContact = legacy_record(LinkedInContact)
+LegacyEnrichedCompany = legacy_record(EnrichedCompany)
+LegacyContactCandidate = legacy_record(
+    ContactCandidate, drop=("raw_ref",), extra=(("raw_data", dict, field(default_factory=dict)),)
+)
+
+
+def _parsed(rows):
+    """Round-trip rows through csv so every field is a freshly parsed string"""
+    for row in rows:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow(row)
+        yield next(csv.reader([buffer.getvalue()]))
+
+
+def connection_rows(n: int, rng: random.Random):
+    """Connections.csv rows: First Name, Last Name, URL, Email Address, Company, Position, Connected On"""
+    companies = max(1, n // 20)
+    for i in range(n):
+        first, last = rng.choice(FIRST), rng.choice(LAST)
+        yield [
+            first, last, f"https://www.linkedin.com/in/{first.lower()}-{last.lower()}-{i}",
+            f"{first.lower()}.{last.lower()}{i}@example.com" if rng.random() < 0.3 else "",
+            f"Company {rng.randrange(companies)} LLC", rng.choice(TITLES),
+            f"{rng.randint(1, 28):02d} {rng.choice(['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun'])} {rng.randint(2012, 2025)}",
+        ]
+
+
+def company_rows(n: int, rng: random.Random):
+    """Truth rows: name, city, state, phone, context, expected_domain"""
+    for i in range(n):
+        yield [f"Company {i} LLC", f"City {rng.randrange(2000)}", rng.choice(STATES),
+               f"(555) {rng.randrange(1000):03d}-{rng.randrange(10000):04d}", rng.choice(CONTEXTS),
+               f"company{i}.com"]
+
+
+def scrapin_payload(i: int, rng: random.Random) -> dict:
+    """Employee entry roughly the size of a Scrapin company-employees item"""
+    first, last = rng.choice(FIRST), rng.choice(LAST)
+    return {
+        "first_name": first,
+        "last_name": last,
+        "headline": f"{rng.choice(TITLES)} at Company {i // 5} LLC",
+        "linkedin_url": f"https://www.linkedin.com/in/{first.lower()}-{last.lower()}-{i}",
+        "location": f"City {rng.randrange(2000)}, {rng.choice(STATES)}",
+        "summary": " ".join(rng.choice(WORDS) for _ in range(60)),
+        "positions": [
+            {"title": rng.choice(TITLES), "company": f"Company {rng.randrange(10000)} LLC",
+             "start": f"{rng.randint(2005, 2024)}-{rng.randint(1, 12):02d}"}
+            for _ in range(3)
+        ],
+    }
+
+
+def load_contacts(rows, compact: bool) -> list:
+    contacts = []
+    for first, last, url, email, company, position, connected_on in _parsed(rows):
+        if compact:
+            contacts.append(contact_from_export_row({
+                "first_name": first, "last_name": last, "linkedin_url": url, "email": email,
+                "company": company, "position": position, "connected_on": connected_on,
+            }))
+        else:
+            contacts.append(LegacyLinkedInContact(
+                first_name=first, last_name=last, full_name=f"{first} {last}", linkedin_url=url,
+                email=email or None, company=company, position=position, connected_on=connected_on,
+            ))
+    return contacts
+
+
+def load_companies(rows, compact: bool) -> list:
+    companies = []
+    for name, city, state, phone, context, domain in _parsed(rows):
+        if compact:
+            companies.append(EnrichedCompany(
+                name=name, city=intern_field(city), state=intern_field(state), phone=phone,
+                context=intern_field(context), expected_domain=domain,
+            ))
+        else:
+            companies.append(LegacyEnrichedCompany(
+                name=name, city=city, state=state, phone=phone, context=context, expected_domain=domain,
+            ))
+    return companies
+
+
+def build_candidates(n: int, rng: random.Random, compact: bool) -> list:
+    candidates = []
+    for i in range(n):
+        payload = json.loads(json.dumps(scrapin_payload(i, rng)))  # Parsed like an API response
+        name = f"{payload['first_name']} {payload['last_name']}"
+        common = dict(
+            name=name, first_name=payload["first_name"], last_name=payload["last_name"],
+            title=payload["headline"], email=None, phone=None, linkedin_url=payload["linkedin_url"],
+            source=ContactSource.SCRAPIN, email_origin=None, confidence=70,
+            evidence=[f"Found in Company {i // 5} LLC LinkedIn employees"],
+        )
+        if compact:
+            candidates.append(ContactCandidate(**common, raw_ref=put_payload(payload)))
+        else:
+            candidates.append(LegacyContactCandidate(**common, raw_data=payload))
+    return candidates
+
+
+def rss_bytes() -> int:
+    """Current resident set size (peak RSS where /proc is not available)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        scale = 1 if sys.platform == "darwin" else 1024
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+def measure(variant: str, contacts: int, seed: int, payload_db: str | None) -> dict:
+    """Build every record set for one variant; RSS each set keeps alive"""
+    compact = variant == "compact"
+    if compact:
+        set_payload_store(PayloadStore(payload_db))
+    rng = random.Random(seed)
+    kept = []
+    usage = {}
+
+    steps = [
+        ("linkedin_contacts", lambda: load_contacts(connection_rows(contacts, rng), compact)),
+        ("truth_companies", lambda: load_companies(company_rows(contacts // 5, rng), compact)),
+        ("candidates", lambda: build_candidates(contacts, rng, compact)),
+    ]
+    gc.collect()
+    start = before = rss_bytes()
+    for name, build in steps:
+        kept.append(build())
+        gc.collect()
+        after = rss_bytes()
+        usage[name] = {"records": len(kept[-1]), "bytes": after - before}
+        before = after
+    usage["total"] = {"records": sum(len(k) for k in kept), "bytes": before - start}
+    usage["peak_rss"] = {"records": 0, "bytes": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024}
+    return usage
+
+
+def _mb(n: int) -> str:
+    return f"{n / 1024 / 1024:,.1f} MB"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark memory of compact vs plain records")
+    parser.add_argument("--contacts", type=int, default=500_000, help="LinkedIn contacts and candidates")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--payload-db", help="SQLite file for the PayloadStore (default: in-memory)")
+    parser.add_argument("--variant", choices=["legacy", "compact"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.variant:
+        print(json.dumps(measure(args.variant, args.contacts, args.seed, args.payload_db)))
+        return
+
+    results = {}
+    for variant in ("legacy", "compact"):
+        cmd = [sys.executable, "-m", "evaluation.scripts.benchmark_memory", "--variant", variant,
+               "--contacts", str(args.contacts), "--seed", str(args.seed)]
+        if args.payload_db:
+            cmd += ["--payload-db", args.payload_db]
+        out = subprocess.run(cmd, cwd=PROJECT_ROOT, capture_output=True, text=True, check=True).stdout
+        results[variant] = json.loads(out.strip().splitlines()[-1])
+
+    print(f"Synthetic set: {args.contacts:,} LinkedIn contacts, {args.contacts // 5:,} truth companies, "
+          f"{args.contacts:,} candidates with raw payloads "
+          f"(payloads {'in ' + args.payload_db if args.payload_db else 'in memory'})\n")
+    print(f"{'Records':<20} {'Legacy':>12} {'Compact':>12} {'Reduction':>10}")
+    print("-" * 57)
+    for name in ("linkedin_contacts", "truth_companies", "candidates", "total", "peak_rss"):
+        legacy, compact = results["legacy"][name]["bytes"], results["compact"][name]["bytes"]
+        reduction = f"{1 - compact / legacy:.0%}" if legacy > 0 else "-"
+        print(f"{name:<20} {_mb(legacy):>12} {_mb(compact):>12} {reduction:>10}")
+
+
+if __name__ == "__main__":
+    main()
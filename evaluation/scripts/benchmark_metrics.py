@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Columnar Metrics vs Per-Row Reference
+
+Builds a synthetic results/truth pair (companies with contact lists,
+personas, domains, confidences) and times calculate_domain_metrics,
+calculate_contact_metrics and calculate_e2e_metrics against the per-row
+(apply/iterrows) implementation they replaced (merge, flags and
+breakdowns), checking both give the same flags and breakdowns.
+
+Usage:
+    python -m evaluation.scripts.benchmark_metrics --rows 100000
+    python -m evaluation.scripts.benchmark_metrics --rows 20000 --skip-reference
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from evaluation.harness import metrics
+from evaluation.harness.metrics import (
+    calculate_contact_metrics,
+    calculate_domain_metrics,
+    calculate_e2e_metrics,
+)
+
+
+FIRST = ["john", "maria", "wei", "aisha", "li", "sam", "olga", "raj"]
+LAST = ["smith", "garcia", "chen", "khan", "ng", "lee", "ivanova", "patel"]
+TITLES = ["Owner", "Founder & CEO", "VP Sales", "Head of Marketing", "Office Manager", "CMO", "Engineer", "", None]
+PERSONAS = ["owner_operator", "vp_marketing", "vp_sales", "", None]
+INDUSTRIES = ["plumbing", "hvac", "saas", "dental", None]
+SIZES = ["1-10", "11-50", "51-200", None]
+SOURCES = ["serper", "blitz", "exa", None]
+
+
+def _person(rng: random.Random, company: str) -> dict:
+    first, last = rng.choice(FIRST), rng.choice(LAST)
+    contact = {"name": rng.choice([f"{first} {last}", first.title(), "", None])}
+    if rng.random() < 0.6:
+        contact["linkedin_url"] = f"https://linkedin.com/in/{first}-{last}" + rng.choice(["", "/", "/ "])
+    if rng.random() < 0.7:
+        contact["email"] = rng.choice([f"{first}@{company}.com", f"{first}.{last}@{company}.com", None])
+    contact["title"] = rng.choice(TITLES)
+    return contact
+
+
+def make_synthetic(rows: int, seed: int = 7) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Synthetic (results, truth) frames with every column the metrics read"""
+    rng = random.Random(seed)
+    results, truth = [], []
+    for i in range(rows):
+        company = f"co{i}"
+        domain = rng.choice([f"{company}.com", f"www.{company}.com/", f"{company}.net", None])
+        expected = rng.choice([f"{company}.com", f"WWW.{company.upper()}.COM", None])
+        contacts = [_person(rng, company) for _ in range(rng.randint(0, 4))]
+        expected_contacts = [_person(rng, company) for _ in range(rng.randint(0, 2))]
+        results.append({
+            "company_name": company,
+            "domain": domain,
+            "confidence": rng.choice([rng.uniform(0, 100), None]),
+            "source": rng.choice(SOURCES),
+            "contacts": contacts,
+            "domain_correct": rng.choice([True, False, None]),
+            "persona_found": rng.choice([True, False]),
+            "person_correct": rng.choice([True, False]),
+            "email_correct": rng.choice([True, False]),
+            "total_cost": rng.uniform(0, 0.2),
+        })
+        truth.append({
+            "company_name": company,
+            "name": company,
+            "expected_domain": expected,
+            "expected_contacts": expected_contacts,
+            "persona_type": rng.choice(PERSONAS),
+            "industry": rng.choice(INDUSTRIES),
+            "size_bucket": rng.choice(SIZES),
+            "tier": rng.choice(["gold", "silver", "bronze"]),
+        })
+    return pd.DataFrame(results), pd.DataFrame(truth)
+
+
+# Per-row reference (the implementation before the columnar rewrite)
+
+def reference_breakdown(df: pd.DataFrame, col: str, correct_col: str = 'correct') -> dict:
+    if col not in df.columns:
+        return {}
+    breakdown = {}
+    for val in df[col].dropna().unique():
+        subset = df[df[col] == val]
+        n = len(subset)
+        correct = subset[correct_col].sum() if correct_col in subset.columns else 0
+        breakdown[str(val)] = {"count": n, "correct": int(correct), "accuracy": correct / n if n > 0 else 0.0}
+    return breakdown
+
+
+def reference_domain(df_results: pd.DataFrame, df_truth: pd.DataFrame) -> tuple[pd.DataFrame, dict]:
+    merged = df_results.merge(df_truth, left_on="company_name", right_on="name", how='inner',
+                              suffixes=('_result', '_truth'))
+    match = lambda row: metrics._domains_match(row.get('domain'), row.get('expected_domain'))
+    merged['correct'] = merged.apply(match, axis=1)
+    merged['false_positive'] = merged.apply(lambda row: pd.notna(row.get('domain')) and not match(row), axis=1)
+    merged['false_negative'] = merged.apply(
+        lambda row: pd.isna(row.get('domain')) and pd.notna(row.get('expected_domain')), axis=1
+    )
+    merged['true_negative'] = merged.apply(
+        lambda row: pd.isna(row.get('domain')) and pd.isna(row.get('expected_domain')), axis=1
+    )
+    breakdowns = {c: reference_breakdown(merged, c) for c in ("source", "industry", "size_bucket", "tier")}
+    return merged, breakdowns
+
+
+def reference_contact(df_results: pd.DataFrame, df_truth: pd.DataFrame) -> tuple[pd.DataFrame, dict]:
+    merged = df_results.merge(df_truth, on="company_name", how='inner', suffixes=('_result', '_truth'))
+    merged['persona_found'] = merged.apply(metrics._check_persona_found, axis=1)
+    merged['person_correct'] = merged.apply(metrics._check_person_match, axis=1)
+    merged['email_correct'] = merged.apply(metrics._check_email_match, axis=1)
+    return merged, reference_breakdown(merged, 'persona_type', 'persona_found')
+
+
+def reference_e2e(df_results: pd.DataFrame, df_truth: pd.DataFrame) -> dict:
+    merged = df_results.merge(df_truth, on="company_name", how='inner')
+    counts = {k: 0 for k in (
+        "domain_wrong", "domain_missing", "contact_not_found", "wrong_persona",
+        "wrong_person", "email_invalid", "success"
+    )}
+    for _, row in merged.iterrows():
+        counts[metrics._attribute_failure_stage(row)] += 1
+    return counts
+
+
+def _timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark columnar evaluation metrics")
+    parser.add_argument("--rows", type=int, default=100_000, help="Synthetic companies")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--skip-reference", action="store_true", help="Only time the columnar version")
+    args = parser.parse_args()
+
+    df_results, df_truth = make_synthetic(args.rows, args.seed)
+    print(f"Synthetic set: {args.rows:,} companies, "
+          f"{df_results['contacts'].map(len).sum():,} contacts, "
+          f"{df_truth['expected_contacts'].map(len).sum():,} expected contacts\n")
+
+    domain, t_domain = _timed(calculate_domain_metrics, df_results, df_truth)
+    contact, t_contact = _timed(calculate_contact_metrics, df_results, df_truth)
+    e2e, t_e2e = _timed(calculate_e2e_metrics, df_results, df_truth)
+
+    print(f"{'Metric':<10} {'Columnar':>10} {'Per-row':>10} {'Speedup':>8}  Parity")
+    print("-" * 52)
+    rows = [("domain", t_domain), ("contact", t_contact), ("e2e", t_e2e)]
+
+    if args.skip_reference:
+        for name, t in rows:
+            print(f"{name:<10} {t:>9.2f}s {'-':>10} {'-':>8}")
+        return
+
+    domain_flags = ["correct", "false_positive", "false_negative", "true_negative"]
+    (ref_merged, ref_breakdowns), r_domain = _timed(reference_domain, df_results, df_truth)
+    domain_ok = (
+        ref_merged[domain_flags].equals(domain.merged_data[domain_flags])
+        and ref_breakdowns == {
+            "source": domain.by_source, "industry": domain.by_industry,
+            "size_bucket": domain.by_size_bucket, "tier": domain.by_tier,
+        }
+    )
+
+    contact_flags = ["persona_found", "person_correct", "email_correct"]
+    (ref_merged, ref_by_persona), r_contact = _timed(reference_contact, df_results, df_truth)
+    contact_ok = (
+        ref_merged[contact_flags].equals(contact.merged_data[contact_flags])
+        and ref_by_persona == contact.by_persona
+    )
+
+    ref_counts, r_e2e = _timed(reference_e2e, df_results, df_truth)
+    e2e_ok = ref_counts == e2e["error_attribution"]
+
+    for (name, t), r, ok in zip(rows, (r_domain, r_contact, r_e2e), (domain_ok, contact_ok, e2e_ok)):
+        print(f"{name:<10} {t:>9.2f}s {r:>9.2f}s {r / t:>7.1f}x  {'identical' if ok else 'MISMATCH'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Single-Pass Page Extraction vs Per-Keyword Regex Reference
+
+Times page_extraction.extract_page (one combined raw scan, one markup
+strip, one keyword scan) against the per-page extraction it replaced in
+WebsiteContactExtractor (two regexes per owner keyword plus separate
+email/phone/LinkedIn/JSON-LD scans over the raw HTML) on the saved SMB
+HTML corpus, and checks parity page by page:
+
+- emails, phones, LinkedIn slugs and Schema.org blocks: identical
+- owner names that pass _is_valid_name: every reference (name, title)
+  is found; extra names (now visible through inline tags and alt text)
+  are counted, not failed
+
+Pages can also be taken from a recorded cassette (text/html bodies) and
+inflated to exercise the heavy-page worker pool.
+
+Usage:
+    python -m evaluation.scripts.benchmark_page_extraction
+    python -m evaluation.scripts.benchmark_page_extraction --repeat 200
+    python -m evaluation.scripts.benchmark_page_extraction --cassette evaluation/data/cassettes/smb.jsonl
+    python -m evaluation.scripts.benchmark_page_extraction --inflate 40 --workers 4
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# Add project root and contact-finder to path
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, PROJECT_ROOT)
+sys.path.insert(0, os.path.join(PROJECT_ROOT, "contact-finder"))
+
+from modules.discovery.page_extraction import OWNER_KEYWORDS, extract_page
+from modules.discovery.website_extractor import WebsiteContactExtractor
+
+
+CORPUS_DIR = Path(PROJECT_ROOT) / "evaluation" / "data" / "smb_html_corpus"
+
+
+# Per-keyword reference (the extraction before the single-pass engine)
+
+REF_EMAIL_REGEX = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+REF_PHONE_REGEX = re.compile(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+REF_LINKEDIN_REGEX = re.compile(r'linkedin\.com/in/([a-zA-Z0-9\-]+)')
+
+
+def reference_schema_org(html: str) -> list[dict]:
+    schemas = []
+    pattern = r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>'
+    for match in re.findall(pattern, html, re.DOTALL | re.IGNORECASE):
+        try:
+            data = json.loads(match.strip())
+            if isinstance(data, dict) and "@graph" in data:
+                schemas.extend(data["@graph"])
+            elif isinstance(data, list):
+                schemas.extend(data)
+            else:
+                schemas.append(data)
+        except json.JSONDecodeError:
+            continue
+    return schemas
+
+
+def reference_phones(html: str) -> set[str]:
+    phones = set()
+    for match in REF_PHONE_REGEX.findall(html):
+        phone = re.sub(r'[^\d]', '', match)
+        if len(phone) >= 10:
+            phones.add(phone[-10:])
+    return phones
+
+
+def reference_owners(html: str) -> list[tuple[str, str]]:
+    owners = []
+    for keyword in OWNER_KEYWORDS:
+        patterns = [
+            rf'(?i)\b{keyword}\b[:\s]+([A-Z][a-z]+\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)',
+            rf'([A-Z][a-z]+\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)[,\s]+(?i:\b{keyword}\b)',
+        ]
+        for pattern in patterns:
+            for match in re.findall(pattern, html):
+                owners.append((match.strip(), keyword))
+    return owners
+
+
+def reference_extract(html: str) -> dict:
+    """Everything the old per-page code pulled out of one page"""
+    return {
+        "schemas": reference_schema_org(html),
+        "emails": set(REF_EMAIL_REGEX.findall(html)),
+        "phones": reference_phones(html),
+        "linkedin_slugs": REF_LINKEDIN_REGEX.findall(html),
+        "owners": reference_owners(html),
+    }
+
+
+def compare_page(html: str, is_valid_name) -> dict:
+    """Parity of extract_page against the reference for one page"""
+    ref = reference_extract(html)
+    new = extract_page(html)
+    ref_owners = {(n, k) for n, k in ref["owners"] if is_valid_name(n)}
+    new_owners = {(n, k) for n, k in new.owners if is_valid_name(n)}
+    return {
+        "schemas": new.schemas == ref["schemas"],
+        "emails": set(new.emails) == ref["emails"],
+        "phones": set(new.phones) == ref["phones"],
+        "linkedin_slugs": new.linkedin_slugs == ref["linkedin_slugs"],
+        "missing_owners": sorted(ref_owners - new_owners),
+        "extra_owners": sorted(new_owners - ref_owners),
+    }
+
+
+def load_corpus(corpus_dir: Path = CORPUS_DIR) -> dict[str, str]:
+    return {p.name: p.read_text(encoding="utf-8") for p in sorted(corpus_dir.glob("*.html"))}
+
+
+def load_cassette_pages(path: str) -> dict[str, str]:
+    """text/html response bodies from a recorded cassette, keyed by URL"""
+    pages = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            data = json.loads(line)
+            if "_meta" in data or data.get("status") != 200 or data.get("body_encoding") != "text":
+                continue
+            content_type = {k.lower(): v for k, v in data.get("headers", {}).items()}.get("content-type", "")
+            if "html" in content_type or data.get("body", "").lstrip()[:15].lower().startswith(("<!doctype", "<html")):
+                pages[data["url"]] = data["body"]
+    return pages
+
+
+def inflate(html: str, factor: int) -> str:
+    """Repeat the page body `factor` times (a stand-in for builder-generated heavy pages)"""
+    if factor <= 1:
+        return html
+    start = html.lower().find("<body")
+    end = html.lower().rfind("</body>")
+    if start < 0 or end < start:
+        return html * factor
+    return html[:end] + html[start:end] * (factor - 1) + html[end:]
+
+
+def _throughput(fn, pages: list[str], repeat: int) -> tuple[float, float]:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for html in pages:
+            fn(html)
+    elapsed = time.perf_counter() - start
+    n = len(pages) * repeat
+    return n / elapsed, sum(map(len, pages)) * repeat / elapsed / 1e6
+
+
+def _pool_throughput(pages: list[str], repeat: int, workers: int) -> tuple[float, float]:
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(extract_page, pages[:workers]))  # Warm up the workers
+        start = time.perf_counter()
+        list(pool.map(extract_page, pages * repeat, chunksize=max(1, len(pages) // workers)))
+        elapsed = time.perf_counter() - start
+    n = len(pages) * repeat
+    return n / elapsed, sum(map(len, pages)) * repeat / elapsed / 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark single-pass page extraction")
+    parser.add_argument("--corpus", default=str(CORPUS_DIR), help="Directory of saved .html pages")
+    parser.add_argument("--cassette", help="Also take text/html bodies from this cassette")
+    parser.add_argument("--repeat", type=int, default=100, help="Passes over the corpus per timing")
+    parser.add_argument("--inflate", type=int, default=1, help="Repeat each page body N times")
+    parser.add_argument("--workers", type=int, default=0, help="Also time a process pool of this size")
+    args = parser.parse_args()
+
+    pages = load_corpus(Path(args.corpus))
+    if args.cassette:
+        pages.update(load_cassette_pages(args.cassette))
+    if not pages:
+        sys.exit("No pages to benchmark")
+    pages = {name: inflate(html, args.inflate) for name, html in pages.items()}
+    total_kb = sum(map(len, pages.values())) / 1024
+    print(f"Corpus: {len(pages)} pages, {total_kb:,.0f} KB\n")
+
+    is_valid_name = WebsiteContactExtractor()._is_valid_name
+    mismatches, extra = [], 0
+    for name, html in pages.items():
+        parity = compare_page(html, is_valid_name)
+        failed = [k for k in ("schemas", "emails", "phones", "linkedin_slugs") if not parity[k]]
+        if failed or parity["missing_owners"]:
+            mismatches.append((name, failed, parity["missing_owners"]))
+        extra += len(parity["extra_owners"])
+
+    html_list = list(pages.values())
+    rows = [
+        ("reference", *_throughput(reference_extract, html_list, args.repeat)),
+        ("single-pass", *_throughput(extract_page, html_list, args.repeat)),
+    ]
+    if args.workers:
+        rows.append((f"pool x{args.workers}", *_pool_throughput(html_list, args.repeat, args.workers)))
+
+    print(f"{'Extractor':<14} {'Pages/s':>10} {'MB/s':>8} {'Speedup':>8}")
+    print("-" * 44)
+    for name, pages_s, mb_s in rows:
+        print(f"{name:<14} {pages_s:>10,.0f} {mb_s:>8.1f} {pages_s / rows[0][1]:>7.1f}x")
+
+    print(f"\nParity: {len(pages) - len(mismatches)}/{len(pages)} pages identical "
+          f"(+{extra} owner names the reference missed)")
+    for name, failed, missing in mismatches:
+        print(f"  MISMATCH {name}: {', '.join(failed)} missing owners {missing}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+"""
+End-to-end Pipeline Throughput Benchmark
+
+Runs the pipelines against local stub servers (evaluation/harness/stub_providers.py)
+that answer like Serper, OpenWeb Ninja, MillionVerifier, LeadMagic, ZenRows and
+OpenAI with per-provider latency and error rates, sweeping concurrency:
+
+- smb:     SMBContactPipeline.run(input_file)
+- domain:  DomainResolver.resolve_batch(companies)
+- contact: ContactFinder.process_batch(companies)
+
+For every (pipeline, concurrency) point it reports companies/minute, p50/p95
+per-company latency, peak RSS and event-loop lag. Each point runs in a fresh
+worker process (so peak RSS is per point, and contact-finder/domain-resolver's
+top-level `modules` packages never meet); the stub server runs in this
+process. No API keys or network are needed.
+
+The JSON report is meant to be diffed between commits:
+
+Usage:
+    python -m evaluation.scripts.benchmark_pipelines --companies 200 --concurrency 5 10 20 \\
+        --output bench_before.json
+    # ...change code...
+    python -m evaluation.scripts.benchmark_pipelines --companies 200 --concurrency 5 10 20 \\
+        --output bench_after.json --compare bench_before.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from evaluation.harness.loop_monitor import LoopLagSampler, LoopMonitor
+from evaluation.harness.stub_providers import StubRouter, StubServer, parse_profile_overrides
+
+REPORT_VERSION = 1
+RESULT_MARKER = "BENCH_RESULT "
+
+API_KEY_ENV = {
+    "smb": ["SERPER_API_KEY", "LEADMAGIC_API_KEY", "ZENROWS_API_KEY", "RAPIDAPI_KEY",
+            "OPENAI_API_KEY", "MILLIONVERIFIER_API_KEY"],
+    "domain": ["SERPER_API_KEY", "ZENROWS_API_KEY", "OPENAI_API_KEY"],
+    "contact": ["OPENAI_API_KEY", "SERPER_API_KEY", "ZENROWS_API_KEY", "LEADMAGIC_API_KEY"],
+}
+
+VERTICALS = ["plumbing", "hvac", "dental_offices", "auto_body_shops", "bakeries", "law_firms", "veterinary"]
+WORDS = ["Summit", "Riverside", "Oak", "Precision", "Family", "Golden", "Metro", "Valley", "Blue Sky", "Liberty",
+         "Pioneer", "Cornerstone", "Evergreen", "Allied", "Northside", "Heritage", "Bright", "Keystone"]
+SUFFIXES = {"plumbing": "Plumbing", "hvac": "Heating & Air", "dental_offices": "Dental",
+            "auto_body_shops": "Collision", "bakeries": "Bakery", "law_firms": "Law Group",
+            "veterinary": "Animal Hospital"}
+CITIES = [("Springfield", "IL"), ("Austin", "TX"), ("Denver", "CO"), ("Tampa", "FL"), ("Columbus", "OH"),
+          ("Boise", "ID"), ("Raleigh", "NC"), ("Tucson", "AZ")]
+
+
+def synthetic_companies(n: int, seed: int = 0) -> list[dict]:
+    """SMB-style companies; ~30% have no domain, ~20% come with an owner."""
+    rng = random.Random(seed)
+    companies = []
+    for i in range(n):
+        vertical = rng.choice(VERTICALS)
+        name = f"{rng.choice(WORDS)} {rng.choice(WORDS)} {SUFFIXES[vertical]} {i}"
+        city, state = rng.choice(CITIES)
+        slug = "".join(c for c in name.lower() if c.isalnum())
+        phone = f"({rng.randint(200, 899)}) {rng.randint(200, 899)}-{rng.randint(1000, 9999)}"
+        company = {
+            "company_name": name,
+            "name": name,
+            "vertical": vertical,
+            "industry": vertical,
+            "domain": f"{slug}.com" if rng.random() < 0.7 else None,
+            "address": f"{rng.randint(10, 9999)} Main St, {city}, {state}",
+            "city": city,
+            "state": state,
+            "location": f"{city}, {state}",
+            "phone": phone,
+        }
+        if rng.random() < 0.2:
+            company["owner"] = f"{rng.choice(['Maria', 'James', 'Linda', 'Robert'])} {rng.choice(['Garcia', 'Smith', 'Nguyen'])}"
+        companies.append(company)
+    return companies
+
+
+# --- worker (one pipeline, one concurrency value) ---
+
+def _time_calls(obj, name: str, timings: list[float], failures: list[str]):
+    """Wrap obj.<name> (the per-company coroutine) to record its duration."""
+    method = getattr(obj, name)
+
+    async def timed(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return await method(*args, **kwargs)
+        except Exception as e:
+            failures.append(type(e).__name__)
+            raise
+        finally:
+            timings.append(time.perf_counter() - start)
+
+    setattr(obj, name, timed)
+
+
+def import_pipeline(pipeline: str):
+    if pipeline == "domain":
+        sys.path.insert(0, str(PROJECT_ROOT / "domain-resolver"))
+        import domain_resolver  # noqa: F401
+    elif pipeline == "contact":
+        sys.path.insert(0, str(PROJECT_ROOT / "contact-finder"))
+        import contact_finder  # noqa: F401
+    else:
+        sys.path.insert(0, str(PROJECT_ROOT / "contact-finder"))
+        import modules.pipeline.smb_pipeline  # noqa: F401
+
+
+def _config(pipeline_dir: str) -> Path:
+    config_path = PROJECT_ROOT / pipeline_dir / "config.yaml"
+    return config_path if config_path.exists() else PROJECT_ROOT / pipeline_dir / "config.yaml.example"
+
+
+async def run_smb(input_file: str, companies: list[dict], concurrency: int, timings, failures) -> int:
+    from modules.pipeline.smb_pipeline import SMBContactPipeline
+
+    pipeline = SMBContactPipeline(concurrency=concurrency, min_validation_score=50)
+    _time_calls(pipeline, "_process_single_company", timings, failures)
+    try:
+        result = await pipeline.run(input_file=input_file)
+        return result.companies_processed
+    finally:
+        await pipeline.close()
+
+
+async def run_domain(input_file: str, companies: list[dict], concurrency: int, timings, failures) -> int:
+    import yaml
+
+    from domain_resolver import DomainResolver
+
+    with open(_config("domain-resolver")) as f:
+        config = yaml.safe_load(f)
+    resolver = DomainResolver(config)
+    df = await resolver.resolve_batch(companies, max_workers=concurrency)
+    # Per-row latency as the resolver records it (pipelined runs never call resolve_single_company)
+    timings.extend(df["latency_ms"].dropna() / 1000)
+    return len(df)
+
+
+async def run_contact(input_file: str, companies: list[dict], concurrency: int, timings, failures) -> int:
+    from contact_finder import ContactFinder
+    from modules.enrichment import set_profile_store
+
+    finder = ContactFinder.from_config(str(_config("contact-finder")))
+    set_profile_store(None)
+    _time_calls(finder, "find_contacts", timings, failures)
+    try:
+        with tempfile.TemporaryDirectory() as checkpoint_dir:
+            result = await finder.process_batch(companies, checkpoint_dir=checkpoint_dir,
+                                                max_concurrent=concurrency)
+        return result.total_companies
+    finally:
+        await finder.close()
+
+
+RUNNERS = {"smb": run_smb, "domain": run_domain, "contact": run_contact}
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def latency_summary(timings: list[float]) -> dict:
+    if not timings:
+        return {"p50_ms": None, "p95_ms": None, "mean_ms": None, "max_ms": None}
+    ms = np.array(timings) * 1000
+    return {
+        "p50_ms": round(float(np.percentile(ms, 50)), 1),
+        "p95_ms": round(float(np.percentile(ms, 95)), 1),
+        "mean_ms": round(float(ms.mean()), 1),
+        "max_ms": round(float(ms.max()), 1),
+    }
+
+
+async def _measure(spec: dict, companies: list[dict]) -> dict:
+    timings: list[float] = []
+    failures: list[str] = []
+    runner = RUNNERS[spec["pipeline"]]
+    if spec.get("blocking_threshold_ms"):
+        monitor = LoopMonitor(threshold_ms=spec["blocking_threshold_ms"], interval=spec["lag_interval"])
+    else:
+        monitor = LoopLagSampler(interval=spec["lag_interval"])
+    async with monitor:
+        start = time.perf_counter()
+        processed = await runner(spec["input"], companies, spec["concurrency"], timings, failures)
+        wall = time.perf_counter() - start
+    result = {
+        "companies": processed,
+        "wall_s": round(wall, 3),
+        "companies_per_min": round(processed * 60 / wall, 1) if wall else None,
+        "latency": latency_summary(timings),
+        "company_failures": len(failures),
+    }
+    if isinstance(monitor, LoopMonitor):
+        summary = monitor.summary()
+        result["loop_lag"] = summary["loop_lag"]
+        result["blocking"] = {k: summary[k] for k in ("threshold_ms", "blocking_calls", "blocked_ms", "by_stage")}
+        if spec.get("monitor_dir"):
+            monitor.write_summary(Path(spec["monitor_dir"]) / f"{spec['pipeline']}_c{spec['concurrency']}.json",
+                                  pipeline=spec["pipeline"], concurrency=spec["concurrency"])
+    else:
+        result["loop_lag"] = monitor.summary()
+    return result
+
+
+def worker(spec: dict):
+    """Run one benchmark point and print the result line for the orchestrator."""
+    import logging
+
+    logging.basicConfig(level=logging.ERROR)
+    for key in API_KEY_ENV[spec["pipeline"]]:
+        os.environ[key] = "stub"
+    with open(spec["input"]) as f:
+        companies = json.load(f)
+
+    result: dict = {"status": "ok"}
+    try:
+        import_pipeline(spec["pipeline"])
+        result["import_rss_mb"] = _peak_rss_mb()
+        with StubRouter(spec["stub_url"], dns_latency=spec["dns_latency"], seed=spec["seed"]) as router:
+            result.update(asyncio.run(_measure(spec, companies)))
+        result["requests"] = dict(router.requests)
+    except Exception as e:
+        result = {"status": "error", "error": f"{type(e).__name__}: {e}"}
+    result["peak_rss_mb"] = _peak_rss_mb()
+    print(RESULT_MARKER + json.dumps(result), flush=True)
+
+
+# --- orchestrator ---
+
+def run_point(spec: dict, timeout: float) -> dict:
+    with tempfile.TemporaryDirectory() as workdir:
+        # Pipelines write logs/checkpoints relative to the working directory
+        try:
+            proc = subprocess.run(
+                [sys.executable, str(Path(__file__).resolve()), "--worker", json.dumps(spec)],
+                cwd=workdir, capture_output=True, text=True, timeout=timeout,
+            )
+        except subprocess.TimeoutExpired:
+            return {"status": "error", "error": f"timed out after {timeout:.0f}s"}
+    for line in reversed(proc.stdout.splitlines()):
+        if line.startswith(RESULT_MARKER):
+            return json.loads(line[len(RESULT_MARKER):])
+    tail = (proc.stderr or proc.stdout).strip().splitlines()[-1:] or ["no output"]
+    return {"status": "error", "error": f"worker exited {proc.returncode}: {tail[0]}"}
+
+
+def git_revision() -> dict:
+    def git(*args):
+        try:
+            return subprocess.run(["git", *args], cwd=PROJECT_ROOT, capture_output=True, text=True,
+                                  timeout=30).stdout.strip()
+        except (OSError, subprocess.SubprocessError):
+            return ""
+
+    return {"commit": git("rev-parse", "HEAD") or None, "dirty": bool(git("status", "--porcelain", "--untracked-files=no"))}
+
+
+def compare(report: dict, baseline: dict):
+    """Print per-point deltas against a previous report."""
+    old = {(r["pipeline"], r["concurrency"]): r for r in baseline.get("results", [])}
+    metrics = [
+        ("co/min", lambda r: r.get("companies_per_min")),
+        ("p50 ms", lambda r: r.get("latency", {}).get("p50_ms")),
+        ("p95 ms", lambda r: r.get("latency", {}).get("p95_ms")),
+        ("RSS MB", lambda r: r.get("peak_rss_mb")),
+        ("lag p95", lambda r: r.get("loop_lag", {}).get("p95_ms")),
+    ]
+    print(f"\nCompared to {baseline.get('git', {}).get('commit', '?')[:10]}:")
+    print(f"{'Pipeline':<8} {'Conc':>4}  " + "  ".join(f"{name:>24}" for name, _ in metrics))
+    for r in report["results"]:
+        before = old.get((r["pipeline"], r["concurrency"]))
+        if before is None or r["status"] != "ok" or before.get("status") != "ok":
+            continue
+        cells = []
+        for _, get in metrics:
+            a, b = get(before), get(r)
+            if a is None or b is None:
+                cells.append(f"{'-':>24}")
+                continue
+            pct = f"{(b - a) / a * 100:+.0f}%" if a else "n/a"
+            cells.append(f"{a:g} -> {b:g} ({pct})".rjust(24))
+        print(f"{r['pipeline']:<8} {r['concurrency']:>4}  " + "  ".join(cells))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="End-to-end pipeline throughput benchmark (stub providers)")
+    parser.add_argument("--pipelines", nargs="+", default=["smb", "domain", "contact"], choices=sorted(RUNNERS))
+    parser.add_argument("--companies", "-n", type=int, default=100, help="Synthetic companies per run")
+    parser.add_argument("--input", "-i", default=None, help="Companies JSON instead of synthetic ones")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[5, 10, 20])
+    parser.add_argument("--latency", action="append", default=[], metavar="PROVIDER=SPEC",
+                        help="Provider latency, e.g. openai=lognormal:2,0.5 (repeatable)")
+    parser.add_argument("--error-rate", action="append", default=[], metavar="PROVIDER=RATE")
+    parser.add_argument("--rate-limit-rate", action="append", default=[], metavar="PROVIDER=RATE")
+    parser.add_argument("--page-kb", type=int, default=40, help="Size of synthetic website pages")
+    parser.add_argument("--lag-interval", type=float, default=0.05, help="Loop lag sampling interval (s)")
+    parser.add_argument("--detect-blocking", type=float, nargs="?", const=100, default=None, metavar="MS",
+                        help="Report calls that block the event loop for MS or longer (default 100)")
+    parser.add_argument("--monitor-dir", default=None,
+                        help="With --detect-blocking: write per-run summaries with stacks here")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=1800, help="Per-point timeout (s)")
+    parser.add_argument("--output", "-o", default=None, help="Write the JSON report here")
+    parser.add_argument("--compare", default=None, help="Previous report to diff against")
+    parser.add_argument("--worker", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        worker(json.loads(args.worker))
+        return
+
+    profiles = parse_profile_overrides(args.latency, args.error_rate, args.rate_limit_rate)
+    if args.input:
+        with open(args.input) as f:
+            companies = json.load(f)[: args.companies]
+    else:
+        companies = synthetic_companies(args.companies, args.seed)
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp, StubServer(profiles, seed=args.seed, page_kb=args.page_kb) as server:
+        input_file = str(Path(tmp) / "companies.json")
+        with open(input_file, "w") as f:
+            json.dump(companies, f)
+
+        print(f"Stub providers at {server.url} | {len(companies)} companies")
+        print(f"{'Pipeline':<8} {'Conc':>4} {'Co/min':>8} {'p50 ms':>8} {'p95 ms':>8} {'RSS MB':>7} "
+              f"{'Lag p95':>8} {'Lag max':>8}")
+        for pipeline in args.pipelines:
+            for concurrency in args.concurrency:
+                server.reset_stats()
+                spec = {
+                    "pipeline": pipeline,
+                    "concurrency": concurrency,
+                    "input": input_file,
+                    "stub_url": server.url,
+                    "dns_latency": profiles["dns"].latency,
+                    "lag_interval": args.lag_interval,
+                    "blocking_threshold_ms": args.detect_blocking,
+                    "monitor_dir": str(Path(args.monitor_dir).resolve()) if args.monitor_dir else None,
+                    "seed": args.seed,
+                }
+                point = {"pipeline": pipeline, "concurrency": concurrency, **run_point(spec, args.timeout)}
+                point["stub"] = server.stats()
+                results.append(point)
+                if point["status"] != "ok":
+                    print(f"{pipeline:<8} {concurrency:>4}  error: {point['error']}")
+                    continue
+                print(f"{pipeline:<8} {concurrency:>4} {point['companies_per_min']:>8} "
+                      f"{point['latency']['p50_ms']!s:>8} {point['latency']['p95_ms']!s:>8} "
+                      f"{point['peak_rss_mb']:>7} {point['loop_lag']['p95_ms']:>8} {point['loop_lag']['max_ms']:>8}")
+                for stage, stats in list(point.get("blocking", {}).get("by_stage", {}).items())[:3]:
+                    print(f"{'':>14}blocked {stats['count']}x, {stats['total_ms']:.0f}ms "
+                          f"(max {stats['max_ms']:.0f}ms) in {stage}")
+
+    report = {
+        "benchmark": "pipeline_throughput",
+        "version": REPORT_VERSION,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "git": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": {
+            "companies": len(companies),
+            "input": args.input or "synthetic",
+            "concurrency": args.concurrency,
+            "seed": args.seed,
+            "page_kb": args.page_kb,
+            "lag_interval_s": args.lag_interval,
+            "blocking_threshold_ms": args.detect_blocking,
+            "profiles": {name: asdict(p) for name, p in sorted(profiles.items())},
+        },
+        "results": results,
+    }
+
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+        print(f"\nReport saved to: {args.output}")
+    if args.compare:
+        with open(args.compare) as f:
+            compare(report, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
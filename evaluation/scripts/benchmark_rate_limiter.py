@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Adaptive Rate Limiter vs Fixed Delays
+
+Drives a simulated provider (requests/second cap, concurrency cap, fixed
+latency, 429 + Retry-After when either cap is exceeded) with:
+
+- fixed_client:  old RapidAPI client pacing (1 in flight, 1.5s between
+                 starts, delay doubled on each 429) under enrich_batch's
+                 semaphore(5) + 0.5s sleep
+- fixed_batch:   semaphore(5) + 0.5s sleep only (no client pacing)
+- adaptive:      AdaptiveRateLimiter with the RapidAPI client defaults
+
+Reports successful calls/minute and 429s for each. No network, no keys.
+
+Usage:
+    python -m evaluation.scripts.benchmark_rate_limiter
+    python -m evaluation.scripts.benchmark_rate_limiter --provider-rps 8 --provider-concurrency 4 --duration 20
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from collections import deque
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from evaluation.harness.rate_limiter import AdaptiveRateLimiter
+
+
+class SimulatedProvider:
+    """Sliding one-second window + concurrency cap; over either -> 429"""
+
+    def __init__(self, rps: float, concurrency: int, latency: float):
+        self.rps = rps
+        self.concurrency = concurrency
+        self.latency = latency
+        self.in_flight = 0
+        self.starts: deque = deque()
+        self.ok = 0
+        self.throttled = 0
+
+    async def call(self) -> tuple[int, dict]:
+        now = time.monotonic()
+        while self.starts and now - self.starts[0] > 1.0:
+            self.starts.popleft()
+        if len(self.starts) >= self.rps or self.in_flight >= self.concurrency:
+            self.throttled += 1
+            await asyncio.sleep(0.01)
+            return 429, {"Retry-After": "1", **self._headers()}
+
+        self.starts.append(now)
+        self.in_flight += 1
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+        self.ok += 1
+        return 200, self._headers()
+
+    def _headers(self) -> dict:
+        now = time.monotonic()
+        while self.starts and now - self.starts[0] > 1.0:
+            self.starts.popleft()
+        remaining = max(0, int(self.rps) - len(self.starts))
+        reset = 1.0 - (now - self.starts[0]) if self.starts else 0.0
+        return {"X-RateLimit-Requests-Remaining": str(remaining), "X-RateLimit-Requests-Reset": f"{reset:.3f}"}
+
+
+class FixedDelayClient:
+    """The pre-limiter RapidAPI client pacing"""
+
+    def __init__(self, provider: SimulatedProvider):
+        self.provider = provider
+        self._semaphore = asyncio.Semaphore(1)
+        self._last_request_time = 0.0
+        self._min_delay = 1.5
+
+    async def call(self):
+        async with self._semaphore:
+            elapsed = time.time() - self._last_request_time
+            if elapsed < self._min_delay:
+                await asyncio.sleep(self._min_delay - elapsed)
+            self._last_request_time = time.time()
+            status, _ = await self.provider.call()
+            if status == 429:
+                self._min_delay = min(self._min_delay * 2, 10.0)
+
+
+class AdaptiveClient:
+    """Same call path as RapidAPILinkedInClient._post with the adaptive limiter"""
+
+    def __init__(self, provider: SimulatedProvider, max_retries: int = 3):
+        self.provider = provider
+        self.max_retries = max_retries
+        self.limiter = AdaptiveRateLimiter(
+            initial_rate=1.0, max_rate=10.0, initial_concurrency=1, max_concurrency=5
+        )
+
+    async def call(self):
+        for _ in range(self.max_retries):
+            async with self.limiter.slot():
+                status, headers = await self.provider.call()
+                self.limiter.record(status, headers)
+            if status != 429:
+                return
+
+
+class UnpacedClient:
+    def __init__(self, provider: SimulatedProvider):
+        self.provider = provider
+
+    async def call(self):
+        await self.provider.call()
+
+
+async def drive(client, duration: float, batch_concurrency: int, delay_between: float):
+    """enrich_batch-style fan-out over an endless work list for `duration` seconds"""
+    semaphore = asyncio.Semaphore(batch_concurrency)
+    deadline = time.monotonic() + duration
+
+    async def worker():
+        while time.monotonic() < deadline:
+            async with semaphore:
+                await client.call()
+                if delay_between:
+                    await asyncio.sleep(delay_between)
+
+    workers = [asyncio.create_task(worker()) for _ in range(batch_concurrency * 2)]
+    await asyncio.sleep(duration)
+    for task in workers:
+        task.cancel()
+    await asyncio.gather(*workers, return_exceptions=True)
+
+
+async def run_strategy(name: str, args) -> dict:
+    provider = SimulatedProvider(args.provider_rps, args.provider_concurrency, args.latency)
+    if name == "fixed_client":
+        client, batch, delay = FixedDelayClient(provider), 5, 0.5
+    elif name == "fixed_batch":
+        client, batch, delay = UnpacedClient(provider), 5, 0.5
+    else:
+        client, batch, delay = AdaptiveClient(provider), 10, 0.0
+
+    await drive(client, args.duration, batch, delay)
+    result = {
+        "strategy": name,
+        "calls_per_min": provider.ok * 60.0 / args.duration,
+        "ok": provider.ok,
+        "throttled": provider.throttled,
+    }
+    if isinstance(client, AdaptiveClient):
+        result["limiter"] = client.limiter.snapshot()
+    return result
+
+
+async def main_async(args):
+    ceiling = min(args.provider_rps, args.provider_concurrency / args.latency) * 60
+    print(f"Simulated provider: {args.provider_rps} req/s, {args.provider_concurrency} concurrent, "
+          f"{args.latency * 1000:.0f}ms latency (ceiling ~{ceiling:.0f} calls/min)")
+    print(f"Duration per strategy: {args.duration:.0f}s\n")
+    print(f"{'Strategy':<14} {'Calls/min':>10} {'OK':>6} {'429s':>6}")
+    print("-" * 40)
+    for name in ("fixed_client", "fixed_batch", "adaptive"):
+        result = await run_strategy(name, args)
+        print(f"{name:<14} {result['calls_per_min']:>10.1f} {result['ok']:>6} {result['throttled']:>6}")
+        if "limiter" in result:
+            limiter = result["limiter"]
+            print(f"{'':<14} final rate {limiter['rate']}/s, concurrency {limiter['concurrency']}, "
+                  f"peak {limiter['peak_rate']}/s x {limiter['peak_concurrency']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark adaptive rate limiting against fixed delays")
+    parser.add_argument("--provider-rps", type=float, default=5.0, help="Provider requests/second cap")
+    parser.add_argument("--provider-concurrency", type=int, default=3, help="Provider concurrency cap")
+    parser.add_argument("--latency", type=float, default=0.3, help="Provider response time (seconds)")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds per strategy")
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
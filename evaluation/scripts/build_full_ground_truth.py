@@ -11,11 +11,12 @@ This script:
 6. Exports final ground truth datasets
 
 Usage:
-    python evaluation/scripts/build_full_ground_truth.py
+    python evaluation/scripts/build_full_ground_truth.py [--run-store evaluation/data/run_store]
 
 Budget estimate: ~$150 for Ocean.io enrichment (1000 companies × $0.15)
 """
 
+import argparse
 import asyncio
 import aiohttp
 import pandas as pd
@@ -32,6 +33,8 @@ from typing import Any
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from evaluation.harness.cache import EvaluationCache
+from evaluation.harness.ground_truth_builder import intern_field
+from evaluation.harness.run_store import RunStore
 
 logging.basicConfig(
     level=logging.INFO,
@@ -40,7 +43,7 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class EnrichedCompany:
     """Company with enriched data"""
     # Original data
@@ -244,9 +247,9 @@ class GroundTruthBuilder:
         for _, row in df_merged.iterrows():
             company = EnrichedCompany(
                 name=row["name"],
-                city=row.get("city"),
+                city=intern_field(row.get("city")),
                 phone=row.get("phone"),
-                context=row.get("context"),
+                context=intern_field(row.get("context")),
                 expected_domain=row.get("expected_domain"),
             )
             # Also classify industry from context
@@ -662,6 +665,12 @@ Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
 async def main():
     """Run full ground truth building"""
+    parser = argparse.ArgumentParser(description="Build the full ground truth dataset")
+    parser.add_argument("--run-store", default=None,
+                        help="Also append the ground truth to this Parquet run store directory")
+    parser.add_argument("--run-id", default=None, help="Run id in the run store (default: generated)")
+    args = parser.parse_args()
+
     print("\n" + "=" * 60)
     print("PHASE 2: FULL GROUND TRUTH BUILDING")
     print("=" * 60 + "\n")
@@ -700,6 +709,13 @@ async def main():
     # Step 5: Export
     print("Step 5: Exporting ground truth datasets...")
     df_truth = builder.export_ground_truth()
+    if args.run_store:
+        run_id = args.run_id or RunStore.new_run_id("ground_truth")
+        RunStore(args.run_store).append_frame(
+            "ground_truth", df_truth, run_id=run_id, pipeline="ground_truth",
+            meta={"companies": len(df_truth)}, vertical_column="industry"
+        )
+        print(f"  Appended to run store {args.run_store} (run_id={run_id})")
     print()
 
     # Step 6: Generate report
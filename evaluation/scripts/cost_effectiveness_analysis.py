@@ -4,10 +4,22 @@ Analyze cost-effectiveness of different pipeline strategies.
 Calculate ROI for different source combinations and verticals.
 """
 
+import argparse
 import json
+import sys
 from collections import defaultdict
+from pathlib import Path
 from typing import Dict, List, Any
 
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+DEFAULT_RESULTS_FILE = "/Users/jordancrawford/Desktop/Blueprint-GTM-Skills/evaluation/results/yelp_940_results.json"
+
+# Fields read from the run store (everything else stays on disk)
+RESULT_COLUMNS = ['vertical', 'stages_completed']
+CONTACT_COLUMNS = ['sources', 'is_valid']
+
 def load_results(file_path: str) -> List[Dict[str, Any]]:
     """Load JSON results file."""
     with open(file_path, 'r') as f:
@@ -260,10 +272,21 @@ def print_report(source_roi: List[Dict[str, Any]], vertical_roi: List[Dict[str,
 
 def main():
     """Main execution."""
-    results_file = "/Users/jordancrawford/Desktop/Blueprint-GTM-Skills/evaluation/results/yelp_940_results.json"
-
-    print(f"Loading results from: {results_file}")
-    results = load_results(results_file)
+    parser = argparse.ArgumentParser(description="Cost-effectiveness of source combinations and verticals")
+    parser.add_argument("results_file", nargs="?", default=DEFAULT_RESULTS_FILE, help="Results JSON file")
+    parser.add_argument("--run-store", help="Read from this Parquet run store instead of a JSON file")
+    parser.add_argument("--run-id", action="append", help="Run id(s) to analyze (default: all runs)")
+    args = parser.parse_args()
+
+    if args.run_store:
+        from evaluation.harness.run_store import RunStore
+        print(f"Loading results from run store: {args.run_store} (runs: {args.run_id or 'all'})")
+        results = RunStore(args.run_store).load_results(
+            run_ids=args.run_id, columns=RESULT_COLUMNS, contact_columns=CONTACT_COLUMNS
+        )
+    else:
+        print(f"Loading results from: {args.results_file}")
+        results = load_results(args.results_file)
 
     print("Calculating cost-effectiveness metrics...")
     source_roi = analyze_cost_by_source_combination(results)
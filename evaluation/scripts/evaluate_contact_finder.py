@@ -32,6 +32,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "contact-finder"))
 
 from harness.cache import EvaluationCache
+from harness.run_store import RunStore
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -704,6 +705,10 @@ async def main():
                         help="Max companies to evaluate")
     parser.add_argument("--concurrent", type=int, default=3,
                         help="Max concurrent evaluations")
+    parser.add_argument("--run-store", default=None,
+                        help="Also append detailed records to this Parquet run store directory")
+    parser.add_argument("--run-id", default=None,
+                        help="Run id in the run store (default: generated)")
 
     args = parser.parse_args()
 
@@ -723,6 +728,17 @@ async def main():
 
         evaluator.generate_report(summary, records, args.output)
 
+        if args.run_store and records:
+            run_id = args.run_id or RunStore.new_run_id("contact_finder")
+            RunStore(args.run_store).append_frame(
+                "pipeline_eval_records",
+                pd.DataFrame([asdict(r) for r in records]),
+                run_id=run_id,
+                pipeline="contact_finder",
+                meta={"personas": args.personas, "config": args.config, **asdict(summary)}
+            )
+            logger.info(f"Appended {len(records)} records to run store {args.run_store} (run_id={run_id})")
+
         # Print summary
         print("\n=== Contact Finder Pipeline Evaluation ===")
         print(f"Discovery Rate: {summary.discovery_rate*100:.1f}% (target: {evaluator.targets['discovery_rate']*100:.0f}%)")
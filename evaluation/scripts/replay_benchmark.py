@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Offline Pipeline Benchmark (record/replay)
+
+Records the HTTP/DNS traffic of one pipeline run into a cassette, then
+replays it at several concurrency settings with simulated latency. No API
+keys or network are needed for replay, so throughput and concurrency
+regressions can be checked in CI.
+
+Pipelines (one per process: contact-finder and domain-resolver both ship a
+top-level `modules` package):
+- smb:     SMBContactPipeline.run(input_file)             (--input CSV/JSON)
+- domain:  DomainResolver.resolve_batch(companies)        (--input CSV)
+- contact: ContactFinder.process_batch(companies)         (--input CSV/JSON)
+
+API keys that were set while recording are stored (names only) in the
+cassette, and replaced by placeholders on replay so the same stages run.
+
+Usage:
+    # Record once (live, paid APIs)
+    python -m evaluation.scripts.replay_benchmark --pipeline smb --mode record \\
+        --input evaluation/data/smb_sample_1400.json --limit 50
+
+    # Replay offline
+    python -m evaluation.scripts.replay_benchmark --pipeline smb \\
+        --input evaluation/data/smb_sample_1400.json --limit 50 \\
+        --concurrency 1 5 10 20 --latency lognormal:0.4,0.6 \\
+        --host-latency api.openai.com=lognormal:1.2,0.4 --output smb_replay.json
+
+    # Also report calls that block the event loop for 100ms+ (stacks in --monitor-dir)
+    python -m evaluation.scripts.replay_benchmark --pipeline domain --input companies.csv \\
+        --detect-blocking 100 --monitor-dir evaluation/results/loop_monitor
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from evaluation.harness.cassette import Cassette
+from evaluation.harness.loop_monitor import LoopMonitor
+
+logger = logging.getLogger(__name__)
+
+API_KEY_ENV = {
+    "smb": ["SERPER_API_KEY", "LEADMAGIC_API_KEY", "ZENROWS_API_KEY", "RAPIDAPI_KEY",
+            "OPENAI_API_KEY", "MILLIONVERIFIER_API_KEY"],
+    "domain": ["SERPER_API_KEY", "ZENROWS_API_KEY", "DISCOLIKE_API_KEY", "OCEAN_API_KEY", "OPENAI_API_KEY"],
+    "contact": ["OPENAI_API_KEY", "ANTHROPIC_API_KEY"],
+}
+
+
+def load_companies(path: str, limit: int | None) -> list[dict]:
+    import pandas as pd
+
+    if path.endswith(".json"):
+        with open(path) as f:
+            data = json.load(f)
+        companies = data.get("companies", data.get("results", [])) if isinstance(data, dict) else data
+    else:
+        companies = pd.read_csv(path).to_dict("records")
+    return companies[:limit] if limit else companies
+
+
+def import_pipeline(pipeline: str):
+    """Put the pipeline's package on the path and import it (outside the timed runs)."""
+    if pipeline == "domain":
+        sys.path.insert(0, str(PROJECT_ROOT / "domain-resolver"))
+        import domain_resolver  # noqa: F401
+    elif pipeline == "contact":
+        sys.path.insert(0, str(PROJECT_ROOT / "contact-finder"))
+        import contact_finder  # noqa: F401
+    else:
+        sys.path.insert(0, str(PROJECT_ROOT / "contact-finder"))
+        import modules.pipeline.smb_pipeline  # noqa: F401
+
+
+async def run_smb(args, concurrency: int) -> int:
+    from modules.pipeline.smb_pipeline import SMBContactPipeline
+
+    pipeline = SMBContactPipeline(concurrency=concurrency, min_validation_score=50)
+    try:
+        result = await pipeline.run(input_file=args.input, limit=args.limit, skip_stages=args.skip)
+        return result.companies_processed
+    finally:
+        await pipeline.close()
+
+
+async def run_domain(args, concurrency: int) -> int:
+    import yaml
+
+    from domain_resolver import DomainResolver
+
+    config_path = args.config or PROJECT_ROOT / "domain-resolver" / "config.yaml"
+    if not Path(config_path).exists():
+        config_path = PROJECT_ROOT / "domain-resolver" / "config.yaml.example"
+    with open(config_path) as f:
+        config = yaml.safe_load(f)
+
+    resolver = DomainResolver(config)
+    df = await resolver.resolve_batch(load_companies(args.input, args.limit), max_workers=concurrency)
+    return len(df)
+
+
+async def run_contact(args, concurrency: int) -> int:
+    from contact_finder import ContactFinder
+    from modules.enrichment import set_profile_store
+
+    finder = ContactFinder.from_config(args.config or str(PROJECT_ROOT / "contact-finder" / "config.yaml"))
+    # A shared profile store would turn later sweeps into cache hits
+    set_profile_store(None)
+    try:
+        with tempfile.TemporaryDirectory() as checkpoint_dir:
+            result = await finder.process_batch(
+                load_companies(args.input, args.limit),
+                checkpoint_dir=checkpoint_dir,
+                max_concurrent=concurrency
+            )
+        return result.total_companies
+    finally:
+        await finder.close()
+
+
+RUNNERS = {"smb": run_smb, "domain": run_domain, "contact": run_contact}
+
+
+async def run_monitored(coro, monitor: LoopMonitor | None):
+    if monitor is None:
+        return await coro
+    async with monitor:
+        return await coro
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record/replay pipeline benchmark")
+    parser.add_argument("--pipeline", required=True, choices=sorted(RUNNERS))
+    parser.add_argument("--input", "-i", required=True, help="Companies file")
+    parser.add_argument("--limit", "-n", type=int, default=50)
+    parser.add_argument("--config", default=None, help="Pipeline config (domain/contact)")
+    parser.add_argument("--skip", nargs="+", default=[], help="SMB stages to skip")
+    parser.add_argument("--cassette", default=None,
+                        help="Cassette file (default: evaluation/data/cassettes/<pipeline>.jsonl)")
+    parser.add_argument("--mode", default="replay", choices=["record", "replay", "auto"])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[5],
+                        help="Concurrency values to sweep (record uses the first)")
+    parser.add_argument("--latency", default="recorded", help="Latency spec, e.g. lognormal:0.4,0.6")
+    parser.add_argument("--host-latency", action="append", default=[], metavar="HOST=SPEC",
+                        help="Per-host latency spec (repeatable; 'dns' for DNS lookups)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--detect-blocking", type=float, nargs="?", const=100, default=None, metavar="MS",
+                        help="Report calls that block the event loop for MS or longer (default 100)")
+    parser.add_argument("--monitor-dir", default=None,
+                        help="With --detect-blocking: write per-run summaries with stacks here")
+    parser.add_argument("--output", "-o", default=None, help="Write the report as JSON")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    cassette_path = Path(args.cassette or PROJECT_ROOT / "evaluation" / "data" / "cassettes" / f"{args.pipeline}.jsonl")
+    host_latency = dict(spec.split("=", 1) for spec in args.host_latency)
+    sweep = args.concurrency[:1] if args.mode == "record" else args.concurrency
+    runner = RUNNERS[args.pipeline]
+    import_pipeline(args.pipeline)
+
+    cassette = Cassette(cassette_path, mode=args.mode, latency=args.latency,
+                        host_latency=host_latency, seed=args.seed)
+    if args.mode == "record":
+        cassette.meta = {
+            "pipeline": args.pipeline,
+            "input": args.input,
+            "limit": args.limit,
+            "skip": args.skip,
+            "env_keys": [k for k in API_KEY_ENV[args.pipeline] if os.environ.get(k)],
+            "recorded_at": datetime.now().isoformat(),
+        }
+    else:
+        # Same stages as the recording: placeholder keys where the real ones were set
+        for key in cassette.meta.get("env_keys", []):
+            os.environ.setdefault(key, "replay")
+
+    runs = []
+    print(f"{args.pipeline} | mode={args.mode} | cassette={cassette_path} ({len(cassette)} recorded)")
+    print(f"{'Concurrency':>11} {'Companies':>10} {'Wall (s)':>9} {'Co/min':>8} {'Hits':>6} {'Misses':>7}")
+    for concurrency in sweep:
+        monitor = LoopMonitor(threshold_ms=args.detect_blocking) if args.detect_blocking else None
+        with cassette:
+            start = time.perf_counter()
+            companies = asyncio.run(run_monitored(runner(args, concurrency), monitor))
+            wall = time.perf_counter() - start
+        stats = cassette.stats.to_dict()
+        runs.append({
+            "concurrency": concurrency,
+            "companies": companies,
+            "wall_s": round(wall, 3),
+            "companies_per_min": round(companies * 60 / wall, 1) if wall else None,
+            "cassette": stats,
+        })
+        print(f"{concurrency:>11} {companies:>10} {wall:>9.2f} {runs[-1]['companies_per_min']:>8} "
+              f"{stats['hits']:>6} {stats['misses']:>7}")
+        if monitor is not None:
+            summary = monitor.summary()
+            runs[-1]["loop_lag"] = summary["loop_lag"]
+            runs[-1]["blocking"] = {k: summary[k] for k in ("threshold_ms", "blocking_calls", "blocked_ms", "by_stage")}
+            for stage, s in list(summary["by_stage"].items())[:3]:
+                print(f"{'':>13}blocked {s['count']}x, {s['total_ms']:.0f}ms (max {s['max_ms']:.0f}ms) in {stage}")
+            if args.monitor_dir:
+                monitor.write_summary(Path(args.monitor_dir) / f"{args.pipeline}_{args.mode}_c{concurrency}.json",
+                                      pipeline=args.pipeline, mode=args.mode, concurrency=concurrency)
+
+    if args.output:
+        report = {
+            "pipeline": args.pipeline,
+            "mode": args.mode,
+            "cassette": str(cassette_path),
+            "latency": args.latency,
+            "host_latency": host_latency,
+            "seed": args.seed,
+            "limit": args.limit,
+            "runs": runs,
+        }
+        Path(args.output).write_text(json.dumps(report, indent=2))
+        print(f"\nReport saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
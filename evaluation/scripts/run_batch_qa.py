@@ -27,8 +27,14 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import pandas as pd
 from openai import AsyncOpenAI
 
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from evaluation.harness.run_store import RunStore
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
@@ -170,7 +176,9 @@ async def run_qa(
     input_file: str,
     output_file: str,
     batch_size: int,
-    model: str
+    model: str,
+    run_store: str | None = None,
+    run_id: str | None = None
 ):
     """Run GPT-4 QA on pipeline results"""
 
@@ -287,6 +295,17 @@ async def run_qa(
 
     logger.info(f"\nSaved QA scores to: {output_path}")
 
+    if run_store and all_scores:
+        run_id = run_id or RunStore.new_run_id("batch_qa")
+        RunStore(run_store).append_frame(
+            "qa_scores",
+            pd.DataFrame(all_scores),
+            run_id=run_id,
+            pipeline=f"batch_qa_{model}",
+            meta={**output_data["metadata"], "metrics": metrics}
+        )
+        logger.info(f"Appended QA scores to run store {run_store} (run_id={run_id})")
+
     # Print summary
     print("\n" + "=" * 60)
     print("QA SUMMARY")
@@ -412,6 +431,16 @@ def main():
         default="gpt-4o-mini",
         help="OpenAI model to use"
     )
+    parser.add_argument(
+        "--run-store",
+        default=None,
+        help="Also append QA scores to this Parquet run store directory"
+    )
+    parser.add_argument(
+        "--run-id",
+        default=None,
+        help="Run id in the run store (default: generated)"
+    )
 
     args = parser.parse_args()
 
@@ -423,7 +452,9 @@ def main():
         input_file=args.input,
         output_file=args.output,
         batch_size=args.batch_size,
-        model=args.model
+        model=args.model,
+        run_store=args.run_store,
+        run_id=args.run_id
     ))
 
 
@@ -121,27 +121,19 @@ async def run_comparison(args, rapidapi_key, scrapin_key):
     )
 
     try:
-        # Load connections
+        # Load connections (streamed; a sample never parses the whole export)
         print(f"\nLoading LinkedIn export...")
-        connections = tester.load_linkedin_export(args.linkedin_export)
-        print(f"Loaded {len(connections)} total connections")
-
-        # Filter to those with LinkedIn URLs
-        connections_with_url = [c for c in connections if c.linkedin_url]
-        print(f"{len(connections_with_url)} have LinkedIn URLs")
-
-        # Sample or use all
         if args.all:
-            test_connections = connections_with_url
-            print(f"Testing ALL {len(test_connections)} connections")
+            connections = tester.load_linkedin_export(args.linkedin_export)
+            print(f"Loaded {len(connections)} total connections")
+
+            # Filter to those with LinkedIn URLs
+            test_connections = [c for c in connections if c.linkedin_url]
+            print(f"Testing ALL {len(test_connections)} connections with LinkedIn URLs")
         else:
             sample_size = args.sample or 100
-            if sample_size < len(connections_with_url):
-                import random
-                test_connections = random.sample(connections_with_url, sample_size)
-                print(f"Sampled {len(test_connections)} connections")
-            else:
-                test_connections = connections_with_url
+            test_connections = tester.load_linkedin_export(args.linkedin_export, sample_size=sample_size)
+            print(f"Sampled {len(test_connections)} connections with LinkedIn URLs")
 
         if not test_connections:
             print("ERROR: No connections with LinkedIn URLs found")
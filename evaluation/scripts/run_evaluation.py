@@ -7,6 +7,7 @@ Generates metrics and reports comparing predictions to verified data.
 
 Usage:
     python evaluation/scripts/run_evaluation.py [--domain-only] [--contact-only] [--split cal_dev]
+                                                [--run-store evaluation/data/run_store]
 """
 
 import asyncio
@@ -28,6 +29,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent / "contact-finder"))
 
 from evaluation.harness.cache import EvaluationCache
 from evaluation.harness.metrics import calculate_domain_metrics, MetricsResult
+from evaluation.harness.run_store import RunStore
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -594,6 +596,9 @@ async def main():
     parser.add_argument("--max-concurrent", type=int, default=5, help="Max concurrent API calls")
     parser.add_argument("--personas", nargs="+", default=["owner_operator"],
                        help="Personas to search for")
+    parser.add_argument("--run-store", default=None,
+                       help="Also append results to this Parquet run store directory")
+    parser.add_argument("--run-id", default=None, help="Run id in the run store (default: generated)")
     args = parser.parse_args()
 
     print("=" * 60)
@@ -621,6 +626,14 @@ async def main():
     ground_truth_df = pd.read_parquet(gt_path)
     print(f"\nLoaded {len(ground_truth_df)} companies from {gt_path.name}")
 
+    run_store = RunStore(args.run_store) if args.run_store else None
+    run_id = args.run_id or RunStore.new_run_id(f"eval_{args.split}")
+    industry_by_name = (
+        ground_truth_df.drop_duplicates("name").set_index("name")["industry"]
+        if {"name", "industry"} <= set(ground_truth_df.columns) else pd.Series(dtype=object)
+    )
+    run_meta = {"split": args.split, "personas": args.personas, "skip_cache": args.skip_cache}
+
     domain_results_df = None
     contact_results_df = None
 
@@ -648,6 +661,13 @@ async def main():
             # Save raw results
             domain_results_df.to_parquet(data_dir / f"domain_results_{args.split}.parquet")
             print(f"  Saved results to domain_results_{args.split}.parquet")
+            if run_store:
+                run_store.append_frame(
+                    "domain_results",
+                    domain_results_df.assign(vertical=domain_results_df["company_name"].map(industry_by_name)),
+                    run_id=run_id, pipeline="domain_resolver", meta=run_meta
+                )
+                print(f"  Appended to run store {args.run_store} (run_id={run_id})")
 
         except Exception as e:
             logger.error(f"Domain evaluation failed: {e}")
@@ -683,6 +703,15 @@ async def main():
                 # Save raw results
                 contact_results_df.to_parquet(data_dir / f"contact_results_{args.split}.parquet")
                 print(f"  Saved results to contact_results_{args.split}.parquet")
+                if run_store:
+                    run_store.append_frame(
+                        "contact_results",
+                        contact_results_df.assign(
+                            vertical=contact_results_df["company_name"].map(industry_by_name)
+                        ),
+                        run_id=run_id, pipeline="blitz", meta=run_meta
+                    )
+                    print(f"  Appended to run store {args.run_store} (run_id={run_id})")
 
             except Exception as e:
                 logger.error(f"Contact evaluation failed: {e}")
@@ -24,11 +24,13 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent.parent
 contact_finder_path = project_root / "contact-finder"
 sys.path.insert(0, str(contact_finder_path))
+sys.path.insert(0, str(project_root))
 
 from modules.pipeline.smb_pipeline import (
     SMBContactPipeline,
     print_pipeline_result
 )
+from evaluation.harness.run_store import RunStore
 
 logging.basicConfig(
     level=logging.INFO,
@@ -42,7 +44,9 @@ async def run_test(
     output_file: str | None,
     limit: int,
     concurrency: int,
-    skip_stages: list[str]
+    skip_stages: list[str],
+    run_store: str | None = None,
+    run_id: str | None = None
 ):
     """Run the SMB V2 pipeline test"""
 
@@ -85,7 +89,7 @@ async def run_test(
         print_pipeline_result(result)
 
         # Save results
-        if output_file:
+        if output_file or run_store:
             output_data = {
                 "metadata": {
                     "input_file": input_file,
@@ -132,12 +136,24 @@ async def run_test(
                 ]
             }
 
+        if output_file:
             Path(output_file).parent.mkdir(parents=True, exist_ok=True)
             with open(output_file, 'w') as f:
                 json.dump(output_data, f, indent=2)
 
             logger.info(f"Results saved to: {output_file}")
 
+        if run_store:
+            store = RunStore(run_store)
+            run_id = run_id or store.new_run_id("smb_v2")
+            store.append_results(
+                output_data["results"],
+                run_id=run_id,
+                pipeline="smb_v2",
+                meta={**output_data["metadata"], **output_data["summary"]}
+            )
+            logger.info(f"Results appended to run store {run_store} (run_id={run_id})")
+
         # Print success metrics
         if result.companies_processed > 0:
             find_rate = result.contacts_found / result.companies_processed * 100
@@ -202,6 +218,16 @@ Examples:
         choices=["data_fill", "website", "serper_osint", "enrichment"],
         help="Stages to skip"
     )
+    parser.add_argument(
+        "--run-store",
+        default=None,
+        help="Also append results to this Parquet run store directory"
+    )
+    parser.add_argument(
+        "--run-id",
+        default=None,
+        help="Run id in the run store (default: generated)"
+    )
 
     args = parser.parse_args()
 
@@ -216,7 +242,9 @@ Examples:
         output_file=args.output,
         limit=args.limit,
         concurrency=args.concurrency,
-        skip_stages=args.skip
+        skip_stages=args.skip,
+        run_store=args.run_store,
+        run_id=args.run_id
     ))
 
 
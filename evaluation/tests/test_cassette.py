@@ -0,0 +1,162 @@
+"""
+Cassette tests: record against a local server, replay with it stopped
+
+Run: python -m pytest evaluation/tests/test_cassette.py -q
+"""
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+import aiohttp
+import httpx
+import pytest
+from aiohttp import web
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from evaluation.harness.cassette import Cassette, CassetteMiss, LatencyModel, request_key
+from evaluation.harness.stub_providers import ProviderProfile, StubRouter, StubServer
+
+
+def _app() -> web.Application:
+    calls = {"n": 0}
+
+    async def search(request: web.Request) -> web.Response:
+        calls["n"] += 1
+        body = await request.json()
+        return web.json_response({"q": body["q"], "call": calls["n"]}, headers={"X-RateLimit-Remaining": "9"})
+
+    async def page(request: web.Request) -> web.Response:
+        return web.Response(text="<html>Owner: Jo Smith</html>", content_type="text/html")
+
+    app = web.Application()
+    app.router.add_post("/search", search)
+    app.router.add_get("/page", page)
+    return app
+
+
+async def _record(path: Path) -> list:
+    runner = web.AppRunner(_app())
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    base = f"http://127.0.0.1:{port}"
+    try:
+        with Cassette(path, mode="record"):
+            return await _calls(base), base
+    finally:
+        await runner.cleanup()
+
+
+async def _calls(base: str) -> list:
+    out = []
+    async with aiohttp.ClientSession() as session:
+        for _ in range(2):
+            async with session.post(f"{base}/search?api_key=SECRET", json={"q": "plumber", "api_key": "SECRET"}) as r:
+                out.append((r.status, await r.json(), r.headers.get("X-RateLimit-Remaining")))
+        async with session.get(f"{base}/page") as r:
+            out.append((r.status, await r.text()))
+    async with httpx.AsyncClient() as client:
+        r = await client.get(f"{base}/page")
+        out.append((r.status_code, r.text))
+    return out
+
+
+def test_record_then_replay_offline(tmp_path):
+    path = tmp_path / "cassette.jsonl"
+    recorded, base = asyncio.run(_record(path))
+    assert recorded[0][1] == {"q": "plumber", "call": 1}
+    assert recorded[1][1] == {"q": "plumber", "call": 2}
+    assert "SECRET" not in path.read_text()
+
+    # Server is gone; the key differs, which must not matter
+    async def replay():
+        async with aiohttp.ClientSession() as session:
+            async with session.post(f"{base}/search?api_key=OTHER", json={"api_key": "OTHER", "q": "plumber"}) as r:
+                first = (r.status, await r.json(), r.headers.get("X-RateLimit-Remaining"))
+        return first
+
+    with Cassette(path, latency="none", strict=True) as cassette:
+        replayed = asyncio.run(_calls(base))
+    assert replayed == recorded
+    assert cassette.stats.hits == 4 and cassette.stats.misses == 0
+
+    with Cassette(path, latency="none"):
+        assert asyncio.run(replay()) == recorded[0]
+
+
+def test_replay_miss(tmp_path):
+    path = tmp_path / "cassette.jsonl"
+    _, base = asyncio.run(_record(path))
+
+    async def unknown():
+        async with aiohttp.ClientSession() as session:
+            async with session.get(f"{base}/missing"):
+                pass
+
+    with pytest.raises(CassetteMiss):
+        with Cassette(path, latency="none", strict=True):
+            with pytest.raises(aiohttp.ClientConnectionError):
+                asyncio.run(unknown())
+
+
+def test_openai_sdk_is_recorded_and_replayed_offline(tmp_path):
+    from openai import APIConnectionError, AsyncOpenAI
+
+    path = tmp_path / "cassette.jsonl"
+
+    async def judge(content: str) -> str:
+        client = AsyncOpenAI(api_key="test", max_retries=0)
+        try:
+            response = await client.chat.completions.create(
+                model="gpt-4o-mini", messages=[{"role": "user", "content": content}]
+            )
+            return response.choices[0].message.content
+        finally:
+            await client.close()
+
+    with StubServer({"openai": ProviderProfile("none")}) as server, StubRouter(server.url):
+        with Cassette(path, mode="record"):
+            recorded = asyncio.run(judge("Is Jo Smith the owner?"))
+    assert "api.openai.com/v1/chat/completions" in path.read_text()
+
+    # No stub server and no router: anything not in the cassette would go live
+    with Cassette(path, mode="replay", latency="none") as cassette:
+        assert asyncio.run(judge("Is Jo Smith the owner?")) == recorded
+        with pytest.raises(APIConnectionError):
+            asyncio.run(judge("Is Pat Lee the owner?"))
+    assert cassette.stats.hits == 1 and cassette.stats.misses == 1
+
+
+def test_simulated_latency_is_deterministic(tmp_path):
+    path = tmp_path / "cassette.jsonl"
+    _, base = asyncio.run(_record(path))
+
+    async def timed_calls():
+        start = time.perf_counter()
+        await asyncio.gather(*[_calls(base) for _ in range(3)])
+        return time.perf_counter() - start
+
+    totals = []
+    for _ in range(2):
+        with Cassette(path, latency="lognormal:0.05,0.5", seed=3) as cassette:
+            elapsed = asyncio.run(timed_calls())
+        totals.append(cassette.stats.simulated_latency_s)
+    assert totals[0] == totals[1] > 0
+    assert elapsed >= 0.05
+
+    model = LatencyModel("recorded:0.5")
+    assert model.sample(None, 0.4) == pytest.approx(0.2)
+    with pytest.raises(ValueError):
+        LatencyModel("gamma:1")
+
+
+def test_request_key_ignores_secrets_and_order():
+    a = request_key("post", "https://x.dev/s?b=2&a=1&apikey=k1", json.dumps({"q": 1, "token": "t"}).encode())
+    b = request_key("POST", "https://X.dev/s?a=1&b=2", {"q": 1})
+    assert a == b
+    assert a != request_key("POST", "https://x.dev/s?a=1&b=3", {"q": 1})
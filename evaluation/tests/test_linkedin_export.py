@@ -0,0 +1,96 @@
+"""
+LinkedIn export tests: streaming Connections.csv reader, reservoir sampling, QA tester loaders
+
+Run: python -m pytest evaluation/tests/test_linkedin_export.py -q
+"""
+import random
+import sys
+import zipfile
+from collections import Counter
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from evaluation.harness.contact_qa_tester import ContactQATester
+from evaluation.harness.linkedin_export import (
+    iter_connection_rows,
+    load_connections,
+    reservoir_sample,
+)
+from evaluation.harness.pipeline_tester import PipelineTester
+
+
+NOTES = (
+    "Notes:\r\n"
+    "\"When exporting your connection data, you may notice that some of the email addresses are missing.\"\r\n"
+    "\r\n"
+)
+HEADER = "First Name,Last Name,URL,Email Address,Company,Position,Connected On\r\n"
+
+
+def _export(tmp_path, rows: int) -> Path:
+    lines = [
+        f"Person{i},Last{i} PMP,https://www.linkedin.com/in/person{i},"
+        f"{f'p{i}@example.com' if i % 3 == 0 else ''},\"Acme, Inc.\",Owner,01 Jan 2024\r\n"
+        for i in range(rows)
+    ]
+    lines.append("NoUrl,Person,,,Acme,Owner,01 Jan 2024\r\n")
+    path = tmp_path / "Complete_LinkedInDataExport.zip"
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("Connections.csv", ("\ufeff" + NOTES + HEADER + "".join(lines)).encode("utf-8"))
+    return path
+
+
+def test_rows_stream_with_canonical_keys(tmp_path):
+    rows = iter_connection_rows(_export(tmp_path, 3))
+    first = next(rows)  # Lazy: a generator, parsed row by row
+
+    assert first == {
+        "first_name": "Person0", "last_name": "Last0 PMP", "email": "p0@example.com",
+        "company": "Acme, Inc.", "position": "Owner",
+        "linkedin_url": "https://www.linkedin.com/in/person0", "connected_on": "01 Jan 2024",
+    }
+    assert [row["first_name"] for row in rows] == ["Person1", "Person2", "NoUrl"]
+
+
+def test_reservoir_sample_is_uniform_and_bounded():
+    assert reservoir_sample(range(3), 5) == [0, 1, 2]
+
+    counts = Counter()
+    rng = random.Random(1)
+    for _ in range(2000):
+        counts.update(reservoir_sample(range(10), 3, rng))
+    # Each item is kept with probability 3/10 (600 of 2000 draws)
+    assert all(500 < counts[i] < 700 for i in range(10))
+
+
+def test_sample_parses_only_sampled_rows(tmp_path):
+    export = _export(tmp_path, 500)
+    parsed = []
+
+    def parse(row):
+        parsed.append(row)
+        return row["linkedin_url"]
+
+    sample = load_connections(export, parse, where=lambda row: bool(row["linkedin_url"]), sample_size=20, seed=3)
+    assert len(sample) == len(parsed) == 20
+    assert len(set(sample)) == 20 and all(sample)
+    assert sample == load_connections(export, lambda row: row["linkedin_url"],
+                                      where=lambda row: bool(row["linkedin_url"]), sample_size=20, seed=3)
+
+
+def test_tester_loaders(tmp_path):
+    export = _export(tmp_path, 30)
+
+    tester = ContactQATester(cache_path=tmp_path / "cache.db")
+    assert tester.load_linkedin_export(export) == 30
+    contact = tester.ground_truth[0]
+    assert (contact.full_name, contact.company, contact.email) == ("Person0 Last0", "Acme, Inc.", "p0@example.com")
+    assert len(tester.get_contacts_with_email()) == 10
+    assert tester.load_linkedin_export(export, sample_size=5) == 5
+
+    connections = PipelineTester.load_linkedin_export(str(export), sample_size=7, seed=1)
+    assert len(connections) == 7
+    assert all("linkedin.com" in c.linkedin_url for c in connections)
+    assert len(PipelineTester.load_linkedin_export(str(export))) == 30
@@ -0,0 +1,64 @@
+"""
+Loop monitor tests: blocking calls are caught with stack and owning stage
+
+Run: python -m pytest evaluation/tests/test_loop_monitor.py -q
+"""
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from evaluation.harness.loop_monitor import LoopMonitor
+
+
+def parse_page(seconds: float):
+    """Stands in for a synchronous parser called from a coroutine"""
+    time.sleep(seconds)
+
+
+async def scrape(block_s: float):
+    await asyncio.sleep(0.02)
+    parse_page(block_s)
+
+
+async def poll(n: int):
+    for _ in range(n):
+        await asyncio.sleep(0.005)
+
+
+def test_blocking_call_reported_with_stage(tmp_path):
+    async def run():
+        monitor = LoopMonitor(threshold_ms=50, interval=0.01, stage_roots=[Path(__file__).parent])
+        async with monitor:
+            await asyncio.gather(scrape(0.25), scrape(0.01), poll(40), asyncio.create_task(scrape(0.0), name="fast"))
+        return monitor
+
+    monitor = asyncio.run(run())
+    summary = monitor.summary()
+    assert summary["blocking_calls"] == 1
+    assert list(summary["by_stage"]) == ["test_loop_monitor.parse_page"]
+    worst = summary["worst"][0]
+    assert 150 <= worst["duration_ms"] <= 400
+    assert "sleep" in worst["blocked_in"] or "parse_page" in worst["blocked_in"]
+    assert any("parse_page(block_s)" in line for line in worst["stack"])
+    assert not any("base_events.py" in line for line in worst["stack"])
+    assert summary["loop_lag"]["max_ms"] >= 150
+
+    path = monitor.write_summary(tmp_path / "run.json", pipeline="test")
+    written = json.loads(path.read_text())
+    assert written["pipeline"] == "test" and written["blocking_calls"] == 1
+
+
+def test_no_events_when_loop_yields():
+    async def run():
+        async with LoopMonitor(threshold_ms=50, interval=0.01) as monitor:
+            await asyncio.gather(poll(30), scrape(0.005))
+        return monitor
+
+    summary = asyncio.run(run()).summary()
+    assert summary["blocking_calls"] == 0 and summary["worst"] == []
+    assert summary["loop_lag"]["samples"] > 0
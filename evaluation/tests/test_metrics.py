@@ -0,0 +1,83 @@
+"""
+Parity tests: columnar metrics vs the per-row reference
+
+Run: python -m pytest evaluation/tests/test_metrics.py -q
+"""
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from evaluation.harness.metrics import (
+    calculate_contact_metrics,
+    calculate_domain_metrics,
+    calculate_e2e_metrics,
+)
+from evaluation.scripts.benchmark_metrics import (
+    make_synthetic,
+    reference_contact,
+    reference_domain,
+    reference_e2e,
+)
+
+
+def test_domain_metrics_match_reference():
+    df_results, df_truth = make_synthetic(3000, seed=1)
+    result = calculate_domain_metrics(df_results, df_truth)
+    ref_merged, ref_breakdowns = reference_domain(df_results, df_truth)
+
+    flags = ["correct", "false_positive", "false_negative", "true_negative"]
+    assert result.merged_data[flags].equals(ref_merged[flags])
+    assert result.true_positives == ref_merged["correct"].sum()
+    assert result.by_source == ref_breakdowns["source"]
+    assert result.by_industry == ref_breakdowns["industry"]
+    assert result.by_size_bucket == ref_breakdowns["size_bucket"]
+    assert result.by_tier == ref_breakdowns["tier"]
+
+
+def test_contact_metrics_match_reference():
+    df_results, df_truth = make_synthetic(3000, seed=2)
+    result = calculate_contact_metrics(df_results, df_truth)
+    ref_merged, ref_by_persona = reference_contact(df_results, df_truth)
+
+    flags = ["persona_found", "person_correct", "email_correct"]
+    assert result.merged_data[flags].equals(ref_merged[flags])
+    assert result.by_persona == ref_by_persona
+    assert result.precision == ref_merged["person_correct"].sum() / ref_merged["persona_found"].sum()
+
+
+def test_e2e_attribution_matches_reference():
+    df_results, df_truth = make_synthetic(3000, seed=3)
+    result = calculate_e2e_metrics(df_results, df_truth)
+    assert result["error_attribution"] == reference_e2e(df_results, df_truth)
+    assert all(type(v) is int for v in result["error_attribution"].values())
+
+
+def test_contact_edge_cases():
+    df_results = pd.DataFrame({
+        "company_name": ["a", "b", "c", "d"],
+        "contacts": [
+            [{"name": "Jo Smith", "title": "Owner"}],
+            [],
+            [{"name": "", "linkedin_url": "https://LinkedIn.com/in/x/", "title": "VP of Sales"}],
+            [{"name": "Pat", "title": "Engineer"}],   # no email on either side
+        ],
+    })
+    df_truth = pd.DataFrame({
+        "company_name": ["a", "b", "c", "d"],
+        "persona_type": ["owner_operator", "owner_operator", "vp_sales", "unknown"],
+        "expected_contacts": [
+            [{"name": "jo smith jr"}],
+            [{"name": "Someone"}],
+            [{"name": "Other", "linkedin_url": "https://linkedin.com/in/x"}],
+            [{"name": "Lee"}],
+        ],
+    })
+    merged = calculate_contact_metrics(df_results, df_truth).merged_data
+    assert merged["persona_found"].tolist() == [True, False, True, False]
+    assert merged["person_correct"].tolist() == [True, False, True, False]
+    # Missing emails compare equal ('' == ''), same as the per-row check
+    assert merged["email_correct"].tolist() == [True, False, True, True]
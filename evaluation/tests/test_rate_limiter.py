@@ -0,0 +1,108 @@
+"""
+AdaptiveRateLimiter tests: slow-start ramp-up, backoff on 429 / Retry-After, concurrency cap
+
+Run: python -m pytest evaluation/tests/test_rate_limiter.py -q
+"""
+import asyncio
+import sys
+import time
+from email.utils import formatdate
+from pathlib import Path
+
+import pytest
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from evaluation.harness.rate_limiter import AdaptiveRateLimiter, parse_reset, parse_retry_after
+
+
+def test_ramps_up_geometrically_then_additively_within_bounds():
+    limiter = AdaptiveRateLimiter(initial_rate=1.0, max_rate=3.0, max_concurrency=3, rate_step=0.1, slow_start=2.0)
+
+    # Slow start: x2 per success, one more slot per full window of successes
+    limiter.record(200)
+    assert limiter.rate == 2.0 and limiter.concurrency == 2
+    limiter.record(200)
+    limiter.record(200)
+    assert limiter.rate == 3.0 and limiter.concurrency == 3  # Capped at max_rate
+    for _ in range(10):
+        limiter.record(200)
+    assert limiter.concurrency == 3 and limiter.snapshot()["peak_concurrency"] == 3
+
+    # After the first 429 the rate only grows by rate_step
+    limiter.record(429)
+    assert limiter.rate == 1.5 and limiter.concurrency == 1
+    limiter.record(200)
+    assert limiter.rate == pytest.approx(1.6)
+
+    # Errors say nothing about the rate limit
+    limiter.record(503)
+    limiter.record(0)
+    assert limiter.rate == pytest.approx(1.6) and limiter.stats.throttled == 1
+
+
+def test_429_backs_off_and_pauses_for_retry_after():
+    limiter = AdaptiveRateLimiter(initial_rate=10.0, min_rate=2.0, initial_concurrency=4)
+
+    limiter.record(429, {"Retry-After": "0.3"})
+    assert limiter.rate == 5.0 and limiter.concurrency == 2
+    limiter.record(429, {"retry-after": "0"})
+    limiter.record(429)
+    assert limiter.rate == 2.0 and limiter.concurrency == 1  # Never below the minima
+
+    fresh = AdaptiveRateLimiter(initial_rate=20.0)
+    fresh.record(429, {"Retry-After": "0.3"})
+    waited = asyncio.run(_timed_slot(fresh))
+    assert 0.25 <= waited < 0.6
+    assert fresh.stats.pauses == 1
+
+
+def test_exhausted_window_pauses_until_reset():
+    limiter = AdaptiveRateLimiter(initial_rate=10.0)
+    limiter.record(200, {"X-RateLimit-Requests-Remaining": "0", "X-RateLimit-Requests-Reset": "0.3"})
+    rate = limiter.rate
+    assert limiter.stats.pauses == 1
+
+    assert 0.25 <= asyncio.run(_timed_slot(limiter)) < 0.6
+    # At the ceiling: probing stops, later successes grow the rate additively
+    limiter.record(200)
+    assert limiter.rate == pytest.approx(rate + limiter.rate_step)
+
+
+def test_in_flight_never_exceeds_concurrency():
+    limiter = AdaptiveRateLimiter(initial_rate=1000.0, max_rate=1000.0, initial_concurrency=2, max_concurrency=4)
+    peak = 0
+
+    async def call(status: int):
+        nonlocal peak
+        async with limiter.slot():
+            peak = max(peak, limiter.in_flight)
+            assert limiter.in_flight <= limiter.concurrency
+            await asyncio.sleep(0.01)
+            limiter.record(status)
+
+    async def run():
+        await asyncio.gather(*(call(200) for _ in range(20)))
+        grown = limiter.concurrency
+        await asyncio.gather(*(call(429) for _ in range(3)))
+        return grown
+
+    grown = asyncio.run(run())
+    assert grown == 4 and peak == 4
+    assert limiter.concurrency == 1 and limiter.in_flight == 0
+    assert limiter.stats.calls == 23
+
+
+def test_header_parsing():
+    assert parse_retry_after("2") == 2.0
+    assert parse_retry_after(None) is None and parse_retry_after("soon") is None
+    assert 55 < parse_retry_after(formatdate(time.time() + 60, usegmt=True)) <= 60
+    assert parse_reset("30") == 30.0
+    assert 25 < parse_reset(str(time.time() + 30)) <= 30
+
+
+async def _timed_slot(limiter: AdaptiveRateLimiter) -> float:
+    start = time.monotonic()
+    async with limiter.slot():
+        return time.monotonic() - start
@@ -0,0 +1,126 @@
+"""
+Run store tests: round-trip, partition pruning, schema evolution
+
+Run: python -m pytest evaluation/tests/test_run_store.py -q
+"""
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pyarrow.dataset as ds
+import pytest
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from evaluation.harness.run_store import RunStore
+
+
+RESULTS = [
+    {
+        "company_name": "Acme Plumbing",
+        "domain": "acmeplumbing.com",
+        "vertical": "plumbing",
+        "stages_completed": ["data_fill", "website"],
+        "errors": [],
+        "processing_time_ms": 1250.0,
+        "contacts": [
+            {"name": "Jo Smith", "title": "Owner", "email": "jo@acmeplumbing.com", "phone": None,
+             "linkedin_url": None, "sources": ["website"], "is_valid": True, "confidence": 82,
+             "validation_reasons": ["name on site"]},
+            {"name": "Office", "title": None, "email": None, "phone": "555-0100",
+             "linkedin_url": None, "sources": ["serper"], "is_valid": False, "confidence": 20,
+             "validation_reasons": []},
+        ],
+    },
+    {
+        "company_name": "Cool Air",
+        "domain": None,
+        "vertical": "HVAC/Refrigeration",
+        "stages_completed": ["data_fill"],
+        "errors": ["website: timeout"],
+        "processing_time_ms": 900.0,
+        "contacts": [],
+        "rating": 4.5,
+    },
+    {"company_name": "No Vertical", "stages_completed": [], "errors": [], "processing_time_ms": 10.0,
+     "contacts": []},
+]
+
+
+def test_results_round_trip(tmp_path):
+    store = RunStore(tmp_path)
+    assert store.append_results(RESULTS, run_id="r1", pipeline="smb_v2") == 3
+
+    loaded = {r["company_name"]: r for r in store.load_results(run_ids=["r1"])}
+    acme = loaded["Acme Plumbing"]
+    assert acme["vertical"] == "plumbing"
+    assert acme["stages_completed"] == ["data_fill", "website"]
+    assert [c["name"] for c in acme["contacts"]] == ["Jo Smith", "Office"]
+    assert acme["contacts"][0]["sources"] == ["website"]
+    assert "phone" not in acme["contacts"][0]          # nulls are dropped like missing keys
+    assert loaded["Cool Air"]["rating"] == 4.5          # unknown fields survive via `extra`
+    assert loaded["Cool Air"]["vertical"] == "HVAC/Refrigeration"
+    assert loaded["No Vertical"]["vertical"] == "unknown"
+
+    companies = store.load("companies", columns=["company_name", "valid_contacts", "best_confidence"])
+    acme_row = companies[companies["company_name"] == "Acme Plumbing"].iloc[0]
+    assert acme_row["valid_contacts"] == 1 and acme_row["best_confidence"] == 82
+
+
+def test_partition_pruning_and_projection(tmp_path):
+    store = RunStore(tmp_path)
+    store.append_results(RESULTS, run_id="r1", pipeline="smb_v2")
+    store.append_results(RESULTS[:1], run_id="r2", pipeline="smb_v2")
+
+    df = store.load("companies", columns=["company_name"], run_ids=["r2"])
+    assert list(df.columns) == ["company_name"]
+    assert df["company_name"].tolist() == ["Acme Plumbing"]
+
+    dataset = store.dataset("companies")
+    fragments = list(dataset.get_fragments(filter=ds.field("vertical") == "plumbing"))
+    assert len(fragments) == 2   # one file per run; other verticals are never opened
+
+    results = store.load_results(verticals=["plumbing"], columns=["company_name"],
+                                 contact_columns=["is_valid"])
+    assert len(results) == 2
+    assert results[0]["contacts"] == [{"is_valid": True}, {"is_valid": False}]
+
+    valid = store.load("contacts", columns=["name"], filter=ds.field("is_valid"))
+    assert valid["name"].tolist() == ["Jo Smith", "Jo Smith"]
+    assert set(store.runs()["run_id"]) == {"r1", "r2"}
+
+
+def test_frame_schema_evolution(tmp_path):
+    store = RunStore(tmp_path)
+    store.append_frame("domain_results", pd.DataFrame({
+        "company_name": ["a", "b"], "correct": [True, False], "confidence": [90.0, 10.0],
+    }), run_id="r1", pipeline="domain_resolver")
+    store.append_frame("domain_results", pd.DataFrame({
+        "company_name": ["c"], "correct": [True], "details": [{"source": "serper"}], "industry": ["saas"],
+    }), run_id="r2", pipeline="domain_resolver", vertical_column="industry")
+
+    df = store.load("domain_results").sort_values("company_name")
+    assert df["company_name"].tolist() == ["a", "b", "c"]
+    assert df["confidence"].isna().tolist() == [False, False, True]
+    assert df["details"].tolist()[:2] == [None, None]
+    assert df["details"].iloc[2] == '{"source": "serper"}'
+    assert df["vertical"].tolist() == ["unknown", "unknown", "saas"]
+
+    with pytest.raises(ValueError):
+        store.append_frame("domain_results", pd.DataFrame({"company_name": [1]}),
+                           run_id="r3", pipeline="domain_resolver")
+    with pytest.raises(ValueError):
+        store.append_frame("companies", pd.DataFrame({"x": [1]}), run_id="r3", pipeline="p")
+
+
+def test_numeric_columns_widen_across_appends(tmp_path):
+    store = RunStore(tmp_path)
+    store.append_frame("timings", pd.DataFrame({"company_name": ["a"], "latency": [3]}),
+                       run_id="r1", pipeline="domain_resolver")
+    store.append_frame("timings", pd.DataFrame({"company_name": ["b"], "latency": [2.5]}),
+                       run_id="r2", pipeline="domain_resolver")
+
+    assert str(store.schema("timings").field("latency").type) == "double"
+    df = store.load("timings").sort_values("company_name")
+    assert df["latency"].tolist() == [3.0, 2.5]
@@ -0,0 +1,139 @@
+"""
+Stub provider tests: routing, response shapes, injected errors, loop lag
+
+Run: python -m pytest evaluation/tests/test_stub_providers.py -q
+"""
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+import aiohttp
+import httpx
+import pytest
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from evaluation.harness.loop_monitor import LoopLagSampler
+from evaluation.harness.stub_providers import ProviderProfile, StubRouter, StubServer, parse_profile_overrides
+from evaluation.scripts.benchmark_pipelines import latency_summary, synthetic_companies
+
+FAST = {name: ProviderProfile("none") for name in ("serper", "openweb_ninja", "millionverifier", "leadmagic",
+                                                   "zenrows", "openai", "other_api", "website", "dns")}
+
+
+async def _calls() -> dict:
+    out = {}
+    async with aiohttp.ClientSession() as session:
+        async with session.post("https://google.serper.dev/search", json={"q": '"Acme Plumbing" owner'}) as r:
+            out["serper"] = await r.json()
+        async with session.get("https://api.millionverifier.com/api/v3/",
+                               params={"api": "k", "email": "jo@acmeplumbing.com"}) as r:
+            out["mv"] = await r.json()
+        async with session.get("https://acmeplumbing.com/about") as r:
+            out["site"] = await r.text()
+    async with httpx.AsyncClient() as client:
+        r = await client.post("https://api.openai.com/v1/chat/completions",
+                              json={"model": "gpt-4o-mini", "messages": [{"role": "user", "content": "Judge"}]})
+        out["openai"] = r.json()
+    return out
+
+
+def test_router_serves_provider_shapes():
+    with StubServer(FAST) as server:
+        with StubRouter(server.url) as router:
+            out = asyncio.run(_calls())
+        stats = server.stats()
+
+    assert out["serper"]["knowledgeGraph"]["website"] == "https://acmeplumbing.com"
+    assert out["serper"]["organic"][0]["link"].startswith("https://acmeplumbing.com")
+    assert out["mv"]["email"] == "jo@acmeplumbing.com" and out["mv"]["result"] in ("ok", "catch_all", "invalid")
+    assert "info@acmeplumbing.com" in out["site"] and "application/ld+json" in out["site"]
+    judgment = json.loads(out["openai"]["choices"][0]["message"]["content"])
+    assert {"accept", "overall_confidence", "match", "confidence"} <= set(judgment)
+    assert {p: s["requests"] for p, s in stats.items()} == {"millionverifier": 1, "openai": 1, "serper": 1,
+                                                             "website": 1}
+    assert router.requests["serper"] == 1
+
+
+def test_openai_batch_endpoints():
+    from openai import AsyncOpenAI
+
+    lines = [json.dumps({"custom_id": f"verify-{i}", "method": "POST", "url": "/v1/chat/completions",
+                         "body": {"model": "gpt-4o-mini", "messages": [{"role": "user", "content": f"Judge {i}"}]}})
+             for i in range(3)]
+
+    async def run():
+        client = AsyncOpenAI(api_key="test")
+        uploaded = await client.files.create(file=("requests.jsonl", "\n".join(lines).encode()), purpose="batch")
+        batch = await client.batches.create(input_file_id=uploaded.id, endpoint="/v1/chat/completions",
+                                            completion_window="24h")
+        statuses = [batch.status]
+        while batch.status != "completed":
+            batch = await client.batches.retrieve(batch.id)
+            statuses.append(batch.status)
+        content = await client.files.content(batch.output_file_id)
+        await client.close()
+        return statuses, batch, content.text
+
+    with StubServer(FAST, batch_polls=2) as server, StubRouter(server.url):
+        statuses, batch, text = asyncio.run(run())
+
+    assert statuses == ["validating", "in_progress", "in_progress", "completed"]
+    assert batch.request_counts.completed == 3
+    results = [json.loads(line) for line in text.splitlines()]
+    assert [r["custom_id"] for r in results] == ["verify-0", "verify-1", "verify-2"]
+    judgment = json.loads(results[0]["response"]["body"]["choices"][0]["message"]["content"])
+    assert results[0]["response"]["status_code"] == 200 and "match" in judgment
+
+
+def test_injected_errors_are_seeded():
+    profiles = {**FAST, "serper": ProviderProfile("none", error_rate=0.3, rate_limit_rate=0.2)}
+
+    async def statuses():
+        async with aiohttp.ClientSession() as session:
+            out = []
+            for _ in range(40):
+                async with session.post("https://google.serper.dev/search", json={"q": "x"}) as r:
+                    out.append((r.status, r.headers.get("Retry-After")))
+            return out
+
+    runs = []
+    for _ in range(2):
+        with StubServer(profiles, seed=7) as server, StubRouter(server.url):
+            runs.append(asyncio.run(statuses()))
+    assert runs[0] == runs[1]
+    codes = [status for status, _ in runs[0]]
+    assert {200, 429, 503} <= set(codes)
+    assert all(retry == "1" for status, retry in runs[0] if status == 429)
+    assert server.stats()["serper"]["rate_limited"] == codes.count(429)
+
+    with pytest.raises(ValueError):
+        parse_profile_overrides(latency=["nope=fixed:1"])
+    assert parse_profile_overrides(error_rate=["openai=0.5"])["openai"].error_rate == 0.5
+
+
+def test_loop_lag_sampler_sees_blocking_call():
+    async def work(block: bool):
+        async with LoopLagSampler(interval=0.01) as sampler:
+            await asyncio.sleep(0.05)
+            if block:
+                time.sleep(0.2)
+            await asyncio.sleep(0.05)
+        return sampler.summary()
+
+    assert asyncio.run(work(False))["max_ms"] < 100
+    assert asyncio.run(work(True))["max_ms"] >= 150
+
+
+def test_synthetic_companies_and_latency_summary():
+    companies = synthetic_companies(50, seed=1)
+    assert companies == synthetic_companies(50, seed=1)
+    assert len({c["company_name"] for c in companies}) == 50
+    assert any(c["domain"] is None for c in companies)
+
+    summary = latency_summary([0.1, 0.2, 0.3, 0.4])
+    assert summary["p50_ms"] == 250.0 and summary["max_ms"] == 400.0
+    assert latency_summary([])["p95_ms"] is None